@@ -0,0 +1,93 @@
+"""
+JSON Encoding Benchmark — Response rendering per encoder backend.
+
+Renders a single ``/predict`` response and a 1k-row ``/predict/batch``
+response the way FastAPI does for a returned dict (``jsonable_encoder``
+followed by ``JSONResponse``) and with ``FastJSONResponse`` on every
+backend available in this environment, and reports the mean time to
+build each response.
+
+Usage:
+    python -m benchmarks.json_encoding_benchmark [--rows N] [--iterations N]
+"""
+
+import argparse
+import time
+import uuid
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from phoenix_ml.infrastructure.http.json_response import (
+    FastJSONResponse,
+    available_encoders,
+    set_json_encoder,
+)
+
+
+def _single_payload() -> dict[str, Any]:
+    return {
+        "prediction_id": str(uuid.uuid4()),
+        "model_id": "credit-risk",
+        "version": "v1",
+        "result": 1,
+        "confidence": {"value": 0.93},
+        "latency_ms": 1.27,
+    }
+
+
+def _batch_payload(rows: int) -> dict[str, Any]:
+    rng = np.random.default_rng(42)
+    return {
+        "model_id": "credit-risk",
+        "version": "v1",
+        "results": rng.integers(0, 2, rows).tolist(),
+        "confidences": rng.random(rows).tolist(),
+        "total": rows,
+        "successful": rows,
+        "errors": [],
+        "batch_latency_ms": 4.2,
+    }
+
+
+def _time_us(render: Callable[[], Any], iterations: int) -> float:
+    render()  # warm up
+    start = time.perf_counter()
+    for _ in range(iterations):
+        render()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def run_json_encoding_benchmark(rows: int = 1000, iterations: int = 2000) -> dict[str, Any]:
+    """Mean µs to build each response, per payload and renderer."""
+    payloads = {"single": _single_payload(), f"batch_{rows}": _batch_payload(rows)}
+    results: dict[str, Any] = {}
+
+    for name, payload in payloads.items():
+        n = iterations if name == "single" else max(1, iterations // 10)
+        results[f"{name}_fastapi_default_us"] = round(
+            _time_us(lambda p=payload: JSONResponse(jsonable_encoder(p)), n), 2
+        )
+        for backend in available_encoders():
+            set_json_encoder(backend)
+            results[f"{name}_{backend}_us"] = round(
+                _time_us(lambda p=payload: FastJSONResponse(p), n), 2
+            )
+    set_json_encoder("auto")
+
+    print("=== JSON Encoding Benchmark ===")  # noqa: T201
+    for k, v in results.items():
+        print(f"  {k}: {v}")  # noqa: T201
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Phoenix ML JSON encoding benchmark")
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+    run_json_encoding_benchmark(rows=args.rows, iterations=args.iterations)
@@ -2,18 +2,31 @@
 Memory Benchmark — Profiles peak memory during inference bursts.
 
 Uses tracemalloc to measure memory allocation during model loading
-and concurrent prediction runs.
+and concurrent prediction runs. ``run_worker_memory_benchmark`` starts
+N worker processes serving the same dense model, with and without
+shared weights, and reports each worker's RSS, PSS (shared pages split
+between the processes mapping them) and private memory (Linux only).
+
+Usage:
+    python -m benchmarks.memory_benchmark [--workers N] [--width N]
 """
 
+import argparse
 import asyncio
+import multiprocessing as mp
 import tracemalloc
+from multiprocessing.synchronize import Barrier
 from pathlib import Path
+from typing import Any
 
 import numpy as np
+import onnx
+from onnx import TensorProto, helper, numpy_helper
 
 from phoenix_ml.domain.inference.entities.model import Model
 from phoenix_ml.domain.inference.value_objects.feature_vector import FeatureVector
 from phoenix_ml.infrastructure.ml_engines.onnx_engine import ONNXInferenceEngine
+from phoenix_ml.infrastructure.ml_engines.shared_weights import SharedWeights
 from phoenix_ml.shared.utils.model_generator import generate_simple_onnx
 
 
@@ -38,7 +51,7 @@ async def run_memory_benchmark(n_predictions: int = 100) -> dict[str, str]:
     model_path.parent.mkdir(parents=True, exist_ok=True)
 
     if not model_path.exists():
-        generate_simple_onnx(model_path)
+        generate_simple_onnx(model_path, n_features=30)
 
     engine = ONNXInferenceEngine(cache_dir=cache_dir)
     model = Model(
@@ -84,5 +97,107 @@ async def run_memory_benchmark(n_predictions: int = 100) -> dict[str, str]:
     return results
 
 
+def _generate_dense_onnx(path: Path, width: int) -> None:
+    """Two stacked (width, width) float32 dense layers."""
+    rng = np.random.default_rng(0)
+    weights = [
+        numpy_helper.from_array(rng.random((width, width), dtype=np.float32), f"W{i}")
+        for i in range(2)
+    ]
+    graph = helper.make_graph(
+        [
+            helper.make_node("MatMul", ["input", "W0"], ["hidden"]),
+            helper.make_node("MatMul", ["hidden", "W1"], ["output"]),
+        ],
+        "dense",
+        [helper.make_tensor_value_info("input", TensorProto.FLOAT, [None, width])],
+        [helper.make_tensor_value_info("output", TensorProto.FLOAT, [None, width])],
+        weights,
+    )
+    model = helper.make_model(
+        graph,
+        producer_name="phoenix-ml",
+        ir_version=8,
+        opset_imports=[helper.make_operatorsetid("", 15)],
+    )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    onnx.save(model, str(path))
+
+
+def _smaps_mb() -> dict[str, float]:
+    """RSS, PSS and private memory of this process from /proc (MB)."""
+    fields: dict[str, float] = {}
+    with open("/proc/self/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if parts[0] in ("Rss:", "Pss:", "Private_Clean:", "Private_Dirty:"):
+                fields[parts[0].rstrip(":")] = int(parts[1]) / 1024
+    return {
+        "rss": fields["Rss"],
+        "pss": fields["Pss"],
+        "private": fields["Private_Clean"] + fields["Private_Dirty"],
+    }
+
+
+def _worker(cache_dir: Path, width: int, shared: bool, barrier: Barrier, results: Any) -> None:
+    """One serving worker: load the model, predict once, report memory."""
+
+    async def serve() -> None:
+        engine = ONNXInferenceEngine(
+            cache_dir=cache_dir, shared_weights=SharedWeights() if shared else None
+        )
+        model = Model(id="dense", version="v1", uri="local:///bench", framework="onnx")
+        await engine.load(model)
+        fv = FeatureVector(values=np.ones(width, dtype=np.float32))
+        await engine.predict(model, fv)
+        # Measure once every worker has its model resident
+        barrier.wait()
+        results.put(_smaps_mb())
+        barrier.wait()
+
+    asyncio.run(serve())
+
+
+def run_worker_memory_benchmark(workers: int = 4, width: int = 2048) -> dict[str, Any]:
+    """Per-worker memory of ``workers`` processes serving one dense model."""
+    cache_dir = Path("/tmp/bench_model_cache/workers")
+    model_path = cache_dir / "dense" / "v1" / "model.onnx"
+    if not model_path.exists():
+        _generate_dense_onnx(model_path, width)
+
+    ctx = mp.get_context("spawn")
+    results: dict[str, Any] = {
+        "workers": workers,
+        "weights_mb": round(model_path.stat().st_size / 2**20, 1),
+    }
+    for mode, shared in (("default", False), ("shared", True)):
+        barrier = ctx.Barrier(workers)
+        queue = ctx.Queue()
+        procs = [
+            ctx.Process(target=_worker, args=(cache_dir, width, shared, barrier, queue))
+            for _ in range(workers)
+        ]
+        for p in procs:
+            p.start()
+        samples = [queue.get() for _ in procs]
+        for p in procs:
+            p.join()
+        for key in ("rss", "pss", "private"):
+            results[f"{mode}_{key}_mb_per_worker"] = round(
+                sum(s[key] for s in samples) / workers, 1
+            )
+
+    print("=== Worker Memory Benchmark ===")  # noqa: T201
+    for k, v in results.items():
+        print(f"  {k}: {v}")  # noqa: T201
+
+    return results
+
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Phoenix ML memory benchmark")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--width", type=int, default=2048)
+    args = parser.parse_args()
     asyncio.run(run_memory_benchmark())
+    run_worker_memory_benchmark(workers=args.workers, width=args.width)
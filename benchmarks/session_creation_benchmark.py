@@ -0,0 +1,106 @@
+"""
+Session Creation Benchmark — Cold start with and without optimized graphs.
+
+Creates ONNX Runtime sessions for the same model the way a fresh process
+does: once from the source model (full graph optimization on every
+start) and once through ``OptimizedGraphCache`` after the optimized
+graph has been persisted (optimization disabled). Reports the median
+creation time of each.
+
+Usage:
+    python -m benchmarks.session_creation_benchmark [--features N] [--trees N] [--repeats N]
+"""
+
+import argparse
+import statistics
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+import onnxruntime as ort
+
+from phoenix_ml.domain.inference.value_objects.runtime_options import RuntimeOptions
+from phoenix_ml.infrastructure.ml_engines.inference_executor import ThreadPlan
+from phoenix_ml.infrastructure.ml_engines.optimized_graph_cache import OptimizedGraphCache
+from phoenix_ml.infrastructure.ml_engines.session_options import build_session_options
+
+PROVIDERS = ["CPUExecutionProvider"]
+
+
+def _export_model(path: Path, n_features: int, n_trees: int) -> None:
+    """A gradient-boosted classifier, the shape of the example models."""
+    import numpy as np  # noqa: PLC0415
+    from skl2onnx import to_onnx  # noqa: PLC0415
+    from sklearn.ensemble import GradientBoostingClassifier  # noqa: PLC0415
+
+    rng = np.random.default_rng(42)
+    x = rng.normal(size=(500, n_features)).astype(np.float32)
+    y = (x[:, 0] + x[:, 1] > 0).astype(np.int64)
+    clf = GradientBoostingClassifier(n_estimators=n_trees, max_depth=4).fit(x, y)
+    path.write_bytes(to_onnx(clf, x[:1], options={"zipmap": False}).SerializeToString())
+
+
+def _median_ms(create: Callable[[], Any], repeats: int) -> float:
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        create()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings)
+
+
+def run_session_creation_benchmark(
+    n_features: int = 30, n_trees: int = 200, repeats: int = 10
+) -> dict[str, Any]:
+    """Compare cold session creation from the source model and the cache."""
+    options = RuntimeOptions()
+    plan = ThreadPlan(workers=1, intra_op_threads=1, inter_op_threads=1)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        model_path = Path(tmp) / "model.onnx"
+        _export_model(model_path, n_features, n_trees)
+        model_bytes = model_path.stat().st_size
+        cache = OptimizedGraphCache(Path(tmp) / "graphs")
+        cache.create_session(model_path, options, build_session_options(options, plan), PROVIDERS)
+
+        cold_ms = _median_ms(
+            lambda: ort.InferenceSession(
+                str(model_path),
+                sess_options=build_session_options(options, plan),
+                providers=PROVIDERS,
+            ),
+            repeats,
+        )
+        cached_ms = _median_ms(
+            lambda: cache.create_session(
+                model_path, options, build_session_options(options, plan), PROVIDERS
+            ),
+            repeats,
+        )
+
+    results = {
+        "model_bytes": model_bytes,
+        "ort_version": ort.__version__,
+        "optimizing_session_ms": round(cold_ms, 2),
+        "pre_optimized_session_ms": round(cached_ms, 2),
+        "speedup": round(cold_ms / cached_ms, 2) if cached_ms else None,
+    }
+
+    print("=== Session Creation Benchmark ===")  # noqa: T201
+    for k, v in results.items():
+        print(f"  {k}: {v}")  # noqa: T201
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Phoenix ML session creation benchmark")
+    parser.add_argument("--features", type=int, default=30)
+    parser.add_argument("--trees", type=int, default=200)
+    parser.add_argument("--repeats", type=int, default=10)
+    args = parser.parse_args()
+    run_session_creation_benchmark(
+        n_features=args.features, n_trees=args.trees, repeats=args.repeats
+    )
@@ -152,6 +152,11 @@ def train_and_export(
         f.write(onx.SerializeToString())
     print(f"✅ ONNX → {path}")
 
+    # Held-out split for the pipeline's fp32 vs quantized benchmark step
+    holdout = path.parent / "holdout.npz"
+    np.savez_compressed(holdout, x=np.asarray(x_test, dtype=np.float32), y=np.asarray(y_test))
+    print(f"✅ Held-out data → {holdout}")
+
     # Save reference distributions for drift detection
     ref_path = reference_path or str(
         Path(output_path).parent.parent.parent / "data" / "reference_data.json"
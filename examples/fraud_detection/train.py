@@ -16,6 +16,7 @@ import logging
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 from onnxmltools import convert_xgboost
 from onnxmltools.convert.common.data_types import FloatTensorType
 from sklearn.metrics import (
@@ -137,6 +138,11 @@ def train_and_export(
         f.write(onx.SerializeToString())
     print(f"✅ ONNX → {out}")
 
+    # Held-out split for the pipeline's fp32 vs quantized benchmark step
+    holdout = out.parent / "holdout.npz"
+    np.savez_compressed(holdout, x=np.asarray(x_test, dtype=np.float32), y=np.asarray(y_test))
+    print(f"✅ Held-out data → {holdout}")
+
     # Save reference distributions
     ref_path = reference_path or str(out.parent / "reference_features.json")
     reference: dict[str, Any] = {
@@ -95,6 +95,11 @@ def train_and_export(
         f.write(onnx_model.SerializeToString())
     print(f"📦 ONNX → {out}")
 
+    # Held-out split for the pipeline's fp32 vs quantized benchmark step
+    holdout = out.parent / "holdout.npz"
+    np.savez_compressed(holdout, x=np.asarray(x_test, dtype=np.float32), y=np.asarray(y_test))
+    print(f"✅ Held-out data → {holdout}")
+
     # Save metrics
     metrics = {
         "rmse": rmse,
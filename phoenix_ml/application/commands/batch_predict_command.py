@@ -2,6 +2,8 @@
 
 from dataclasses import dataclass
 
+import numpy as np
+
 
 @dataclass(frozen=True)
 class BatchPredictCommand:
@@ -10,11 +12,14 @@ class BatchPredictCommand:
     Attributes:
         model_id: Target model identifier.
         model_version: Optional specific version.
-        batch: List of feature vectors (each is a list of floats).
+        batch: List of feature vectors (each is a list of floats), or an
+            (N, D) array decoded from a binary request body.
         entity_ids: Optional list of entity IDs for feature store lookup.
+        deadline_ms: Optional per-item deadline, measured from receipt.
     """
 
     model_id: str
-    batch: list[list[float]]
+    batch: list[list[float]] | np.ndarray
     model_version: str | None = None
     entity_ids: list[str] | None = None
+    deadline_ms: float | None = None
@@ -1,10 +1,27 @@
-from pydantic import BaseModel
+import numpy as np
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic.json_schema import SkipJsonSchema
+
+from phoenix_ml.domain.inference.value_objects.request_priority import RequestPriority
 
 
 class PredictCommand(BaseModel):
-    """Input DTO for a single prediction request."""
+    """Input DTO for a single prediction request.
+
+    ``deadline_ms`` is the time (from receipt) after which the result is
+    no longer useful; the request is dropped instead of run once it passes.
+    Binary tensor requests carry the decoded float32 row in
+    ``features_array`` (not part of the JSON schema) so it reaches the
+    engine without a list round-trip; ``features`` then holds its plain
+    floats for logging.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
 
     model_id: str
     model_version: str | None = None
     features: list[float] | None = None
+    features_array: SkipJsonSchema[np.ndarray | None] = Field(default=None, exclude=True)
     entity_id: str | None = None
+    priority: RequestPriority = RequestPriority.INTERACTIVE
+    deadline_ms: float | None = Field(default=None, gt=0)
@@ -1,6 +1,9 @@
 """Handler for batch prediction requests.
 
-Delegates to ``PredictHandler`` for each item and aggregates results.
+Rows without entity ids are served as one feature matrix: the model is
+resolved once and the matrix runs through the engine in chunks of
+``InferenceService.max_batch_rows``. Rows with entity ids may route to
+different versions, so they are delegated to ``PredictHandler`` one by one.
 """
 
 import asyncio
@@ -8,9 +11,19 @@ import logging
 import time
 from typing import Any
 
+import numpy as np
+
 from phoenix_ml.application.commands.batch_predict_command import BatchPredictCommand
 from phoenix_ml.application.commands.predict_command import PredictCommand
 from phoenix_ml.application.handlers.predict_handler import PredictHandler
+from phoenix_ml.domain.inference.entities.prediction import Prediction
+from phoenix_ml.domain.inference.entities.prediction_batch import PredictionBatch
+from phoenix_ml.domain.inference.services.inference_service import InferenceService
+from phoenix_ml.domain.inference.services.model_runtime import ModelRuntime
+from phoenix_ml.domain.inference.value_objects.feature_vector import FeatureMatrix
+from phoenix_ml.domain.inference.value_objects.request_priority import RequestPriority
+from phoenix_ml.domain.shared.domain_events import PredictionCompleted
+from phoenix_ml.shared.exceptions import OverloadedError
 
 logger = logging.getLogger(__name__)
 
@@ -18,21 +31,137 @@ logger = logging.getLogger(__name__)
 class BatchPredictHandler:
     """Handles batch prediction requests.
 
-    Delegates to PredictHandler for each item, running concurrently
-    with asyncio.gather for throughput.
+    Returns columnar results: ``results[i]`` and ``confidences[i]`` belong
+    to input row ``i`` and are ``None`` for rows listed in ``errors``.
+    On the per-row path items are queued in the bulk lane so they do not
+    delay interactive predictions; when admission control sheds every
+    item, the ``OverloadedError`` is re-raised so the caller can answer
+    with a retryable status.
     """
 
     def __init__(self, predict_handler: PredictHandler) -> None:
         self._predict_handler = predict_handler
 
+    @property
+    def inference_service(self) -> InferenceService:
+        return self._predict_handler.inference_service
+
     async def handle(self, command: BatchPredictCommand) -> dict[str, Any]:
         """Execute batch predictions.
 
         Returns:
-            Dict with predictions list, total count, and aggregate latency.
+            Dict with columnar results, row errors, counts and aggregate latency.
         """
         start = time.perf_counter()
+        deadline = (
+            time.monotonic() + command.deadline_ms / 1000.0
+            if command.deadline_ms is not None
+            else None
+        )
+
+        total = len(command.batch)
+        results: list[Any] = [None] * total
+        confidences: list[float | None] = [None] * total
+        errors: list[dict[str, Any]] = []
+
+        if len(command.batch) == 0:
+            model_id, version = command.model_id, command.model_version
+        elif command.entity_ids:
+            model_id, version = await self._predict_rows(command, results, confidences, errors)
+        else:
+            model_id, version = await self._predict_matrix(
+                command, deadline, results, confidences, errors
+            )
+
+        errors.sort(key=lambda e: e["index"])
+        successful = total - len(errors)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        logger.info(
+            "Batch prediction: %d/%d successful in %.1fms",
+            successful,
+            total,
+            elapsed_ms,
+        )
+
+        return {
+            "model_id": model_id,
+            "version": version,
+            "results": results,
+            "confidences": confidences,
+            "total": total,
+            "successful": successful,
+            "errors": errors,
+            "batch_latency_ms": round(elapsed_ms, 2),
+        }
 
+    async def _predict_matrix(
+        self,
+        command: BatchPredictCommand,
+        deadline: float | None,
+        results: list[Any],
+        confidences: list[float | None],
+        errors: list[dict[str, Any]],
+    ) -> tuple[str, str | None]:
+        service = self.inference_service
+        runtime = await service.resolve(command.model_id, command.model_version)
+        model = runtime.model
+
+        batch = command.batch
+        width = runtime.n_features or len(batch[0])
+        if isinstance(batch, np.ndarray):
+            # Binary request bodies arrive as one (N, D) array: no per-row checks
+            if batch.shape[1] != width:
+                message = f"Expected {width} features, got {batch.shape[1]}"
+                errors.extend({"index": i, "error": message} for i in range(len(batch)))
+                return model.id, model.version
+            rows = list(range(len(batch)))
+            matrix = batch.astype(runtime.dtype, copy=False)
+        else:
+            # Rows of the wrong width are reported; the rest form one matrix
+            rows = [i for i, row in enumerate(batch) if len(row) == width]
+            for i, row in enumerate(batch):
+                if len(row) != width:
+                    errors.append(
+                        {"index": i, "error": f"Expected {width} features, got {len(row)}"}
+                    )
+            if not rows:
+                return model.id, model.version
+            matrix = np.asarray([batch[i] for i in rows], dtype=runtime.dtype)
+
+        chunk = max(1, service.max_batch_rows)
+        offsets = range(0, len(rows), chunk)
+
+        outcomes = await asyncio.gather(
+            *(
+                self.predict_chunk(
+                    runtime, FeatureMatrix.from_array(matrix[o : o + chunk]), deadline
+                )
+                for o in offsets
+            ),
+            return_exceptions=True,
+        )
+
+        for offset, outcome in zip(offsets, outcomes, strict=True):
+            indices = rows[offset : offset + chunk]
+            if isinstance(outcome, BaseException):
+                errors.extend({"index": i, "error": str(outcome)} for i in indices)
+                continue
+            chunk_results, chunk_confidences = outcome.columns()
+            for i, result, confidence in zip(
+                indices, chunk_results, chunk_confidences, strict=True
+            ):
+                results[i] = result
+                confidences[i] = confidence
+        return model.id, model.version
+
+    async def _predict_rows(
+        self,
+        command: BatchPredictCommand,
+        results: list[Any],
+        confidences: list[float | None],
+        errors: list[dict[str, Any]],
+    ) -> tuple[str, str | None]:
         tasks = []
         for i, features in enumerate(command.batch):
             entity_id = (
@@ -45,32 +174,66 @@ class BatchPredictHandler:
                 model_version=command.model_version,
                 features=features,
                 entity_id=entity_id,
+                priority=RequestPriority.BULK,
+                deadline_ms=command.deadline_ms,
             )
             tasks.append(self._predict_handler.execute(cmd))
 
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        outcomes = await asyncio.gather(*tasks, return_exceptions=True)
 
-        predictions = []
-        errors = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                errors.append({"index": i, "error": str(result)})
-            else:
-                predictions.append(result)
-
-        elapsed_ms = (time.perf_counter() - start) * 1000
+        shed = [r for r in outcomes if isinstance(r, OverloadedError)]
+        if shed and len(shed) == len(outcomes):
+            raise shed[0]
 
-        logger.info(
-            "Batch prediction: %d/%d successful in %.1fms",
-            len(predictions),
-            len(command.batch),
-            elapsed_ms,
+        version = command.model_version
+        for i, outcome in enumerate(outcomes):
+            if isinstance(outcome, Prediction):
+                results[i] = outcome.result
+                confidences[i] = outcome.confidence.value
+                version = outcome.model_version
+            else:
+                errors.append({"index": i, "error": str(outcome)})
+        return command.model_id, version
+
+    async def predict_chunk(
+        self,
+        runtime: ModelRuntime,
+        features: FeatureMatrix,
+        deadline: float | None = None,
+    ) -> PredictionBatch:
+        """Run one engine-sized chunk and publish its ``PredictionCompleted`` event."""
+        model = runtime.model
+        start = time.perf_counter()
+        service = self.inference_service
+        try:
+            batch = await service.predict_matrix(runtime, features, deadline)
+        except Exception:
+            self._publish(model.id, model.version, start, len(features), None)
+            raise
+        self._publish(
+            model.id,
+            model.version,
+            start,
+            len(batch),
+            float(batch.confidences.mean()) if len(batch) else 0.0,
+        )
+        return batch
+
+    def _publish(
+        self,
+        model_id: str,
+        version: str,
+        start: float,
+        rows: int,
+        confidence: float | None,
+    ) -> None:
+        self._predict_handler.event_bus.publish(
+            PredictionCompleted(
+                model_id=model_id,
+                version=version,
+                latency=time.perf_counter() - start,
+                confidence=confidence or 0.0,
+                status="error" if confidence is None else "success",
+                rows=rows,
+            )
         )
-
-        return {
-            "predictions": predictions,
-            "total": len(command.batch),
-            "successful": len(predictions),
-            "errors": errors,
-            "batch_latency_ms": round(elapsed_ms, 2),
-        }
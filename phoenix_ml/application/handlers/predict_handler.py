@@ -25,15 +25,34 @@ class PredictHandler:
         self._inference_service = inference_service
         self._event_bus = event_bus
 
+    @property
+    def inference_service(self) -> InferenceService:
+        return self._inference_service
+
+    @property
+    def event_bus(self) -> DomainEventBus:
+        return self._event_bus
+
     async def execute(self, command: PredictCommand) -> Prediction:
         start_time = time.time()
+        deadline = (
+            time.monotonic() + command.deadline_ms / 1000.0
+            if command.deadline_ms is not None
+            else None
+        )
 
         try:
             request = PredictionRequest(
                 model_id=command.model_id,
                 model_version=command.model_version,
                 entity_id=command.entity_id,
-                features=command.features,
+                features=(
+                    command.features_array
+                    if command.features_array is not None
+                    else command.features
+                ),
+                priority=command.priority,
+                deadline=deadline,
             )
             prediction = await self._inference_service.predict(request)
 
@@ -7,10 +7,12 @@ from pathlib import Path
 
 from phoenix_ml.application.commands.trigger_retrain_command import TriggerRetrainCommand
 from phoenix_ml.domain.inference.entities.model import Model
+from phoenix_ml.domain.inference.services.model_hot_swap import ModelHotSwapper
 from phoenix_ml.domain.model_registry.repositories.model_repository import ModelRepository
 from phoenix_ml.domain.monitoring.services.model_evaluator import IModelEvaluator
 from phoenix_ml.domain.shared.domain_events import ModelRetrained
 from phoenix_ml.domain.shared.event_bus import DomainEventBus
+from phoenix_ml.shared.exceptions import InferenceError
 
 logger = logging.getLogger(__name__)
 
@@ -20,7 +22,9 @@ class RetrainHandler:
 
     Runs the training script, evaluates results against the current
     champion, and promotes the challenger if metrics improve. Emits
-    ``ModelRetrained`` events via the domain event bus.
+    ``ModelRetrained`` events via the domain event bus. With a
+    ``hot_swapper`` the promoted version is warmed up before it takes
+    traffic and the replaced champion is drained and unloaded.
     """
 
     def __init__(
@@ -29,11 +33,13 @@ class RetrainHandler:
         model_repo: ModelRepository,
         evaluator: IModelEvaluator,
         event_bus: DomainEventBus,
+        hot_swapper: ModelHotSwapper | None = None,
     ) -> None:
         self._project_root = project_root
         self._model_repo = model_repo
         self._evaluator = evaluator
         self._event_bus = event_bus
+        self._hot_swapper = hot_swapper
 
     async def execute(self, command: TriggerRetrainCommand) -> bool:
         """
@@ -79,7 +85,9 @@ class RetrainHandler:
             )
 
         # 5. Register and potentially Promote
-        role = "champion" if should_promote else "challenger"
+        # A hot-swapped version is saved unrouted and promoted once warmed up
+        hot_swap = should_promote and self._hot_swapper is not None
+        role = "champion" if should_promote and not hot_swap else "challenger"
         new_model = Model(
             id=command.model_id,
             version=version,
@@ -87,12 +95,19 @@ class RetrainHandler:
             framework="onnx",
             metadata={"metrics": challenger_metrics, "role": role},
             created_at=datetime.now(UTC),
-            is_active=True,
+            is_active=not hot_swap,
         )
 
         await self._model_repo.save(new_model)
 
-        if should_promote:
+        if self._hot_swapper is not None and hot_swap:
+            try:
+                await self._hot_swapper.promote(self._model_repo, new_model)
+                logger.info("👑 Model %s:%s hot-swapped in as CHAMPION", command.model_id, version)
+            except InferenceError as e:
+                logger.error("❌ Hot swap failed, keeping the current champion: %s", e)
+                should_promote = False
+        elif should_promote:
             await self._model_repo.update_stage(command.model_id, version, "champion")
             logger.info("👑 Model %s:%s promoted to CHAMPION", command.model_id, version)
 
@@ -0,0 +1,169 @@
+"""Handler for streamed bulk prediction.
+
+Input arrives as an async iterator of row chunks (decoded incrementally
+from the request body) and results are yielded chunk by chunk in input
+order. At most ``max_in_flight`` engine chunks run at once; while they
+are busy the body is not read further, so memory stays bounded by the
+pipeline depth rather than the size of the upload.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import AsyncIterable, AsyncIterator, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+from phoenix_ml.application.handlers.batch_predict_handler import BatchPredictHandler
+from phoenix_ml.domain.inference.entities.prediction_batch import PredictionBatch
+from phoenix_ml.domain.inference.services.model_runtime import ModelRuntime
+from phoenix_ml.domain.inference.value_objects.feature_vector import FeatureMatrix
+
+logger = logging.getLogger(__name__)
+
+# A chunk of input: an (N, D) array, or rows where None marks an undecodable row
+RowChunk = np.ndarray | Sequence[Sequence[float] | None]
+
+
+@dataclass
+class _Chunk:
+    offset: int
+    count: int
+    indices: list[int]
+    task: asyncio.Task[PredictionBatch] | None
+    errors: list[dict[str, Any]] = field(default_factory=list)
+
+
+class StreamPredictHandler:
+    """Pipelines streamed rows through ``BatchPredictHandler.predict_chunk``.
+
+    Every yielded dict covers ``count`` consecutive input rows starting at
+    ``offset``; ``results``/``confidences`` are ``None`` for rows listed
+    in ``errors`` (indices are absolute within the stream).
+    """
+
+    def __init__(self, batch_handler: BatchPredictHandler, max_in_flight: int = 2) -> None:
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1")
+        self._batch_handler = batch_handler
+        self._max_in_flight = max_in_flight
+
+    @property
+    def max_batch_rows(self) -> int:
+        return max(1, self._batch_handler.inference_service.max_batch_rows)
+
+    async def open(self, model_id: str, model_version: str | None = None) -> ModelRuntime:
+        """Resolve the serving version before any output is streamed."""
+        return await self._batch_handler.inference_service.resolve(model_id, model_version)
+
+    async def stream(
+        self,
+        runtime: ModelRuntime,
+        chunks: AsyncIterable[RowChunk],
+        deadline_ms: float | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Yield one result dict per engine chunk, in input order.
+        ``deadline_ms`` is a budget per chunk, counted from when the chunk
+        is read, since the stream as a whole may run for minutes.
+        """
+        pending: deque[_Chunk] = deque()
+        width = runtime.n_features
+        offset = 0
+        try:
+            async for rows in chunks:
+                size = self.max_batch_rows
+                for start in range(0, len(rows), size):
+                    part = rows[start : start + size]
+                    if width is None:
+                        width = _first_width(part)
+                    deadline = (
+                        time.monotonic() + deadline_ms / 1000.0 if deadline_ms is not None else None
+                    )
+                    pending.append(self._submit(runtime, part, offset, width, deadline))
+                    offset += len(part)
+                    # Backpressure: stop reading input until the oldest chunk lands
+                    while len(pending) >= self._max_in_flight:
+                        yield await _collect(pending.popleft())
+            while pending:
+                yield await _collect(pending.popleft())
+        finally:
+            for chunk in pending:
+                if chunk.task is not None:
+                    chunk.task.cancel()
+
+    def _submit(
+        self,
+        runtime: ModelRuntime,
+        rows: RowChunk,
+        offset: int,
+        width: int | None,
+        deadline: float | None,
+    ) -> _Chunk:
+        chunk = _Chunk(offset=offset, count=len(rows), indices=[], task=None)
+        if isinstance(rows, np.ndarray):
+            if rows.shape[1:] == (width,):
+                chunk.indices = list(range(len(rows)))
+                matrix = rows.astype(runtime.dtype, copy=False)
+            else:
+                got = rows.shape[-1] if rows.ndim > 1 else 0
+                chunk.errors = [
+                    {"index": offset + i, "error": f"Expected {width} features, got {got}"}
+                    for i in range(len(rows))
+                ]
+        else:
+            for i, row in enumerate(rows):
+                if row is None:
+                    chunk.errors.append({"index": offset + i, "error": "Malformed row"})
+                elif len(row) != width:
+                    chunk.errors.append(
+                        {"index": offset + i, "error": f"Expected {width} features, got {len(row)}"}
+                    )
+                else:
+                    chunk.indices.append(i)
+            if chunk.indices:
+                matrix = np.asarray([rows[i] for i in chunk.indices], dtype=runtime.dtype)
+
+        if chunk.indices:
+            chunk.task = asyncio.create_task(
+                self._batch_handler.predict_chunk(
+                    runtime, FeatureMatrix.from_array(matrix), deadline
+                )
+            )
+        return chunk
+
+
+def _first_width(rows: RowChunk) -> int | None:
+    if isinstance(rows, np.ndarray):
+        return rows.shape[-1] if rows.ndim > 1 else None
+    return next((len(row) for row in rows if row is not None), None)
+
+
+async def _collect(chunk: _Chunk) -> dict[str, Any]:
+    results: list[Any] = [None] * chunk.count
+    confidences: list[float | None] = [None] * chunk.count
+    errors = chunk.errors
+    if chunk.task is not None:
+        try:
+            batch = await chunk.task
+        except Exception as e:
+            logger.warning("Stream chunk at offset %d failed: %s", chunk.offset, e)
+            errors += [{"index": chunk.offset + i, "error": str(e)} for i in chunk.indices]
+        else:
+            chunk_results, chunk_confidences = batch.columns()
+            for i, result, confidence in zip(
+                chunk.indices, chunk_results, chunk_confidences, strict=True
+            ):
+                results[i] = result
+                confidences[i] = confidence
+        errors.sort(key=lambda e: e["index"])
+    return {
+        "offset": chunk.offset,
+        "count": chunk.count,
+        "results": results,
+        "confidences": confidences,
+        "errors": errors,
+    }
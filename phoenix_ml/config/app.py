@@ -11,6 +11,19 @@ class AppSettings(BaseSettings):
     APP_NAME: str = "Phoenix ML Platform"
     APP_VERSION: str = "0.1.0"
     DEBUG: bool = False
+    # Response JSON backend: auto (orjson > msgspec > pydantic), orjson,
+    # msgspec, pydantic or stdlib
+    JSON_ENCODER: str = "auto"
+
+    # Server (phoenix-serve): worker processes, event loop (auto, asyncio,
+    # uvloop), HTTP parser (auto, h11, httptools) and keep-alive timeout.
+    # With several workers, metrics are merged across them and the gRPC
+    # server runs in one worker; SERVER_RUNTIME_DIR holds their shared state
+    SERVER_WORKERS: int = 1
+    SERVER_LOOP: str = "auto"
+    SERVER_HTTP: str = "auto"
+    SERVER_KEEP_ALIVE_S: int = 5
+    SERVER_RUNTIME_DIR: str = "/tmp/phoenix/serve"
 
     # Model defaults
     DEFAULT_MODEL_ID: str = ""
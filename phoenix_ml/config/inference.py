@@ -17,6 +17,74 @@ class InferenceSettings(BaseSettings):
     BATCH_MAX_SIZE: int = 16
     BATCH_MAX_WAIT_MS: int = 10
 
+    # Adaptive batching (SLO-driven window and batch cap per model)
+    BATCH_ADAPTIVE: bool = False
+    BATCH_TARGET_P99_MS: float = 50.0
+    BATCH_ADAPTIVE_MAX_SIZE: int = 256
+    # Share of every batch reserved for interactive (single /predict) requests
+    BATCH_INTERACTIVE_SHARE: float = 0.5
+    # Attach identical in-flight requests to one batch slot
+    BATCH_COALESCE: bool = True
+    # Admission control (opt-in): queued requests per model (0 = unbounded;
+    # counted per row, so size it above the largest batch request) and
+    # engine batches in flight per model
+    BATCH_MAX_QUEUE_DEPTH: int = 0
+    BATCH_MAX_CONCURRENT: int = 1
+    # Engine slots shared by all models' batches (weighted fair queuing);
+    # 0 disables the cross-model scheduler
+    BATCH_SCHEDULER_SLOTS: int = 2
+    # Engine chunks in flight per /predict/stream request (input backpressure)
+    STREAM_MAX_IN_FLIGHT: int = 2
+
+    # Routing across a model's active versions: ab_test, canary, shadow, single
+    ROUTING_STRATEGY: str = "ab_test"
+    # Shadow routing: share of champion predictions replayed on the
+    # challenger, samples waiting at most (further ones are dropped),
+    # rows per shadow batch and champion/challenger pairs kept per pair
+    SHADOW_SAMPLE_RATE: float = 0.1
+    SHADOW_MAX_PENDING: int = 1024
+    SHADOW_BATCH_SIZE: int = 32
+    SHADOW_BUFFER_SIZE: int = 10_000
+
+    # Serve a version's quantized artifact when its benchmarked held-out
+    # score is at most this much worse and its p50 latency this many times lower
+    QUANTIZED_SERVING: bool = True
+    QUANTIZED_MAX_SCORE_DROP: float = 0.01
+    QUANTIZED_MIN_SPEEDUP: float = 1.1
+
+    # Inference executor (default workers per model when the config sets none)
+    INFERENCE_EXECUTOR_WORKERS: int = 2
+    # Reuse preallocated ORT input/output buffers per batch-size bucket
+    INFERENCE_IO_BINDING: bool = True
+
+    # Memory budget for loaded model sessions (0 = unbounded): least recently
+    # used non-champion versions are unloaded beyond it and reloaded on demand.
+    # A session's footprint is estimated as artifact size x this factor.
+    MODEL_MEMORY_BUDGET_MB: int = 0
+    MODEL_FOOTPRINT_FACTOR: float = 2.0
+
+    # Memory-map initializers of at least this size from a weights file
+    # shared by all sessions and worker processes (disables weight prepacking).
+    # Unset: enabled when serving with more than one worker (SERVER_WORKERS)
+    SHARED_WEIGHTS: bool | None = None
+    SHARED_WEIGHTS_MIN_TENSOR_KB: int = 64
+
+    # Persist each model's ORT-optimized graph (keyed by model hash, ORT
+    # version and session options) and load it with optimization disabled
+    OPTIMIZED_GRAPH_CACHE: bool = True
+    OPTIMIZED_GRAPH_DIR: str = "/tmp/phoenix/optimized_graphs"
+
+    # Startup warm-up: preload every configured model and run synthetic
+    # batches at each padded batch size before reporting ready
+    WARMUP_ENABLED: bool = True
+    WARMUP_ITERATIONS: int = 2
+
+    # Champion hot swap: how long the replaced version may take to finish
+    # its queued batches before it is left loaded, and the window of
+    # prediction latencies its added p99 is measured against
+    HOT_SWAP_DRAIN_TIMEOUT_S: float = 30.0
+    HOT_SWAP_LATENCY_WINDOW_S: float = 60.0
+
     # Storage
     CACHE_DIR: str = "/tmp/phoenix/model_cache"
     ARTIFACT_STORAGE_DIR: str = "/tmp/phoenix/remote_storage"
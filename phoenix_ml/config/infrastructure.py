@@ -26,6 +26,8 @@ class InfrastructureSettings(BaseSettings):
 
     # Model Registry Backend
     MODEL_REGISTRY_BACKEND: str = "postgres"
+    # Seconds between background reloads of the in-process registry snapshot
+    REGISTRY_SNAPSHOT_REFRESH_S: float = 30.0
 
     # Airflow
     AIRFLOW_API_URL: str = "http://localhost:8080/api/v1"
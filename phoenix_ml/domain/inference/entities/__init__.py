@@ -1,6 +1,7 @@
-"""Inference entities — Model, Prediction."""
+"""Inference entities — Model, Prediction, PredictionBatch."""
 
 from phoenix_ml.domain.inference.entities.model import Model
 from phoenix_ml.domain.inference.entities.prediction import Prediction
+from phoenix_ml.domain.inference.entities.prediction_batch import PredictionBatch
 
-__all__ = ["Model", "Prediction"]
+__all__ = ["Model", "Prediction", "PredictionBatch"]
@@ -0,0 +1,108 @@
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from phoenix_ml.domain.inference.entities.prediction import Prediction
+from phoenix_ml.domain.inference.value_objects.confidence_score import ConfidenceScore
+
+
+@dataclass(frozen=True)
+class PredictionBatch:
+    """
+    Columnar result of a batch inference call.
+
+    Holds one row per input as NumPy arrays instead of a list of
+    ``Prediction`` entities, so decoding a batch stays vectorized.
+    Per-row ``Prediction`` objects are built lazily by ``prediction()``
+    or ``to_predictions()`` only for the rows a caller needs.
+
+    Attributes:
+        results: Decoded output per row (class label, regression value
+            or raw row for unrecognised output shapes).
+        confidences: Confidence per row, already clamped to [0, 1].
+        raw: Raw model output the results were decoded from
+            (logits, probabilities or regression column), if any.
+    """
+
+    model_id: str
+    model_version: str
+    results: np.ndarray
+    confidences: np.ndarray
+    latency_ms: float
+    raw: np.ndarray | None = None
+
+    def __post_init__(self) -> None:
+        if len(self.results) != len(self.confidences):
+            raise ValueError(
+                f"results ({len(self.results)}) and confidences "
+                f"({len(self.confidences)}) must have the same length"
+            )
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    def __iter__(self) -> Iterator[Prediction]:
+        return iter(self.to_predictions())
+
+    def head(self, n: int) -> "PredictionBatch":
+        """Return the first ``n`` rows (e.g. to drop batch padding)."""
+        if n >= len(self):
+            return self
+        return PredictionBatch(
+            model_id=self.model_id,
+            model_version=self.model_version,
+            results=self.results[:n],
+            confidences=self.confidences[:n],
+            latency_ms=self.latency_ms,
+            raw=None if self.raw is None else self.raw[:n],
+        )
+
+    def prediction(self, index: int) -> Prediction:
+        """Materialize the ``Prediction`` entity for a single row."""
+        return self._build(_to_python(self.results[index]), float(self.confidences[index]))
+
+    def columns(self) -> tuple[list[Any], list[float]]:
+        """Results and confidences as plain Python lists (e.g. for JSON)."""
+        results = self.results.tolist()
+        if self.results.dtype == object:
+            results = [_to_python(r) for r in results]
+        return results, self.confidences.tolist()
+
+    def to_predictions(self) -> list[Prediction]:
+        """Materialize a ``Prediction`` entity for every row."""
+        results = self.results.tolist()
+        confidences = self.confidences.tolist()
+        return [self._build(r, c) for r, c in zip(results, confidences, strict=True)]
+
+    def _build(self, result: Any, confidence: float) -> Prediction:
+        # Values were validated when the columns were decoded; skip re-validation.
+        return Prediction.model_construct(
+            model_id=self.model_id,
+            model_version=self.model_version,
+            result=result,
+            confidence=ConfidenceScore.model_construct(value=confidence),
+            latency_ms=self.latency_ms,
+        )
+
+    @classmethod
+    def from_predictions(cls, predictions: list[Prediction]) -> "PredictionBatch":
+        """Wrap row-wise predictions (engines without a columnar path)."""
+        if not predictions:
+            raise ValueError("Cannot build a PredictionBatch from no predictions")
+        first = predictions[0]
+        results = np.empty(len(predictions), dtype=object)
+        for i, prediction in enumerate(predictions):
+            results[i] = prediction.result
+        return cls(
+            model_id=first.model_id,
+            model_version=first.model_version,
+            results=results,
+            confidences=np.array([p.confidence.value for p in predictions], dtype=np.float64),
+            latency_ms=first.latency_ms,
+        )
+
+
+def _to_python(value: Any) -> Any:
+    return value.tolist() if hasattr(value, "tolist") else value
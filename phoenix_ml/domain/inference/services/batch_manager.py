@@ -1,118 +1,453 @@
 import asyncio
+import functools
+import math
 import time
-from dataclasses import dataclass
+from collections import Counter
+from dataclasses import dataclass, field
 from typing import Any
 
 from phoenix_ml.domain.inference.entities.model import Model
 from phoenix_ml.domain.inference.entities.prediction import Prediction
+from phoenix_ml.domain.inference.entities.prediction_batch import PredictionBatch
+from phoenix_ml.domain.inference.services.batch_policy import (
+    AdaptiveBatchPolicy,
+    BatchDecision,
+)
+from phoenix_ml.domain.inference.services.batch_scheduler import BatchScheduler
 from phoenix_ml.domain.inference.services.inference_engine import InferenceEngine
-from phoenix_ml.domain.inference.value_objects.feature_vector import FeatureVector
+from phoenix_ml.domain.inference.services.request_lanes import (
+    NO_DEADLINE,
+    PendingRequest,
+    RequestLanes,
+)
+from phoenix_ml.domain.inference.services.single_flight import SingleFlight, flight_key
+from phoenix_ml.domain.inference.value_objects.feature_vector import FeatureMatrix, FeatureVector
+from phoenix_ml.domain.inference.value_objects.latency_budget import LatencyBudget
+from phoenix_ml.domain.inference.value_objects.request_priority import RequestPriority
+from phoenix_ml.domain.monitoring.services.metrics_publisher import MetricsPublisher
+from phoenix_ml.shared.exceptions import DeadlineExceededError, OverloadedError
+
+# Smoothing factor of the per-model batch cost average used by admission
+_COST_EWMA_ALPHA = 0.2
+# How often ``drain`` checks whether a model's work has finished
+_DRAIN_POLL_S = 0.005
 
 
 @dataclass
 class BatchConfig:
+    """Batching parameters.
+
+    With ``adaptive=True`` the static ``max_batch_size``/``max_wait_time_ms``
+    only seed the policy; each model then gets an ``AdaptiveBatchPolicy``
+    that sizes batches to keep p99 latency inside ``latency_budget``
+    (overridable per model id via ``model_latency_budgets``).
+
+    ``interactive_share`` is the fraction of every batch reserved for
+    ``RequestPriority.INTERACTIVE`` requests when any are waiting.
+
+    With ``coalesce=True`` identical queued requests (same model version
+    and feature bytes) share one batch slot (see ``SingleFlight``).
+
+    Admission control: a model's queue holds at most ``max_queue_depth``
+    requests (``None`` for unbounded), at most ``max_concurrent_batches``
+    engine batches run at once per model, and a request whose estimated
+    queue wait exceeds its deadline is shed with ``OverloadedError``.
+    """
+
     max_batch_size: int = 32
     max_wait_time_ms: float = 10.0
     enabled: bool = True
+    adaptive: bool = False
+    latency_budget: LatencyBudget = field(default_factory=lambda: LatencyBudget(50.0))
+    adaptive_max_batch_size: int = 256
+    model_latency_budgets: dict[str, LatencyBudget] = field(default_factory=dict)
+    interactive_share: float = 0.5
+    coalesce: bool = True
+    max_queue_depth: int | None = None
+    max_concurrent_batches: int = 1
 
 
 class BatchManager:
     """
     Manages dynamic batching of inference requests to optimize throughput.
     Accumulates requests over a short window and executes them as a single batch.
+
+    Requests wait in per-model priority lanes (see ``RequestLanes``) and
+    batches are formed earliest-deadline-first. Requests whose deadline
+    has passed are failed with ``DeadlineExceededError`` before they
+    reach the engine.
+
+    With a ``BatchScheduler`` every engine batch (queued or from
+    ``predict_matrix``) first waits for one of its slots, which are
+    shared fairly by all models instead of every model running at once.
     """
 
-    def __init__(self, engine: InferenceEngine, config: BatchConfig | None = None) -> None:
+    def __init__(
+        self,
+        engine: InferenceEngine,
+        config: BatchConfig | None = None,
+        metrics_publisher: MetricsPublisher | None = None,
+        scheduler: BatchScheduler | None = None,
+    ) -> None:
         self._engine = engine
         self._config = config or BatchConfig()
-        self._queues: dict[
-            str, asyncio.Queue[tuple[FeatureVector, asyncio.Future[Prediction]]]
-        ] = {}
+        self._metrics = metrics_publisher
+        self._scheduler = scheduler
+        self._queues: dict[str, RequestLanes] = {}
         self._running_tasks: dict[str, asyncio.Task[Any]] = {}
+        self._policies: dict[str, AdaptiveBatchPolicy] = {}
+        self._flights = SingleFlight()
+        # Per model: smoothed engine time of a batch and the last applied cap
+        self._batch_cost_ms: dict[str, float] = {}
+        self._batch_caps: dict[str, int] = {}
+        # Per model: engine batches (queued or matrix) currently running
+        self._active_batches: Counter[str] = Counter()
         self._lock = asyncio.Lock()
 
-    async def predict(self, model: Model, features: FeatureVector) -> Prediction:
+    async def predict(
+        self,
+        model: Model,
+        features: FeatureVector,
+        priority: RequestPriority = RequestPriority.INTERACTIVE,
+        deadline: float | None = None,
+    ) -> Prediction:
         """
         Submits a prediction request to the batcher.
         Returns a future that will be resolved once the batch is processed.
+
+        ``deadline`` is a ``time.monotonic()`` timestamp after which the
+        request is no longer worth running. A duplicate of a request that
+        is already queued awaits that request's result instead.
         """
+        if deadline is not None and deadline <= time.monotonic():
+            raise DeadlineExceededError(model.id)
+
         if not self._config.enabled:
             return await self._engine.predict(model, features)
 
+        key = flight_key(model, features) if self._config.coalesce else None
+        if key is not None:
+            shared = self._flights.join(key, priority, deadline)
+            if shared is not None:
+                if self._metrics is not None:
+                    self._metrics.record_coalesced(model.id, model.version)
+                return await self._flights.wait(key, shared)
+
         async with self._lock:
             if model.unique_key not in self._queues:
-                self._queues[model.unique_key] = asyncio.Queue()
+                self._queues[model.unique_key] = RequestLanes(self._config.interactive_share)
+                if self._config.adaptive:
+                    self._policies[model.unique_key] = self._create_policy(model)
                 self._running_tasks[model.unique_key] = asyncio.create_task(
                     self._batch_worker(model),
                     name=f"batch_worker_{model.unique_key}",
                 )
 
+        lanes = self._queues[model.unique_key]
+        self._admit(model, lanes, deadline)
+
+        policy = self._policies.get(model.unique_key)
+        if policy is not None:
+            policy.record_arrival()
+
         future: asyncio.Future[Prediction] = asyncio.Future()
-        await self._queues[model.unique_key].put((features, future))
+        lanes.push(features, future, priority, deadline)
+        if key is not None and self._flights.lead(key, future, priority, deadline):
+            return await self._flights.wait(key, future)
         return await future
 
-    async def _batch_worker(self, model: Model) -> None:  # noqa: PLR0912
+    @property
+    def max_batch_rows(self) -> int:
+        """Largest batch the engine is asked to run (e.g. to chunk big matrices)."""
+        if self._config.adaptive:
+            return self._config.adaptive_max_batch_size
+        return self._config.max_batch_size
+
+    async def predict_matrix(
+        self, model: Model, features: FeatureMatrix, deadline: float | None = None
+    ) -> PredictionBatch:
+        """
+        Runs a caller-assembled (N, D) batch in one engine call.
+        The matrix is already a batch, so it bypasses the request queue;
+        its cost still feeds the model's adaptive policy.
+        """
+        self._active_batches[model.unique_key] += 1
+        try:
+            if self._scheduler is not None:
+                async with self._scheduler.slot(model, len(features)):
+                    return await self._run_matrix(model, features, deadline)
+            return await self._run_matrix(model, features, deadline)
+        finally:
+            self._batch_done(model.unique_key)
+
+    async def predict_shadow(self, model: Model, features: FeatureMatrix) -> PredictionBatch:
+        """
+        Runs a shadow (N, D) batch on spare capacity only.
+
+        With a scheduler the batch waits for an idle slot (see
+        ``BatchScheduler.idle_slot``) and never competes with live batches
+        for one. Shadow cost is kept out of the adaptive policy and
+        admission estimates so it cannot steer live batching.
+        """
+        if self._scheduler is not None:
+            async with self._scheduler.idle_slot():
+                return await self._engine.batch_predict_matrix(model, features)
+        return await self._engine.batch_predict_matrix(model, features)
+
+    async def _run_matrix(
+        self, model: Model, features: FeatureMatrix, deadline: float | None
+    ) -> PredictionBatch:
+        if deadline is not None and deadline <= time.monotonic():
+            raise DeadlineExceededError(model.id)
+        start = time.perf_counter()
+        batch = await self._engine.batch_predict_matrix(model, features)
+        policy = self._policies.get(model.unique_key)
+        if policy is not None:
+            policy.record_batch(len(features), (time.perf_counter() - start) * 1000.0)
+        return batch
+
+    def estimate_queue_wait_ms(self, model: Model) -> float:
+        """
+        Expected wait of a request queued for ``model`` now: the batches
+        ahead of it (including its own) times the observed batch cost,
+        spread over the concurrent batch slots. 0.0 before any batch ran.
+        """
+        lanes = self._queues.get(model.unique_key)
+        cost_ms = self._batch_cost_ms.get(model.unique_key, 0.0)
+        if lanes is None or cost_ms == 0.0:
+            return 0.0
+        cap = self._batch_caps.get(model.unique_key, self._config.max_batch_size)
+        batches_ahead = len(lanes) // max(1, cap) + 1
+        return batches_ahead * cost_ms / max(1, self._config.max_concurrent_batches)
+
+    def _admit(self, model: Model, lanes: RequestLanes, deadline: float | None) -> None:
+        """Shed the request when the queue is full or it would miss its deadline."""
+        max_depth = self._config.max_queue_depth
+        wait_ms = self.estimate_queue_wait_ms(model)
+        if max_depth is not None and len(lanes) >= max_depth:
+            reason = "queue_full"
+        elif deadline is not None and time.monotonic() + wait_ms / 1000.0 > deadline:
+            reason = "deadline"
+        else:
+            return
+
+        if self._metrics is not None:
+            self._metrics.record_shed(model.id, model.version, reason)
+        # Suggest retrying once the current backlog has drained
+        raise OverloadedError(model.id, reason, retry_after_s=max(1.0, math.ceil(wait_ms / 1000.0)))
+
+    def batch_decision(self, model: Model) -> BatchDecision:
+        """Return the batch cap and wait window currently applied to ``model``."""
+        policy = self._policies.get(model.unique_key)
+        if policy is None:
+            return BatchDecision(
+                max_batch_size=self._config.max_batch_size,
+                max_wait_time_ms=self._config.max_wait_time_ms,
+            )
+        return policy.decide()
+
+    def _create_policy(self, model: Model) -> AdaptiveBatchPolicy:
+        budget = self._config.model_latency_budgets.get(model.id, self._config.latency_budget)
+        return AdaptiveBatchPolicy(
+            budget=budget,
+            max_batch_size=self._config.adaptive_max_batch_size,
+            initial=BatchDecision(
+                max_batch_size=min(
+                    self._config.max_batch_size, self._config.adaptive_max_batch_size
+                ),
+                max_wait_time_ms=min(self._config.max_wait_time_ms, budget.max_latency_ms),
+            ),
+        )
+
+    def _publish_decision(
+        self, model: Model, decision: BatchDecision, previous: BatchDecision | None
+    ) -> None:
+        if self._metrics is None or decision == previous:
+            return
+        self._metrics.record_batch_policy(
+            model.id,
+            model.version,
+            decision.max_batch_size,
+            decision.max_wait_time_ms,
+        )
+
+    async def _batch_worker(self, model: Model) -> None:
         """
-        Worker loop that pulls requests from the queue and processes them in batches.
+        Worker loop that pulls requests from the lanes and processes them in batches.
         """
-        queue = self._queues[model.unique_key]
+        lanes = self._queues[model.unique_key]
+        policy = self._policies.get(model.unique_key)
+        last_decision: BatchDecision | None = None
+        # One permit per engine batch allowed in flight for this model
+        slots = asyncio.Semaphore(max(1, self._config.max_concurrent_batches))
+        in_flight: set[asyncio.Task[None]] = set()
 
         try:
             while True:
-                batch_items: list[tuple[FeatureVector, asyncio.Future[Prediction]]] = []
+                while not len(lanes):
+                    await lanes.wait_changed()
 
+                # Form the batch only once it can run, so it is as full as possible
+                await slots.acquire()
+                scheduled = False
                 try:
-                    item = await queue.get()
-                except asyncio.CancelledError:
-                    break
+                    decision = self.batch_decision(model)
+                    self._publish_decision(model, decision, last_decision)
+                    last_decision = decision
+                    self._batch_caps[model.unique_key] = decision.max_batch_size
 
-                batch_items.append(item)
+                    await self._fill_window(lanes, decision, policy)
 
-                deadline = time.time() + (self._config.max_wait_time_ms / 1000.0)
+                    if self._scheduler is not None:
+                        await self._scheduler.acquire(
+                            model, min(len(lanes), decision.max_batch_size)
+                        )
+                        scheduled = True
 
-                while len(batch_items) < self._config.max_batch_size:
-                    wait_time = deadline - time.time()
-                    if wait_time <= 0:
-                        break
+                    self._expire(model, lanes.drop_expired(time.monotonic()))
+                    # Callers that gave up (cancelled futures) get no engine time either
+                    batch_items = [
+                        r for r in lanes.take(decision.max_batch_size) if not r.future.done()
+                    ]
+                except BaseException:
+                    self._release(slots, scheduled)
+                    raise
+                if not batch_items:
+                    self._release(slots, scheduled)
+                    continue
 
-                    try:
-                        item = await asyncio.wait_for(queue.get(), timeout=wait_time)
-                        batch_items.append(item)
-                    except TimeoutError:
-                        break
-                    except asyncio.CancelledError:
-                        raise
+                task = asyncio.create_task(self._run_batch(model, batch_items, policy))
+                in_flight.add(task)
+                self._active_batches[model.unique_key] += 1
+                task.add_done_callback(in_flight.discard)
+                task.add_done_callback(functools.partial(self._batch_done, model.unique_key))
+                task.add_done_callback(functools.partial(self._release, slots, scheduled))
+        except asyncio.CancelledError:
+            pass
+        finally:
+            for task in list(in_flight):
+                task.cancel()
+            for request in lanes.drain():
+                if not request.future.done():
+                    request.future.set_exception(RuntimeError("Batch worker shutting down"))
 
-                if batch_items:
-                    features_list = [item[0] for item in batch_items]
-                    futures = [item[1] for item in batch_items]
+    def _batch_done(self, key: str, *_: object) -> None:
+        self._active_batches[key] -= 1
+        if self._active_batches[key] <= 0:
+            del self._active_batches[key]
 
-                    padded_features_list = self._pad_batch(features_list)
+    def _release(self, slots: asyncio.Semaphore, scheduled: bool, *_: object) -> None:
+        """Free the model's batch slot (and the scheduler slot, if one was granted)."""
+        slots.release()
+        if scheduled and self._scheduler is not None:
+            self._scheduler.release()
 
-                    try:
-                        predictions = await self._engine.batch_predict(model, padded_features_list)
+    async def _fill_window(
+        self,
+        lanes: RequestLanes,
+        decision: BatchDecision,
+        policy: AdaptiveBatchPolicy | None,
+    ) -> None:
+        """
+        Wait for the batch to fill up or the wait window to close.
+        The window closes at once when the earliest deadline would not
+        survive it (plus the estimated engine time).
+        """
+        window_end = time.monotonic() + (decision.max_wait_time_ms / 1000.0)
 
-                        predictions = predictions[: len(features_list)]
+        while len(lanes) < decision.max_batch_size:
+            earliest = lanes.earliest_deadline()
+            if earliest != NO_DEADLINE:
+                cost_ms = policy.estimate_cost_ms(decision.max_batch_size) if policy else 0.0
+                if earliest - cost_ms / 1000.0 <= window_end:
+                    return
+            wait_time = window_end - time.monotonic()
+            if wait_time <= 0 or not await lanes.wait_changed(wait_time):
+                return
 
-                        for i, prediction in enumerate(predictions):
-                            if not futures[i].done():
-                                futures[i].set_result(prediction)
+    async def _run_batch(
+        self,
+        model: Model,
+        batch_items: list[PendingRequest],
+        policy: AdaptiveBatchPolicy | None,
+    ) -> None:
+        features_list = [item.features for item in batch_items]
+        padded_features_list = self._pad_batch(features_list)
+
+        try:
+            engine_start = time.perf_counter()
+            batch = await self._engine.batch_predict_columnar(model, padded_features_list)
+            cost_ms = (time.perf_counter() - engine_start) * 1000.0
+            if policy is not None:
+                policy.record_batch(len(padded_features_list), cost_ms)
+            previous = self._batch_cost_ms.get(model.unique_key)
+            self._batch_cost_ms[model.unique_key] = (
+                cost_ms if previous is None else previous + _COST_EWMA_ALPHA * (cost_ms - previous)
+            )
+
+            # Padding rows are never materialized as Predictions
+            batch = batch.head(len(features_list))
+
+            for i, item in enumerate(batch_items):
+                if not item.future.done():
+                    item.future.set_result(batch.prediction(i))
 
-                    except Exception as e:
-                        for future in futures:
-                            if not future.done():
-                                future.set_exception(e)
-                    finally:
-                        for _ in range(len(batch_items)):
-                            queue.task_done()
         except asyncio.CancelledError:
-            pass
-        finally:
-            while not queue.empty():
-                _, future = queue.get_nowait()
-                if not future.done():
-                    future.set_exception(RuntimeError("Batch worker shutting down"))
-                queue.task_done()
+            for item in batch_items:
+                if not item.future.done():
+                    item.future.set_exception(RuntimeError("Batch worker shutting down"))
+            raise
+        except Exception as e:
+            for item in batch_items:
+                if not item.future.done():
+                    item.future.set_exception(e)
+
+    def _expire(self, model: Model, expired: list[PendingRequest]) -> None:
+        for request in expired:
+            if not request.future.done():
+                request.future.set_exception(DeadlineExceededError(model.id))
+        if expired and self._metrics is not None:
+            for priority in {r.priority for r in expired}:
+                self._metrics.record_deadline_miss(
+                    model.id,
+                    model.version,
+                    priority.value,
+                    sum(1 for r in expired if r.priority is priority),
+                )
+
+    def _has_work(self, key: str) -> bool:
+        lanes = self._queues.get(key)
+        return (lanes is not None and len(lanes) > 0) or key in self._active_batches
+
+    async def drain(self, model: Model, timeout_s: float = 30.0) -> bool:
+        """
+        Wait until ``model``'s queued requests and running batches have
+        finished, then stop its batch worker and drop its state. Call once
+        no new traffic is routed to the version (e.g. after a hot swap).
+        Returns False when work is still pending after ``timeout_s``; the
+        worker then keeps running so no queued request is failed.
+        """
+        key = model.unique_key
+        deadline = time.monotonic() + timeout_s
+        while True:
+            if not self._has_work(key):
+                async with self._lock:
+                    # A request may have been queued while waiting for the lock
+                    if not self._has_work(key):
+                        task = self._running_tasks.pop(key, None)
+                        self._queues.pop(key, None)
+                        self._policies.pop(key, None)
+                        self._batch_cost_ms.pop(key, None)
+                        self._batch_caps.pop(key, None)
+                        break
+            if time.monotonic() >= deadline:
+                return False
+            await asyncio.sleep(_DRAIN_POLL_S)
+
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        return True
 
     async def stop(self) -> None:
         """Cancel all worker tasks and cleanup"""
@@ -130,6 +465,10 @@ class BatchManager:
         finally:
             self._running_tasks.clear()
             self._queues.clear()
+            self._policies.clear()
+            self._batch_cost_ms.clear()
+            self._batch_caps.clear()
+            self._active_batches.clear()
 
     def _pad_batch(self, features_list: list[FeatureVector]) -> list[FeatureVector]:
         """
@@ -0,0 +1,181 @@
+"""SLO-driven adaptive batching policy.
+
+Learns the request arrival rate and the engine cost per batch size
+online, then picks the batching window and batch cap that keep the
+estimated p99 latency of a request inside a ``LatencyBudget``.
+"""
+
+import math
+import time
+from dataclasses import dataclass
+
+from phoenix_ml.domain.inference.value_objects.latency_budget import LatencyBudget
+
+# z-score of the 99th percentile for a normal approximation of engine cost
+_P99_Z = 2.326
+
+
+@dataclass(frozen=True)
+class BatchDecision:
+    """Batch cap and wait window chosen for the next batch."""
+
+    max_batch_size: int
+    max_wait_time_ms: float
+
+
+class _EwmaStat:
+    """Exponentially weighted mean and variance of a stream of samples."""
+
+    __slots__ = ("_alpha", "count", "mean", "var")
+
+    def __init__(self, alpha: float) -> None:
+        self._alpha = alpha
+        self.count = 0
+        self.mean = 0.0
+        self.var = 0.0
+
+    def update(self, sample: float) -> None:
+        if self.count == 0:
+            self.mean = sample
+        else:
+            delta = sample - self.mean
+            self.mean += self._alpha * delta
+            self.var = (1 - self._alpha) * (self.var + self._alpha * delta * delta)
+        self.count += 1
+
+    @property
+    def p99(self) -> float:
+        return self.mean + _P99_Z * math.sqrt(self.var)
+
+
+class AdaptiveBatchPolicy:
+    """
+    Online estimator that sizes batches for a single model.
+
+    Batch sizes are considered in power-of-two buckets (the sizes the
+    ``BatchManager`` pads to). The policy picks the *smallest* bucket
+    whose throughput (``size / cost(size)``) keeps up with the observed
+    arrival rate with ``utilization`` headroom, and waits only as long
+    as it takes to fill that bucket. While unbatched execution keeps up,
+    requests are therefore dispatched immediately. When no bucket both
+    keeps up and fits the budget, it falls back to the largest bucket
+    that still fits (the budget wins; overload is left to load shedding).
+
+    Latency of the first request in a batch is estimated as::
+
+        cost(size)        # queueing: the previous batch still on the engine
+        + fill(size)      # waiting for the batch to fill
+        + cost(size)      # its own engine call
+
+    i.e. one in-flight batch of the same size is charged to every request,
+    so the window is only opened when the budget leaves room for it.
+    """
+
+    def __init__(
+        self,
+        budget: LatencyBudget,
+        max_batch_size: int = 256,
+        initial: BatchDecision | None = None,
+        smoothing: float = 0.2,
+        utilization: float = 0.8,
+    ) -> None:
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        if not 0 < smoothing <= 1:
+            raise ValueError("smoothing must be in (0, 1]")
+        if not 0 < utilization <= 1:
+            raise ValueError("utilization must be in (0, 1]")
+
+        self._budget = budget
+        self._max_batch_size = max_batch_size
+        self._initial = initial or BatchDecision(
+            max_batch_size=min(32, max_batch_size), max_wait_time_ms=0.0
+        )
+        self._smoothing = smoothing
+        self._utilization = utilization
+
+        self._gap_ms = _EwmaStat(smoothing)
+        self._last_arrival: float | None = None
+        self._costs: dict[int, _EwmaStat] = {}
+
+    @property
+    def budget(self) -> LatencyBudget:
+        return self._budget
+
+    def record_arrival(self, now: float | None = None) -> None:
+        """Record that a request was enqueued at ``now`` (monotonic seconds)."""
+        now = time.monotonic() if now is None else now
+        if self._last_arrival is not None:
+            self._gap_ms.update((now - self._last_arrival) * 1000.0)
+        self._last_arrival = now
+
+    def record_batch(self, batch_size: int, engine_ms: float) -> None:
+        """Record the engine time spent on a (padded) batch of ``batch_size`` rows."""
+        bucket = _bucket(batch_size)
+        stat = self._costs.get(bucket)
+        if stat is None:
+            stat = self._costs[bucket] = _EwmaStat(self._smoothing)
+        stat.update(engine_ms)
+
+    def arrival_gap_ms(self, now: float | None = None) -> float:
+        """Estimated mean time between arrivals, decayed while traffic is idle."""
+        if self._gap_ms.count == 0 or self._last_arrival is None:
+            return math.inf
+        now = time.monotonic() if now is None else now
+        idle_ms = (now - self._last_arrival) * 1000.0
+        return max(self._gap_ms.mean, idle_ms)
+
+    def estimate_cost_ms(self, batch_size: int) -> float:
+        """Estimated p99 engine cost for a batch padded to ``batch_size`` (0 if unobserved)."""
+        bucket = _bucket(batch_size)
+        stat = self._costs.get(bucket)
+        if stat is not None:
+            return stat.p99
+
+        # Unobserved bucket: fit cost(n) = a + b*n through the observed buckets.
+        points = [(n, s.p99) for n, s in self._costs.items()]
+        if not points:
+            return 0.0
+        if len(points) == 1:
+            n0, c0 = points[0]
+            # Assume half of the cost is fixed per-call overhead
+            return c0 / 2 + (c0 / 2) * bucket / n0
+
+        mean_n = sum(n for n, _ in points) / len(points)
+        mean_c = sum(c for _, c in points) / len(points)
+        var_n = sum((n - mean_n) ** 2 for n, _ in points)
+        slope = sum((n - mean_n) * (c - mean_c) for n, c in points) / var_n
+        slope = max(slope, 0.0)
+        intercept = max(mean_c - slope * mean_n, 0.0)
+        return intercept + slope * bucket
+
+    def decide(self, now: float | None = None) -> BatchDecision:
+        """Choose the batch cap and wait window for the next batch."""
+        if not self._costs:
+            return self._initial
+
+        budget_ms = self._budget.max_latency_ms
+        gap_ms = self.arrival_gap_ms(now)
+
+        largest_fitting = BatchDecision(max_batch_size=1, max_wait_time_ms=0.0)
+        size = 1
+        while size <= self._max_batch_size:
+            cost_ms = self.estimate_cost_ms(size)
+            fill_ms = (size - 1) * gap_ms if size > 1 else 0.0
+            slack_ms = budget_ms - 2 * cost_ms
+            keeps_up = cost_ms <= size * gap_ms * self._utilization
+
+            fits = fill_ms <= slack_ms
+
+            if keeps_up and fits:
+                return BatchDecision(max_batch_size=size, max_wait_time_ms=fill_ms)
+            if fits:
+                largest_fitting = BatchDecision(max_batch_size=size, max_wait_time_ms=fill_ms)
+            size *= 2
+
+        return largest_fitting
+
+
+def _bucket(batch_size: int) -> int:
+    """Round a batch size up to the next power of two."""
+    return 1 << max(batch_size - 1, 0).bit_length()
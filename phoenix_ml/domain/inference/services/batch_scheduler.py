@@ -0,0 +1,166 @@
+"""
+Cross-model batch scheduling.
+
+Every model has its own batch worker; without coordination they all
+call the engine at once, oversubscribing the CPU, and a hot model
+starves the rest. ``BatchScheduler`` owns a fixed number of execution
+slots shared by all models and hands a freed slot to the waiting batch
+with the smallest weighted-fair-queuing finish tag.
+
+Shadow batches (see ``ShadowRunner``) are not a fair-share tenant: they
+take a slot only while no live batch is waiting and at least one other
+slot stays free, so they never delay live traffic.
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+
+from phoenix_ml.domain.inference.entities.model import Model
+from phoenix_ml.domain.monitoring.services.metrics_publisher import MetricsPublisher
+
+
+@dataclass(order=True, slots=True)
+class _Waiter:
+    finish: float
+    seq: int
+    start: float = field(compare=False)
+    future: asyncio.Future[None] = field(compare=False)
+
+
+class BatchScheduler:
+    """
+    Weighted fair queuing over a fixed pool of engine slots.
+
+    A batch of ``cost`` rows for a model with weight ``w`` is tagged
+    ``start = max(V, last_finish[model])`` and ``finish = start + cost / w``,
+    where ``V`` is the start tag of the most recently dispatched batch.
+    Under contention each model receives slot time in proportion to its
+    weight; an idle model does not bank credit. Weights are keyed by
+    model id (default ``default_weight``). Not thread-safe: used from the
+    event loop only.
+    """
+
+    def __init__(
+        self,
+        slots: int,
+        weights: dict[str, float] | None = None,
+        default_weight: float = 1.0,
+        metrics_publisher: MetricsPublisher | None = None,
+    ) -> None:
+        if slots < 1:
+            raise ValueError("slots must be at least 1")
+        if default_weight <= 0:
+            raise ValueError("default_weight must be positive")
+        self._slots = slots
+        self._weights: dict[str, float] = {}
+        for model_id, weight in (weights or {}).items():
+            self.set_weight(model_id, weight)
+        self._default_weight = default_weight
+        self._metrics = metrics_publisher
+        self._in_use = 0
+        self._virtual_time = 0.0
+        self._last_finish: dict[str, float] = {}
+        self._waiters: list[_Waiter] = []
+        self._seq = itertools.count()
+
+    @property
+    def slots(self) -> int:
+        return self._slots
+
+    @property
+    def in_use(self) -> int:
+        return self._in_use
+
+    @property
+    def waiting(self) -> int:
+        return sum(1 for w in self._waiters if not w.future.done())
+
+    def weight(self, model_id: str) -> float:
+        return self._weights.get(model_id, self._default_weight)
+
+    def set_weight(self, model_id: str, weight: float) -> None:
+        if weight <= 0:
+            raise ValueError(f"weight for '{model_id}' must be positive")
+        self._weights[model_id] = weight
+
+    async def acquire(self, model: Model, cost: float = 1.0) -> None:
+        """Wait for an execution slot for a batch of ``cost`` rows of ``model``."""
+        weight = self.weight(model.id)
+        start = max(self._virtual_time, self._last_finish.get(model.unique_key, 0.0))
+        finish = start + max(cost, 1.0) / weight
+        self._last_finish[model.unique_key] = finish
+        queued_at = time.perf_counter()
+
+        if self._in_use < self._slots and not self._waiters:
+            self._grant(start)
+        else:
+            future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+            heapq.heappush(self._waiters, _Waiter(finish, next(self._seq), start, future))
+            try:
+                await future
+            except asyncio.CancelledError:
+                if future.done() and not future.cancelled():
+                    # The slot was granted just as the caller gave up
+                    self.release()
+                raise
+
+        if self._metrics is not None:
+            self._metrics.record_scheduler_dispatch(
+                model.id,
+                model.version,
+                max(cost, 1.0) / weight,
+                (time.perf_counter() - queued_at) * 1000.0,
+            )
+
+    def release(self) -> None:
+        """Return a slot and hand it to the waiter with the smallest finish tag."""
+        self._in_use -= 1
+        while self._waiters and self._in_use < self._slots:
+            waiter = heapq.heappop(self._waiters)
+            if waiter.future.done():  # cancelled while waiting
+                continue
+            self._grant(waiter.start)
+            waiter.future.set_result(None)
+        self._publish_slots()
+
+    @asynccontextmanager
+    async def slot(self, model: Model, cost: float = 1.0) -> AsyncIterator[None]:
+        await self.acquire(model, cost)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def has_idle_slot(self) -> bool:
+        """True if a slot is free for background work without crowding live batches.
+
+        One slot is always kept for live traffic when there is more than
+        one; with a single slot it must be idle.
+        """
+        reserve = 1 if self._slots > 1 else 0
+        return self.waiting == 0 and self._in_use < self._slots - reserve
+
+    @asynccontextmanager
+    async def idle_slot(self, poll_s: float = 0.005) -> AsyncIterator[None]:
+        """Hold a slot granted only while ``has_idle_slot``; no WFQ tags are charged."""
+        while not self.has_idle_slot():
+            await asyncio.sleep(poll_s)
+        self._grant(self._virtual_time)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def _grant(self, start: float) -> None:
+        self._in_use += 1
+        self._virtual_time = max(self._virtual_time, start)
+        self._publish_slots()
+
+    def _publish_slots(self) -> None:
+        if self._metrics is not None:
+            self._metrics.record_scheduler_slots(self._in_use, self._slots)
@@ -1,8 +1,23 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
 
 from phoenix_ml.domain.inference.entities.model import Model
 from phoenix_ml.domain.inference.entities.prediction import Prediction
-from phoenix_ml.domain.inference.value_objects.feature_vector import FeatureVector
+from phoenix_ml.domain.inference.entities.prediction_batch import PredictionBatch
+from phoenix_ml.domain.inference.value_objects.feature_vector import FeatureMatrix, FeatureVector
+
+
+@dataclass(frozen=True)
+class EngineHandle:
+    """Engine-specific view of a loaded model: session, input name, dtype and width."""
+
+    session: Any = None
+    input_name: str | None = None
+    dtype: np.dtype[Any] = np.dtype(np.float32)
+    n_features: int | None = None
 
 
 class InferenceEngine(ABC):
@@ -28,6 +43,47 @@ class InferenceEngine(ABC):
         """Run batch inference for multiple inputs"""
         pass
 
+    async def batch_predict_columnar(
+        self, model: Model, features_list: list[FeatureVector]
+    ) -> PredictionBatch:
+        """
+        Run batch inference and return a columnar ``PredictionBatch``.
+        Engines with vectorized output decoding override this; the default
+        wraps ``batch_predict``.
+        """
+        return PredictionBatch.from_predictions(await self.batch_predict(model, features_list))
+
+    async def batch_predict_matrix(self, model: Model, features: FeatureMatrix) -> PredictionBatch:
+        """
+        Run batch inference on an (N, D) ``FeatureMatrix``.
+        Engines that can feed the matrix to the runtime as-is override
+        this; the default splits it into row views.
+        """
+        return await self.batch_predict_columnar(model, features.rows())
+
+    def engine_handle(self, model: Model) -> EngineHandle:
+        """
+        Describe the loaded model for a ``ModelRuntime`` handle.
+        Call after ``load``; engines without a local session return defaults.
+        """
+        return EngineHandle()
+
+    async def unload(self, model: Model) -> bool:
+        """
+        Release the loaded session of ``model`` (e.g. a replaced version).
+        Returns False when nothing was released; engines without local
+        sessions keep the default.
+        """
+        return False
+
+    def set_pinned(self, model: Model, pinned: bool) -> None:
+        """
+        Exempt ``model`` from memory-budget eviction (a champion) or make
+        it evictable again. Engines without a residency budget keep the
+        default no-op.
+        """
+        return
+
     @abstractmethod
     async def optimize(self, model: Model) -> None:
         """Apply engine-specific optimizations (e.g., quantization)"""
@@ -1,3 +1,6 @@
+import functools
+import logging
+from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -6,26 +9,54 @@ import numpy as np
 from phoenix_ml.domain.feature_store.repositories.feature_store import FeatureStore
 from phoenix_ml.domain.inference.entities.model import Model
 from phoenix_ml.domain.inference.entities.prediction import Prediction
+from phoenix_ml.domain.inference.entities.prediction_batch import PredictionBatch
 from phoenix_ml.domain.inference.services.batch_manager import BatchManager
 from phoenix_ml.domain.inference.services.inference_engine import InferenceEngine
+from phoenix_ml.domain.inference.services.model_cascade import ModelCascade
+from phoenix_ml.domain.inference.services.model_runtime import ModelRuntime, ModelRuntimeCache
+from phoenix_ml.domain.inference.services.processor_plugin import IPostprocessor
 from phoenix_ml.domain.inference.services.routing_strategy import RoutingStrategy
-from phoenix_ml.domain.inference.value_objects.feature_vector import FeatureVector
+from phoenix_ml.domain.inference.services.shadow_runner import ShadowRunner
+from phoenix_ml.domain.inference.services.variant_selector import VariantSelector
+from phoenix_ml.domain.inference.value_objects.cascade_options import CascadeOptions
+from phoenix_ml.domain.inference.value_objects.feature_vector import FeatureMatrix, FeatureVector
+from phoenix_ml.domain.inference.value_objects.request_priority import RequestPriority
 from phoenix_ml.domain.model_registry.repositories.artifact_storage import ArtifactStorage
 from phoenix_ml.domain.model_registry.repositories.model_repository import ModelRepository
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass(frozen=True)
 class PredictionRequest:
     model_id: str
     model_version: str | None = None
     entity_id: str | None = None
-    features: list[float] | None = None
+    # A list, or an already decoded row (e.g. from a binary tensor body)
+    features: list[float] | np.ndarray | None = None
+    priority: RequestPriority = RequestPriority.INTERACTIVE
+    # time.monotonic() timestamp after which the request is dropped
+    deadline: float | None = None
 
 
 class InferenceService:
     """
     Domain Service that orchestrates the inference flow.
     Coordinates between routing, feature retrieval, and batch processing.
+
+    Loaded models are served through ``ModelRuntime`` handles; pass a
+    shared ``runtime_cache`` so handles outlive the per-request service.
+
+    When the routing strategy names a shadow model (``ShadowStrategy``),
+    single predictions are also offered to ``shadow_runner`` once the
+    champion result is ready; the caller never waits for the shadow run.
+
+    Routed single predictions of a model with ``CascadeOptions`` go
+    through ``cascade``: its first-stage model answers and only
+    low-confidence requests reach the routed model.
+
+    ``variant_selector`` decides whether a version is loaded from its
+    registered artifact or from its benchmarked quantized variant.
     """
 
     def __init__(  # noqa: PLR0913
@@ -37,6 +68,11 @@ class InferenceService:
         artifact_storage: ArtifactStorage,
         routing_strategy: RoutingStrategy,
         cache_dir: Path | None = None,
+        runtime_cache: ModelRuntimeCache | None = None,
+        postprocessor_resolver: Callable[[str], IPostprocessor] | None = None,
+        shadow_runner: ShadowRunner | None = None,
+        cascade: ModelCascade | None = None,
+        variant_selector: VariantSelector | None = None,
     ) -> None:
         self._model_repo = model_repo
         self._inference_engine = inference_engine
@@ -45,47 +81,124 @@ class InferenceService:
         self._artifact_storage = artifact_storage
         self._routing_strategy = routing_strategy
         self._cache_dir = cache_dir or Path("/tmp/phoenix/model_cache")
+        self._runtime_cache = runtime_cache if runtime_cache is not None else ModelRuntimeCache()
+        self._postprocessor_resolver = postprocessor_resolver
+        self._shadow_runner = shadow_runner
+        self._cascade = cascade
+        self._variant_selector = variant_selector
 
     async def predict(self, request: PredictionRequest) -> Prediction:
         """
         Coordinates the full prediction flow.
         """
-        model = await self._select_model(request.model_id, request.model_version, request.entity_id)
-
-        local_model_path = self._cache_dir / model.id / model.version / "model.onnx"
-        if not local_model_path.exists():
-            await self._artifact_storage.download(model.uri, local_model_path)
+        model, shadow = await self._select_model(
+            request.model_id, request.model_version, request.entity_id
+        )
 
-        await self._inference_engine.load(model)
+        runtime = self._runtime_cache.get(model) or await self.load_runtime(model)
 
         feature_values = request.features
         if feature_values is None:
             if not request.entity_id:
                 raise ValueError("No features provided and no entity_id for lookup")
 
-            metadata = model.metadata or {}
-            required_features = metadata.get("features")
-            if not isinstance(required_features, list) or not required_features:
+            if not runtime.has_feature_list:
                 raise ValueError(
                     f"Model '{request.model_id}' has no feature list in metadata. "
                     "Provide features explicitly or configure model metadata."
                 )
 
             feature_values = await self._feature_store.get_online_features(
-                request.entity_id, required_features
+                request.entity_id, list(runtime.feature_names)
             )
 
             if feature_values is None:
                 raise ValueError(f"Features not found for entity {request.entity_id}")
 
-        feature_vector = FeatureVector(values=np.array(feature_values, dtype=np.float32))
+        # Inputs were validated at the API boundary; skip re-validation here
+        values = np.asarray(feature_values, dtype=runtime.dtype)
+        if values.size == 0:
+            raise ValueError("Feature vector cannot be empty")
+
+        prediction = await self._predict_routed(model, values, request)
+        if shadow is not None and self._shadow_runner is not None:
+            self._shadow_runner.submit(
+                prediction, shadow, values, functools.partial(self.load_runtime, shadow)
+            )
+        return prediction
+
+    @property
+    def max_batch_rows(self) -> int:
+        """Rows per engine call; larger matrices are split into chunks of this size."""
+        return self._batch_manager.max_batch_rows
+
+    async def resolve(self, model_id: str, model_version: str | None = None) -> ModelRuntime:
+        """
+        Select the serving version of ``model_id`` and return its runtime
+        handle, so batch callers route and load once for all their rows.
+        """
+        model, _ = await self._select_model(model_id, model_version, None)
+        return self._runtime_cache.get(model) or await self.load_runtime(model)
+
+    async def predict_matrix(
+        self,
+        runtime: ModelRuntime,
+        features: FeatureMatrix,
+        deadline: float | None = None,
+    ) -> PredictionBatch:
+        """Run one chunk of an (N, D) batch (N <= ``max_batch_rows``) for ``runtime``."""
+        return await self._batch_manager.predict_matrix(runtime.model, features, deadline)
+
+    async def load_runtime(self, model: Model) -> ModelRuntime:
+        """
+        Resolve the ``ModelRuntime`` handle for ``model``, loading it on
+        first use. Call ahead of traffic to preload a model.
+        """
+        return await self._runtime_cache.resolve(model, self._build_runtime)
+
+    async def _build_runtime(self, model: Model) -> ModelRuntime:
+        """Download, load and describe ``model`` (first request per version only)."""
+        local_model_path = self._cache_dir / model.id / model.version / "model.onnx"
+        source_uri = (
+            self._variant_selector.artifact_uri(model) if self._variant_selector else model.uri
+        )
+        # Remembers which variant the cached copy came from (none: registered artifact)
+        source_marker = local_model_path.with_name("model.source")
+        try:
+            cached_uri: str | None = source_marker.read_text()
+        except FileNotFoundError:
+            cached_uri = None
+        if not local_model_path.exists() or (cached_uri or model.uri) != source_uri:
+            await self._artifact_storage.download(source_uri, local_model_path)
+            if cached_uri is not None or source_uri != model.uri:
+                source_marker.write_text(source_uri)
+
+        await self._inference_engine.load(model)
+        handle = self._inference_engine.engine_handle(model)
+
+        required_features = (model.metadata or {}).get("features")
+        feature_names = (
+            tuple(str(f) for f in required_features) if isinstance(required_features, list) else ()
+        )
 
-        return await self._batch_manager.predict(model, feature_vector)
+        return ModelRuntime(
+            model=model,
+            feature_names=feature_names,
+            dtype=handle.dtype,
+            input_name=handle.input_name,
+            session=handle.session,
+            n_features=handle.n_features or len(feature_names) or None,
+            postprocessor=(
+                self._postprocessor_resolver(model.id) if self._postprocessor_resolver else None
+            ),
+        )
 
     async def _select_model(
         self, model_id: str, model_version: str | None, entity_id: str | None
-    ) -> Model:
+    ) -> tuple[Model, Model | None]:
+        """Serving model plus the model to shadow it with, if routing names one."""
         model: Model | None = None
+        shadow: Model | None = None
         if model_version and model_version != "latest":
             model = await self._model_repo.get_by_id(model_id, model_version)
         else:
@@ -95,7 +208,57 @@ class InferenceService:
 
             context = {"user_id": entity_id} if entity_id else {}
             model = self._routing_strategy.select_model(candidates, context)
+            shadow = self._routing_strategy.shadow_for(candidates, model)
 
         if not model:
             raise ValueError(f"Model {model_id}:{model_version} not found")
-        return model
+        return model, shadow
+
+    async def _predict_routed(
+        self, model: Model, values: np.ndarray, request: PredictionRequest
+    ) -> Prediction:
+        """Predict with ``model``, through its cascade when one is configured."""
+        options = None
+        routed = not request.model_version or request.model_version == "latest"
+        if self._cascade is not None and routed:
+            options = self._cascade.options_for(request.model_id)
+        first_stage = await self._first_stage(model, options) if options else None
+
+        if self._cascade is None or options is None or first_stage is None:
+            return await self._batch_manager.predict(
+                model,
+                FeatureVector.from_array(values),
+                priority=request.priority,
+                deadline=request.deadline,
+            )
+
+        # Both stages take the champion's feature schema
+        if self._runtime_cache.get(first_stage) is None:
+            await self.load_runtime(first_stage)
+        return await self._cascade.predict(
+            first_stage,
+            model,
+            FeatureVector.from_array(values),
+            options.confidence_threshold,
+            priority=request.priority,
+            deadline=request.deadline,
+        )
+
+    async def _first_stage(self, model: Model, options: CascadeOptions) -> Model | None:
+        """Registered first-stage model of ``model``'s cascade, if it exists."""
+        stage_id = options.model_id or model.id
+        if options.version:
+            stage = await self._model_repo.get_by_id(stage_id, options.version)
+        else:
+            stage = await self._model_repo.get_champion(stage_id)
+
+        if stage is None:
+            logger.warning(
+                "Cascade stage %s:%s of %s not found; serving %s directly",
+                stage_id,
+                options.version or "champion",
+                model.id,
+                model.unique_key,
+            )
+            return None
+        return None if stage.unique_key == model.unique_key else stage
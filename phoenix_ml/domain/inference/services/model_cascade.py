@@ -0,0 +1,81 @@
+"""
+Confidence-gated model cascade.
+
+A cheap first-stage model (a quantized or distilled artifact registered
+alongside the champion) answers every request first. Only predictions
+whose confidence falls below the model's ``CascadeOptions`` threshold are
+escalated to the champion. Both stages go through ``BatchManager``, so
+first-stage calls batch with each other and escalations batch with the
+rest of the champion's traffic.
+
+End-to-end latency is published per answering stage (``first`` or
+``escalated``); the escalation rate is the share of ``escalated``.
+"""
+
+import time
+from collections.abc import Mapping
+
+from phoenix_ml.domain.inference.entities.model import Model
+from phoenix_ml.domain.inference.entities.prediction import Prediction
+from phoenix_ml.domain.inference.services.batch_manager import BatchManager
+from phoenix_ml.domain.inference.value_objects.cascade_options import CascadeOptions
+from phoenix_ml.domain.inference.value_objects.feature_vector import FeatureVector
+from phoenix_ml.domain.inference.value_objects.request_priority import RequestPriority
+from phoenix_ml.domain.monitoring.services.metrics_publisher import MetricsPublisher
+
+STAGE_FIRST = "first"
+STAGE_ESCALATED = "escalated"
+
+
+class ModelCascade:
+    """
+    Runs a request through a model's first stage, escalating it to the
+    champion when the first stage is not confident enough.
+
+    ``options`` maps model ids to their cascade settings; it is read on
+    every call, so entries filled in at startup take effect at once.
+    """
+
+    def __init__(
+        self,
+        batch_manager: BatchManager,
+        options: Mapping[str, CascadeOptions],
+        metrics_publisher: MetricsPublisher | None = None,
+    ) -> None:
+        self._batch_manager = batch_manager
+        self._options = options
+        self._metrics = metrics_publisher
+
+    def options_for(self, model_id: str) -> CascadeOptions | None:
+        """Cascade settings for ``model_id``, or None when it is not cascaded."""
+        options = self._options.get(model_id)
+        return options if options is not None and options.enabled else None
+
+    async def predict(  # noqa: PLR0913
+        self,
+        first_stage: Model,
+        champion: Model,
+        features: FeatureVector,
+        confidence_threshold: float,
+        *,
+        priority: RequestPriority = RequestPriority.INTERACTIVE,
+        deadline: float | None = None,
+    ) -> Prediction:
+        """
+        Prediction from ``first_stage`` if its confidence reaches
+        ``confidence_threshold``, otherwise from ``champion``.
+        """
+        start = time.perf_counter()
+        prediction = await self._batch_manager.predict(
+            first_stage, features, priority=priority, deadline=deadline
+        )
+        stage = STAGE_FIRST
+        if prediction.confidence.value < confidence_threshold:
+            stage = STAGE_ESCALATED
+            prediction = await self._batch_manager.predict(
+                champion, features, priority=priority, deadline=deadline
+            )
+
+        if self._metrics is not None:
+            self._metrics.record_cascade(champion.id, stage, time.perf_counter() - start)
+        return prediction
@@ -0,0 +1,163 @@
+"""
+Zero-downtime promotion of a new champion version.
+
+Promoting with ``update_stage(..., "champion")`` alone flips routing at
+once, so the first requests for the new version pay for its download,
+session creation and first-run initialization inline. ``ModelHotSwapper``
+instead loads and warms the new version while the old champion keeps
+serving, flips routing in one registry write, moves the eviction pin
+from the old champion to the new one, drains the old version's queued
+and running batches and then unloads it.
+
+The swap duration and the p99 latency it added over the pre-swap
+baseline (from ``PredictionCompleted`` events, see ``observe``) are
+published through the ``MetricsPublisher``.
+"""
+
+import logging
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+
+import numpy as np
+
+from phoenix_ml.domain.inference.entities.model import Model
+from phoenix_ml.domain.inference.services.batch_manager import BatchManager
+from phoenix_ml.domain.inference.services.inference_engine import InferenceEngine
+from phoenix_ml.domain.inference.services.model_runtime import ModelRuntime, ModelRuntimeCache
+from phoenix_ml.domain.inference.services.model_warmup import ModelWarmup
+from phoenix_ml.domain.model_registry.repositories.model_repository import ModelRepository
+from phoenix_ml.domain.monitoring.services.metrics_publisher import MetricsPublisher
+from phoenix_ml.domain.shared.domain_events import PredictionCompleted
+from phoenix_ml.shared.exceptions import InferenceError
+
+logger = logging.getLogger(__name__)
+
+
+class ModelHotSwapper:
+    """
+    Promotes a model version to champion without a cold first request.
+
+    ``resolve`` loads a model's runtime handle (e.g.
+    ``InferenceService.load_runtime``); pass the ``runtime_cache`` it
+    fills so the handle warmed up before the flip is rebuilt around the
+    promoted ``Model``. The old champion gets
+    ``drain_timeout_s`` to finish its queued work; if it is still busy
+    then it stays loaded and is left to the residency manager.
+
+    Successful prediction latencies of the last ``latency_window_s``
+    seconds (at most ``max_samples`` per model) form the baseline p99
+    that the p99 observed during a swap is compared against.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        warmup: ModelWarmup,
+        batch_manager: BatchManager,
+        engine: InferenceEngine,
+        resolve: Callable[[Model], Awaitable[ModelRuntime]],
+        *,
+        runtime_cache: ModelRuntimeCache | None = None,
+        metrics_publisher: MetricsPublisher | None = None,
+        drain_timeout_s: float = 30.0,
+        latency_window_s: float = 60.0,
+        max_samples: int = 10_000,
+    ) -> None:
+        self._warmup = warmup
+        self._batch_manager = batch_manager
+        self._engine = engine
+        self._resolve = resolve
+        self._runtime_cache = runtime_cache
+        self._metrics = metrics_publisher
+        self._drain_timeout_s = drain_timeout_s
+        self._latency_window_s = latency_window_s
+        self._max_samples = max_samples
+        # Per model id: (monotonic time, latency seconds) of recent predictions
+        self._latencies: dict[str, deque[tuple[float, float]]] = {}
+
+    def observe(self, event: PredictionCompleted) -> None:
+        """Record a prediction's latency (subscribe to ``PredictionCompleted``)."""
+        if event.status != "success":
+            return
+        samples = self._latencies.get(event.model_id)
+        if samples is None:
+            samples = self._latencies[event.model_id] = deque(maxlen=self._max_samples)
+        samples.append((time.monotonic(), event.latency))
+
+    async def promote(self, model_repo: ModelRepository, model: Model) -> bool:
+        """
+        Make ``model`` (already saved in ``model_repo``) the champion.
+
+        Returns False when the replaced version could not be drained in
+        time and is still loaded. Raises ``InferenceError`` if the new
+        version fails to load or warm up; the old champion then stays
+        in place.
+        """
+        start = time.monotonic()
+        previous = await model_repo.get_champion(model.id)
+
+        result = await self._warmup.warm(model, self._resolve)
+        if not result.ok:
+            self._record(model, "failed", start)
+            raise InferenceError(model.id, f"warm-up of {model.version} failed: {result.error}")
+
+        await model_repo.update_stage(model.id, model.version, "champion")
+        # Reading the champion back reloads a snapshot repository, whose
+        # routing view is replaced in one step
+        champion = await model_repo.get_champion(model.id)
+        if champion is None or champion.unique_key != model.unique_key:
+            champion = model
+        await self._refresh_runtime(champion)
+        self._engine.set_pinned(champion, True)
+        logger.info("👑 %s is champion after %.0fms warm-up", model.unique_key, result.duration_ms)
+
+        drained = True
+        if previous is not None and previous.unique_key != model.unique_key:
+            self._engine.set_pinned(previous, False)
+            drained = await self._retire(previous)
+
+        self._record(model, "completed" if drained else "undrained", start)
+        self._record_tail_latency(model, start)
+        return drained
+
+    async def _refresh_runtime(self, champion: Model) -> None:
+        """Rebuild the warmed-up handle, whose ``Model`` still has its old role."""
+        if self._runtime_cache is None:
+            return
+        self._runtime_cache.invalidate(champion.id, champion.version)
+        try:
+            await self._resolve(champion)
+        except Exception as e:
+            # Already routed to; the next request resolves it lazily
+            logger.warning("⚠️ Could not re-resolve %s: %s", champion.unique_key, e)
+
+    async def _retire(self, model: Model) -> bool:
+        """Drain the replaced champion's batches and unload its session."""
+        if not await self._batch_manager.drain(model, self._drain_timeout_s):
+            logger.warning(
+                "⚠️ %s still busy after %.0fs; left loaded",
+                model.unique_key,
+                self._drain_timeout_s,
+            )
+            return False
+        if await self._engine.unload(model):
+            logger.info("Unloaded replaced champion %s", model.unique_key)
+        return True
+
+    def _record(self, model: Model, outcome: str, start: float) -> None:
+        if self._metrics is not None:
+            self._metrics.record_model_swap(
+                model.id, model.version, outcome, time.monotonic() - start
+            )
+
+    def _record_tail_latency(self, model: Model, start: float) -> None:
+        """Publish the p99 during the swap minus the p99 of the window before it."""
+        samples = self._latencies.get(model.id, ())
+        baseline = [
+            latency for t, latency in samples if start - self._latency_window_s <= t < start
+        ]
+        during = [latency for t, latency in samples if t >= start]
+        if not baseline or not during or self._metrics is None:
+            return
+        added = float(np.percentile(during, 99)) - float(np.percentile(baseline, 99))
+        self._metrics.record_swap_tail_latency(model.id, model.version, max(0.0, added))
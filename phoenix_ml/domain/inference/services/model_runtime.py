@@ -0,0 +1,98 @@
+"""
+Hot-path handles for loaded models.
+
+A ``ModelRuntime`` is resolved once per (model_id, version): artifact
+download, ``engine.load``, feature-order parsing and postprocessor
+lookup all happen on the first request. Later requests only do a dict
+lookup — no filesystem calls and no metadata parsing.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from phoenix_ml.domain.inference.entities.model import Model
+from phoenix_ml.domain.inference.services.processor_plugin import IPostprocessor
+
+
+@dataclass(frozen=True, slots=True)
+class ModelRuntime:
+    """Everything the hot path needs to serve one model version."""
+
+    model: Model
+    feature_names: tuple[str, ...]
+    dtype: np.dtype[Any]
+    input_name: str | None = None
+    session: Any = None
+    postprocessor: IPostprocessor | None = None
+    n_features: int | None = None
+
+    @property
+    def has_feature_list(self) -> bool:
+        return len(self.feature_names) > 0
+
+
+class ModelRuntimeCache:
+    """
+    ``ModelRuntime`` handles keyed by ``Model.unique_key``.
+
+    Concurrent first requests for the same key share one resolution.
+    Handles are dropped with ``invalidate`` (e.g. on ``ModelRetrained``).
+    """
+
+    def __init__(self) -> None:
+        self._runtimes: dict[str, ModelRuntime] = {}
+        self._pending: dict[str, asyncio.Future[ModelRuntime]] = {}
+
+    def __len__(self) -> int:
+        return len(self._runtimes)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._runtimes
+
+    def get(self, model: Model) -> ModelRuntime | None:
+        return self._runtimes.get(model.unique_key)
+
+    async def resolve(
+        self, model: Model, build: Callable[[Model], Awaitable[ModelRuntime]]
+    ) -> ModelRuntime:
+        """Return the cached handle for ``model`` or build it once."""
+        key = model.unique_key
+        runtime = self._runtimes.get(key)
+        if runtime is not None:
+            return runtime
+
+        pending = self._pending.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        future: asyncio.Future[ModelRuntime] = asyncio.get_running_loop().create_future()
+        self._pending[key] = future
+        try:
+            runtime = await build(model)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so an unawaited failure is not logged
+            future.exception()
+            raise
+        else:
+            self._runtimes[key] = runtime
+            future.set_result(runtime)
+            return runtime
+        finally:
+            self._pending.pop(key, None)
+
+    def invalidate(self, model_id: str, version: str | None = None) -> None:
+        """Drop the handles of ``model_id`` (all versions unless ``version`` is given)."""
+        for key, runtime in list(self._runtimes.items()):
+            if runtime.model.id == model_id and version in (None, runtime.model.version):
+                del self._runtimes[key]
+
+    def clear(self) -> None:
+        self._runtimes.clear()
@@ -0,0 +1,164 @@
+"""
+Startup warm-up for served models.
+
+The first request for a model otherwise pays for the artifact copy,
+session creation and the runtime's first-run graph initialization.
+``ModelWarmup`` resolves every model's runtime handle up front and runs
+synthetic batches at each padded batch size through the real
+``BatchManager``, so buffers, batch workers and kernels are ready before
+traffic arrives.
+"""
+
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+import numpy as np
+
+from phoenix_ml.domain.inference.entities.model import Model
+from phoenix_ml.domain.inference.services.batch_manager import BatchManager
+from phoenix_ml.domain.inference.services.model_runtime import ModelRuntime
+from phoenix_ml.domain.inference.value_objects.feature_vector import FeatureMatrix, FeatureVector
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class WarmupResult:
+    """Outcome of warming up one model version."""
+
+    model_key: str
+    batch_sizes: tuple[int, ...]
+    duration_ms: float
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class ModelWarmup:
+    """
+    Preloads models and tracks whether warm-up has finished.
+
+    ``BatchManager`` pads batches to the next power of two, so each power
+    of two up to ``max_batch_size`` (rounded up) is run ``iterations``
+    times. A disabled warm-up reports ready immediately.
+    """
+
+    def __init__(
+        self,
+        batch_manager: BatchManager,
+        iterations: int = 2,
+        max_batch_size: int = 16,
+        enabled: bool = True,
+    ) -> None:
+        if iterations < 0:
+            raise ValueError("iterations must be non-negative")
+        self._batch_manager = batch_manager
+        self._iterations = iterations
+        self._max_batch_size = max(1, max_batch_size)
+        self._enabled = enabled
+        self._finished = not enabled
+        self._pending = 0
+        self._results: list[WarmupResult] = []
+        # Versions whose latest warm-up failed
+        self._failed: set[str] = set()
+
+    @property
+    def is_ready(self) -> bool:
+        """Whether warm-up has finished (or is disabled)."""
+        return self._finished
+
+    @property
+    def pending(self) -> int:
+        """Models still waiting to be warmed up."""
+        return self._pending
+
+    @property
+    def results(self) -> list[WarmupResult]:
+        return list(self._results)
+
+    @property
+    def failed(self) -> list[str]:
+        """Model keys whose latest warm-up failed (a later successful warm-up clears one)."""
+        return sorted(self._failed)
+
+    def batch_sizes(self) -> list[int]:
+        """Padded batch sizes that are exercised: 1, 2, 4, ... up to the cap."""
+        sizes = [1]
+        while sizes[-1] < self._max_batch_size:
+            sizes.append(sizes[-1] * 2)
+        return sizes
+
+    async def run(
+        self,
+        models: list[Model],
+        resolve: Callable[[Model], Awaitable[ModelRuntime]],
+    ) -> list[WarmupResult]:
+        """
+        Warm up ``models`` one after another and mark warm-up finished.
+        ``resolve`` loads a model's runtime handle (e.g.
+        ``InferenceService.load_runtime``). A failing model is recorded
+        and skipped; it does not block readiness of the others.
+        """
+        if not self._enabled:
+            return []
+
+        self._pending = len(models)
+        try:
+            for model in models:
+                result = await self.warm(model, resolve)
+                self._results.append(result)
+                self._pending -= 1
+                if result.ok:
+                    logger.info(
+                        "🔥 Warmed up %s in %.0fms (batch sizes %s)",
+                        result.model_key,
+                        result.duration_ms,
+                        list(result.batch_sizes),
+                    )
+                else:
+                    logger.warning("⚠️ Warm-up failed for %s: %s", result.model_key, result.error)
+        finally:
+            self._pending = 0
+            self._finished = True
+        return self.results
+
+    async def warm(
+        self, model: Model, resolve: Callable[[Model], Awaitable[ModelRuntime]]
+    ) -> WarmupResult:
+        """
+        Load and warm up one model version, e.g. before it takes traffic
+        in a hot swap. Failures are returned in the result, not raised.
+        """
+        start = time.perf_counter()
+        sizes: tuple[int, ...] = ()
+        try:
+            runtime = await resolve(model)
+            if runtime.n_features is None:
+                logger.info("ℹ️ %s: unknown input width, loaded without batches", model.unique_key)
+            else:
+                sizes = tuple(self.batch_sizes())
+                await self._run_batches(model, runtime, sizes)
+        except Exception as e:
+            self._failed.add(model.unique_key)
+            return WarmupResult(
+                model.unique_key, sizes, (time.perf_counter() - start) * 1000, str(e)
+            )
+        self._failed.discard(model.unique_key)
+        return WarmupResult(model.unique_key, sizes, (time.perf_counter() - start) * 1000)
+
+    async def _run_batches(
+        self, model: Model, runtime: ModelRuntime, sizes: tuple[int, ...]
+    ) -> None:
+        n_features = runtime.n_features or 0
+        # One queued request starts the model's batch worker (and adaptive policy)
+        row = np.zeros(n_features, dtype=runtime.dtype)
+        await self._batch_manager.predict(model, FeatureVector.from_array(row))
+
+        for size in sizes:
+            matrix = FeatureMatrix.from_array(np.zeros((size, n_features), dtype=runtime.dtype))
+            for _ in range(self._iterations):
+                await self._batch_manager.predict_matrix(model, matrix)
@@ -0,0 +1,123 @@
+"""
+Per-model pending requests, split into priority lanes.
+
+Each lane is a heap ordered by deadline (requests without one sort
+last) and arrival order, so batches are formed earliest-deadline-first.
+``take`` reserves a share of every batch for the interactive lane so a
+flood of bulk items cannot crowd out single predictions.
+"""
+
+import asyncio
+import heapq
+import itertools
+import math
+from dataclasses import dataclass, field
+
+from phoenix_ml.domain.inference.entities.prediction import Prediction
+from phoenix_ml.domain.inference.value_objects.feature_vector import FeatureVector
+from phoenix_ml.domain.inference.value_objects.request_priority import RequestPriority
+
+NO_DEADLINE = math.inf
+
+
+@dataclass(order=True, slots=True)
+class PendingRequest:
+    """A queued request; ordered by (deadline, arrival)."""
+
+    deadline: float
+    seq: int
+    features: FeatureVector = field(compare=False)
+    future: asyncio.Future[Prediction] = field(compare=False)
+    priority: RequestPriority = field(compare=False, default=RequestPriority.INTERACTIVE)
+
+
+class RequestLanes:
+    """
+    Interactive and bulk heaps of ``PendingRequest`` for one model.
+
+    Deadlines are ``time.monotonic()`` timestamps. Not thread-safe: used
+    from the event loop only.
+    """
+
+    def __init__(self, interactive_share: float = 0.5) -> None:
+        if not 0.0 <= interactive_share <= 1.0:
+            raise ValueError("interactive_share must be within [0, 1]")
+        self._interactive_share = interactive_share
+        self._lanes: dict[RequestPriority, list[PendingRequest]] = {
+            RequestPriority.INTERACTIVE: [],
+            RequestPriority.BULK: [],
+        }
+        self._seq = itertools.count()
+        self._changed = asyncio.Event()
+
+    def __len__(self) -> int:
+        return sum(len(lane) for lane in self._lanes.values())
+
+    def depth(self, priority: RequestPriority) -> int:
+        return len(self._lanes[priority])
+
+    def push(
+        self,
+        features: FeatureVector,
+        future: asyncio.Future[Prediction],
+        priority: RequestPriority = RequestPriority.INTERACTIVE,
+        deadline: float | None = None,
+    ) -> None:
+        request = PendingRequest(
+            deadline=NO_DEADLINE if deadline is None else deadline,
+            seq=next(self._seq),
+            features=features,
+            future=future,
+            priority=priority,
+        )
+        heapq.heappush(self._lanes[priority], request)
+        self._changed.set()
+
+    async def wait_changed(self, timeout: float | None = None) -> bool:
+        """Wait for the next ``push``; False if ``timeout`` (seconds) elapsed first."""
+        self._changed.clear()
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout=timeout)
+        except TimeoutError:
+            return False
+        return True
+
+    def earliest_deadline(self) -> float:
+        """Earliest deadline across lanes (``NO_DEADLINE`` when none is set)."""
+        heads = [lane[0].deadline for lane in self._lanes.values() if lane]
+        return min(heads, default=NO_DEADLINE)
+
+    def drop_expired(self, now: float) -> list[PendingRequest]:
+        """Remove and return requests whose deadline is at or before ``now``."""
+        expired: list[PendingRequest] = []
+        for lane in self._lanes.values():
+            while lane and lane[0].deadline <= now:
+                expired.append(heapq.heappop(lane))
+        return expired
+
+    def take(self, max_batch_size: int) -> list[PendingRequest]:
+        """
+        Pop up to ``max_batch_size`` requests for the next batch.
+
+        Interactive requests first claim their reserved share of the
+        slots; the rest are filled earliest-deadline-first from both lanes.
+        """
+        interactive = self._lanes[RequestPriority.INTERACTIVE]
+        bulk = self._lanes[RequestPriority.BULK]
+
+        reserved = min(max_batch_size, math.ceil(max_batch_size * self._interactive_share))
+        batch = [heapq.heappop(interactive) for _ in range(min(reserved, len(interactive)))]
+
+        while len(batch) < max_batch_size and (interactive or bulk):
+            if interactive and (not bulk or interactive[0] <= bulk[0]):
+                batch.append(heapq.heappop(interactive))
+            else:
+                batch.append(heapq.heappop(bulk))
+        return batch
+
+    def drain(self) -> list[PendingRequest]:
+        """Remove and return every pending request."""
+        drained = [r for lane in self._lanes.values() for r in lane]
+        for lane in self._lanes.values():
+            lane.clear()
+        return drained
@@ -15,6 +15,10 @@ class RoutingStrategy(ABC):
     def select_model(self, models: list[Model], context: dict[str, Any] | None = None) -> Model:
         pass
 
+    def shadow_for(self, models: list[Model], selected: Model) -> Model | None:
+        """Model that should also see ``selected``'s traffic in shadow (none by default)."""
+        return None
+
 
 class SingleModelStrategy(RoutingStrategy):
     """Default strategy: Returns the first available active model."""
@@ -80,7 +84,8 @@ class ShadowStrategy(RoutingStrategy):
     """
     Routes to champion model and logs the challenger model selection
     for shadow comparison. The actual shadow prediction is handled
-    by the caller (InferenceService).
+    by the caller (InferenceService hands sampled requests to
+    ``ShadowRunner``, which replays them off the critical path).
     """
 
     def __init__(self) -> None:
@@ -104,6 +109,12 @@ class ShadowStrategy(RoutingStrategy):
             raise ValueError("No champion model found")
         return champion
 
+    def shadow_for(self, models: list[Model], selected: Model) -> Model | None:
+        challenger = self._find_by_role(models, "challenger")
+        if challenger is None or challenger.unique_key == selected.unique_key:
+            return None
+        return challenger
+
     def _find_by_role(self, models: list[Model], role: str) -> Model | None:
         for m in models:
             m_meta = m.metadata or {}
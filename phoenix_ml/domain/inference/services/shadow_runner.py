@@ -0,0 +1,270 @@
+"""
+Shadow inference off the critical path.
+
+``InferenceService`` hands every champion prediction routed by a
+``ShadowStrategy`` to ``ShadowRunner.submit``, which samples it into a
+bounded shadow lane and returns at once; the champion response never
+waits for the challenger. A background worker drains the lane in
+batches per challenger and runs them through
+``BatchManager.predict_shadow``, which only uses engine capacity that
+live traffic leaves idle. When the lane is full new samples are dropped.
+
+Each champion/challenger pair's outcomes are kept in a fixed-size
+``ShadowPairBuffer`` for ``ABTestAnalyzer.compare_shadow``.
+"""
+
+import asyncio
+import logging
+import random
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from numbers import Real
+from typing import Any
+
+import numpy as np
+
+from phoenix_ml.domain.inference.entities.model import Model
+from phoenix_ml.domain.inference.entities.prediction import Prediction
+from phoenix_ml.domain.inference.entities.prediction_batch import PredictionBatch
+from phoenix_ml.domain.inference.services.batch_manager import BatchManager
+from phoenix_ml.domain.inference.services.model_runtime import ModelRuntime
+from phoenix_ml.domain.inference.value_objects.feature_vector import FeatureMatrix
+from phoenix_ml.domain.monitoring.services.metrics_publisher import MetricsPublisher
+
+logger = logging.getLogger(__name__)
+
+RuntimeLoader = Callable[[], Awaitable[ModelRuntime]]
+
+
+@dataclass(frozen=True)
+class ShadowPairs:
+    """
+    Champion/challenger outcomes for the same requests, one row per pair.
+
+    ``*_results`` are float64 with NaN for non-scalar results; ``agree``
+    is exact equality of the two results, whatever their type.
+    """
+
+    model_id: str
+    champion_version: str
+    challenger_version: str
+    champion_results: np.ndarray
+    challenger_results: np.ndarray
+    agree: np.ndarray
+    champion_confidence: np.ndarray
+    challenger_confidence: np.ndarray
+    champion_latency_ms: np.ndarray
+    challenger_latency_ms: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.agree)
+
+
+class ShadowPairBuffer:
+    """Ring buffer of the latest ``capacity`` pairs, stored as NumPy columns."""
+
+    def __init__(
+        self,
+        model_id: str,
+        champion_version: str,
+        challenger_version: str,
+        capacity: int = 10_000,
+    ) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.model_id = model_id
+        self.champion_version = champion_version
+        self.challenger_version = challenger_version
+        self._capacity = capacity
+        # Columns: 0 = champion, 1 = challenger
+        self._results = np.full((capacity, 2), np.nan)
+        self._agree = np.zeros(capacity, dtype=bool)
+        self._confidence = np.zeros((capacity, 2), dtype=np.float32)
+        self._latency_ms = np.zeros((capacity, 2), dtype=np.float32)
+        self._next = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def extend(self, champions: list[Prediction], challenger: PredictionBatch) -> None:
+        """Append row ``i`` of ``challenger`` paired with ``champions[i]``."""
+        challenger_results, challenger_confidences = challenger.columns()
+        rows = list(zip(champions, challenger_results, challenger_confidences, strict=True))
+        rows = rows[-self._capacity :]
+        index = (self._next + np.arange(len(rows))) % self._capacity
+
+        self._results[index] = [(_scalar(c.result), _scalar(r)) for c, r, _ in rows]
+        self._agree[index] = [c.result == r for c, r, _ in rows]
+        self._confidence[index] = [(c.confidence.value, conf) for c, _, conf in rows]
+        self._latency_ms[index] = [(c.latency_ms, challenger.latency_ms) for c, _, _ in rows]
+
+        self._next = (self._next + len(rows)) % self._capacity
+        self._size = min(self._capacity, self._size + len(rows))
+
+    def snapshot(self) -> ShadowPairs:
+        """Copy of the buffered pairs, oldest first."""
+        start = self._next - self._size
+        order = (start + np.arange(self._size)) % self._capacity
+        return ShadowPairs(
+            model_id=self.model_id,
+            champion_version=self.champion_version,
+            challenger_version=self.challenger_version,
+            champion_results=self._results[order, 0],
+            challenger_results=self._results[order, 1],
+            agree=self._agree[order],
+            champion_confidence=self._confidence[order, 0],
+            challenger_confidence=self._confidence[order, 1],
+            champion_latency_ms=self._latency_ms[order, 0],
+            challenger_latency_ms=self._latency_ms[order, 1],
+        )
+
+
+def _scalar(value: Any) -> float:
+    return float(value) if isinstance(value, Real) else np.nan
+
+
+@dataclass(slots=True)
+class _Sample:
+    champion: Prediction
+    challenger: Model
+    features: np.ndarray
+    load_runtime: RuntimeLoader
+
+
+class ShadowRunner:
+    """
+    Samples champion traffic and replays it against the challenger.
+
+    ``submit`` is synchronous and O(1); it never awaits. Samples wait in
+    a lane of at most ``max_pending`` entries and run in batches of up
+    to ``max_batch_size`` rows on one background task. Not thread-safe:
+    used from the event loop only.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        batch_manager: BatchManager,
+        *,
+        sample_rate: float = 0.1,
+        max_pending: int = 1024,
+        max_batch_size: int = 32,
+        buffer_capacity: int = 10_000,
+        metrics_publisher: MetricsPublisher | None = None,
+        rng: Callable[[], float] = random.random,
+    ) -> None:
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError("sample_rate must be within [0, 1]")
+        self._batch_manager = batch_manager
+        self._sample_rate = sample_rate
+        self._max_pending = max(1, max_pending)
+        self._max_batch_size = max(1, max_batch_size)
+        self._buffer_capacity = buffer_capacity
+        self._metrics = metrics_publisher
+        self._rng = rng
+        self._pending: deque[_Sample] = deque()
+        self._buffers: dict[tuple[str, str, str], ShadowPairBuffer] = {}
+        self._wake = asyncio.Event()
+        self._worker: asyncio.Task[None] | None = None
+
+    @property
+    def sample_rate(self) -> float:
+        return self._sample_rate
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def submit(
+        self,
+        champion: Prediction,
+        challenger: Model,
+        features: np.ndarray,
+        load_runtime: RuntimeLoader,
+    ) -> bool:
+        """
+        Queue a shadow run of ``features`` on ``challenger`` for a sampled
+        share of calls. Returns True if the sample was queued.
+        """
+        if self._sample_rate <= 0.0 or self._rng() >= self._sample_rate:
+            return False
+        if len(self._pending) >= self._max_pending:
+            self._record(challenger, "dropped")
+            return False
+
+        self._pending.append(_Sample(champion, challenger, features, load_runtime))
+        worker = self._worker
+        if worker is None or worker.done() or worker.get_loop() is not asyncio.get_running_loop():
+            # First sample, or the previous loop is gone (module-level singleton)
+            self._wake = asyncio.Event()
+            self._worker = asyncio.create_task(self._run(), name="shadow_runner")
+        self._wake.set()
+        return True
+
+    def buffers(self) -> list[ShadowPairBuffer]:
+        return list(self._buffers.values())
+
+    def pairs(self, model_id: str) -> list[ShadowPairs]:
+        """Snapshots of every champion/challenger pair recorded for ``model_id``."""
+        return [b.snapshot() for b in self._buffers.values() if b.model_id == model_id]
+
+    async def stop(self) -> None:
+        """Cancel the worker and discard samples that have not run."""
+        if self._worker is not None:
+            self._worker.cancel()
+            await asyncio.gather(self._worker, return_exceptions=True)
+            self._worker = None
+        self._pending.clear()
+
+    async def _run(self) -> None:
+        while True:
+            while not self._pending:
+                self._wake.clear()
+                await self._wake.wait()
+            await self._run_batch(self._take_batch())
+
+    def _take_batch(self) -> list[_Sample]:
+        """Pop up to ``max_batch_size`` samples for the oldest sample's challenger."""
+        key = self._pending[0].challenger.unique_key
+        batch: list[_Sample] = []
+        others: list[_Sample] = []
+        while self._pending and len(batch) < self._max_batch_size:
+            sample = self._pending.popleft()
+            (batch if sample.challenger.unique_key == key else others).append(sample)
+        self._pending.extendleft(reversed(others))
+        return batch
+
+    async def _run_batch(self, samples: list[_Sample]) -> None:
+        challenger = samples[0].challenger
+        try:
+            runtime = await samples[0].load_runtime()
+            # Champion features were fetched for the champion's schema
+            width = runtime.n_features
+            usable = [s for s in samples if width is None or s.features.shape[-1] == width]
+            if len(usable) < len(samples):
+                self._record(challenger, "skipped", len(samples) - len(usable))
+            if not usable:
+                return
+            matrix = np.stack([s.features for s in usable]).astype(runtime.dtype, copy=False)
+            batch = await self._batch_manager.predict_shadow(
+                runtime.model, FeatureMatrix.from_array(matrix)
+            )
+        except Exception:
+            logger.warning("Shadow batch for %s failed", challenger.unique_key, exc_info=True)
+            self._record(challenger, "failed", len(samples))
+            return
+
+        champions = [s.champion for s in usable]
+        self._buffer(champions[0], challenger).extend(champions, batch)
+        self._record(challenger, "completed", len(usable))
+
+    def _buffer(self, champion: Prediction, challenger: Model) -> ShadowPairBuffer:
+        key = (champion.model_id, champion.model_version, challenger.version)
+        if key not in self._buffers:
+            self._buffers[key] = ShadowPairBuffer(*key, capacity=self._buffer_capacity)
+        return self._buffers[key]
+
+    def _record(self, challenger: Model, outcome: str, count: int = 1) -> None:
+        if self._metrics is not None:
+            self._metrics.record_shadow(challenger.id, challenger.version, outcome, count)
@@ -0,0 +1,114 @@
+"""
+Coalescing of identical in-flight prediction requests.
+
+Retries and fan-out clients often send the same features to the same
+model version within a few milliseconds. ``SingleFlight`` lets the
+first caller (the leader) queue the request and attaches later,
+identical callers to the leader's future, so the duplicates take no
+batch slot and no engine time.
+"""
+
+import asyncio
+from dataclasses import dataclass
+
+import numpy as np
+
+from phoenix_ml.domain.inference.entities.model import Model
+from phoenix_ml.domain.inference.entities.prediction import Prediction
+from phoenix_ml.domain.inference.services.request_lanes import NO_DEADLINE
+from phoenix_ml.domain.inference.value_objects.feature_vector import FeatureVector
+from phoenix_ml.domain.inference.value_objects.request_priority import RequestPriority
+
+FlightKey = tuple[str, bytes]
+
+
+def flight_key(model: Model, features: FeatureVector) -> FlightKey:
+    """
+    Key of a request: model version plus the float32 feature bytes.
+    The bytes themselves are the dict key, so equal hashes of different
+    features never share a result.
+    """
+    return model.unique_key, features.values.astype(np.float32, copy=False).tobytes()
+
+
+@dataclass(slots=True)
+class _Flight:
+    future: asyncio.Future[Prediction]
+    priority: RequestPriority
+    deadline: float
+    waiters: int = 1
+
+    def covers(self, priority: RequestPriority, deadline: float) -> bool:
+        # A follower must not inherit a tighter deadline or a lower priority
+        if self.deadline < deadline:
+            return False
+        return not (
+            self.priority is RequestPriority.BULK and priority is RequestPriority.INTERACTIVE
+        )
+
+
+class SingleFlight:
+    """
+    In-flight requests by ``flight_key``.
+
+    A flight ends when its future resolves. If every caller of a flight
+    is cancelled, the future is cancelled too so the batch worker skips
+    it. Not thread-safe: used from the event loop only.
+    """
+
+    def __init__(self) -> None:
+        self._flights: dict[FlightKey, _Flight] = {}
+
+    def __len__(self) -> int:
+        return len(self._flights)
+
+    def join(
+        self,
+        key: FlightKey,
+        priority: RequestPriority = RequestPriority.INTERACTIVE,
+        deadline: float | None = None,
+    ) -> asyncio.Future[Prediction] | None:
+        """Attach to the flight for ``key``; None when the caller must lead its own."""
+        flight = self._flights.get(key)
+        if flight is None or flight.future.done():
+            return None
+        if not flight.covers(priority, NO_DEADLINE if deadline is None else deadline):
+            return None
+        flight.waiters += 1
+        return flight.future
+
+    def lead(
+        self,
+        key: FlightKey,
+        future: asyncio.Future[Prediction],
+        priority: RequestPriority = RequestPriority.INTERACTIVE,
+        deadline: float | None = None,
+    ) -> bool:
+        """
+        Register ``future`` as the flight for ``key``. Returns False while
+        another flight owns the key; the caller then runs uncoalesced.
+        """
+        if key in self._flights:
+            return False
+        self._flights[key] = _Flight(
+            future, priority, NO_DEADLINE if deadline is None else deadline
+        )
+        future.add_done_callback(lambda _: self._land(key, future))
+        return True
+
+    async def wait(self, key: FlightKey, future: asyncio.Future[Prediction]) -> Prediction:
+        """Await a flight's result on behalf of one caller."""
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            flight = self._flights.get(key)
+            if flight is not None and flight.future is future:
+                flight.waiters -= 1
+                if flight.waiters == 0:
+                    future.cancel()
+            raise
+
+    def _land(self, key: FlightKey, future: asyncio.Future[Prediction]) -> None:
+        flight = self._flights.get(key)
+        if flight is not None and flight.future is future:
+            del self._flights[key]
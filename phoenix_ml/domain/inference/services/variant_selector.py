@@ -0,0 +1,63 @@
+"""
+Serving artifact selection between a model's fp32 and quantized variants.
+
+The training pipeline's ``benchmark`` step scores both artifacts on
+held-out data and times them; the ``QuantizationReport`` lands in the
+model's registry metadata under ``variants``. ``VariantSelector`` serves
+the quantized artifact when its score is at most ``max_score_drop``
+worse and its p50 latency is at least ``min_speedup`` times lower;
+otherwise (or without a report) the registered artifact is served.
+"""
+
+import logging
+
+from phoenix_ml.domain.inference.entities.model import Model
+from phoenix_ml.domain.inference.value_objects.variant_benchmark import QuantizationReport
+
+logger = logging.getLogger(__name__)
+
+
+class VariantSelector:
+    """Picks the artifact URI to serve for a model version."""
+
+    def __init__(
+        self,
+        max_score_drop: float = 0.01,
+        min_speedup: float = 1.1,
+        enabled: bool = True,
+    ) -> None:
+        if max_score_drop < 0:
+            raise ValueError("max_score_drop must be non-negative")
+        self._max_score_drop = max_score_drop
+        self._min_speedup = min_speedup
+        self._enabled = enabled
+
+    def report(self, model: Model) -> QuantizationReport | None:
+        """The model's benchmark report, if its metadata carries a valid one."""
+        raw = (model.metadata or {}).get("variants")
+        if not isinstance(raw, dict):
+            return None
+        try:
+            return QuantizationReport.from_dict(raw)
+        except (KeyError, TypeError, ValueError):
+            logger.warning("Ignoring malformed variant report of %s", model.unique_key)
+            return None
+
+    def use_quantized(self, report: QuantizationReport) -> bool:
+        return report.score_drop <= self._max_score_drop and report.speedup >= self._min_speedup
+
+    def artifact_uri(self, model: Model) -> str:
+        """URI of the artifact to load for ``model``."""
+        report = self.report(model) if self._enabled else None
+        if report is None or not self.use_quantized(report):
+            return model.uri
+
+        base, sep, _ = model.uri.rpartition("/")
+        logger.info(
+            "Serving quantized %s (%s drop %.4f, %.2fx faster)",
+            model.unique_key,
+            report.metric,
+            report.score_drop,
+            report.speedup,
+        )
+        return f"{base}{sep}{report.quantized.artifact}"
@@ -1,6 +1,9 @@
 """Inference value objects — ConfidenceScore, FeatureVector, etc."""
 
 from phoenix_ml.domain.inference.value_objects.confidence_score import ConfidenceScore
-from phoenix_ml.domain.inference.value_objects.feature_vector import FeatureVector
+from phoenix_ml.domain.inference.value_objects.feature_vector import (
+    FeatureMatrix,
+    FeatureVector,
+)
 
-__all__ = ["ConfidenceScore", "FeatureVector"]
+__all__ = ["ConfidenceScore", "FeatureMatrix", "FeatureVector"]
@@ -0,0 +1,27 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class CascadeOptions:
+    """
+    Value Object describing a model's confidence-gated cascade.
+
+    A cheap first-stage model (``model_id``/``version`` in the registry,
+    e.g. a quantized or distilled artifact) answers first; predictions
+    with confidence below ``confidence_threshold`` are escalated to the
+    routed champion. An empty ``model_id`` means the cascaded model's own
+    id; an empty ``version`` means that model's champion. The cascade is
+    off unless at least one of the two is set.
+    """
+
+    model_id: str = ""
+    version: str = ""
+    confidence_threshold: float = 0.9
+
+    def __post_init__(self) -> None:
+        if not 0.0 <= self.confidence_threshold <= 1.0:
+            raise ValueError("confidence_threshold must be within [0, 1]")
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.model_id or self.version)
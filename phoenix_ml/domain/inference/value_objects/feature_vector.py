@@ -1,47 +1,144 @@
 from typing import Any
 
 import numpy as np
-from pydantic import BaseModel, ConfigDict, field_validator
+from pydantic import ValidationError
 
+_MATRIX_NDIM = 2
 
-class FeatureVector(BaseModel):
+
+def _validation_error(title: str, value: Any, message: str) -> ValidationError:
+    return ValidationError.from_exception_data(
+        title,
+        [
+            {
+                "type": "value_error",
+                "loc": ("values",),
+                "input": value,
+                "ctx": {"error": ValueError(message)},
+            }
+        ],
+    )
+
+
+def _as_numeric_array(title: str, v: Any) -> np.ndarray:
+    if isinstance(v, list):
+        try:
+            v = np.array(v, dtype=np.float32)
+        except (TypeError, ValueError) as e:
+            raise _validation_error(title, v, "Feature vector must contain numeric values") from e
+
+    if not isinstance(v, np.ndarray):
+        raise _validation_error(title, v, "Values must be a numpy array or a list")
+
+    if v.size == 0:
+        raise _validation_error(title, v, "Feature vector cannot be empty")
+
+    if not np.issubdtype(v.dtype, np.number):
+        raise _validation_error(title, v, "Feature vector must contain numeric values")
+
+    return v
+
+
+class FeatureVector:
     """
     Value Object representing the input feature vector for the model.
-    Immutable and validated upon creation using Pydantic.
+
+    A slotted, ndarray-backed container. ``FeatureVector(values=...)``
+    validates its input (raising pydantic's ``ValidationError`` as before);
+    code behind the API boundary, where inputs are already validated,
+    uses ``from_array`` which skips validation entirely.
     """
 
-    model_config = ConfigDict(
-        frozen=True,
-        arbitrary_types_allowed=True,
-        unsafe_hash=True,  # type: ignore
-    )
+    __slots__ = ("_hash", "values")
 
     values: np.ndarray
+    _hash: int | None
 
-    def __hash__(self) -> int:
-        return hash(self.values.tobytes())
+    def __init__(self, values: Any) -> None:
+        object.__setattr__(self, "values", _as_numeric_array("FeatureVector", values))
+        object.__setattr__(self, "_hash", None)
 
-    @field_validator("values", mode="before")
     @classmethod
-    def validate_values(cls, v: Any) -> np.ndarray:
-        if isinstance(v, list):
-            v = np.array(v, dtype=np.float32)
-
-        if not isinstance(v, np.ndarray):
-            raise ValueError("Values must be a numpy array or a list")
-
-        if v.size == 0:
-            raise ValueError("Feature vector cannot be empty")
+    def from_array(cls, values: np.ndarray) -> "FeatureVector":
+        """Wrap an already validated array without copying or checking it."""
+        vec = object.__new__(cls)
+        object.__setattr__(vec, "values", values)
+        object.__setattr__(vec, "_hash", None)
+        return vec
 
-        if not np.issubdtype(v.dtype, np.number):
-            raise ValueError("Feature vector must contain numeric values")
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
 
-        return v
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
 
-    def to_list(self) -> list[float]:
-        return list(self.values.tolist())  # Explicit cast to list
+    def __hash__(self) -> int:
+        # Computed on first use only; the hot path never hashes vectors
+        cached: int | None = self._hash
+        if cached is None:
+            cached = hash(self.values.tobytes())
+            object.__setattr__(self, "_hash", cached)
+        return cached
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, FeatureVector):
             return NotImplemented
         return np.array_equal(self.values, other.values)
+
+    def __repr__(self) -> str:
+        return f"FeatureVector(values={self.values!r})"
+
+    def to_list(self) -> list[float]:
+        return list(self.values.tolist())  # Explicit cast to list
+
+
+class FeatureMatrix:
+    """
+    An (N, D) batch of feature rows backed by a single ndarray.
+
+    Batch callers pass a matrix through ``BatchManager`` and the engines
+    instead of building N ``FeatureVector`` objects. Like ``FeatureVector``,
+    the constructor validates and ``from_array`` trusts its input.
+    """
+
+    __slots__ = ("values",)
+
+    values: np.ndarray
+
+    def __init__(self, values: Any) -> None:
+        arr = _as_numeric_array("FeatureMatrix", values)
+        if arr.ndim != _MATRIX_NDIM:
+            raise _validation_error("FeatureMatrix", values, "Feature matrix must be 2-D (N, D)")
+        object.__setattr__(self, "values", arr)
+
+    @classmethod
+    def from_array(cls, values: np.ndarray) -> "FeatureMatrix":
+        """Wrap an already validated (N, D) array without copying or checking it."""
+        matrix = object.__new__(cls)
+        object.__setattr__(matrix, "values", values)
+        return matrix
+
+    @classmethod
+    def from_vectors(cls, vectors: list[FeatureVector], dtype: Any = np.float32) -> "FeatureMatrix":
+        """Stack feature vectors into one matrix (a single copy)."""
+        return cls.from_array(np.stack([v.values for v in vectors]).astype(dtype, copy=False))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __len__(self) -> int:
+        return int(self.values.shape[0])
+
+    def __repr__(self) -> str:
+        return f"FeatureMatrix(shape={self.values.shape}, dtype={self.values.dtype})"
+
+    @property
+    def n_features(self) -> int:
+        return int(self.values.shape[1])
+
+    def row(self, i: int) -> FeatureVector:
+        """Row ``i`` as a ``FeatureVector`` view (no copy)."""
+        return FeatureVector.from_array(self.values[i])
+
+    def rows(self) -> list[FeatureVector]:
+        return [FeatureVector.from_array(r) for r in self.values]
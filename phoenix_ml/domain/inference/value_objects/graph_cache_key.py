@@ -0,0 +1,53 @@
+import hashlib
+import json
+import platform
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from phoenix_ml.domain.inference.value_objects.runtime_options import RuntimeOptions
+
+
+@dataclass(frozen=True)
+class GraphCacheKey:
+    """
+    Value Object identifying a persisted, pre-optimized ONNX graph.
+
+    An optimized graph is only valid for the exact source model, the ONNX
+    Runtime build that wrote it, the settings that shaped it and (for the
+    ``all`` level, which may emit hardware-specific kernels) the machine
+    architecture. Any change in these yields a different ``filename``.
+    """
+
+    model_sha256: str
+    runtime_version: str
+    graph_optimization_level: str
+    execution_mode: str
+    providers: tuple[str, ...] = ("CPUExecutionProvider",)
+    machine: str = ""
+
+    @classmethod
+    def for_model(
+        cls,
+        model_path: Path,
+        runtime_version: str,
+        options: RuntimeOptions,
+        providers: tuple[str, ...] = ("CPUExecutionProvider",),
+    ) -> "GraphCacheKey":
+        digest = hashlib.sha256()
+        with model_path.open("rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        return cls(
+            model_sha256=digest.hexdigest(),
+            runtime_version=runtime_version,
+            graph_optimization_level=options.graph_optimization_level,
+            execution_mode=options.execution_mode,
+            providers=providers,
+            machine=platform.machine(),
+        )
+
+    @property
+    def filename(self) -> str:
+        """File name of the optimized graph (ORT format)."""
+        raw = json.dumps(asdict(self), sort_keys=True)
+        return f"{hashlib.sha256(raw.encode()).hexdigest()[:32]}.ort"
@@ -4,9 +4,12 @@ Loaded from YAML files in ``MODEL_CONFIG_DIR``. Each model's task type,
 features, training script, and monitoring settings are captured here.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
+from phoenix_ml.domain.inference.value_objects.cascade_options import CascadeOptions
+from phoenix_ml.domain.inference.value_objects.runtime_options import RuntimeOptions
+
 
 @dataclass(frozen=True)
 class ModelConfig:
@@ -50,6 +53,13 @@ class ModelConfig:
         drift_detection_enabled: Whether drift monitoring is active.
             Set to False for tasks without meaningful drift detection
             (e.g. object detection, NLP).
+        latency_budget_ms: Target p99 serving latency used by adaptive
+            batching. 0 means "use the global ``BATCH_TARGET_P99_MS``".
+        scheduler_weight: Share of the cross-model batch scheduler's slot
+            time relative to other models (default 1.0).
+        runtime: Inference session threading and executor options.
+        cascade: Cheap first-stage model answering confident requests
+            before the champion (disabled by default).
     """
 
     model_id: str
@@ -75,6 +85,12 @@ class ModelConfig:
     retrain_schedule: str = ""
     drift_detection_enabled: bool = True
 
+    # Serving configuration
+    latency_budget_ms: float = 0.0
+    scheduler_weight: float = 1.0
+    runtime: RuntimeOptions = field(default_factory=RuntimeOptions)
+    cascade: CascadeOptions = field(default_factory=CascadeOptions)
+
     # Optional pipeline steps (omit for default train → validate → register)
     pipeline_steps: tuple[tuple[str, ...], ...] = ()
 
@@ -103,6 +119,10 @@ class ModelConfig:
             retrain_trigger=self.retrain_trigger,
             retrain_schedule=self.retrain_schedule,
             drift_detection_enabled=self.drift_detection_enabled,
+            latency_budget_ms=self.latency_budget_ms,
+            scheduler_weight=self.scheduler_weight,
+            runtime=self.runtime,
+            cascade=self.cascade,
         )
 
     @property
@@ -0,0 +1,16 @@
+"""Scheduling class of a prediction request."""
+
+from enum import StrEnum
+
+
+class RequestPriority(StrEnum):
+    """
+    Lane a request is queued in by ``BatchManager``.
+
+    ``INTERACTIVE`` requests (single ``/predict`` calls) get a reserved
+    share of every batch; ``BULK`` requests (items of ``/predict/batch``)
+    fill the remaining slots.
+    """
+
+    INTERACTIVE = "interactive"
+    BULK = "bulk"
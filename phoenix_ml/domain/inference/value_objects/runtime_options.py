@@ -0,0 +1,31 @@
+from dataclasses import dataclass
+
+EXECUTION_MODES = ("sequential", "parallel")
+GRAPH_OPTIMIZATION_LEVELS = ("disabled", "basic", "extended", "all")
+
+
+@dataclass(frozen=True)
+class RuntimeOptions:
+    """
+    Value Object describing how a model's inference runtime is threaded.
+
+    ``intra_op_threads``/``inter_op_threads`` of 0 let the infrastructure
+    pick a value that fits the available cores. ``executor_workers`` is the
+    number of concurrent inference calls allowed for the model.
+    """
+
+    intra_op_threads: int = 0
+    inter_op_threads: int = 0
+    execution_mode: str = "sequential"
+    graph_optimization_level: str = "all"
+    executor_workers: int = 0
+
+    def __post_init__(self) -> None:
+        if self.intra_op_threads < 0 or self.inter_op_threads < 0:
+            raise ValueError("Thread counts must be non-negative")
+        if self.executor_workers < 0:
+            raise ValueError("executor_workers must be non-negative")
+        if self.execution_mode not in EXECUTION_MODES:
+            raise ValueError(f"execution_mode must be one of {EXECUTION_MODES}")
+        if self.graph_optimization_level not in GRAPH_OPTIMIZATION_LEVELS:
+            raise ValueError(f"graph_optimization_level must be one of {GRAPH_OPTIMIZATION_LEVELS}")
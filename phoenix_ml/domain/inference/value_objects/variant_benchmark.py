@@ -0,0 +1,72 @@
+from dataclasses import asdict, dataclass
+from typing import Any
+
+
+@dataclass(frozen=True)
+class VariantBenchmark:
+    """
+    Value Object with one artifact variant's held-out score and latency.
+
+    ``artifact`` is the file name next to the model's registered artifact
+    (e.g. ``model_quantized.onnx``).
+    """
+
+    artifact: str
+    score: float
+    latency_p50_ms: float
+    latency_p95_ms: float
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "VariantBenchmark":
+        return cls(
+            artifact=str(data["artifact"]),
+            score=float(data["score"]),
+            latency_p50_ms=float(data["latency_p50_ms"]),
+            latency_p95_ms=float(data["latency_p95_ms"]),
+        )
+
+
+@dataclass(frozen=True)
+class QuantizationReport:
+    """
+    Value Object comparing a model's fp32 and quantized artifacts.
+
+    Written by the training pipeline's ``benchmark`` step and stored in
+    registry metadata under ``variants``; ``metric`` names the score
+    (``accuracy``, ``rmse``) and ``higher_is_better`` its direction.
+    """
+
+    metric: str
+    higher_is_better: bool
+    fp32: VariantBenchmark
+    quantized: VariantBenchmark
+
+    @property
+    def score_drop(self) -> float:
+        """How much worse the quantized score is (negative when it is better)."""
+        drop = self.fp32.score - self.quantized.score
+        return drop if self.higher_is_better else -drop
+
+    @property
+    def speedup(self) -> float:
+        """fp32 p50 latency over quantized p50 latency."""
+        if self.quantized.latency_p50_ms <= 0:
+            return 0.0
+        return self.fp32.latency_p50_ms / self.quantized.latency_p50_ms
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "metric": self.metric,
+            "higher_is_better": self.higher_is_better,
+            "fp32": asdict(self.fp32),
+            "quantized": asdict(self.quantized),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "QuantizationReport":
+        return cls(
+            metric=str(data["metric"]),
+            higher_is_better=bool(data["higher_is_better"]),
+            fp32=VariantBenchmark.from_dict(data["fp32"]),
+            quantized=VariantBenchmark.from_dict(data["quantized"]),
+        )
@@ -9,10 +9,13 @@ from __future__ import annotations
 import logging
 import math
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
 
+if TYPE_CHECKING:
+    from phoenix_ml.domain.inference.services.shadow_runner import ShadowPairs
+
 logger = logging.getLogger(__name__)
 
 
@@ -66,12 +69,37 @@ class ABTestResult:
         }
 
 
+@dataclass
+class ShadowComparison:
+    """Champion vs shadow challenger on the same requests."""
+
+    model_id: str
+    champion_version: str
+    challenger_version: str
+    count: int
+    agreement: float
+    latency: ABTestResult
+    confidence: ABTestResult
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "model_id": self.model_id,
+            "champion_version": self.champion_version,
+            "challenger_version": self.challenger_version,
+            "count": self.count,
+            "agreement": round(self.agreement, 4),
+            "latency": self.latency.to_dict(),
+            "confidence": self.confidence.to_dict(),
+        }
+
+
 class ABTestAnalyzer:
     """Statistical analysis for A/B testing model variants.
 
     Methods:
     - compare_means: compare numeric outcomes (latency, scores)
     - compare_proportions: compare success rates (accuracy)
+    - compare_shadow: agreement, latency and confidence of shadow pairs
     """
 
     def __init__(self, confidence_level: float | None = None) -> None:
@@ -177,6 +205,48 @@ class ABTestAnalyzer:
             details={"test_method": "chi_squared"},
         )
 
+    def compare_shadow(
+        self, pairs: ShadowPairs, tolerance: float | None = None
+    ) -> ShadowComparison:
+        """Compare a champion with its shadow challenger request by request.
+
+        Agreement is the share of pairs with equal results; with
+        ``tolerance`` numeric results agree when they differ by at most
+        that much (regression). Latency and confidence are compared with
+        ``compare_means``; for latency a higher variant mean is worse.
+        """
+        min_pairs = 2
+        if len(pairs) < min_pairs:
+            raise ValueError(
+                f"Need at least {min_pairs} shadow pairs, got {len(pairs)}"
+            )
+
+        agree = pairs.agree
+        if tolerance is not None:
+            diff = np.abs(pairs.champion_results - pairs.challenger_results)
+            agree = agree | (diff <= tolerance)
+
+        versions = (pairs.champion_version, pairs.challenger_version)
+        return ShadowComparison(
+            model_id=pairs.model_id,
+            champion_version=pairs.champion_version,
+            challenger_version=pairs.challenger_version,
+            count=len(pairs),
+            agreement=float(np.mean(agree)),
+            latency=self.compare_means(
+                pairs.champion_latency_ms.tolist(),
+                pairs.challenger_latency_ms.tolist(),
+                f"{pairs.model_id}_shadow_latency_ms",
+                *versions,
+            ),
+            confidence=self.compare_means(
+                pairs.champion_confidence.tolist(),
+                pairs.challenger_confidence.tolist(),
+                f"{pairs.model_id}_shadow_confidence",
+                *versions,
+            ),
+        )
+
     def _mann_whitney_u(self, x: np.ndarray, y: np.ndarray) -> float:
         """Compute Mann-Whitney U test p-value (two-sided)."""
         combined = np.concatenate([x, y])
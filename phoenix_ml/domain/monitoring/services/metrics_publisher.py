@@ -24,6 +24,7 @@ class MetricsPublisher(ABC):
         model_id: str,
         version: str,
         status: str,
+        count: int = 1,
     ) -> None:
         """Increment the prediction counter.
 
@@ -31,6 +32,7 @@ class MetricsPublisher(ABC):
             model_id: Model identifier.
             version: Model version string.
             status: "success" or "error".
+            count: Number of predictions to add (rows of a batch chunk).
         """
 
     @abstractmethod
@@ -90,3 +92,104 @@ class MetricsPublisher(ABC):
         feature_name: str,
     ) -> None:
         """Increment the drift-detected event counter."""
+
+    # ── Serving internals ─────────────────────────────────────────
+
+    @abstractmethod
+    def record_batch_policy(
+        self,
+        model_id: str,
+        version: str,
+        max_batch_size: int,
+        max_wait_time_ms: float,
+    ) -> None:
+        """Publish the batch cap and wait window chosen by adaptive batching."""
+
+    @abstractmethod
+    def record_executor_saturation(
+        self,
+        model_id: str,
+        version: str,
+        in_flight: int,
+        workers: int,
+    ) -> None:
+        """Publish how many inference calls are running or queued on a model's executor."""
+
+    @abstractmethod
+    def record_deadline_miss(
+        self,
+        model_id: str,
+        version: str,
+        priority: str,
+        count: int = 1,
+    ) -> None:
+        """Count requests dropped because their deadline passed before inference."""
+
+    @abstractmethod
+    def record_coalesced(self, model_id: str, version: str, count: int = 1) -> None:
+        """Count requests served by an identical request already in flight."""
+
+    @abstractmethod
+    def record_shed(self, model_id: str, version: str, reason: str, count: int = 1) -> None:
+        """Count requests rejected by admission control (``reason``: queue_full, deadline)."""
+
+    @abstractmethod
+    def record_scheduler_slots(self, in_use: int, total: int) -> None:
+        """Publish how many of the cross-model scheduler's engine slots are busy."""
+
+    @abstractmethod
+    def record_scheduler_dispatch(
+        self,
+        model_id: str,
+        version: str,
+        weighted_work: float,
+        wait_ms: float,
+    ) -> None:
+        """Record a batch dispatched by the scheduler: rows / weight and slot wait."""
+
+    @abstractmethod
+    def record_shadow(self, model_id: str, version: str, outcome: str, count: int = 1) -> None:
+        """Count shadow samples per challenger by ``outcome``.
+
+        Outcomes: completed, dropped (lane full), skipped (feature width
+        mismatch) and failed.
+        """
+
+    @abstractmethod
+    def record_cascade(self, model_id: str, stage: str, latency_seconds: float) -> None:
+        """Record a cascaded request's end-to-end latency by the stage that answered it.
+
+        Stages: first (cheap model was confident enough) and escalated
+        (champion answered).
+        """
+
+    @abstractmethod
+    def record_model_residency(
+        self, resident_models: int, resident_bytes: int, budget_bytes: int
+    ) -> None:
+        """Publish how many model sessions are loaded, their estimated bytes and the budget."""
+
+    @abstractmethod
+    def record_model_eviction(self, model_id: str, version: str) -> None:
+        """Count sessions unloaded to stay within the memory budget."""
+
+    @abstractmethod
+    def record_model_reload(self, model_id: str, version: str) -> None:
+        """Count sessions loaded again after an eviction."""
+
+    @abstractmethod
+    def record_model_swap(
+        self, model_id: str, version: str, outcome: str, duration_seconds: float
+    ) -> None:
+        """Record a hot swap of the champion to ``version`` and how long it took.
+
+        Outcomes: completed, undrained (the replaced version was still busy
+        at the drain timeout and stays loaded) and failed (warm-up failed,
+        nothing promoted).
+        """
+
+    @abstractmethod
+    def record_swap_tail_latency(
+        self, model_id: str, version: str, added_p99_seconds: float
+    ) -> None:
+        """Publish how much p99 prediction latency during a hot swap exceeded the baseline."""
@@ -18,6 +18,9 @@ class PredictionCompleted:
     confidence: float
     status: str  # "success" | "error"
     timestamp: datetime = field(default_factory=lambda: datetime.now(UTC))
+    # Predictions covered by the event (> 1 for a chunk of a batch request,
+    # whose confidence is then the chunk mean)
+    rows: int = 1
 
 
 @dataclass(frozen=True)
@@ -1,8 +1,8 @@
 """Multi-step training pipeline.
 
 Executes a sequence of ``IPipelineStep`` instances against a
-``PipelineContext``. Steps can be built-in (train, quantize, validate,
-register) or user-supplied via ``script`` in YAML config.
+``PipelineContext``. Steps can be built-in (train, quantize, benchmark,
+optimize, validate, register) or user-supplied via ``script`` in YAML config.
 
 Configuration (optional, in ``model_configs/<model_id>.yaml``)::
 
@@ -10,6 +10,9 @@ Configuration (optional, in ``model_configs/<model_id>.yaml``)::
       - step: train
       - step: quantize
         config: {method: dynamic, weight_type: int8}
+      - step: benchmark
+        config: {metric: accuracy}
+      - step: optimize
       - step: validate
         config: {min_accuracy: 0.95}
       - step: register
@@ -21,12 +24,25 @@ automatically wraps execution with MLflow logging.
 from __future__ import annotations
 
 import importlib
+import json
 import logging
+import os
+import time
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+
+from phoenix_ml.domain.inference.value_objects.graph_cache_key import GraphCacheKey
+from phoenix_ml.domain.inference.value_objects.runtime_options import RuntimeOptions
+from phoenix_ml.domain.inference.value_objects.variant_benchmark import (
+    QuantizationReport,
+    VariantBenchmark,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -233,6 +249,218 @@ class QuantizeStep(IPipelineStep):
         return context
 
 
+# Held-out score per metric: (score(predictions, targets), higher_is_better)
+_SCORERS: dict[str, tuple[Callable[[np.ndarray, np.ndarray], float], bool]] = {
+    "accuracy": (lambda pred, y: float(np.mean(pred == y)), True),
+    "rmse": (lambda pred, y: float(np.sqrt(np.mean((pred - y) ** 2))), False),
+}
+
+
+class BenchmarkStep(IPipelineStep):
+    """Built-in: Compare the fp32 and quantized models for serving.
+
+    Scores both artifacts on held-out data and times them with a latency
+    harness. The ``QuantizationReport`` is written to the metrics file
+    under ``variants``, which carries it into the registry metadata;
+    serving picks the variant from it (``VariantSelector``).
+
+    Config options:
+        holdout_path: .npz with ``x`` and ``y`` arrays
+            (default: ``holdout.npz`` next to the model)
+        metric: 'accuracy' (default) or 'rmse'
+        batch_size: rows per timed call (default 1)
+        iterations: timed calls per variant (default 100)
+    """
+
+    WARMUP_CALLS = 5
+
+    def __init__(self, config: dict[str, Any] | None = None) -> None:
+        super().__init__(name="benchmark", config=config)
+
+    async def execute(self, context: PipelineContext) -> PipelineContext:
+        quantized_path = context.artifacts.get("quantized_model")
+        if not quantized_path:
+            logger.warning("⚠️ [benchmark] No quantized model, skipping")
+            return context
+
+        fp32_path = context.artifacts.get("model") or quantized_path.replace(
+            "_quantized.onnx", ".onnx"
+        )
+        holdout_path = Path(
+            self.step_config.get("holdout_path") or Path(fp32_path).parent / "holdout.npz"
+        )
+        metric = self.step_config.get("metric", "accuracy")
+        if metric not in _SCORERS:
+            logger.warning("⚠️ [benchmark] Unknown metric '%s', skipping", metric)
+            return context
+        if not holdout_path.exists():
+            logger.warning("⚠️ [benchmark] No held-out data at %s, skipping", holdout_path)
+            return context
+
+        logger.info("⏱️ [benchmark] %s vs %s on %s", fp32_path, quantized_path, holdout_path)
+        try:
+            with np.load(holdout_path, allow_pickle=False) as holdout:
+                x = holdout["x"].astype(np.float32, copy=False)
+                y = holdout["y"]
+            if len(x) == 0:
+                raise ValueError(f"No held-out rows in {holdout_path}")
+            fp32 = await asyncio.to_thread(self._measure, fp32_path, x, y, metric)
+            quantized = await asyncio.to_thread(self._measure, quantized_path, x, y, metric)
+        except ImportError:
+            logger.warning("⚠️ [benchmark] onnxruntime not available, skipping")
+            return context
+        except Exception as e:
+            # The fp32 artifact is still served; benchmarking is best-effort
+            logger.error("❌ [benchmark] %s", e)
+            return context
+
+        report = QuantizationReport(
+            metric=metric,
+            higher_is_better=_SCORERS[metric][1],
+            fp32=fp32,
+            quantized=quantized,
+        )
+        context.metrics["quantized_score_drop"] = report.score_drop
+        context.metrics["quantized_speedup"] = report.speedup
+
+        metrics_path = Path(
+            context.artifacts.get("metrics") or Path(fp32_path).parent / "metrics.json"
+        )
+        recorded = json.loads(metrics_path.read_text()) if metrics_path.exists() else {}
+        recorded["variants"] = report.to_dict()
+        metrics_path.write_text(json.dumps(recorded, indent=2))
+        context.artifacts["metrics"] = str(metrics_path)
+
+        logger.info(
+            "✅ [benchmark] quantized %s drop %.4f, %.2fx faster",
+            metric,
+            report.score_drop,
+            report.speedup,
+        )
+        return context
+
+    def _measure(
+        self, model_path: str, x: np.ndarray, y: np.ndarray, metric: str
+    ) -> VariantBenchmark:
+        """Held-out score and per-call latency percentiles of one artifact."""
+        import onnxruntime as ort  # noqa: PLC0415
+
+        session = ort.InferenceSession(model_path, providers=["CPUExecutionProvider"])
+        input_name = session.get_inputs()[0].name
+
+        output = np.asarray(session.run(None, {input_name: x})[0])
+        # Class probabilities/scores per column, or one label/value per row
+        pred = output.argmax(axis=1) if output.ndim > 1 and output.shape[1] > 1 else output.ravel()
+        score = _SCORERS[metric][0](pred, y)
+
+        batch_size = max(1, min(int(self.step_config.get("batch_size", 1)), len(x)))
+        iterations = max(1, int(self.step_config.get("iterations", 100)))
+        batches = [x[i : i + batch_size] for i in range(0, len(x) - batch_size + 1, batch_size)]
+        timings = []
+        for i in range(self.WARMUP_CALLS + iterations):
+            batch = batches[i % len(batches)]
+            start = time.perf_counter()
+            session.run(None, {input_name: batch})
+            if i >= self.WARMUP_CALLS:
+                timings.append((time.perf_counter() - start) * 1000)
+
+        return VariantBenchmark(
+            artifact=Path(model_path).name,
+            score=score,
+            latency_p50_ms=float(np.percentile(timings, 50)),
+            latency_p95_ms=float(np.percentile(timings, 95)),
+        )
+
+
+# ORT enum member names per RuntimeOptions setting
+_ORT_OPTIMIZATION_LEVELS = {
+    "basic": "ORT_ENABLE_BASIC",
+    "extended": "ORT_ENABLE_EXTENDED",
+    "all": "ORT_ENABLE_ALL",
+}
+_ORT_EXECUTION_MODES = {"sequential": "ORT_SEQUENTIAL", "parallel": "ORT_PARALLEL"}
+
+
+class OptimizeStep(IPipelineStep):
+    """Built-in: Persist ORT-optimized graphs of the model artifacts.
+
+    Runs ONNX Runtime's graph optimizations once, at training time, and
+    saves each optimized graph (ORT format) under its ``GraphCacheKey``
+    in the serving-side optimized graph directory. Serving processes
+    sharing that directory skip optimization when creating sessions.
+
+    Config options:
+        cache_dir: optimized graph directory
+            (default ``/tmp/phoenix/optimized_graphs``, as for serving)
+        graph_optimization_level: 'all' (default), 'extended' or 'basic'
+        execution_mode: 'sequential' (default) or 'parallel'
+    """
+
+    DEFAULT_CACHE_DIR = "/tmp/phoenix/optimized_graphs"
+    # Artifact key of each source model -> artifact key of its optimized graph
+    ARTIFACTS = {"model": "optimized_model", "quantized_model": "optimized_quantized_model"}
+
+    def __init__(self, config: dict[str, Any] | None = None) -> None:
+        super().__init__(name="optimize", config=config)
+
+    async def execute(self, context: PipelineContext) -> PipelineContext:
+        sources = {
+            name: Path(context.artifacts[key])
+            for key, name in self.ARTIFACTS.items()
+            if context.artifacts.get(key)
+        } or {"optimized_model": context.model_path}
+        try:
+            options = RuntimeOptions(
+                graph_optimization_level=self.step_config.get("graph_optimization_level", "all"),
+                execution_mode=self.step_config.get("execution_mode", "sequential"),
+            )
+        except ValueError as e:
+            logger.warning("⚠️ [optimize] %s, skipping", e)
+            return context
+        if options.graph_optimization_level == "disabled":
+            logger.warning("⚠️ [optimize] Graph optimization disabled, skipping")
+            return context
+
+        cache_dir = Path(self.step_config.get("cache_dir", self.DEFAULT_CACHE_DIR))
+        try:
+            for name, source in sources.items():
+                graph_path = await asyncio.to_thread(self._optimize, source, cache_dir, options)
+                context.artifacts[name] = str(graph_path)
+                logger.info("✅ [optimize] %s -> %s", source, graph_path)
+        except ImportError:
+            logger.warning("⚠️ [optimize] onnxruntime not available, skipping")
+        except Exception as e:
+            # Serving optimizes (and caches) the graph itself on first load
+            logger.error("❌ [optimize] %s", e)
+        return context
+
+    @staticmethod
+    def _optimize(model_path: Path, cache_dir: Path, options: RuntimeOptions) -> Path:
+        """Write the optimized graph of ``model_path`` and return its path."""
+        import onnxruntime as ort  # noqa: PLC0415
+
+        key = GraphCacheKey.for_model(model_path, ort.__version__, options)
+        graph_path = cache_dir / key.filename
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = graph_path.with_name(f"{graph_path.name}.{os.getpid()}.tmp")
+
+        so = ort.SessionOptions()
+        so.graph_optimization_level = getattr(
+            ort.GraphOptimizationLevel, _ORT_OPTIMIZATION_LEVELS[options.graph_optimization_level]
+        )
+        so.execution_mode = getattr(ort.ExecutionMode, _ORT_EXECUTION_MODES[options.execution_mode])
+        so.optimized_model_filepath = str(tmp_path)
+        so.add_session_config_entry("session.save_model_format", "ORT")
+        try:
+            ort.InferenceSession(
+                str(model_path), sess_options=so, providers=["CPUExecutionProvider"]
+            )
+            os.replace(tmp_path, graph_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        return graph_path
+
+
 class RegisterStep(IPipelineStep):
     """Built-in: Register model version with the model registry."""
 
@@ -259,6 +487,8 @@ class RegisterStep(IPipelineStep):
 BUILTIN_STEPS: dict[str, type[IPipelineStep]] = {
     "train": TrainStep,
     "quantize": QuantizeStep,
+    "benchmark": BenchmarkStep,
+    "optimize": OptimizeStep,
     "validate": ValidateStep,
     "register": RegisterStep,
 }
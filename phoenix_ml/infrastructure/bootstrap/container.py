@@ -1,13 +1,22 @@
 import asyncio
 import logging
 import os
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
 from pathlib import Path
 
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from phoenix_ml.config import get_settings
 from phoenix_ml.domain.feature_store.repositories.feature_store import FeatureStore
 from phoenix_ml.domain.inference.services.batch_manager import BatchConfig, BatchManager
+from phoenix_ml.domain.inference.services.batch_scheduler import BatchScheduler
 from phoenix_ml.domain.inference.services.inference_engine import InferenceEngine
+from phoenix_ml.domain.inference.services.model_cascade import ModelCascade
+from phoenix_ml.domain.inference.value_objects.cascade_options import CascadeOptions
+from phoenix_ml.domain.inference.value_objects.latency_budget import LatencyBudget
+from phoenix_ml.domain.inference.value_objects.runtime_options import RuntimeOptions
+from phoenix_ml.domain.model_registry.repositories.model_repository import ModelRepository
 from phoenix_ml.domain.monitoring.services.drift_calculator import DriftCalculator
 from phoenix_ml.domain.monitoring.services.metrics_publisher import MetricsPublisher
 from phoenix_ml.domain.monitoring.services.model_evaluator import (
@@ -29,7 +38,11 @@ from phoenix_ml.infrastructure.feature_store.in_memory_feature_store import (
 )
 from phoenix_ml.infrastructure.feature_store.redis_feature_store import RedisFeatureStore
 from phoenix_ml.infrastructure.messaging.kafka_producer import KafkaProducer
+from phoenix_ml.infrastructure.ml_engines.inference_executor import InferenceExecutor
+from phoenix_ml.infrastructure.ml_engines.model_residency import ModelResidencyManager
 from phoenix_ml.infrastructure.ml_engines.onnx_engine import ONNXInferenceEngine
+from phoenix_ml.infrastructure.ml_engines.optimized_graph_cache import OptimizedGraphCache
+from phoenix_ml.infrastructure.ml_engines.shared_weights import SharedWeights
 from phoenix_ml.infrastructure.ml_engines.tensorrt_executor import TensorRTExecutor
 from phoenix_ml.infrastructure.ml_engines.triton_client import TritonInferenceClient
 from phoenix_ml.infrastructure.monitoring.prometheus_metrics_publisher import (
@@ -42,10 +55,58 @@ settings = get_settings()
 
 artifact_storage = LocalArtifactStorage(base_dir=Path(settings.ARTIFACT_STORAGE_DIR))
 
+# ── MetricsPublisher (Adapter Pattern) ────────────────────────────
+metrics_publisher: MetricsPublisher = PrometheusMetricsPublisher()
+
+# ── Inference Executor (dedicated per-model thread pools) ─────────
+#    Per-model ORT runtime options are filled from model_configs at startup.
+runtime_options: dict[str, RuntimeOptions] = {}
+inference_executor = InferenceExecutor(
+    default_workers=settings.INFERENCE_EXECUTOR_WORKERS,
+    metrics_publisher=metrics_publisher,
+)
+
+# ── Model Residency (memory-bounded LRU of loaded sessions) ───────
+model_residency = ModelResidencyManager(
+    budget_bytes=settings.MODEL_MEMORY_BUDGET_MB * 1024 * 1024,
+    footprint_factor=settings.MODEL_FOOTPRINT_FACTOR,
+    metrics_publisher=metrics_publisher,
+)
+
+
+def shared_weights_enabled() -> bool:
+    """``SHARED_WEIGHTS``; when unset, on for multi-worker serving."""
+    if settings.SHARED_WEIGHTS is not None:
+        return settings.SHARED_WEIGHTS
+    return settings.SERVER_WORKERS > 1
+
+
 # ── Engine Factory Registry (OCP: add new engines via dict entry) ─────
 _ENGINE_FACTORIES: dict[str, Callable[[], InferenceEngine]] = {
-    "onnx": lambda: ONNXInferenceEngine(cache_dir=Path(settings.CACHE_DIR)),
-    "tensorrt": lambda: TensorRTExecutor(cache_dir=Path(settings.CACHE_DIR)),
+    "onnx": lambda: ONNXInferenceEngine(
+        cache_dir=Path(settings.CACHE_DIR),
+        executor=inference_executor,
+        runtime_options=runtime_options,
+        io_binding=settings.INFERENCE_IO_BINDING,
+        graph_cache=(
+            OptimizedGraphCache(Path(settings.OPTIMIZED_GRAPH_DIR))
+            if settings.OPTIMIZED_GRAPH_CACHE
+            else None
+        ),
+        residency=model_residency,
+        shared_weights=(
+            SharedWeights(min_tensor_bytes=settings.SHARED_WEIGHTS_MIN_TENSOR_KB * 1024)
+            if shared_weights_enabled()
+            else None
+        ),
+    ),
+    "tensorrt": lambda: TensorRTExecutor(
+        cache_dir=Path(settings.CACHE_DIR),
+        executor=inference_executor,
+        runtime_options=runtime_options,
+        io_binding=settings.INFERENCE_IO_BINDING,
+        residency=model_residency,
+    ),
     "triton": lambda: TritonInferenceClient(
         triton_url=getattr(settings, "TRITON_URL", "http://localhost:8000"),
     ),
@@ -55,11 +116,6 @@ engine_type = getattr(settings, "INFERENCE_ENGINE", "onnx").lower()
 _engine_factory = _ENGINE_FACTORIES.get(engine_type, _ENGINE_FACTORIES["onnx"])
 inference_engine: InferenceEngine = _engine_factory()
 
-batch_config = BatchConfig(
-    max_batch_size=settings.BATCH_MAX_SIZE,
-    max_wait_time_ms=settings.BATCH_MAX_WAIT_MS,
-)
-batch_manager = BatchManager(inference_engine, config=batch_config)
 kafka_producer = KafkaProducer(bootstrap_servers=settings.KAFKA_URL)
 
 # ── Kafka Consumer (consumes inference-events for downstream processing) ──
@@ -81,8 +137,35 @@ drift_calculator = DriftCalculator()
 default_task_type = getattr(settings, "DEFAULT_TASK_TYPE", "classification")
 model_evaluator: IModelEvaluator = get_evaluator(default_task_type)
 
-# ── MetricsPublisher (Adapter Pattern) ────────────────────────────
-metrics_publisher: MetricsPublisher = PrometheusMetricsPublisher()
+batch_config = BatchConfig(
+    max_batch_size=settings.BATCH_MAX_SIZE,
+    max_wait_time_ms=settings.BATCH_MAX_WAIT_MS,
+    adaptive=settings.BATCH_ADAPTIVE,
+    latency_budget=LatencyBudget(settings.BATCH_TARGET_P99_MS),
+    adaptive_max_batch_size=settings.BATCH_ADAPTIVE_MAX_SIZE,
+    interactive_share=settings.BATCH_INTERACTIVE_SHARE,
+    coalesce=settings.BATCH_COALESCE,
+    max_queue_depth=settings.BATCH_MAX_QUEUE_DEPTH or None,
+    max_concurrent_batches=settings.BATCH_MAX_CONCURRENT,
+)
+# Engine slots shared fairly by every model's batch worker;
+# per-model weights are filled from model_configs at startup.
+batch_scheduler = (
+    BatchScheduler(settings.BATCH_SCHEDULER_SLOTS, metrics_publisher=metrics_publisher)
+    if settings.BATCH_SCHEDULER_SLOTS > 0
+    else None
+)
+batch_manager = BatchManager(
+    inference_engine,
+    config=batch_config,
+    metrics_publisher=metrics_publisher,
+    scheduler=batch_scheduler,
+)
+
+# ── Model Cascade (cheap first stage, confidence-gated escalation) ──
+#    Per-model cascades are filled from model_configs at startup.
+cascade_options: dict[str, CascadeOptions] = {}
+model_cascade = ModelCascade(batch_manager, cascade_options, metrics_publisher=metrics_publisher)
 
 # ── Domain Event Bus (Observer Pattern) ───────────────────────────
 #    Subscribers react to domain events independently.
@@ -93,7 +176,7 @@ event_bus = DomainEventBus()
 event_bus.subscribe(
     PredictionCompleted,
     lambda e: (
-        metrics_publisher.record_prediction(e.model_id, e.version, e.status),
+        metrics_publisher.record_prediction(e.model_id, e.version, e.status, e.rows),
         metrics_publisher.record_latency(e.model_id, e.version, e.latency),
         metrics_publisher.record_confidence(e.model_id, e.version, e.confidence)
         if e.status == "success"
@@ -103,18 +186,16 @@ event_bus.subscribe(
 
 event_bus.subscribe(
     DriftScorePublished,
-    lambda e: (
-        metrics_publisher.publish_drift_score(e.model_id, e.feature_name, e.method, e.score)
-    ),
+    lambda e: metrics_publisher.publish_drift_score(e.model_id, e.feature_name, e.method, e.score),
 )
 
 event_bus.subscribe(
-    DriftDetected, lambda e: (metrics_publisher.record_drift_detected(e.model_id, e.feature_name))
+    DriftDetected, lambda e: metrics_publisher.record_drift_detected(e.model_id, e.feature_name)
 )
 
 event_bus.subscribe(
     ModelRetrained,
-    lambda e: (metrics_publisher.publish_model_metrics(e.model_id, e.version, e.metrics)),
+    lambda e: metrics_publisher.publish_model_metrics(e.model_id, e.version, e.metrics),
 )
 
 # ── Feature Store Factory Registry (OCP) ──────────────────────────
@@ -131,6 +212,25 @@ from phoenix_ml.domain.shared.plugin_registry import PluginRegistry  # noqa: E40
 
 plugin_registry = PluginRegistry()
 
+# ── Model runtime handles (hot path: no filesystem / metadata work) ──
+from phoenix_ml.domain.inference.services.model_runtime import ModelRuntimeCache  # noqa: E402
+
+model_runtime_cache = ModelRuntimeCache()
+
+# A retrained model may reuse its version and artifact path; re-resolve it.
+event_bus.subscribe(ModelRetrained, lambda e: model_runtime_cache.invalidate(e.model_id))
+# Evicted sessions must not stay referenced by cached runtime handles
+model_residency.add_eviction_listener(lambda m: model_runtime_cache.invalidate(m.id, m.version))
+
+
+def _pin_promoted(event: ModelRetrained) -> None:
+    """Keep a version promoted by the registry resident (pins only change explicitly)."""
+    if event.promoted:
+        model_residency.pin(event.model_id, event.version)
+
+
+event_bus.subscribe(ModelRetrained, _pin_promoted)
+
 shutdown_event = asyncio.Event()
 
 # ── In-memory model repo (used when DB is unavailable) ────────────
@@ -140,6 +240,126 @@ from phoenix_ml.infrastructure.persistence.in_memory_model_repo import (  # noqa
 
 in_memory_model_repo = InMemoryModelRepository()
 
+# ── Model Registry Snapshot (routing reads served from memory) ────
+#    Backends are opened per refresh/write; predictions never hit the DB.
+from phoenix_ml.infrastructure.persistence.database import AsyncSessionLocal  # noqa: E402
+from phoenix_ml.infrastructure.persistence.mlflow_model_registry import (  # noqa: E402
+    MlflowModelRegistry,
+)
+from phoenix_ml.infrastructure.persistence.postgres_model_registry import (  # noqa: E402
+    PostgresModelRegistry,
+)
+from phoenix_ml.infrastructure.persistence.snapshot_model_repo import (  # noqa: E402
+    SnapshotModelRepository,
+)
+
+# Model Registry Factory (OCP: add new backends via dict entry)
+_REGISTRY_FACTORIES: dict[str, Callable[[AsyncSession], ModelRepository]] = {
+    "mlflow": lambda db: MlflowModelRegistry(tracking_uri=settings.MLFLOW_TRACKING_URI),
+    "postgres": PostgresModelRegistry,
+}
+_registry_factory = _REGISTRY_FACTORIES.get(
+    settings.MODEL_REGISTRY_BACKEND, _REGISTRY_FACTORIES["postgres"]
+)
+
+
+@asynccontextmanager
+async def _registry_session() -> AsyncIterator[ModelRepository]:
+    async with AsyncSessionLocal() as db:
+        yield _registry_factory(db)
+
+
+registry_snapshot = SnapshotModelRepository(
+    _registry_session, refresh_interval_s=settings.REGISTRY_SNAPSHOT_REFRESH_S
+)
+
+# Promotions and retrains change which versions are active.
+event_bus.subscribe(ModelRetrained, lambda e: registry_snapshot.invalidate(e.model_id))
+
+
+# ── Inference Service Factory ─────────────────────────────────────
+from phoenix_ml.domain.inference.services.inference_service import (  # noqa: E402
+    InferenceService,
+)
+from phoenix_ml.domain.inference.services.routing_strategy import (  # noqa: E402
+    ABTestStrategy,
+    CanaryStrategy,
+    RoutingStrategy,
+    ShadowStrategy,
+    SingleModelStrategy,
+)
+from phoenix_ml.domain.inference.services.shadow_runner import ShadowRunner  # noqa: E402
+from phoenix_ml.domain.inference.services.variant_selector import VariantSelector  # noqa: E402
+
+# Routing Strategy Factory (OCP: add new strategies via dict entry)
+_ROUTING_FACTORIES: dict[str, Callable[[], RoutingStrategy]] = {
+    "ab_test": lambda: ABTestStrategy(0.5),
+    "canary": CanaryStrategy,
+    "shadow": ShadowStrategy,
+    "single": SingleModelStrategy,
+}
+_routing_factory = _ROUTING_FACTORIES.get(settings.ROUTING_STRATEGY, _ROUTING_FACTORIES["ab_test"])
+
+# Replays sampled champion traffic on the challenger on idle engine slots
+shadow_runner = ShadowRunner(
+    batch_manager,
+    sample_rate=settings.SHADOW_SAMPLE_RATE,
+    max_pending=settings.SHADOW_MAX_PENDING,
+    max_batch_size=settings.SHADOW_BATCH_SIZE,
+    buffer_capacity=settings.SHADOW_BUFFER_SIZE,
+    metrics_publisher=metrics_publisher,
+)
+
+# Loads benchmarked quantized artifacts when they are accurate and faster enough
+variant_selector = VariantSelector(
+    max_score_drop=settings.QUANTIZED_MAX_SCORE_DROP,
+    min_speedup=settings.QUANTIZED_MIN_SPEEDUP,
+    enabled=settings.QUANTIZED_SERVING,
+)
+
+
+def create_inference_service(model_repo: ModelRepository) -> InferenceService:
+    """InferenceService wired to the shared engine, batcher and runtime cache."""
+    return InferenceService(
+        model_repo=model_repo,
+        inference_engine=inference_engine,
+        batch_manager=batch_manager,
+        feature_store=feature_store,
+        artifact_storage=artifact_storage,
+        routing_strategy=_routing_factory(),
+        runtime_cache=model_runtime_cache,
+        postprocessor_resolver=plugin_registry.get_postprocessor,
+        shadow_runner=shadow_runner,
+        cascade=model_cascade,
+        variant_selector=variant_selector,
+    )
+
+
+# ── Model Warm-up (preload + synthetic batches before readiness) ──
+from phoenix_ml.domain.inference.services.model_warmup import ModelWarmup  # noqa: E402
+
+model_warmup = ModelWarmup(
+    batch_manager,
+    iterations=settings.WARMUP_ITERATIONS,
+    max_batch_size=batch_manager.max_batch_rows,
+    enabled=settings.WARMUP_ENABLED,
+)
+
+# ── Model Hot Swap (warm a new champion, then drain and unload the old) ──
+from phoenix_ml.domain.inference.services.model_hot_swap import ModelHotSwapper  # noqa: E402
+
+model_hot_swapper = ModelHotSwapper(
+    model_warmup,
+    batch_manager,
+    inference_engine,
+    create_inference_service(registry_snapshot).load_runtime,
+    runtime_cache=model_runtime_cache,
+    metrics_publisher=metrics_publisher,
+    drain_timeout_s=settings.HOT_SWAP_DRAIN_TIMEOUT_S,
+    latency_window_s=settings.HOT_SWAP_LATENCY_WINDOW_S,
+)
+event_bus.subscribe(PredictionCompleted, model_hot_swapper.observe)
+
 
 def find_project_root() -> Path:
     """Find root by searching for pyproject.toml upwards from this file."""
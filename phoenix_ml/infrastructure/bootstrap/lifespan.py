@@ -1,8 +1,10 @@
 import asyncio
+import contextlib
 import json
 import logging
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from pathlib import Path
 from typing import Any, cast
 
 from fastapi import FastAPI
@@ -11,6 +13,7 @@ from sqlalchemy import select
 from phoenix_ml.application.services.monitoring_service import MonitoringService
 from phoenix_ml.config import get_settings
 from phoenix_ml.domain.inference.entities.model import Model
+from phoenix_ml.domain.inference.value_objects.latency_budget import LatencyBudget
 from phoenix_ml.domain.monitoring.services.alert_manager import (
     AlertManager,
     AlertRule,
@@ -18,23 +21,35 @@ from phoenix_ml.domain.monitoring.services.alert_manager import (
 )
 from phoenix_ml.infrastructure.bootstrap.container import (
     artifact_storage,
+    batch_config,
     batch_manager,
+    batch_scheduler,
+    cascade_options,
+    create_inference_service,
     drift_calculator,
     ensure_model_exists,
     event_bus,
     feature_store,
     find_project_root,
+    in_memory_model_repo,
     inference_engine,
+    inference_executor,
     kafka_consumer,
     kafka_producer,
+    model_warmup,
     plugin_registry,
+    registry_snapshot,
+    runtime_options,
+    shadow_runner,
     shutdown_event,
 )
 from phoenix_ml.infrastructure.bootstrap.model_config_loader import (
     load_all_model_configs,
     load_features_from_metrics,
 )
+from phoenix_ml.infrastructure.bootstrap.worker_lease import WorkerLease
 from phoenix_ml.infrastructure.grpc.grpc_server import create_grpc_server
+from phoenix_ml.infrastructure.monitoring.prometheus_multiprocess import mark_worker_dead
 from phoenix_ml.infrastructure.monitoring.system_metrics_collector import (
     SystemMetricsCollector,
 )
@@ -85,6 +100,9 @@ settings = get_settings()
 # Monitoring interval (seconds) — Production: 30s to avoid false-positive flood
 MONITORING_INTERVAL_SECONDS = settings.MONITORING_INTERVAL_SECONDS
 
+# Multi-worker serving: how often non-leader workers retry the gRPC lease
+GRPC_LEASE_RETRY_SECONDS = 5.0
+
 
 def _load_reference_data_for_model(model_id: str) -> list[float]:
     """Load per-model reference data for drift detection.
@@ -296,6 +314,9 @@ async def _seed_model_if_needed(
             model_metadata["features"] = feature_names
         if real_metrics.get("dataset"):
             model_metadata["dataset"] = real_metrics["dataset"]
+        # fp32 vs quantized benchmark from the pipeline's benchmark step
+        if real_metrics.get("variants"):
+            model_metadata["variants"] = real_metrics["variants"]
 
         seed_model = Model(
             id=model_id,
@@ -324,6 +345,58 @@ async def _seed_model_if_needed(
         logger.error("❌ Failed to seed model: %s", e)
 
 
+async def _warm_up_models(model_ids: list[str]) -> None:
+    """Preload every configured model's active versions before reporting ready."""
+    model_repo = registry_snapshot if registry_snapshot.is_loaded else in_memory_model_repo
+    models: list[Model] = []
+    for model_id in model_ids:
+        try:
+            models.extend(await model_repo.get_active_versions(model_id))
+        except Exception as e:
+            logger.warning("⚠️ Cannot resolve %s for warm-up: %s", model_id, e)
+
+    service = create_inference_service(model_repo)
+    await model_warmup.run(models, service.load_runtime)
+    logger.info("✅ Warm-up finished for %d model version(s)", len(models))
+
+
+def _create_grpc_server() -> Any:
+    try:
+        return create_grpc_server(
+            model_repo=registry_snapshot,
+            inference_engine=inference_engine,
+            batch_manager=batch_manager,
+            feature_store=feature_store,
+            artifact_storage=artifact_storage,
+            port=50051,
+        )
+    except RuntimeError as e:
+        logger.warning("⚠️ gRPC server skipped (port in use): %s", e)
+        return None
+
+
+async def _serve_grpc_as_leader(lease: WorkerLease) -> None:
+    """Run the gRPC server in the one worker holding ``lease`` until shutdown.
+
+    The other workers keep retrying the lease, so one of them takes over
+    the port when the holder exits.
+    """
+    while not lease.try_acquire():
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(shutdown_event.wait(), timeout=GRPC_LEASE_RETRY_SECONDS)
+        if shutdown_event.is_set():
+            return
+    try:
+        grpc_server = _create_grpc_server()
+        if grpc_server is None:
+            return
+        await grpc_server.start()
+        await shutdown_event.wait()
+        await grpc_server.stop(grace=2.0)
+    finally:
+        lease.release()
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:  # noqa: PLR0915
     # ── Database initialization (optional — graceful degradation) ──
@@ -340,24 +413,18 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:  # noqa: PLR0915
         )
 
     grpc_server = None
+    grpc_lease: WorkerLease | None = None
     model_configs: dict[str, Any] = {}
 
     if db_available:
         async for db in get_db():
             model_repo = PostgresModelRegistry(db)
 
-            try:
-                grpc_server = create_grpc_server(
-                    model_repo=model_repo,
-                    inference_engine=inference_engine,
-                    batch_manager=batch_manager,
-                    feature_store=feature_store,
-                    artifact_storage=artifact_storage,
-                    port=50051,
-                )
-            except RuntimeError as e:
-                logger.warning("⚠️ gRPC server skipped (port in use): %s", e)
-                grpc_server = None
+            if settings.SERVER_WORKERS > 1:
+                # Several workers: only the lease holder binds the gRPC port
+                grpc_lease = WorkerLease(Path(settings.SERVER_RUNTIME_DIR), "grpc")
+            else:
+                grpc_server = _create_grpc_server()
 
             _settings = get_settings()
             _model_id = _settings.DEFAULT_MODEL_ID
@@ -389,6 +456,14 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:  # noqa: PLR0915
                 logger.info("✅ Seeded %d real feature records", len(real_features))
 
             break
+
+        # Serve routing reads from memory; refreshed in the background
+        try:
+            await registry_snapshot.refresh()
+            registry_snapshot.start()
+            logger.info("✅ Registry snapshot loaded")
+        except Exception as e:
+            logger.warning("⚠️ Registry snapshot unavailable: %s", e)
     else:
         # Load model configs even without DB (for inference-only mode)
         _settings = get_settings()
@@ -397,10 +472,6 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:  # noqa: PLR0915
         model_configs = load_all_model_configs(config_dir)
 
         # Seed in-memory model repo so /predict works without DB
-        from phoenix_ml.infrastructure.bootstrap.container import (  # noqa: PLC0415
-            in_memory_model_repo,
-        )
-
         for cfg_id, cfg in model_configs.items():
             try:
                 # Use model_path from config (supports absolute paths)
@@ -432,6 +503,16 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:  # noqa: PLR0915
             except Exception as e:
                 logger.warning("⚠️ Failed to seed %s: %s", cfg_id, e)
 
+    # Per-model latency SLOs for adaptive batching, scheduler weights, ORT runtime options
+    # and model cascades
+    for cfg_id, cfg in model_configs.items():
+        if cfg.latency_budget_ms > 0:
+            batch_config.model_latency_budgets[cfg_id] = LatencyBudget(cfg.latency_budget_ms)
+        if batch_scheduler is not None:
+            batch_scheduler.set_weight(cfg_id, cfg.scheduler_weight)
+        runtime_options[cfg_id] = cfg.runtime
+        cascade_options[cfg_id] = cfg.cascade
+
     # Log model configs and plugin registry state
     if model_configs:
         logger.info(
@@ -446,6 +527,12 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:  # noqa: PLR0915
 
     if grpc_server:
         await grpc_server.start()
+    grpc_leader_task = (
+        asyncio.create_task(_serve_grpc_as_leader(grpc_lease)) if grpc_lease else None
+    )
+
+    # Preload models in the background; /health/deep reports ready when done
+    warmup_task = asyncio.create_task(_warm_up_models(list(model_configs)))
 
     await kafka_producer.start()
     monitor_task = asyncio.create_task(run_monitoring_loop())
@@ -471,13 +558,19 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:  # noqa: PLR0915
     logger.info("🧹 Lifespan shutdown started...")
     shutdown_event.set()
     _system_metrics_collector.stop()
+    warmup_task.cancel()
     monitor_task.cancel()
     consumer_task.cancel()
 
     if grpc_server:
         await grpc_server.stop(grace=2.0)
+    if grpc_leader_task is not None:
+        await grpc_leader_task
 
+    await registry_snapshot.stop()
+    await shadow_runner.stop()
     await batch_manager.stop()
+    inference_executor.shutdown()
     await kafka_producer.stop()
     await kafka_consumer.stop()
     try:
@@ -489,4 +582,5 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:  # noqa: PLR0915
     except (TimeoutError, asyncio.CancelledError):
         pass
     await engine.dispose()
+    mark_worker_dead()
     logger.info("✅ Cleanup complete.")
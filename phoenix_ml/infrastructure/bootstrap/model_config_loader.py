@@ -9,7 +9,9 @@ import logging
 from pathlib import Path
 from typing import Any
 
+from phoenix_ml.domain.inference.value_objects.cascade_options import CascadeOptions
 from phoenix_ml.domain.inference.value_objects.model_config import ModelConfig
+from phoenix_ml.domain.inference.value_objects.runtime_options import RuntimeOptions
 
 logger = logging.getLogger(__name__)
 
@@ -65,6 +67,21 @@ def _dict_to_model_config(data: dict[str, Any]) -> ModelConfig:
     if not isinstance(retrain, dict):
         retrain = {}
 
+    # Parse serving section
+    serving = data.get("serving", {})
+    if not isinstance(serving, dict):
+        serving = {}
+
+    # Parse runtime section (ORT session threading / inference executor)
+    runtime = data.get("runtime", {})
+    if not isinstance(runtime, dict):
+        runtime = {}
+
+    # Parse cascade section (cheap first-stage model, confidence-gated)
+    cascade = data.get("cascade", {})
+    if not isinstance(cascade, dict):
+        cascade = {}
+
     # Task-type defaults mapping (OCP: add new task types via dict entry)
     # Format: (drift_test, primary_metric, default_data_source, default_trigger, drift_enabled)
     _TASK_DEFAULTS: dict[str, tuple[str, str, str, str, bool]] = {
@@ -105,6 +122,20 @@ def _dict_to_model_config(data: dict[str, Any]) -> ModelConfig:
         retrain_trigger=retrain.get("trigger", default_trigger),
         retrain_schedule=retrain.get("schedule", ""),
         drift_detection_enabled=retrain.get("drift_detection", default_drift_enabled),
+        latency_budget_ms=float(serving.get("latency_budget_ms", 0.0)),
+        scheduler_weight=float(serving.get("scheduler_weight", 1.0)),
+        runtime=RuntimeOptions(
+            intra_op_threads=int(runtime.get("intra_op_threads", 0)),
+            inter_op_threads=int(runtime.get("inter_op_threads", 0)),
+            execution_mode=runtime.get("execution_mode", "sequential"),
+            graph_optimization_level=runtime.get("graph_optimization_level", "all"),
+            executor_workers=int(runtime.get("executor_workers", 0)),
+        ),
+        cascade=CascadeOptions(
+            model_id=str(cascade.get("model_id", "")),
+            version=str(cascade.get("version", "")),
+            confidence_threshold=float(cascade.get("confidence_threshold", 0.9)),
+        ),
     )
 
 
@@ -0,0 +1,56 @@
+"""Single-holder leases between serving worker processes.
+
+Some services must run in exactly one worker even when the API is served
+by several processes, e.g. the gRPC server: every worker binding the
+same port would either fail or silently split the traffic. A
+``WorkerLease`` is an exclusive ``flock`` on a file shared by the
+workers. The kernel releases it when the holding process exits, so a
+worker that keeps retrying ``try_acquire`` takes over from a crashed
+holder.
+"""
+
+import fcntl
+import logging
+import os
+from pathlib import Path
+from typing import IO
+
+logger = logging.getLogger(__name__)
+
+
+class WorkerLease:
+    """Exclusive, non-blocking lease identified by ``<lease_dir>/<name>.lock``."""
+
+    def __init__(self, lease_dir: Path, name: str) -> None:
+        self._path = lease_dir / f"{name}.lock"
+        self._file: IO[str] | None = None
+
+    @property
+    def held(self) -> bool:
+        return self._file is not None
+
+    def try_acquire(self) -> bool:
+        """Take the lease if no other process holds it; True if this process holds it."""
+        if self._file is not None:
+            return True
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        f = open(self._path, "a+")  # noqa: SIM115 — held open for the lease lifetime
+        try:
+            fcntl.flock(f, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            f.close()
+            return False
+        f.seek(0)
+        f.truncate()
+        f.write(str(os.getpid()))
+        f.flush()
+        self._file = f
+        logger.info("Worker %d holds the %s lease", os.getpid(), self._path.stem)
+        return True
+
+    def release(self) -> None:
+        if self._file is None:
+            return
+        fcntl.flock(self._file, fcntl.LOCK_UN)
+        self._file.close()
+        self._file = None
@@ -2,18 +2,30 @@
 
 Runs alongside the FastAPI HTTP server, sharing the same domain layer.
 Uses compiled proto stubs from ``inference.proto``.
+
+``PredictBatch`` and ``PredictStream`` carry features as a packed float32
+``Tensor`` and run through ``BatchPredictHandler``, the same batching
+path as ``/predict/batch``. Every RPC is a coroutine served on the
+``grpc.aio`` event loop; no thread pool is involved.
 """
 
+import asyncio
 import logging
+import math
 import time
 import uuid
-from concurrent import futures
+from collections import deque
+from collections.abc import AsyncIterator
 from typing import Any
 
 import grpc
+import numpy as np
 
+from phoenix_ml.application.commands.batch_predict_command import BatchPredictCommand
 from phoenix_ml.application.commands.predict_command import PredictCommand
+from phoenix_ml.application.handlers.batch_predict_handler import BatchPredictHandler
 from phoenix_ml.application.handlers.predict_handler import PredictHandler
+from phoenix_ml.config import get_settings
 from phoenix_ml.domain.feature_store.repositories.feature_store import FeatureStore
 from phoenix_ml.domain.inference.services.batch_manager import BatchManager
 from phoenix_ml.domain.inference.services.inference_engine import InferenceEngine
@@ -21,11 +33,23 @@ from phoenix_ml.domain.inference.services.inference_service import InferenceServ
 from phoenix_ml.domain.inference.services.routing_strategy import SingleModelStrategy
 from phoenix_ml.domain.model_registry.repositories.artifact_storage import ArtifactStorage
 from phoenix_ml.domain.model_registry.repositories.model_repository import ModelRepository
-from phoenix_ml.infrastructure.bootstrap.container import event_bus
+from phoenix_ml.infrastructure.bootstrap.container import (
+    event_bus,
+    model_cascade,
+    model_runtime_cache,
+    plugin_registry,
+    variant_selector,
+)
 from phoenix_ml.infrastructure.grpc.proto import inference_pb2, inference_pb2_grpc
+from phoenix_ml.shared.exceptions import DeadlineExceededError, OverloadedError
 
 logger = logging.getLogger(__name__)
 
+_FLOAT32 = np.dtype("<f4")
+_MATRIX_NDIM = 2
+# Large enough for ~500k float32 features per message (gRPC defaults to 4 MiB)
+_MAX_MESSAGE_BYTES = 64 * 1024 * 1024
+
 
 # ── Fallback classes (used when proto stubs are unavailable, e.g. tests) ──
 
@@ -93,16 +117,83 @@ class LoggingInterceptor(grpc.aio.ServerInterceptor):  # type: ignore[misc]
 # ── InferenceServicer ────────────────────────────────────────────────
 
 
+def _deadline_ms(context: Any) -> float | None:
+    """Time left until the client's gRPC deadline in ms (None without one)."""
+    try:
+        remaining = context.time_remaining()
+    except Exception:
+        return None
+    if isinstance(remaining, (int, float)) and remaining > 0:
+        return float(remaining) * 1000.0
+    return None
+
+
+def _request_deadline_ms(request: Any, context: Any) -> float | None:
+    """Tighter of the request's ``deadline_ms`` and the call deadline."""
+    budgets = [b for b in (request.deadline_ms or None, _deadline_ms(context)) if b]
+    return min(budgets) if budgets else None
+
+
+class TensorFormatError(ValueError):
+    """A ``Tensor`` message does not hold a finite float32 (N, D) matrix."""
+
+
+def decode_tensor(tensor: Any) -> np.ndarray:
+    """(N, D) float32 view of a proto ``Tensor``, without copying its data."""
+    shape = tuple(tensor.shape)
+    if len(shape) == 1:
+        shape = (1, *shape)
+    if len(shape) != _MATRIX_NDIM or min(shape) <= 0:
+        raise TensorFormatError(f"Expected a non-empty (N, D) tensor, got shape {list(shape)}")
+    expected = shape[0] * shape[1] * _FLOAT32.itemsize
+    if len(tensor.data) != expected:
+        raise TensorFormatError(
+            f"Tensor shape {list(shape)} needs {expected} bytes of float32, got {len(tensor.data)}"
+        )
+    matrix = np.frombuffer(tensor.data, dtype=_FLOAT32).reshape(shape)
+    if not np.isfinite(matrix).all():
+        raise TensorFormatError("Tensor contains NaN or infinite values")
+    return matrix
+
+
+def encode_tensor(matrix: np.ndarray) -> Any:
+    """Pack a 2-D array into a proto ``Tensor`` as little-endian float32."""
+    data = np.ascontiguousarray(matrix, dtype=_FLOAT32)
+    return inference_pb2.Tensor(data=data.tobytes(), shape=data.shape)  # type: ignore[attr-defined]
+
+
+def _set_error_status(context: Any, error: Exception, method: str) -> None:
+    """Map a handler exception onto the gRPC status of the current call."""
+    if isinstance(error, DeadlineExceededError):
+        context.set_code(grpc.StatusCode.DEADLINE_EXCEEDED)
+    elif isinstance(error, OverloadedError):
+        context.set_code(grpc.StatusCode.RESOURCE_EXHAUSTED)
+        context.set_trailing_metadata((("retry-after", str(math.ceil(error.retry_after_s))),))
+    elif isinstance(error, TensorFormatError):
+        context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
+    elif isinstance(error, ValueError):
+        context.set_code(grpc.StatusCode.NOT_FOUND)
+    else:
+        logger.error("gRPC %s failed", method, exc_info=error)
+        context.set_code(grpc.StatusCode.INTERNAL)
+    context.set_details(str(error))
+
+
 class InferenceServicer(inference_pb2_grpc.InferenceServiceServicer):
     """
     gRPC service implementation for the Phoenix Inference API.
 
     Inherits from the generated InferenceServiceServicer stub and wraps
     the same PredictHandler used by the FastAPI server for consistency.
+    ``max_in_flight`` bounds how many ``PredictStream`` messages are
+    predicted concurrently per stream; further messages are not read until
+    the oldest response has been sent.
     """
 
-    def __init__(self, predict_handler: PredictHandler) -> None:
+    def __init__(self, predict_handler: PredictHandler, max_in_flight: int = 2) -> None:
         self._handler = predict_handler
+        self._batch_handler = BatchPredictHandler(predict_handler)
+        self._max_in_flight = max(1, max_in_flight)
 
     async def Predict(  # noqa: N802
         self, request: Any, context: Any
@@ -114,6 +205,7 @@ class InferenceServicer(inference_pb2_grpc.InferenceServiceServicer):
                 model_version=request.model_version or None,
                 entity_id=request.entity_id or None,
                 features=list(request.features) if request.features else None,
+                deadline_ms=_deadline_ms(context),
             )
             prediction = await self._handler.execute(command)
 
@@ -130,16 +222,92 @@ class InferenceServicer(inference_pb2_grpc.InferenceServiceServicer):
             response.latency_ms = round(prediction.latency_ms, 2)
             return response
 
-        except ValueError as e:
-            context.set_code(grpc.StatusCode.NOT_FOUND)
-            context.set_details(str(e))
-            return inference_pb2.PredictResponse()  # type: ignore[attr-defined]
         except Exception as e:
-            logger.exception("gRPC Predict failed")
-            context.set_code(grpc.StatusCode.INTERNAL)
-            context.set_details(str(e))
+            _set_error_status(context, e, "Predict")
             return inference_pb2.PredictResponse()  # type: ignore[attr-defined]
 
+    async def PredictBatch(  # noqa: N802
+        self, request: Any, context: Any
+    ) -> Any:
+        """Handle a PredictBatch RPC: one (N, D) tensor, one columnar response."""
+        try:
+            return await self._predict_batch(request, _request_deadline_ms(request, context))
+        except Exception as e:
+            _set_error_status(context, e, "PredictBatch")
+            return inference_pb2.PredictBatchResponse()  # type: ignore[attr-defined]
+
+    async def PredictStream(  # noqa: N802
+        self, request_iterator: AsyncIterator[Any], context: Any
+    ) -> AsyncIterator[Any]:
+        """
+        Handle a PredictStream RPC.
+
+        Each request message is predicted like a ``PredictBatch`` call and
+        answered by exactly one response, in request order. A failing
+        message is reported in that response's ``error`` field and the
+        stream carries on.
+        """
+        pending: deque[asyncio.Task[Any]] = deque()
+        try:
+            async for request in request_iterator:
+                deadline_ms = _request_deadline_ms(request, context)
+                pending.append(asyncio.create_task(self._stream_batch(request, deadline_ms)))
+                if len(pending) >= self._max_in_flight:
+                    yield await pending.popleft()
+            while pending:
+                yield await pending.popleft()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _stream_batch(self, request: Any, deadline_ms: float | None) -> Any:
+        try:
+            return await self._predict_batch(request, deadline_ms)
+        except (DeadlineExceededError, OverloadedError, ValueError) as e:
+            error = str(e)
+        except Exception as e:
+            logger.exception("gRPC PredictStream message failed")
+            error = str(e)
+        return inference_pb2.PredictBatchResponse(  # type: ignore[attr-defined]
+            model_id=request.model_id, version=request.model_version, error=error
+        )
+
+    async def _predict_batch(self, request: Any, deadline_ms: float | None) -> Any:
+        matrix = decode_tensor(request.features)
+        result = await self._batch_handler.handle(
+            BatchPredictCommand(
+                model_id=request.model_id,
+                model_version=request.model_version or None,
+                batch=matrix,
+                deadline_ms=deadline_ms,
+            )
+        )
+        outputs = np.full((result["total"], 2), np.nan, dtype=_FLOAT32)
+        for i, (value, confidence) in enumerate(
+            zip(result["results"], result["confidences"], strict=True)
+        ):
+            if value is not None:
+                try:
+                    outputs[i] = (value, confidence)
+                except (TypeError, ValueError) as e:
+                    # Label postprocessors return strings; only /predict/batch carries those
+                    raise TypeError(
+                        f"Model '{result['model_id']}' returns non-numeric results "
+                        f"({value!r}); use the HTTP batch API"
+                    ) from e
+
+        return inference_pb2.PredictBatchResponse(  # type: ignore[attr-defined]
+            model_id=result["model_id"],
+            version=result["version"] or "",
+            outputs=encode_tensor(outputs),
+            errors=[
+                inference_pb2.RowError(index=e["index"], error=e["error"])  # type: ignore[attr-defined]
+                for e in result["errors"]
+            ],
+            successful=result["successful"],
+            latency_ms=result["batch_latency_ms"],
+        )
+
     async def HealthCheck(  # noqa: N802
         self, request: Any, context: Any
     ) -> Any:
@@ -152,18 +320,24 @@ class InferenceServicer(inference_pb2_grpc.InferenceServiceServicer):
 # ── Server Factory ───────────────────────────────────────────────────
 
 
-def create_grpc_server(  # noqa: PLR0913
+def create_grpc_server(  # noqa: PLR0913, PLR0917
     model_repo: ModelRepository,
     inference_engine: InferenceEngine,
     batch_manager: BatchManager,
     feature_store: FeatureStore,
     artifact_storage: ArtifactStorage,
     port: int = 50051,
-    max_workers: int = 10,
+    *,
+    max_message_bytes: int = _MAX_MESSAGE_BYTES,
 ) -> grpc.aio.Server:
     """
     Create and configure a gRPC async server.
 
+    The servicer's coroutines run directly on the event loop, so the
+    server needs no executor. ``max_message_bytes`` caps request and
+    response size for both directions, which bounds ``PredictBatch``
+    tensors.
+
     Returns the server instance (call ``await server.start()`` to run).
     """
     inference_service = InferenceService(
@@ -173,15 +347,22 @@ def create_grpc_server(  # noqa: PLR0913
         feature_store=feature_store,
         artifact_storage=artifact_storage,
         routing_strategy=SingleModelStrategy(),
+        runtime_cache=model_runtime_cache,
+        postprocessor_resolver=plugin_registry.get_postprocessor,
+        cascade=model_cascade,
+        variant_selector=variant_selector,
     )
 
     handler = PredictHandler(inference_service, event_bus)
-    servicer = InferenceServicer(handler)
+    servicer = InferenceServicer(handler, max_in_flight=get_settings().STREAM_MAX_IN_FLIGHT)
 
     interceptors = [LoggingInterceptor()]
     server = grpc.aio.server(
-        futures.ThreadPoolExecutor(max_workers=max_workers),
         interceptors=interceptors,
+        options=[
+            ("grpc.max_receive_message_length", max_message_bytes),
+            ("grpc.max_send_message_length", max_message_bytes),
+        ],
     )
 
     # Register the servicer with the generated proto stubs
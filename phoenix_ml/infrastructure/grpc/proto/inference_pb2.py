@@ -25,7 +25,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0finference.proto\x12\x14phoenix.inference.v1\"%\n\x12HealthCheckRequest\x12\x0f\n\x07service\x18\x01 \x01(\t\"\x9a\x01\n\x13HealthCheckResponse\x12G\n\x06status\x18\x01 \x01(\x0e\x32\x37.phoenix.inference.v1.HealthCheckResponse.ServingStatus\":\n\rServingStatus\x12\x0b\n\x07UNKNOWN\x10\x00\x12\x0b\n\x07SERVING\x10\x01\x12\x0f\n\x0bNOT_SERVING\x10\x02\"^\n\x0ePredictRequest\x12\x10\n\x08model_id\x18\x01 \x01(\t\x12\x15\n\rmodel_version\x18\x02 \x01(\t\x12\x11\n\tentity_id\x18\x03 \x01(\t\x12\x10\n\x08\x66\x65\x61tures\x18\x04 \x03(\x02\"\x83\x01\n\x0fPredictResponse\x12\x15\n\rprediction_id\x18\x01 \x01(\t\x12\x10\n\x08model_id\x18\x02 \x01(\t\x12\x0f\n\x07version\x18\x03 \x01(\t\x12\x0e\n\x06result\x18\x04 \x03(\x02\x12\x12\n\nconfidence\x18\x05 \x01(\x02\x12\x12\n\nlatency_ms\x18\x06 \x01(\x02\x32\xce\x01\n\x10InferenceService\x12V\n\x07Predict\x12$.phoenix.inference.v1.PredictRequest\x1a%.phoenix.inference.v1.PredictResponse\x12\x62\n\x0bHealthCheck\x12(.phoenix.inference.v1.HealthCheckRequest\x1a).phoenix.inference.v1.HealthCheckResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x0finference.proto\x12\x14phoenix.inference.v1\"%\n\x12HealthCheckRequest\x12\x0f\n\x07service\x18\x01 \x01(\t\"\x9a\x01\n\x13HealthCheckResponse\x12G\n\x06status\x18\x01 \x01(\x0e\x32\x37.phoenix.inference.v1.HealthCheckResponse.ServingStatus\":\n\rServingStatus\x12\x0b\n\x07UNKNOWN\x10\x00\x12\x0b\n\x07SERVING\x10\x01\x12\x0f\n\x0bNOT_SERVING\x10\x02\"^\n\x0ePredictRequest\x12\x10\n\x08model_id\x18\x01 \x01(\t\x12\x15\n\rmodel_version\x18\x02 \x01(\t\x12\x11\n\tentity_id\x18\x03 \x01(\t\x12\x10\n\x08\x66\x65\x61tures\x18\x04 \x03(\x02\"\x83\x01\n\x0fPredictResponse\x12\x15\n\rprediction_id\x18\x01 \x01(\t\x12\x10\n\x08model_id\x18\x02 \x01(\t\x12\x0f\n\x07version\x18\x03 \x01(\t\x12\x0e\n\x06result\x18\x04 \x03(\x02\x12\x12\n\nconfidence\x18\x05 \x01(\x02\x12\x12\n\nlatency_ms\x18\x06 \x01(\x02\"%\n\x06Tensor\x12\x0c\n\x04\x64\x61ta\x18\x01 \x01(\x0c\x12\r\n\x05shape\x18\x02 \x03(\x03\"\x83\x01\n\x13PredictBatchRequest\x12\x10\n\x08model_id\x18\x01 \x01(\t\x12\x15\n\rmodel_version\x18\x02 \x01(\t\x12.\n\x08\x66\x65\x61tures\x18\x03 \x01(\x0b\x32\x1c.phoenix.inference.v1.Tensor\x12\x13\n\x0b\x64\x65\x61\x64line_ms\x18\x04 \x01(\x02\"(\n\x08RowError\x12\r\n\x05index\x18\x01 \x01(\x03\x12\r\n\x05\x65rror\x18\x02 \x01(\t\"\xcf\x01\n\x14PredictBatchResponse\x12\x10\n\x08model_id\x18\x01 \x01(\t\x12\x0f\n\x07version\x18\x02 \x01(\t\x12-\n\x07outputs\x18\x03 \x01(\x0b\x32\x1c.phoenix.inference.v1.Tensor\x12.\n\x06\x65rrors\x18\x04 \x03(\x0b\x32\x1e.phoenix.inference.v1.RowError\x12\x12\n\nsuccessful\x18\x05 \x01(\x03\x12\x12\n\nlatency_ms\x18\x06 \x01(\x02\x12\r\n\x05\x65rror\x18\x07 \x01(\t2\xa1\x03\n\x10InferenceService\x12V\n\x07Predict\x12$.phoenix.inference.v1.PredictRequest\x1a%.phoenix.inference.v1.PredictResponse\x12\x65\n\x0cPredictBatch\x12).phoenix.inference.v1.PredictBatchRequest\x1a*.phoenix.inference.v1.PredictBatchResponse\x12j\n\rPredictStream\x12).phoenix.inference.v1.PredictBatchRequest\x1a*.phoenix.inference.v1.PredictBatchResponse(\x01\x30\x01\x12\x62\n\x0bHealthCheck\x12(.phoenix.inference.v1.HealthCheckRequest\x1a).phoenix.inference.v1.HealthCheckResponseb\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -42,6 +42,14 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_PREDICTREQUEST']._serialized_end=331
   _globals['_PREDICTRESPONSE']._serialized_start=334
   _globals['_PREDICTRESPONSE']._serialized_end=465
-  _globals['_INFERENCESERVICE']._serialized_start=468
-  _globals['_INFERENCESERVICE']._serialized_end=674
+  _globals['_TENSOR']._serialized_start=467
+  _globals['_TENSOR']._serialized_end=504
+  _globals['_PREDICTBATCHREQUEST']._serialized_start=507
+  _globals['_PREDICTBATCHREQUEST']._serialized_end=638
+  _globals['_ROWERROR']._serialized_start=640
+  _globals['_ROWERROR']._serialized_end=680
+  _globals['_PREDICTBATCHRESPONSE']._serialized_start=683
+  _globals['_PREDICTBATCHRESPONSE']._serialized_end=890
+  _globals['_INFERENCESERVICE']._serialized_start=893
+  _globals['_INFERENCESERVICE']._serialized_end=1310
 # @@protoc_insertion_point(module_scope)
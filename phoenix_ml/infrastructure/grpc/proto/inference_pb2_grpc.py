@@ -40,6 +40,16 @@ class InferenceServiceStub:
                 request_serializer=inference__pb2.PredictRequest.SerializeToString,
                 response_deserializer=inference__pb2.PredictResponse.FromString,
                 _registered_method=True)
+        self.PredictBatch = channel.unary_unary(
+                '/phoenix.inference.v1.InferenceService/PredictBatch',
+                request_serializer=inference__pb2.PredictBatchRequest.SerializeToString,
+                response_deserializer=inference__pb2.PredictBatchResponse.FromString,
+                _registered_method=True)
+        self.PredictStream = channel.stream_stream(
+                '/phoenix.inference.v1.InferenceService/PredictStream',
+                request_serializer=inference__pb2.PredictBatchRequest.SerializeToString,
+                response_deserializer=inference__pb2.PredictBatchResponse.FromString,
+                _registered_method=True)
         self.HealthCheck = channel.unary_unary(
                 '/phoenix.inference.v1.InferenceService/HealthCheck',
                 request_serializer=inference__pb2.HealthCheckRequest.SerializeToString,
@@ -57,6 +67,19 @@ class InferenceServiceServicer:
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def PredictBatch(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def PredictStream(self, request_iterator, context):
+        """Responses arrive in request order, one per request message
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
     def HealthCheck(self, request, context):
         """Missing associated documentation comment in .proto file."""
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
@@ -71,6 +94,16 @@ def add_InferenceServiceServicer_to_server(servicer, server):
                     request_deserializer=inference__pb2.PredictRequest.FromString,
                     response_serializer=inference__pb2.PredictResponse.SerializeToString,
             ),
+            'PredictBatch': grpc.unary_unary_rpc_method_handler(
+                    servicer.PredictBatch,
+                    request_deserializer=inference__pb2.PredictBatchRequest.FromString,
+                    response_serializer=inference__pb2.PredictBatchResponse.SerializeToString,
+            ),
+            'PredictStream': grpc.stream_stream_rpc_method_handler(
+                    servicer.PredictStream,
+                    request_deserializer=inference__pb2.PredictBatchRequest.FromString,
+                    response_serializer=inference__pb2.PredictBatchResponse.SerializeToString,
+            ),
             'HealthCheck': grpc.unary_unary_rpc_method_handler(
                     servicer.HealthCheck,
                     request_deserializer=inference__pb2.HealthCheckRequest.FromString,
@@ -115,6 +148,60 @@ class InferenceService:
             metadata,
             _registered_method=True)
 
+    @staticmethod
+    def PredictBatch(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/phoenix.inference.v1.InferenceService/PredictBatch',
+            inference__pb2.PredictBatchRequest.SerializeToString,
+            inference__pb2.PredictBatchResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def PredictStream(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(
+            request_iterator,
+            target,
+            '/phoenix.inference.v1.InferenceService/PredictStream',
+            inference__pb2.PredictBatchRequest.SerializeToString,
+            inference__pb2.PredictBatchResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
     @staticmethod
     def HealthCheck(request,
             target,
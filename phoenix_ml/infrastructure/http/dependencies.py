@@ -1,62 +1,17 @@
-from collections.abc import Callable
-
-from fastapi import Depends
-from sqlalchemy.ext.asyncio import AsyncSession
-
 from phoenix_ml.application.handlers.predict_handler import PredictHandler
-from phoenix_ml.config import get_settings
-from phoenix_ml.domain.inference.services.inference_service import InferenceService
-from phoenix_ml.domain.inference.services.routing_strategy import ABTestStrategy
 from phoenix_ml.domain.model_registry.repositories.model_repository import ModelRepository
 from phoenix_ml.infrastructure.bootstrap.container import (
-    artifact_storage,
-    batch_manager,
+    create_inference_service,
     event_bus,
-    feature_store,
-    inference_engine,
-)
-from phoenix_ml.infrastructure.persistence.database import get_db_optional
-from phoenix_ml.infrastructure.persistence.mlflow_model_registry import (
-    MlflowModelRegistry,
+    in_memory_model_repo,
+    registry_snapshot,
 )
-from phoenix_ml.infrastructure.persistence.postgres_model_registry import (
-    PostgresModelRegistry,
-)
-
-settings = get_settings()
-
-# ── Model Registry Factory (OCP: add new backends via dict entry) ──
-_REGISTRY_FACTORIES: dict[str, Callable[..., ModelRepository]] = {
-    "mlflow": lambda db: MlflowModelRegistry(
-        tracking_uri=settings.MLFLOW_TRACKING_URI,
-    ),
-    "postgres": lambda db: PostgresModelRegistry(db),
-}
-
-# Read backend from config (not os.getenv)
-_registry_backend = settings.MODEL_REGISTRY_BACKEND
-
-
-async def get_predict_handler(
-    db: AsyncSession | None = Depends(get_db_optional),  # noqa: B008
-) -> PredictHandler:
-    if db is not None:
-        factory = _REGISTRY_FACTORIES.get(_registry_backend, _REGISTRY_FACTORIES["postgres"])
-        model_repo: ModelRepository = factory(db)
-    else:
-        # Fallback: use global in-memory model repo (seeded during startup)
-        from phoenix_ml.infrastructure.bootstrap.container import (  # noqa: PLC0415
-            in_memory_model_repo,
-        )
 
-        model_repo = in_memory_model_repo
 
-    inference_service = InferenceService(
-        model_repo=model_repo,
-        inference_engine=inference_engine,
-        batch_manager=batch_manager,
-        feature_store=feature_store,
-        artifact_storage=artifact_storage,
-        routing_strategy=ABTestStrategy(0.5),
+async def get_predict_handler() -> PredictHandler:
+    # Routing reads come from the in-process registry snapshot; without a
+    # DB it is never loaded and the in-memory repo (seeded at startup) is used.
+    model_repo: ModelRepository = (
+        registry_snapshot if registry_snapshot.is_loaded else in_memory_model_repo
     )
-    return PredictHandler(inference_service, event_bus)
+    return PredictHandler(create_inference_service(model_repo), event_bus)
@@ -1,5 +1,6 @@
 import logging
 import signal
+from typing import Any
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -15,8 +16,10 @@ from phoenix_ml.infrastructure.http.feature_routes import feature_router
 from phoenix_ml.infrastructure.http.middleware.correlation_middleware import CorrelationMiddleware
 from phoenix_ml.infrastructure.http.middleware.rate_limit_middleware import RateLimitMiddleware
 from phoenix_ml.infrastructure.http.routes import router
+from phoenix_ml.infrastructure.http.stream_routes import stream_router
 from phoenix_ml.infrastructure.http.websocket_routes import ws_router
 from phoenix_ml.infrastructure.logging.logging_config import configure_logging
+from phoenix_ml.infrastructure.monitoring.prometheus_multiprocess import metrics_registry
 from phoenix_ml.infrastructure.monitoring.tracing import init_tracing
 
 logger = logging.getLogger(__name__)
@@ -71,12 +74,14 @@ app.add_middleware(CorrelationMiddleware)
 app.add_middleware(RateLimitMiddleware)
 
 # ── Metrics ───────────────────────────────────────────────────────
-metrics_app = make_asgi_app()
+# Merged over all workers when serving with several processes
+metrics_app = make_asgi_app(registry=metrics_registry())
 app.mount("/metrics", metrics_app)
 
 # ── Routes (API v1) ──────────────────────────────────────────────
 app.include_router(auth_router, prefix="/api/v1")
 app.include_router(router, prefix="/api/v1")
+app.include_router(stream_router, prefix="/api/v1")
 app.include_router(feature_router, prefix="/api/v1")
 app.include_router(explain_router, prefix="/api/v1")
 app.include_router(data_router, prefix="/api/v1")
@@ -86,46 +91,46 @@ app.include_router(ws_router)
 
 # ── Backward-compatible routes (no prefix) ────────────────────────
 app.include_router(router)
+app.include_router(stream_router)
 app.include_router(feature_router)
 app.include_router(data_router)
 
 
 # ── Graceful shutdown ─────────────────────────────────────────────
 _shutting_down = False
+# Handlers replaced below, e.g. uvicorn's exit handler when a worker
+# imports the app while its server is already running
+_previous_handlers: dict[int, Any] = {}
 
 
-def _graceful_shutdown(signum: int, _frame: object) -> None:
+def _graceful_shutdown(signum: int, frame: Any) -> None:
     """Handle SIGTERM/SIGINT gracefully — drain connections first."""
     global _shutting_down  # noqa: PLW0603
-    if _shutting_down:
-        return
-    _shutting_down = True
-    logger.info(
-        "Received signal %s — starting graceful shutdown...", signum
-    )
-    # Uvicorn handles shutdown via lifespan on SIGINT/SIGTERM
-    # This log ensures we know about it
+    if not _shutting_down:
+        _shutting_down = True
+        logger.info("Received signal %s — starting graceful shutdown...", signum)
+    # Uvicorn handles shutdown via lifespan on SIGINT/SIGTERM; pass the
+    # signal on so its handler still runs
+    previous = _previous_handlers.get(signum)
+    if callable(previous):
+        previous(signum, frame)
 
 
 # Register signal handlers (only in main process, not in workers)
 try:
-    signal.signal(signal.SIGTERM, _graceful_shutdown)
-    signal.signal(signal.SIGINT, _graceful_shutdown)
+    for _sig in (signal.SIGTERM, signal.SIGINT):
+        _previous_handlers[_sig] = signal.getsignal(_sig)
+        signal.signal(_sig, _graceful_shutdown)
 except (ValueError, OSError):
     # Can't set signal handlers in non-main thread
     pass
 
 
 def run() -> None:
-    """CLI entry point: `phoenix-serve` command."""
-    import uvicorn  # noqa: PLC0415
-
-    uvicorn.run(
-        "phoenix_ml.infrastructure.http.fastapi_server:app",
-        host=getattr(settings, "HOST", "0.0.0.0"),
-        port=getattr(settings, "PORT", 8000),
-        reload=settings.DEBUG,
-    )
+    """Run the server (see ``phoenix_ml.infrastructure.http.server``)."""
+    from phoenix_ml.infrastructure.http.server import run as run_server  # noqa: PLC0415
+
+    run_server()
 
 
 if __name__ == "__main__":
@@ -1,11 +1,12 @@
 import logging
 from typing import Any
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Response
 from pydantic import BaseModel
 
 from phoenix_ml.domain.feature_store.entities.feature_registry import FeatureMetadata
 from phoenix_ml.infrastructure.bootstrap.container import feature_store
+from phoenix_ml.infrastructure.http.json_response import FastJSONResponse
 
 logger = logging.getLogger(__name__)
 
@@ -17,8 +18,8 @@ class IngestRequest(BaseModel):
     features: dict[str, float]
 
 
-@feature_router.get("/{entity_id}")
-async def get_features(entity_id: str, keys: str = "") -> dict[str, Any]:
+@feature_router.get("/{entity_id}", response_model=dict[str, Any])
+async def get_features(entity_id: str, keys: str = "") -> Response:
     """Retrieve online features for a specific entity."""
     feature_names = keys.split(",") if keys else []
     if not feature_names:
@@ -28,7 +29,9 @@ async def get_features(entity_id: str, keys: str = "") -> dict[str, Any]:
     if not features:
         raise HTTPException(status_code=404, detail=f"Entity {entity_id} not found")
 
-    return {"entity_id": entity_id, "features": dict(zip(feature_names, features, strict=False))}
+    return FastJSONResponse(
+        {"entity_id": entity_id, "features": dict(zip(feature_names, features, strict=False))}
+    )
 
 
 @feature_router.post("/ingest")
@@ -1,12 +1,14 @@
 import json
 import logging
+import math
 import os
 import uuid
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+import numpy as np
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, Response
 from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -30,10 +32,20 @@ from phoenix_ml.infrastructure.bootstrap.container import (
     drift_calculator,
     event_bus,
     find_project_root,
+    in_memory_model_repo,
     kafka_producer,
     model_evaluator,
+    model_hot_swapper,
+    registry_snapshot,
 )
 from phoenix_ml.infrastructure.http.dependencies import get_predict_handler
+from phoenix_ml.infrastructure.http.json_response import FastJSONResponse
+from phoenix_ml.infrastructure.http.tensor_codec import (
+    accepted_tensor_type,
+    encode_tensor,
+    read_body,
+    request_body_schema,
+)
 from phoenix_ml.infrastructure.persistence.database import get_db, get_db_optional
 from phoenix_ml.infrastructure.persistence.postgres_drift_repo import (
     PostgresDriftReportRepository,
@@ -44,6 +56,7 @@ from phoenix_ml.infrastructure.persistence.postgres_log_repo import (
 from phoenix_ml.infrastructure.persistence.postgres_model_registry import (
     PostgresModelRegistry,
 )
+from phoenix_ml.shared.exceptions import DeadlineExceededError, InferenceError, OverloadedError
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -96,14 +109,38 @@ async def deep_health_check() -> dict[str, Any]:
     return report.to_dict()
 
 
+def _overloaded(e: OverloadedError) -> HTTPException:
+    """503 telling the client when the shed request is worth retrying."""
+    return HTTPException(
+        status_code=503,
+        detail=str(e),
+        headers={"Retry-After": str(math.ceil(e.retry_after_s))},
+    )
+
 
-@router.post("/predict")
+@router.post("/predict", openapi_extra=request_body_schema(PredictCommand))
 async def predict(
-    command: PredictCommand,
+    request: Request,
     background_tasks: BackgroundTasks,
     handler: PredictHandler = Depends(get_predict_handler),  # noqa: B008
     db: AsyncSession | None = Depends(get_db_optional),  # noqa: B008
-) -> dict[str, Any]:
+) -> Any:
+    """
+    Single prediction. Accepts a JSON ``PredictCommand`` or a one-row
+    binary tensor (metadata in the query string); answers in the tensor
+    format named by ``Accept`` when the result is numeric.
+    """
+    command, matrix = await read_body(request, PredictCommand)
+    if matrix is not None:
+        if len(matrix) != 1:
+            raise HTTPException(
+                status_code=422, detail=f"/predict takes one row, got {len(matrix)}"
+            )
+        # Inference reads the body's float32 view; the log gets plain floats
+        command = command.model_copy(
+            update={"features": matrix[0].tolist(), "features_array": matrix[0]}
+        )
+
     try:
         prediction = await handler.execute(command)
         prediction_id = str(uuid.uuid4())
@@ -111,7 +148,33 @@ async def predict(
             background_tasks.add_task(
                 _log_prediction_background, command, prediction, prediction_id, db
             )
-        return {
+    except DeadlineExceededError as e:
+        raise HTTPException(status_code=504, detail=str(e)) from e
+    except OverloadedError as e:
+        raise _overloaded(e) from e
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e)) from e
+    except Exception as e:
+        logger.exception("Inference failed")
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+    tensor_type = accepted_tensor_type(request.headers.get("accept"))
+    if tensor_type is not None and _is_numeric(prediction.result):
+        return Response(
+            encode_tensor(
+                np.array([[prediction.result, prediction.confidence.value]], dtype=np.float32),
+                tensor_type,
+            ),
+            media_type=tensor_type,
+            headers={
+                "X-Prediction-Id": prediction_id,
+                "X-Model-Id": prediction.model_id,
+                "X-Model-Version": prediction.model_version,
+                "X-Latency-Ms": str(round(prediction.latency_ms, 2)),
+            },
+        )
+    return FastJSONResponse(
+        {
             "prediction_id": prediction_id,
             "model_id": prediction.model_id,
             "version": prediction.model_version,
@@ -119,11 +182,13 @@ async def predict(
             "confidence": {"value": prediction.confidence.value},
             "latency_ms": round(prediction.latency_ms, 2),
         }
-    except ValueError as e:
-        raise HTTPException(status_code=404, detail=str(e)) from e
-    except Exception as e:
-        logger.exception("Inference failed")
-        raise HTTPException(status_code=500, detail=str(e)) from e
+    )
+
+
+def _is_numeric(*values: Any) -> bool:
+    return all(
+        v is None or (isinstance(v, int | float) and not isinstance(v, bool)) for v in values
+    )
 
 
 class BatchPredictRequest(BaseModel):
@@ -131,14 +196,22 @@ class BatchPredictRequest(BaseModel):
     batch: list[list[float]]
     model_version: str | None = None
     entity_ids: list[str] | None = None
+    deadline_ms: float | None = Field(default=None, gt=0)
 
 
-@router.post("/predict/batch")
+@router.post("/predict/batch", openapi_extra=request_body_schema(BatchPredictRequest))
 async def batch_predict(
-    request: BatchPredictRequest,
+    request: Request,
     handler: PredictHandler = Depends(get_predict_handler),  # noqa: B008
-) -> dict[str, Any]:
-    """Batch prediction — process multiple inputs in one request."""
+) -> Any:
+    """
+    Batch prediction — process multiple inputs in one request.
+
+    The batch is a JSON ``BatchPredictRequest`` or an (N, D) binary tensor
+    (metadata in the query string). With a tensor ``Accept`` the answer is
+    an (N, 2) float32 tensor of ``[result, confidence]`` rows, NaN for
+    failed rows.
+    """
     from phoenix_ml.application.commands.batch_predict_command import (  # noqa: PLC0415
         BatchPredictCommand,
     )
@@ -146,19 +219,43 @@ async def batch_predict(
         BatchPredictHandler,
     )
 
+    body, matrix = await read_body(request, BatchPredictRequest, batch=[])
     try:
         batch_handler = BatchPredictHandler(handler)
         command = BatchPredictCommand(
-            model_id=request.model_id,
-            batch=request.batch,
-            model_version=request.model_version,
-            entity_ids=request.entity_ids,
+            model_id=body.model_id,
+            batch=body.batch if matrix is None else matrix,
+            model_version=body.model_version,
+            entity_ids=body.entity_ids,
+            deadline_ms=body.deadline_ms,
         )
-        return await batch_handler.handle(command)
+        result = await batch_handler.handle(command)
+    except OverloadedError as e:
+        raise _overloaded(e) from e
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e)) from e
     except Exception as e:
         logger.exception("Batch inference failed")
         raise HTTPException(status_code=500, detail=str(e)) from e
 
+    tensor_type = accepted_tensor_type(request.headers.get("accept"))
+    if tensor_type is not None and _is_numeric(*result["results"]):
+        return Response(
+            encode_tensor(
+                np.array([result["results"], result["confidences"]], dtype=np.float32).T,
+                tensor_type,
+            ),
+            media_type=tensor_type,
+            headers={
+                "X-Model-Id": result["model_id"],
+                "X-Model-Version": str(result["version"]),
+                "X-Total": str(result["total"]),
+                "X-Successful": str(result["successful"]),
+                "X-Batch-Latency-Ms": str(result["batch_latency_ms"]),
+            },
+        )
+    return FastJSONResponse(result)
+
 
 @router.post("/feedback")
 async def feedback(
@@ -173,11 +270,11 @@ async def feedback(
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
-@router.get("/monitoring/drift/{model_id}")
+@router.get("/monitoring/drift/{model_id}", response_model=DriftReport)
 async def check_drift(
     model_id: str,
     db: AsyncSession = Depends(get_db),  # noqa: B008
-) -> DriftReport:
+) -> Response:
     try:
         log_repo = PostgresPredictionLogRepository(db)
         drift_repo = PostgresDriftReportRepository(db)
@@ -196,9 +293,10 @@ async def check_drift(
 
         root = find_project_root()
         reference_data = _load_reference_distributions(root)
-        return await ms.check_drift(
+        report = await ms.check_drift(
             model_id=model_id, reference_data=reference_data, feature_index=0
         )
+        return FastJSONResponse(report)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e)) from e
 
@@ -241,27 +339,28 @@ async def get_model(
     }
 
 
-@router.get("/monitoring/reports/{model_id}")
+@router.get("/monitoring/reports/{model_id}", response_model=list[DriftReport])
 async def get_drift_reports(
     model_id: str,
     limit: int = 10,
     db: AsyncSession = Depends(get_db),  # noqa: B008
-) -> list[DriftReport]:
+) -> Response:
     """Return historical drift reports for a model."""
     drift_repo = PostgresDriftReportRepository(db)
     handler = GetDriftReportQueryHandler(drift_repo)
-    return await handler.execute(GetDriftReportQuery(model_id=model_id, limit=limit))
+    reports = await handler.execute(GetDriftReportQuery(model_id=model_id, limit=limit))
+    return FastJSONResponse(reports)
 
 
-@router.get("/monitoring/performance/{model_id}")
+@router.get("/monitoring/performance/{model_id}", response_model=dict[str, Any])
 async def get_model_performance(
     model_id: str,
     db: AsyncSession = Depends(get_db),  # noqa: B008
-) -> dict[str, Any]:
+) -> Response:
     """Return aggregated performance metrics for a model."""
     log_repo = PostgresPredictionLogRepository(db)
     handler = GetModelPerformanceQueryHandler(log_repo, model_evaluator)
-    return await handler.execute(GetModelPerformanceQuery(model_id=model_id))
+    return FastJSONResponse(await handler.execute(GetModelPerformanceQuery(model_id=model_id)))
 
 
 class RollbackRequest(BaseModel):
@@ -278,6 +377,10 @@ class RegisterModelRequest(BaseModel):
     metrics: dict[str, Any] = Field(default_factory=dict)
 
 
+class PromoteModelRequest(BaseModel):
+    version: str
+
+
 @router.post("/models/rollback")
 async def rollback_challengers(
     request: RollbackRequest,
@@ -296,6 +399,8 @@ async def rollback_challengers(
         elif role == "challenger":
             await model_repo.update_stage(request.model_id, model.version, "archived")
             archived.append(model.version)
+    if archived:
+        registry_snapshot.invalidate(request.model_id)
 
     return {
         "model_id": request.model_id,
@@ -324,6 +429,7 @@ async def register_model(
 
     model_repo = PostgresModelRegistry(db)
     await model_repo.save(model)
+    registry_snapshot.invalidate(model.id)
 
     return {
         "model_id": model.id,
@@ -333,6 +439,23 @@ async def register_model(
     }
 
 
+@router.post("/models/{model_id}/promote")
+async def promote_model(model_id: str, request: PromoteModelRequest) -> dict[str, Any]:
+    """Hot-swap a registered version in as champion (warm up, flip, drain, unload)."""
+    model_repo = registry_snapshot if registry_snapshot.is_loaded else in_memory_model_repo
+    model = await model_repo.get_by_id(model_id, request.version)
+    if model is None:
+        raise HTTPException(
+            status_code=404, detail=f"Model '{model_id}:{request.version}' not found"
+        )
+    try:
+        drained = await model_hot_swapper.promote(model_repo, model)
+    except InferenceError as e:
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+    return {"model_id": model_id, "champion": model.version, "previous_drained": drained}
+
+
 @router.post("/models/{model_id}/retrain")
 async def trigger_retrain(model_id: str) -> dict[str, Any]:
     """Manually trigger model retraining via Airflow.
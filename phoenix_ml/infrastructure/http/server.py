@@ -0,0 +1,124 @@
+"""Pre-fork serving: run the API on several uvicorn worker processes.
+
+A single process caps the Python side of serving (request validation,
+postprocessing, the event bus) at one core. ``serve`` starts
+``SERVER_WORKERS`` uvicorn workers that accept on the same socket, and
+before starting them prepares the state they share:
+
+- a fresh Prometheus multiprocess directory, so ``/metrics`` on any
+  worker reports values merged over all of them;
+- the memory-mapped weight files of every configured ONNX model
+  (``SharedWeights``), so the workers map one copy of each model's
+  weights from the page cache instead of loading N private copies.
+
+uvicorn spawns its workers rather than forking a loaded parent, and ORT
+sessions would not survive a fork anyway (their thread pools stay in the
+parent), so each worker creates its own sessions over the shared
+weights. Inside the workers the gRPC server is bound by the holder of
+the ``grpc`` ``WorkerLease`` (see ``lifespan``).
+
+Spawned workers re-import the launching module before they answer the
+supervisor's health checks, so this module stays cheap to import: the
+app and the container are only imported where they are used.
+"""
+
+import logging
+import os
+from pathlib import Path
+
+import uvicorn
+
+from phoenix_ml.config import Settings, get_settings
+from phoenix_ml.infrastructure.bootstrap.model_config_loader import load_all_model_configs
+from phoenix_ml.infrastructure.monitoring.prometheus_multiprocess import (
+    prepare_multiprocess_dir,
+)
+
+logger = logging.getLogger(__name__)
+
+APP = "phoenix_ml.infrastructure.http.fastapi_server:app"
+
+
+def serve(
+    host: str = "0.0.0.0",
+    port: int = 8000,
+    *,
+    workers: int | None = None,
+    reload: bool = False,
+    log_level: str = "info",
+) -> None:
+    """Run the API server; ``workers`` defaults to ``SERVER_WORKERS``."""
+    settings = get_settings()
+    workers = workers if workers is not None else settings.SERVER_WORKERS
+    if workers > 1 and reload:
+        logger.warning("Auto-reload runs a single worker; ignoring workers=%d", workers)
+        workers = 1
+    if workers > 1:
+        prepare_workers(settings, workers)
+
+    uvicorn.run(
+        APP,
+        host=host,
+        port=port,
+        workers=workers,
+        reload=reload,
+        loop=settings.SERVER_LOOP,
+        http=settings.SERVER_HTTP,
+        timeout_keep_alive=settings.SERVER_KEEP_ALIVE_S,
+        log_level=log_level,
+    )
+
+
+def prepare_workers(settings: Settings, workers: int) -> None:
+    """Set up the state shared by ``workers`` processes before they start."""
+    # Workers build their settings from the environment they inherit
+    os.environ["SERVER_WORKERS"] = str(workers)
+    metrics_dir = prepare_multiprocess_dir(Path(settings.SERVER_RUNTIME_DIR) / "metrics")
+    if settings.SHARED_WEIGHTS is not False:
+        prepare_shared_weights(settings)
+    logger.info(
+        "Serving with %d workers (loop=%s, http=%s, metrics in %s)",
+        workers,
+        settings.SERVER_LOOP,
+        settings.SERVER_HTTP,
+        metrics_dir,
+    )
+
+
+def prepare_shared_weights(settings: Settings) -> None:
+    """Write the shared weight files of every configured ONNX model once."""
+    from phoenix_ml.infrastructure.bootstrap.container import (  # noqa: PLC0415
+        ensure_model_exists,
+        find_project_root,
+    )
+    from phoenix_ml.infrastructure.ml_engines.shared_weights import (  # noqa: PLC0415
+        SharedWeights,
+    )
+
+    shared = SharedWeights(min_tensor_bytes=settings.SHARED_WEIGHTS_MIN_TENSOR_KB * 1024)
+    configs = load_all_model_configs(find_project_root() / settings.MODEL_CONFIG_DIR)
+    for model_id, cfg in configs.items():
+        if cfg.framework != "onnx":
+            continue
+        try:
+            model_path = Path(cfg.model_path)
+            if not (model_path.is_absolute() and model_path.is_file()):
+                model_path = ensure_model_exists(model_id, cfg.version)
+            shared.prepare(model_path)
+        except Exception as e:
+            # Workers fall back to doing the rewrite themselves
+            logger.warning("Cannot prepare shared weights for %s: %s", model_id, e)
+
+
+def run() -> None:
+    """CLI entry point: `phoenix-serve` command (``SERVER_WORKERS`` processes)."""
+    settings = get_settings()
+    serve(
+        host=getattr(settings, "HOST", "0.0.0.0"),
+        port=getattr(settings, "PORT", 8000),
+        reload=settings.DEBUG,
+    )
+
+
+if __name__ == "__main__":
+    run()
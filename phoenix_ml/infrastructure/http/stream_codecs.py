@@ -0,0 +1,144 @@
+"""
+Incremental decoders for streamed prediction input.
+
+Both decoders consume the request body chunk by chunk, so the service
+never holds more than one chunk of rows (plus one partial line or Arrow
+message) regardless of how large the upload is.
+
+- NDJSON: one row per line, either ``[1.0, 2.0]`` or ``{"features": [...]}``.
+  A malformed line is yielded as ``None`` and reported as a row error.
+- Arrow IPC stream: record batches whose numeric columns are the features.
+"""
+
+import json
+import logging
+import struct
+from collections.abc import AsyncIterable, AsyncIterator
+from typing import Any
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc  # noqa: F401
+
+    _HAS_ARROW = True
+except ImportError:
+    _HAS_ARROW = False
+    logger.info("pyarrow not available, Arrow IPC prediction streams disabled")
+
+NDJSON = "application/x-ndjson"
+ARROW_STREAM = "application/vnd.apache.arrow.stream"
+
+# Arrow IPC message prefix: 0xFFFFFFFF continuation marker + int32 metadata length
+_ARROW_PREFIX = struct.Struct("<Ii")
+_ARROW_CONTINUATION = 0xFFFFFFFF
+
+Row = list[float] | None
+
+
+class StreamDecodeError(ValueError):
+    """The request body is not a valid stream of the declared format."""
+
+
+def arrow_available() -> bool:
+    return _HAS_ARROW
+
+
+async def ndjson_rows(body: AsyncIterable[bytes], chunk_rows: int) -> AsyncIterator[list[Row]]:
+    """Yield lists of up to ``chunk_rows`` rows parsed from an NDJSON body."""
+    pending = b""
+    rows: list[Row] = []
+    async for data in body:
+        pending += data
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            if line.strip():
+                rows.append(_parse_row(line))
+                if len(rows) >= chunk_rows:
+                    yield rows
+                    rows = []
+    if pending.strip():
+        rows.append(_parse_row(pending))
+    if rows:
+        yield rows
+
+
+def _parse_row(line: bytes) -> Row:
+    try:
+        value: Any = json.loads(line)
+    except ValueError:
+        return None
+    if isinstance(value, dict):
+        value = value.get("features")
+    if not isinstance(value, list) or not all(
+        isinstance(v, int | float) and not isinstance(v, bool) for v in value
+    ):
+        return None
+    return value
+
+
+async def arrow_rows(body: AsyncIterable[bytes]) -> AsyncIterator[np.ndarray]:
+    """
+    Yield one (N, D) array per record batch of an Arrow IPC stream.
+    Messages are decoded as soon as their bytes have arrived.
+    """
+    if not _HAS_ARROW:
+        raise StreamDecodeError("Arrow IPC input requires pyarrow")
+
+    buffer = bytearray()
+    schema: Any = None
+    async for data in body:
+        buffer += data
+        while True:
+            message, consumed = _next_arrow_message(buffer)
+            if message is None:
+                if consumed:  # end-of-stream marker
+                    return
+                break
+            del buffer[:consumed]
+            if schema is None:
+                schema = pa.ipc.read_schema(message)
+            else:
+                yield _batch_to_matrix(pa.ipc.read_record_batch(message, schema))
+
+    if buffer:
+        raise StreamDecodeError("Truncated Arrow IPC stream")
+
+
+def _next_arrow_message(buffer: bytearray) -> tuple[Any, int]:
+    """
+    Decode the next complete message from ``buffer``.
+    Returns (message, bytes consumed); (None, 0) when more bytes are
+    needed and (None, 8) at the end-of-stream marker.
+    """
+    if len(buffer) < _ARROW_PREFIX.size:
+        return None, 0
+    marker, metadata_len = _ARROW_PREFIX.unpack_from(buffer)
+    if marker != _ARROW_CONTINUATION:
+        raise StreamDecodeError("Not an Arrow IPC stream")
+    if metadata_len == 0:
+        return None, _ARROW_PREFIX.size
+    if len(buffer) < _ARROW_PREFIX.size + metadata_len:
+        return None, 0
+
+    reader = pa.BufferReader(pa.py_buffer(bytes(buffer)))
+    try:
+        message = pa.ipc.read_message(reader)
+    except (pa.ArrowInvalid, OSError):
+        # The message body has not fully arrived yet
+        return None, 0
+    return message, reader.tell()
+
+
+def _batch_to_matrix(batch: Any) -> np.ndarray:
+    columns = []
+    for name, column in zip(batch.schema.names, batch.columns, strict=True):
+        if not (pa.types.is_integer(column.type) or pa.types.is_floating(column.type)):
+            raise StreamDecodeError(f"Column '{name}' is not numeric")
+        columns.append(column.to_numpy(zero_copy_only=False))
+    if not columns:
+        return np.empty((batch.num_rows, 0))
+    return np.column_stack(columns)
@@ -0,0 +1,125 @@
+"""Streaming bulk prediction — NDJSON or Arrow IPC in, NDJSON out."""
+
+import json
+import logging
+import time
+from collections.abc import AsyncIterator
+from typing import Any
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+from starlette.requests import ClientDisconnect
+from starlette.types import Receive, Scope, Send
+
+from phoenix_ml.application.handlers.batch_predict_handler import BatchPredictHandler
+from phoenix_ml.application.handlers.predict_handler import PredictHandler
+from phoenix_ml.application.handlers.stream_predict_handler import (
+    RowChunk,
+    StreamPredictHandler,
+)
+from phoenix_ml.config import get_settings
+from phoenix_ml.domain.inference.services.model_runtime import ModelRuntime
+from phoenix_ml.infrastructure.http.dependencies import get_predict_handler
+from phoenix_ml.infrastructure.http.routes import _overloaded
+from phoenix_ml.infrastructure.http.stream_codecs import (
+    ARROW_STREAM,
+    NDJSON,
+    StreamDecodeError,
+    arrow_available,
+    arrow_rows,
+    ndjson_rows,
+)
+from phoenix_ml.shared.exceptions import OverloadedError
+
+logger = logging.getLogger(__name__)
+stream_router = APIRouter(tags=["Inference"])
+
+
+class _DuplexStreamingResponse(StreamingResponse):
+    """
+    Streams output while the body iterator is still reading the request.
+    ``StreamingResponse`` polls ``receive()`` for disconnects on older ASGI
+    servers, which would swallow request body chunks; here the body read
+    itself observes the disconnect (``request.stream()`` raises).
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await self.stream_response(send)
+        except OSError as e:
+            raise ClientDisconnect() from e
+
+
+@stream_router.post("/predict/stream")
+async def stream_predict(
+    request: Request,
+    model_id: str = Query(...),
+    model_version: str | None = Query(default=None),
+    deadline_ms: float | None = Query(default=None, gt=0),
+    handler: PredictHandler = Depends(get_predict_handler),  # noqa: B008
+) -> StreamingResponse:
+    """
+    Stream predictions for an NDJSON (one feature row per line) or Arrow
+    IPC stream body. Each output line covers one engine chunk:
+    ``{"offset", "count", "results", "confidences", "errors"}``; the last
+    line is a summary with ``"done": true``.
+    """
+    content_type = request.headers.get("content-type", NDJSON).split(";")[0].strip()
+    if content_type == ARROW_STREAM:
+        if not arrow_available():
+            raise HTTPException(status_code=415, detail="Arrow IPC input requires pyarrow")
+    elif content_type not in (NDJSON, "application/jsonl"):
+        raise HTTPException(
+            status_code=415, detail=f"Expected {NDJSON} or {ARROW_STREAM}, got '{content_type}'"
+        )
+
+    stream_handler = StreamPredictHandler(
+        BatchPredictHandler(handler), max_in_flight=get_settings().STREAM_MAX_IN_FLIGHT
+    )
+    try:
+        runtime = await stream_handler.open(model_id, model_version)
+    except OverloadedError as e:
+        raise _overloaded(e) from e
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e)) from e
+
+    rows: AsyncIterator[RowChunk] = (
+        arrow_rows(request.stream())
+        if content_type == ARROW_STREAM
+        else ndjson_rows(request.stream(), stream_handler.max_batch_rows)
+    )
+    return _DuplexStreamingResponse(
+        _encode(stream_handler, runtime, rows, deadline_ms), media_type=NDJSON
+    )
+
+
+async def _encode(
+    stream_handler: StreamPredictHandler,
+    runtime: ModelRuntime,
+    rows: AsyncIterator[RowChunk],
+    deadline_ms: float | None,
+) -> AsyncIterator[bytes]:
+    start = time.perf_counter()
+    total = failed = 0
+    summary: dict[str, Any] = {"done": True}
+    try:
+        async for chunk in stream_handler.stream(runtime, rows, deadline_ms):
+            total += chunk["count"]
+            failed += len(chunk["errors"])
+            yield _line(chunk)
+    except StreamDecodeError as e:
+        # Headers are already sent; report the broken input in-band
+        summary = {"done": False, "error": str(e)}
+    summary.update(
+        model_id=runtime.model.id,
+        version=runtime.model.version,
+        total=total,
+        successful=total - failed,
+        latency_ms=round((time.perf_counter() - start) * 1000, 2),
+    )
+    logger.info("Stream prediction: %d/%d successful", total - failed, total)
+    yield _line(summary)
+
+
+def _line(payload: dict[str, Any]) -> bytes:
+    return json.dumps(payload).encode() + b"\n"
@@ -0,0 +1,171 @@
+"""
+Binary tensor bodies for the prediction routes.
+
+``/predict`` and ``/predict/batch`` negotiate on ``Content-Type`` (request)
+and ``Accept`` (response). Besides JSON they speak:
+
+- ``application/x-phoenix-tensor``: 12-byte header ``b"PHXT"``, uint32
+  rows, uint32 cols (little-endian), then ``rows * cols`` float32 values
+  in row-major order.
+- ``application/x-npy``: a NumPy ``.npy`` file of any numeric dtype.
+
+Both decode with ``np.frombuffer``, so the feature matrix is a read-only
+view of the request body rather than a parsed copy. Request metadata
+(``model_id``, ``model_version``, ...) travels in the query string.
+"""
+
+import io
+import struct
+from typing import Any, TypeVar
+
+import numpy as np
+from fastapi import Request
+from fastapi.exceptions import RequestValidationError
+from pydantic import BaseModel, ValidationError
+
+TENSOR = "application/x-phoenix-tensor"
+NPY = "application/x-npy"
+TENSOR_TYPES = (TENSOR, NPY)
+
+_HEADER = struct.Struct("<4sII")
+_MAGIC = b"PHXT"
+_FLOAT32 = np.dtype("<f4")
+_MATRIX_NDIM = 2
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+class TensorDecodeError(ValueError):
+    """The request body is not a valid tensor of the declared format."""
+
+
+def media_type(header: str | None) -> str:
+    """Bare, lower-cased media type of a ``Content-Type`` header value."""
+    return (header or "").split(";")[0].strip().lower()
+
+
+def accepted_tensor_type(accept: str | None) -> str | None:
+    """First tensor media type listed in an ``Accept`` header, if any."""
+    for part in (accept or "").split(","):
+        if media_type(part) in TENSOR_TYPES:
+            return media_type(part)
+    return None
+
+
+def decode_tensor(body: bytes, content_type: str) -> np.ndarray:
+    """Decode a request body into an (N, D) array without copying it."""
+    if content_type == TENSOR:
+        matrix = _decode_raw(body)
+    elif content_type == NPY:
+        matrix = _decode_npy(body)
+    else:
+        raise TensorDecodeError(f"Unsupported tensor type '{content_type}'")
+
+    if matrix.ndim == 1:
+        matrix = matrix.reshape(1, -1)
+    if matrix.ndim != _MATRIX_NDIM or matrix.size == 0:
+        raise TensorDecodeError(f"Expected a non-empty (N, D) tensor, got shape {matrix.shape}")
+    if not np.isfinite(matrix).all():
+        raise TensorDecodeError("Tensor contains NaN or infinite values")
+    return matrix
+
+
+def encode_tensor(matrix: np.ndarray, content_type: str) -> bytes:
+    """Encode a 2-D array as ``content_type`` (float32 for the raw format)."""
+    if content_type == TENSOR:
+        rows, cols = matrix.shape
+        data = np.ascontiguousarray(matrix, dtype=_FLOAT32)
+        return _HEADER.pack(_MAGIC, rows, cols) + data.tobytes()
+    buffer = io.BytesIO()
+    np.lib.format.write_array(buffer, np.ascontiguousarray(matrix), allow_pickle=False)
+    return buffer.getvalue()
+
+
+def _decode_raw(body: bytes) -> np.ndarray:
+    if len(body) < _HEADER.size:
+        raise TensorDecodeError("Tensor body is shorter than its header")
+    magic, rows, cols = _HEADER.unpack_from(body)
+    if magic != _MAGIC:
+        raise TensorDecodeError("Tensor body does not start with b'PHXT'")
+    expected = _HEADER.size + rows * cols * _FLOAT32.itemsize
+    if len(body) != expected:
+        raise TensorDecodeError(
+            f"Tensor header declares {rows}x{cols} float32 ({expected} bytes), "
+            f"body has {len(body)} bytes"
+        )
+    return np.frombuffer(body, dtype=_FLOAT32, offset=_HEADER.size).reshape(rows, cols)
+
+
+def _decode_npy(body: bytes) -> np.ndarray:
+    fp = io.BytesIO(body)
+    try:
+        version = np.lib.format.read_magic(fp)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(fp)
+        else:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(fp)
+    except ValueError as e:
+        raise TensorDecodeError(f"Invalid .npy body: {e}") from e
+    if not np.issubdtype(dtype, np.number) or np.issubdtype(dtype, np.complexfloating):
+        raise TensorDecodeError(f"Tensor dtype must be real numeric, got {dtype}")
+
+    count = int(np.prod(shape))
+    if len(body) - fp.tell() != count * dtype.itemsize:
+        raise TensorDecodeError(f"Truncated .npy body for shape {shape}")
+    values = np.frombuffer(body, dtype=dtype, count=count, offset=fp.tell())
+    return values.reshape(shape, order="F" if fortran_order else "C")
+
+
+async def read_body(
+    request: Request, model: type[ModelT], **tensor_fields: Any
+) -> tuple[ModelT, np.ndarray | None]:
+    """
+    Parse a JSON or tensor request into ``model``.
+
+    JSON bodies are validated directly from bytes. Tensor bodies are
+    decoded zero-copy; the remaining fields are validated from the query
+    string and the array is returned alongside. Errors surface as the
+    usual 422 ``RequestValidationError``.
+    """
+    body = await request.body()
+    content_type = media_type(request.headers.get("content-type"))
+    try:
+        if content_type not in TENSOR_TYPES:
+            return model.model_validate_json(body), None
+        matrix = decode_tensor(body, content_type)
+        return model.model_validate({**request.query_params, **tensor_fields}), matrix
+    except ValidationError as e:
+        raise RequestValidationError(e.errors(include_url=False), body=body) from e
+    except TensorDecodeError as e:
+        raise RequestValidationError(
+            [{"type": "value_error", "loc": ("body",), "msg": str(e), "input": None}]
+        ) from e
+
+
+def request_body_schema(model: type[BaseModel]) -> dict[str, Any]:
+    """``openapi_extra`` documenting a JSON ``model`` body and the tensor alternatives."""
+    schema = _inline_refs(model.model_json_schema())
+    binary = {"schema": {"type": "string", "format": "binary"}}
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": schema}, TENSOR: binary, NPY: binary},
+        }
+    }
+
+
+def _inline_refs(schema: dict[str, Any]) -> dict[str, Any]:
+    defs = schema.pop("$defs", {})
+
+    def resolve(node: Any) -> Any:
+        if isinstance(node, dict):
+            ref = node.get("$ref", "")
+            if ref.startswith("#/$defs/"):
+                return resolve(defs[ref.removeprefix("#/$defs/")])
+            return {k: resolve(v) for k, v in node.items()}
+        if isinstance(node, list):
+            return [resolve(v) for v in node]
+        return node
+
+    resolved: dict[str, Any] = resolve(schema)
+    return resolved
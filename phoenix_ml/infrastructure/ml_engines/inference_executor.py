@@ -0,0 +1,175 @@
+"""
+Dedicated thread pools for blocking inference calls.
+
+``asyncio.to_thread`` shares the loop's default executor with DB, file
+and S3 work, so a burst of inference can starve I/O (and vice versa).
+``InferenceExecutor`` gives every model its own bounded pool and sizes
+ORT intra-op threads so ``workers × intra_op_threads`` fits the cores.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+from phoenix_ml.domain.inference.entities.model import Model
+from phoenix_ml.domain.inference.value_objects.runtime_options import RuntimeOptions
+from phoenix_ml.domain.monitoring.services.metrics_publisher import MetricsPublisher
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class ThreadPlan:
+    """Resolved thread counts for one model."""
+
+    workers: int
+    intra_op_threads: int
+    inter_op_threads: int
+
+
+class _ModelPool:
+    __slots__ = ("in_flight", "lock", "pool", "workers")
+
+    def __init__(self, name: str, workers: int) -> None:
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=name)
+        self.workers = workers
+        self.in_flight = 0
+        self.lock = threading.Lock()
+
+
+class InferenceExecutor:
+    """
+    Per-model bounded thread pools for ``session.run`` calls.
+
+    Pools are created on first use with the thread plan resolved from
+    the model's ``RuntimeOptions`` (see ``plan()``). Saturation — calls
+    in flight versus workers — is published per model on every submit
+    and completion.
+    """
+
+    def __init__(
+        self,
+        default_workers: int = 2,
+        metrics_publisher: MetricsPublisher | None = None,
+        cpu_count: int | None = None,
+    ) -> None:
+        if default_workers < 1:
+            raise ValueError("default_workers must be at least 1")
+        self._default_workers = default_workers
+        self._metrics = metrics_publisher
+        self._cpu_count = cpu_count or os.cpu_count() or 1
+        self._pools: dict[str, _ModelPool] = {}
+        self._plans: dict[str, ThreadPlan] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def cpu_count(self) -> int:
+        return self._cpu_count
+
+    def plan(self, model: Model, options: RuntimeOptions | None = None) -> ThreadPlan:
+        """
+        Resolve (and remember) the thread plan for ``model``.
+
+        Unset intra-op threads default to an even share of the cores per
+        worker. An explicit plan whose ``workers × intra_op_threads``
+        exceeds the cores is clamped by reducing workers, and a warning
+        is logged when the plans of all models together oversubscribe.
+        """
+        with self._lock:
+            existing = self._plans.get(model.unique_key)
+            if existing is not None:
+                return existing
+
+            options = options or RuntimeOptions()
+            workers = options.executor_workers or self._default_workers
+            intra = options.intra_op_threads or max(1, self._cpu_count // workers)
+            if workers * intra > self._cpu_count:
+                clamped = max(1, self._cpu_count // intra)
+                logger.warning(
+                    "⚠️ %s: %d workers × %d intra-op threads exceeds %d cores; using %d workers",
+                    model.unique_key,
+                    workers,
+                    intra,
+                    self._cpu_count,
+                    clamped,
+                )
+                workers = clamped
+
+            plan = ThreadPlan(
+                workers=workers,
+                intra_op_threads=intra,
+                inter_op_threads=options.inter_op_threads or 1,
+            )
+            self._plans[model.unique_key] = plan
+
+            total = sum(p.workers * p.intra_op_threads for p in self._plans.values())
+            if total > self._cpu_count:
+                logger.warning(
+                    "⚠️ Inference threads across %d models (%d) exceed %d cores",
+                    len(self._plans),
+                    total,
+                    self._cpu_count,
+                )
+            return plan
+
+    async def run(self, model: Model, fn: Callable[..., T], *args: Any) -> T:
+        """Run ``fn(*args)`` on the model's pool and await the result."""
+        pool = self._pool(model)
+        with pool.lock:
+            pool.in_flight += 1
+            in_flight = pool.in_flight
+        self._publish(model, in_flight, pool.workers)
+
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(pool.pool, fn, *args)
+        finally:
+            with pool.lock:
+                pool.in_flight -= 1
+                in_flight = pool.in_flight
+            self._publish(model, in_flight, pool.workers)
+
+    def in_flight(self, model: Model) -> int:
+        """Number of calls submitted for ``model`` and not yet finished."""
+        pool = self._pools.get(model.unique_key)
+        return pool.in_flight if pool is not None else 0
+
+    def release(self, model: Model) -> None:
+        """Shut down the model's pool (e.g. when its session is unloaded)."""
+        with self._lock:
+            pool = self._pools.pop(model.unique_key, None)
+            self._plans.pop(model.unique_key, None)
+        if pool is not None:
+            pool.pool.shutdown(wait=False)
+
+    def shutdown(self) -> None:
+        """Shut down every pool."""
+        with self._lock:
+            pools = list(self._pools.values())
+            self._pools.clear()
+            self._plans.clear()
+        for pool in pools:
+            pool.pool.shutdown(wait=False)
+
+    def _pool(self, model: Model) -> _ModelPool:
+        pool = self._pools.get(model.unique_key)
+        if pool is not None:
+            return pool
+        plan = self.plan(model)
+        with self._lock:
+            pool = self._pools.get(model.unique_key)
+            if pool is None:
+                pool = _ModelPool(f"infer-{model.unique_key}", plan.workers)
+                self._pools[model.unique_key] = pool
+            return pool
+
+    def _publish(self, model: Model, in_flight: int, workers: int) -> None:
+        if self._metrics is not None:
+            self._metrics.record_executor_saturation(model.id, model.version, in_flight, workers)
@@ -0,0 +1,148 @@
+"""
+Preallocated IO-binding buffers for ONNX Runtime sessions.
+
+``session.run`` needs a freshly stacked input matrix and returns freshly
+allocated output tensors on every call. ``IOBindingPool`` keeps, per
+power-of-two batch-size bucket, an input matrix and output tensors that
+are bound to the session once. Batch rows are written straight into the
+input matrix and only the (small) decoded outputs are copied out.
+
+Sessions whose outputs are not fixed-shape tensors (e.g. sklearn ZipMap
+sequences) and batch sizes that are not a power of two fall back to a
+plain ``session.run``.
+"""
+
+import threading
+from collections.abc import Sequence
+from typing import Any
+
+import numpy as np
+import onnxruntime as ort
+
+_ORT_DTYPES: dict[str, type[np.generic]] = {
+    "tensor(float)": np.float32,
+    "tensor(double)": np.float64,
+    "tensor(float16)": np.float16,
+    "tensor(int64)": np.int64,
+    "tensor(int32)": np.int32,
+}
+
+
+class _BufferSet:
+    __slots__ = ("binding", "input", "outputs")
+
+    def __init__(self, binding: ort.IOBinding, inp: np.ndarray, outputs: list[np.ndarray]) -> None:
+        self.binding = binding
+        self.input = inp
+        self.outputs = outputs
+
+
+class IOBindingPool:
+    """
+    Reusable input/output buffers for one ``InferenceSession``.
+
+    Buffer sets are checked out per call, so concurrent executor workers
+    never share a set; at most one set per concurrent call is created
+    for each bucket.
+    """
+
+    def __init__(self, session: ort.InferenceSession, enabled: bool = True) -> None:
+        self._session = session
+        inputs = session.get_inputs()
+        self._input_name: str = inputs[0].name
+        self._input_dtype = _ORT_DTYPES.get(inputs[0].type)
+        self._outputs = session.get_outputs()
+        self._free: dict[int, list[_BufferSet]] = {}
+        self._lock = threading.Lock()
+        self.supported = (
+            enabled
+            and len(inputs) == 1
+            and self._input_dtype is not None
+            and all(
+                _static_tail(o.shape) is not None and o.type in _ORT_DTYPES for o in self._outputs
+            )
+        )
+
+    @property
+    def input_name(self) -> str:
+        return self._input_name
+
+    def buffer_count(self) -> int:
+        """Number of idle buffer sets across all buckets."""
+        with self._lock:
+            return sum(len(sets) for sets in self._free.values())
+
+    def run(self, rows: Sequence[np.ndarray] | np.ndarray) -> list[Any]:
+        """
+        Run the session on ``rows`` and return outputs like ``session.run``.
+        ``rows`` is a sequence of 1-D rows or an already stacked (N, D) matrix.
+        """
+        n = len(rows)
+        is_matrix = isinstance(rows, np.ndarray)
+        if not self.supported or n & (n - 1):
+            batch = rows if isinstance(rows, np.ndarray) else np.stack(list(rows))
+            if self._input_dtype is not None:
+                batch = batch.astype(self._input_dtype, copy=False)
+            return self._session.run(None, {self._input_name: batch})  # type: ignore[no-any-return]
+
+        buffers = self._acquire(n, rows[0].shape)
+        try:
+            if is_matrix:
+                buffers.input[:] = rows
+            else:
+                for i, row in enumerate(rows):
+                    buffers.input[i] = row
+            self._session.run_with_iobinding(buffers.binding)
+            # Copy out: the bound buffers are reused by the next batch.
+            return [out.copy() for out in buffers.outputs]
+        finally:
+            self._release(n, buffers)
+
+    def _acquire(self, bucket: int, row_shape: tuple[int, ...]) -> _BufferSet:
+        with self._lock:
+            sets = self._free.get(bucket)
+            while sets:
+                buffers = sets.pop()
+                if buffers.input.shape[1:] == row_shape:
+                    return buffers
+        return self._allocate(bucket, row_shape)
+
+    def _release(self, bucket: int, buffers: _BufferSet) -> None:
+        with self._lock:
+            self._free.setdefault(bucket, []).append(buffers)
+
+    def _allocate(self, bucket: int, row_shape: tuple[int, ...]) -> _BufferSet:
+        inp = np.empty((bucket, *row_shape), dtype=self._input_dtype)
+        binding = self._session.io_binding()
+        binding.bind_cpu_input(self._input_name, inp)
+
+        outputs = []
+        for meta in self._outputs:
+            tail = _static_tail(meta.shape) or ()
+            out = np.empty((bucket, *tail), dtype=_ORT_DTYPES[meta.type])
+            binding.bind_output(meta.name, "cpu", 0, out.dtype, list(out.shape), out.ctypes.data)
+            outputs.append(out)
+        return _BufferSet(binding, inp, outputs)
+
+
+def numpy_dtype(ort_type: str) -> np.dtype[Any] | None:
+    """NumPy dtype for an ORT tensor type string such as ``tensor(float)``."""
+    dtype = _ORT_DTYPES.get(ort_type)
+    return np.dtype(dtype) if dtype is not None else None
+
+
+def input_width(shape: Sequence[Any]) -> int | None:
+    """Feature count of a ``[batch, features]`` input, or None if not static."""
+    if len(shape) == 2 and isinstance(shape[1], int):  # noqa: PLR2004
+        return shape[1]
+    return None
+
+
+def _static_tail(shape: Sequence[Any]) -> tuple[int, ...] | None:
+    """Non-batch dims of an output shape, or None unless only the batch dim is dynamic."""
+    if not shape or isinstance(shape[0], int):
+        return None
+    tail = tuple(shape[1:])
+    if all(isinstance(d, int) for d in tail):
+        return tail
+    return None
@@ -0,0 +1,202 @@
+"""
+Memory-bounded residency of loaded model sessions.
+
+Engines keep one runtime session per model version, and every champion,
+challenger and retrained version would otherwise stay resident until
+restart. ``ModelResidencyManager`` tracks each session's estimated
+footprint in least-recently-used order; when the total exceeds the
+budget it releases the coldest versions that are neither pinned
+(champions) nor running a call. Evicted versions are reloaded lazily on
+their next request, and concurrent loads of one version share a single
+load.
+
+A version's pin is taken from its role when it is loaded and afterwards
+only changes through ``pin``/``unpin`` on a stage change; the ``Model``
+passed with a request may carry a stale role.
+"""
+
+import asyncio
+import logging
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+from phoenix_ml.domain.inference.entities.model import Model
+from phoenix_ml.domain.monitoring.services.metrics_publisher import MetricsPublisher
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Resident:
+    model: Model
+    footprint: int
+    # Unloads the session; returns False while it is still serving a call
+    release: Callable[[], bool]
+    pinned: bool
+
+
+def _is_pinned(model: Model) -> bool:
+    return (model.metadata or {}).get("role") == "champion"
+
+
+class ModelResidencyManager:
+    """
+    LRU set of resident model sessions under ``budget_bytes``.
+
+    A budget of 0 disables eviction (footprints are still tracked).
+    Footprints are estimated as the artifact size times
+    ``footprint_factor`` (weights plus runtime copies and arenas).
+    """
+
+    def __init__(
+        self,
+        budget_bytes: int = 0,
+        footprint_factor: float = 2.0,
+        metrics_publisher: MetricsPublisher | None = None,
+    ) -> None:
+        if budget_bytes < 0:
+            raise ValueError("budget_bytes must be non-negative")
+        self._budget = budget_bytes
+        self._factor = footprint_factor
+        self._metrics = metrics_publisher
+        self._resident: OrderedDict[str, _Resident] = OrderedDict()
+        self._pending: dict[str, asyncio.Future[None]] = {}
+        self._evicted: set[str] = set()
+        # Explicit pin()/unpin() calls; outlive eviction so a reload keeps them
+        self._pins: dict[str, bool] = {}
+        self._listeners: list[Callable[[Model], None]] = []
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._resident
+
+    def __len__(self) -> int:
+        return len(self._resident)
+
+    @property
+    def resident_bytes(self) -> int:
+        return sum(r.footprint for r in self._resident.values())
+
+    def estimate_footprint(self, model_path: Path) -> int:
+        """Estimated resident bytes of a session loaded from ``model_path``."""
+        try:
+            return int(model_path.stat().st_size * self._factor)
+        except OSError:
+            return 0
+
+    def add_eviction_listener(self, listener: Callable[[Model], None]) -> None:
+        """Call ``listener(model)`` after a version is unloaded (e.g. to drop cached handles)."""
+        self._listeners.append(listener)
+
+    async def ensure_loaded(
+        self,
+        model: Model,
+        load: Callable[[], Awaitable[int]],
+        release: Callable[[], bool],
+    ) -> None:
+        """Load ``model`` once (``load`` returns its footprint) and admit it.
+
+        Concurrent callers for the same version await the first caller's load.
+        """
+        key = model.unique_key
+        if key in self._resident:
+            self.touch(model)
+            return
+
+        pending = self._pending.get(key)
+        if pending is not None:
+            await asyncio.shield(pending)
+            return
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._pending[key] = future
+        try:
+            footprint = await load()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so an unawaited failure is not logged
+            future.exception()
+            raise
+        else:
+            self._admit(model, footprint, release)
+            future.set_result(None)
+        finally:
+            self._pending.pop(key, None)
+
+    def touch(self, model: Model) -> None:
+        """Mark ``model`` most recently used; its pin is left alone."""
+        if model.unique_key in self._resident:
+            self._resident.move_to_end(model.unique_key)
+
+    def pin(self, model_id: str, version: str) -> None:
+        """Keep ``model_id:version`` resident (e.g. promoted to champion)."""
+        self._set_pinned(f"{model_id}:{version}", True)
+
+    def unpin(self, model_id: str, version: str) -> None:
+        """Make ``model_id:version`` evictable again (e.g. a replaced champion)."""
+        self._set_pinned(f"{model_id}:{version}", False)
+
+    def _set_pinned(self, key: str, pinned: bool) -> None:
+        self._pins[key] = pinned
+        resident = self._resident.get(key)
+        if resident is not None:
+            resident.pinned = pinned
+
+    def release(self, model: Model) -> bool:
+        """Unload ``model`` now (e.g. a replaced champion); False while it is busy."""
+        resident = self._resident.get(model.unique_key)
+        if resident is None or not resident.release():
+            return False
+        del self._resident[model.unique_key]
+        logger.info("Unloaded %s (%d bytes)", model.unique_key, resident.footprint)
+        for listener in self._listeners:
+            listener(resident.model)
+        self._publish()
+        return True
+
+    def _admit(self, model: Model, footprint: int, release: Callable[[], bool]) -> None:
+        key = model.unique_key
+        pinned = self._pins.get(key, _is_pinned(model))
+        self._resident[key] = _Resident(model, footprint, release, pinned)
+        if key in self._evicted:
+            self._evicted.discard(key)
+            if self._metrics is not None:
+                self._metrics.record_model_reload(model.id, model.version)
+        self._evict_over_budget(keep=key)
+        self._publish()
+
+    def _evict_over_budget(self, keep: str) -> None:
+        if self._budget <= 0:
+            return
+        total = self.resident_bytes
+        for key, resident in list(self._resident.items()):
+            if total <= self._budget:
+                return
+            if key == keep or resident.pinned or not resident.release():
+                continue
+            del self._resident[key]
+            total -= resident.footprint
+            self._evicted.add(key)
+            logger.info(
+                "Evicted %s (%d bytes) to stay within memory budget", key, resident.footprint
+            )
+            if self._metrics is not None:
+                self._metrics.record_model_eviction(resident.model.id, resident.model.version)
+            for listener in self._listeners:
+                listener(resident.model)
+        if total > self._budget:
+            logger.warning(
+                "Resident models use %d bytes, over the %d byte budget (pinned or busy)",
+                total,
+                self._budget,
+            )
+
+    def _publish(self) -> None:
+        if self._metrics is not None:
+            self._metrics.record_model_residency(
+                len(self._resident), self.resident_bytes, self._budget
+            )
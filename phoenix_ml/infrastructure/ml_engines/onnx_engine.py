@@ -1,28 +1,73 @@
 import asyncio
+import functools
 import time
+from collections.abc import Mapping, Sequence
 from pathlib import Path
-from typing import Any
 
 import numpy as np
 import onnxruntime as ort
 
 from phoenix_ml.domain.inference.entities.model import Model
 from phoenix_ml.domain.inference.entities.prediction import Prediction
-from phoenix_ml.domain.inference.services.inference_engine import InferenceEngine
-from phoenix_ml.domain.inference.value_objects.confidence_score import ConfidenceScore
-from phoenix_ml.domain.inference.value_objects.feature_vector import FeatureVector
+from phoenix_ml.domain.inference.entities.prediction_batch import PredictionBatch
+from phoenix_ml.domain.inference.services.inference_engine import EngineHandle, InferenceEngine
+from phoenix_ml.domain.inference.value_objects.feature_vector import FeatureMatrix, FeatureVector
+from phoenix_ml.domain.inference.value_objects.runtime_options import RuntimeOptions
+from phoenix_ml.infrastructure.ml_engines.inference_executor import InferenceExecutor
+from phoenix_ml.infrastructure.ml_engines.io_binding import (
+    IOBindingPool,
+    input_width,
+    numpy_dtype,
+)
+from phoenix_ml.infrastructure.ml_engines.model_residency import ModelResidencyManager
+from phoenix_ml.infrastructure.ml_engines.optimized_graph_cache import OptimizedGraphCache
+from phoenix_ml.infrastructure.ml_engines.output_decoder import decode_outputs
+from phoenix_ml.infrastructure.ml_engines.session_options import build_session_options
+from phoenix_ml.infrastructure.ml_engines.shared_weights import SharedWeights
 
 
 class ONNXInferenceEngine(InferenceEngine):
     """
     Production implementation of InferenceEngine using ONNX Runtime.
     Supports high-performance execution on CPU and GPU (if configured).
+
+    ``session.run`` calls go through a dedicated ``InferenceExecutor``
+    rather than the event loop's default executor. Per-model session
+    options are looked up by model id in ``runtime_options``. With
+    ``io_binding`` enabled, batches reuse preallocated buffers per
+    batch-size bucket (see ``IOBindingPool``). With a ``graph_cache``,
+    sessions load a persisted pre-optimized graph instead of re-running
+    graph optimization on every start (see ``OptimizedGraphCache``).
+    Loaded sessions are registered with ``residency``, which unloads the
+    least recently used ones when a memory budget is set; evicted
+    versions are reloaded on their next batch. With ``shared_weights``,
+    large initializers are memory-mapped from a file shared by every
+    session and worker process (see ``SharedWeights``).
     """
 
-    def __init__(self, cache_dir: Path | None = None) -> None:
+    def __init__(  # noqa: PLR0913
+        self,
+        cache_dir: Path | None = None,
+        executor: InferenceExecutor | None = None,
+        runtime_options: Mapping[str, RuntimeOptions] | None = None,
+        io_binding: bool = True,
+        *,
+        graph_cache: OptimizedGraphCache | None = None,
+        residency: ModelResidencyManager | None = None,
+        shared_weights: SharedWeights | None = None,
+    ) -> None:
         self._cache_dir = cache_dir or Path("/tmp/phoenix/model_cache")
         self._cache_dir.mkdir(parents=True, exist_ok=True)
         self._sessions: dict[str, ort.InferenceSession] = {}
+        self._executor = executor or InferenceExecutor()
+        self._runtime_options: Mapping[str, RuntimeOptions] = (
+            runtime_options if runtime_options is not None else {}
+        )
+        self._io_binding = io_binding
+        self._io_pools: dict[str, IOBindingPool] = {}
+        self._graph_cache = graph_cache
+        self._residency = residency if residency is not None else ModelResidencyManager()
+        self._shared_weights = shared_weights
 
     async def load(self, model: Model) -> None:
         """
@@ -31,15 +76,89 @@ class ONNXInferenceEngine(InferenceEngine):
         if model.unique_key in self._sessions:
             return
 
+        await self._residency.ensure_loaded(
+            model,
+            functools.partial(self._create_session, model),
+            functools.partial(self._unload, model),
+        )
+
+    async def _create_session(self, model: Model) -> int:
+        """Create and keep the session of ``model``; returns its estimated footprint."""
         model_path = self._cache_dir / model.id / model.version / "model.onnx"
         if not model_path.exists():
             raise FileNotFoundError(f"Model artifact not found at {model_path}")
 
-        # Load session in background thread
-        session = await asyncio.to_thread(
-            ort.InferenceSession, str(model_path), providers=["CPUExecutionProvider"]
-        )
+        options = self._runtime_options.get(model.id, RuntimeOptions())
+        plan = self._executor.plan(model, options)
+        sess_options = build_session_options(options, plan)
+        providers = ["CPUExecutionProvider"]
+
+        source_path = model_path
+        if self._shared_weights is not None:
+            source_path = await asyncio.to_thread(
+                self._shared_weights.apply, model.unique_key, model_path, sess_options
+            )
+
+        # Load session in background thread. A cached optimized graph would
+        # embed the weights, so shared-weight models skip the graph cache.
+        try:
+            if self._graph_cache is not None and source_path == model_path:
+                session = await asyncio.to_thread(
+                    self._graph_cache.create_session, model_path, options, sess_options, providers
+                )
+            else:
+                session = await asyncio.to_thread(
+                    ort.InferenceSession,
+                    str(source_path),
+                    sess_options=sess_options,
+                    providers=providers,
+                )
+        except BaseException:
+            if self._shared_weights is not None:
+                self._shared_weights.release(model.unique_key)
+            raise
         self._sessions[model.unique_key] = session
+        return self._residency.estimate_footprint(model_path)
+
+    def _unload(self, model: Model) -> bool:
+        """Drop the session of ``model`` unless a call is still running on it."""
+        if self._executor.in_flight(model):
+            return False
+        self._sessions.pop(model.unique_key, None)
+        self._io_pools.pop(model.unique_key, None)
+        self._executor.release(model)
+        if self._shared_weights is not None:
+            self._shared_weights.release(model.unique_key)
+        return True
+
+    async def unload(self, model: Model) -> bool:
+        """Release the session of ``model`` and its residency entry."""
+        return self._residency.release(model)
+
+    def set_pinned(self, model: Model, pinned: bool) -> None:
+        """Pin or unpin ``model`` in the residency manager."""
+        if pinned:
+            self._residency.pin(model.id, model.version)
+        else:
+            self._residency.unpin(model.id, model.version)
+
+    def engine_handle(self, model: Model) -> EngineHandle:
+        session = self._sessions[model.unique_key]
+        model_input = session.get_inputs()[0]
+        dtype = numpy_dtype(model_input.type)
+        return EngineHandle(
+            session=session,
+            input_name=model_input.name,
+            dtype=dtype if dtype is not None else np.dtype(np.float32),
+            n_features=input_width(model_input.shape),
+        )
+
+    def _io_pool(self, model: Model) -> IOBindingPool:
+        pool = self._io_pools.get(model.unique_key)
+        if pool is None:
+            pool = IOBindingPool(self._sessions[model.unique_key], enabled=self._io_binding)
+            self._io_pools[model.unique_key] = pool
+        return pool
 
     async def predict(self, model: Model, features: FeatureVector) -> Prediction:
         """
@@ -54,76 +173,50 @@ class ONNXInferenceEngine(InferenceEngine):
         """
         Executes batch inference using ONNX Runtime.
         """
-        if model.unique_key not in self._sessions:
-            await self.load(model)
+        batch = await self.batch_predict_columnar(model, features_list)
+        return batch.to_predictions()
 
-        session = self._sessions[model.unique_key]
+    async def batch_predict_columnar(
+        self, model: Model, features_list: list[FeatureVector]
+    ) -> PredictionBatch:
+        """
+        Executes batch inference and decodes the outputs column-wise.
+        """
+        return await self._run_batch(model, [f.values for f in features_list])
+
+    async def batch_predict_matrix(self, model: Model, features: FeatureMatrix) -> PredictionBatch:
+        """
+        Executes batch inference on an (N, D) matrix without splitting it into rows.
+        """
+        return await self._run_batch(model, features.values)
 
-        # Prepare input batch
-        input_name = session.get_inputs()[0].name
+    async def _run_batch(
+        self, model: Model, rows: Sequence[np.ndarray] | np.ndarray
+    ) -> PredictionBatch:
+        if model.unique_key not in self._sessions:
+            await self.load(model)
+        self._residency.touch(model)
 
-        # Stack all feature vectors into a single batch [N, D]
-        batch_data = np.stack([f.values for f in features_list])
+        pool = self._io_pool(model)
+        n_rows = len(rows)
 
         start_time = time.time()
 
-        # Run inference in thread
-        outputs = await asyncio.to_thread(session.run, None, {input_name: batch_data})
+        # Run inference on the model's dedicated executor; rows are written
+        # straight into the preallocated input buffer of the batch bucket
+        outputs = await self._executor.run(model, pool.run, rows)
 
         latency_ms_total = (time.time() - start_time) * 1000
-        avg_latency_ms = latency_ms_total / len(features_list)
-
-        # Process outputs
-        result_tensors = outputs[0]
-        predictions = []
-
-        for i in range(len(features_list)):
-            result: Any
-            confidence_val: float = 1.0
-
-            if len(outputs) > 1 and isinstance(outputs[1], list):
-                # Case: Sklearn ONNX
-                probs_map = outputs[1][i]
-                result = result_tensors[i]
-
-                if hasattr(result, "item"):
-                    result = result.item()
-
-                lookup_key = result
-                if isinstance(result, (np.int64, np.integer)):
-                    lookup_key = int(result)
-
-                confidence_val = float(probs_map.get(lookup_key, 1.0))
-
-            elif isinstance(result_tensors, np.ndarray) and result_tensors.ndim > 1:
-                row = result_tensors[i]
-                if result_tensors.shape[1] == 1:
-                    # Case: Regression [N, 1] — return raw value
-                    result = float(row[0])
-                else:
-                    # Case: Multi-class classification [N, C]
-                    result = int(np.argmax(row))
-                    confidence_val = float(np.max(row))
-            else:
-                # Fallback
-                val = result_tensors[i]
-                result = val.tolist() if hasattr(val, "tolist") else val
-
-            # Clamp confidence to [0, 1] for regression models
-            # whose raw outputs may exceed the probability range
-            clamped_confidence = max(0.0, min(1.0, confidence_val))
-
-            predictions.append(
-                Prediction(
-                    model_id=model.id,
-                    model_version=model.version,
-                    result=result,
-                    confidence=ConfidenceScore(value=clamped_confidence),
-                    latency_ms=avg_latency_ms,
-                )
-            )
 
-        return predictions
+        results, confidences, raw = decode_outputs(outputs, n_rows)
+        return PredictionBatch(
+            model_id=model.id,
+            model_version=model.version,
+            results=results,
+            confidences=confidences,
+            latency_ms=latency_ms_total / n_rows,
+            raw=raw,
+        )
 
     async def optimize(self, model: Model) -> None:
         """
@@ -0,0 +1,121 @@
+"""
+Persisted, pre-optimized ONNX graphs for fast session creation.
+
+Creating an ``InferenceSession`` runs ORT's graph optimizations on every
+process start. ``OptimizedGraphCache`` saves the optimized graph in ORT
+format the first time a model is loaded (or when the training pipeline's
+``optimize`` step writes it ahead of time) under its ``GraphCacheKey``;
+later sessions load that file with graph optimization disabled.
+"""
+
+import logging
+import os
+import time
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+import onnxruntime as ort
+
+from phoenix_ml.domain.inference.value_objects.graph_cache_key import GraphCacheKey
+from phoenix_ml.domain.inference.value_objects.runtime_options import RuntimeOptions
+
+logger = logging.getLogger(__name__)
+
+
+def _provider_name(provider: Any) -> str:
+    """Providers may be given as names or ``(name, options)`` tuples."""
+    return str(provider[0] if isinstance(provider, tuple) else provider)
+
+
+class OptimizedGraphCache:
+    """Creates ORT sessions from cached optimized graphs when available."""
+
+    def __init__(self, cache_dir: Path, enabled: bool = True) -> None:
+        self._cache_dir = cache_dir
+        self._enabled = enabled
+        if enabled:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def graph_path(
+        self, model_path: Path, options: RuntimeOptions, providers: Sequence[Any]
+    ) -> Path:
+        """Where the optimized graph of ``model_path`` is (or would be) cached."""
+        key = GraphCacheKey.for_model(
+            model_path,
+            ort.__version__,
+            options,
+            tuple(_provider_name(p) for p in providers),
+        )
+        return self._cache_dir / key.filename
+
+    def create_session(
+        self,
+        model_path: Path,
+        options: RuntimeOptions,
+        sess_options: ort.SessionOptions,
+        providers: Sequence[Any],
+    ) -> ort.InferenceSession:
+        """Session for ``model_path``, skipping graph optimization on a cache hit.
+
+        Blocking; call it off the event loop.
+        """
+        if not self._enabled or options.graph_optimization_level == "disabled":
+            return ort.InferenceSession(
+                str(model_path), sess_options=sess_options, providers=providers
+            )
+
+        graph_path = self.graph_path(model_path, options, providers)
+        start = time.perf_counter()
+        if graph_path.is_file():
+            level = sess_options.graph_optimization_level
+            sess_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_DISABLE_ALL
+            try:
+                session = ort.InferenceSession(
+                    str(graph_path), sess_options=sess_options, providers=providers
+                )
+            except Exception as e:
+                # Unreadable or truncated file: rebuild it from the source model
+                logger.warning("Discarding optimized graph %s: %s", graph_path, e)
+                graph_path.unlink(missing_ok=True)
+                sess_options.graph_optimization_level = level
+            else:
+                logger.info(
+                    "Loaded pre-optimized graph of %s in %.1f ms",
+                    model_path,
+                    (time.perf_counter() - start) * 1000,
+                )
+                return session
+
+        session = self._save(model_path, graph_path, sess_options, providers)
+        logger.info(
+            "Optimized %s in %.1f ms; cached graph at %s",
+            model_path,
+            (time.perf_counter() - start) * 1000,
+            graph_path,
+        )
+        return session
+
+    @staticmethod
+    def _save(
+        model_path: Path,
+        graph_path: Path,
+        sess_options: ort.SessionOptions,
+        providers: Sequence[Any],
+    ) -> ort.InferenceSession:
+        """Create a session for ``model_path`` and persist its optimized graph.
+
+        The graph is written to a temporary file and renamed into place, so
+        concurrent writers never expose a partial file.
+        """
+        tmp_path = graph_path.with_name(f"{graph_path.name}.{os.getpid()}.tmp")
+        sess_options.optimized_model_filepath = str(tmp_path)
+        sess_options.add_session_config_entry("session.save_model_format", "ORT")
+        try:
+            session = ort.InferenceSession(
+                str(model_path), sess_options=sess_options, providers=providers
+            )
+            os.replace(tmp_path, graph_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        return session
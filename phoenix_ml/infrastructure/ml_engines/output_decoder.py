@@ -0,0 +1,95 @@
+"""
+Vectorized decoding of raw ONNX Runtime outputs into columns.
+
+Each supported output layout is decoded in a single NumPy step for the
+whole batch instead of row by row:
+
+- sklearn-onnx classifiers: ``[labels, zipmap]`` where zipmap is a list
+  of ``{class: probability}`` dicts, or ``[labels, probabilities]``
+  (a 1-D label vector and an ``[N, C]`` matrix) when the ZipMap
+  operator was disabled.
+- Regression ``[N, 1]``: the raw value, confidence 1.0.
+- Multi-class ``[N, C]``: argmax label, max score as confidence.
+- Anything else: passed through row-wise, confidence 1.0.
+"""
+
+from typing import Any
+
+import numpy as np
+
+_MATRIX_NDIM = 2
+
+
+def decode_outputs(outputs: list[Any], n_rows: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Decode ONNX Runtime ``session.run`` outputs for a batch of ``n_rows``.
+
+    Returns:
+        ``(results, confidences, raw)`` — one entry per row. Confidences
+        are clamped to [0, 1] since raw scores may exceed the probability
+        range.
+    """
+    result_tensors = outputs[0]
+
+    if len(outputs) > 1 and isinstance(outputs[1], list):
+        labels = np.asarray(result_tensors)
+        probs, confidences = _decode_zipmap(labels, outputs[1])
+        return labels, _clamp(confidences), probs
+
+    if _is_label_probabilities(outputs, n_rows):
+        probs = outputs[1]
+        return np.asarray(result_tensors), _clamp(probs.max(axis=1)), probs
+
+    if isinstance(result_tensors, np.ndarray) and result_tensors.ndim > 1:
+        if result_tensors.shape[1] == 1:
+            return (
+                result_tensors[:, 0].astype(np.float64),
+                np.ones(n_rows, dtype=np.float64),
+                result_tensors,
+            )
+        return (
+            result_tensors.argmax(axis=1),
+            _clamp(result_tensors.max(axis=1)),
+            result_tensors,
+        )
+
+    results = np.asarray(result_tensors)
+    return results, np.ones(n_rows, dtype=np.float64), results
+
+
+def _is_label_probabilities(outputs: list[Any], n_rows: int) -> bool:
+    """Whether ``outputs`` is a classifier's 1-D label vector plus an ``[N, C]`` matrix.
+
+    Other models with several outputs keep the single-output decoding.
+    """
+    if len(outputs) < _MATRIX_NDIM:
+        return False
+    labels, probs = outputs[0], outputs[1]
+    return (
+        isinstance(labels, np.ndarray)
+        and labels.ndim == 1
+        and labels.shape[0] == n_rows
+        and isinstance(probs, np.ndarray)
+        and probs.ndim == _MATRIX_NDIM
+        and probs.shape[0] == n_rows
+    )
+
+
+def _decode_zipmap(
+    labels: np.ndarray, prob_maps: list[dict[Any, float]]
+) -> tuple[np.ndarray, np.ndarray]:
+    """Turn zipmap dicts into an ``[N, C]`` matrix and pick each label's probability."""
+    classes = np.asarray(list(prob_maps[0].keys()))
+    # ZipMap emits the same class order for every row.
+    probs = np.array([list(m.values()) for m in prob_maps], dtype=np.float64)
+
+    order = np.argsort(classes)
+    pos = np.searchsorted(classes, labels, sorter=order).clip(0, len(classes) - 1)
+    cols = order[pos]
+    found = classes[cols] == labels
+    confidences = np.where(found, probs[np.arange(len(labels)), cols], 1.0)
+    return probs, confidences
+
+
+def _clamp(values: np.ndarray) -> np.ndarray:
+    return np.clip(values.astype(np.float64, copy=False), 0.0, 1.0)
@@ -0,0 +1,30 @@
+"""Build ONNX Runtime ``SessionOptions`` from per-model runtime settings."""
+
+import onnxruntime as ort
+
+from phoenix_ml.domain.inference.value_objects.runtime_options import RuntimeOptions
+from phoenix_ml.infrastructure.ml_engines.inference_executor import ThreadPlan
+
+_EXECUTION_MODES: dict[str, ort.ExecutionMode] = {
+    "sequential": ort.ExecutionMode.ORT_SEQUENTIAL,
+    "parallel": ort.ExecutionMode.ORT_PARALLEL,
+}
+
+_GRAPH_OPTIMIZATION_LEVELS: dict[str, ort.GraphOptimizationLevel] = {
+    "disabled": ort.GraphOptimizationLevel.ORT_DISABLE_ALL,
+    "basic": ort.GraphOptimizationLevel.ORT_ENABLE_BASIC,
+    "extended": ort.GraphOptimizationLevel.ORT_ENABLE_EXTENDED,
+    "all": ort.GraphOptimizationLevel.ORT_ENABLE_ALL,
+}
+
+
+def build_session_options(options: RuntimeOptions, plan: ThreadPlan) -> ort.SessionOptions:
+    """Apply threading, execution mode and graph optimization settings."""
+    so = ort.SessionOptions()
+    so.intra_op_num_threads = plan.intra_op_threads
+    so.inter_op_num_threads = plan.inter_op_threads
+    so.execution_mode = _EXECUTION_MODES[options.execution_mode]
+    so.graph_optimization_level = _GRAPH_OPTIMIZATION_LEVELS[options.graph_optimization_level]
+    # Threads are bounded explicitly; don't let idle ORT workers spin on the cores.
+    so.add_session_config_entry("session.intra_op.allow_spinning", "0")
+    return so
@@ -0,0 +1,179 @@
+"""
+Memory-mapped model weights shared across sessions and worker processes.
+
+Each ``InferenceSession`` normally keeps a private copy of every
+initializer, so N uvicorn workers (or N sessions in one process) serving
+the same model hold N copies of its weights. ``SharedWeights`` rewrites
+a model once into a graph file plus a weights file whose large tensors
+are stored as external data (``model.shared.onnx`` + ``model.weights``),
+memory-maps the weights read-only and hands them to ORT as user-supplied
+initializers. ORT uses those buffers in place, so all sessions, in this
+process and in every other process mapping the same file, share one
+resident copy from the page cache.
+
+Weight prepacking is disabled for these sessions: prepacked weights are
+private per-session copies, which would defeat the sharing. Models whose
+latency is dominated by large MatMul/Gemm kernels trade some speed for
+the memory saved.
+"""
+
+import fcntl
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+import onnx
+import onnxruntime as ort
+from onnx import TensorProto, helper, numpy_helper
+
+logger = logging.getLogger(__name__)
+
+SHARED_MODEL_FILE = "model.shared.onnx"
+WEIGHTS_FILE = "model.weights"
+# Tensor offsets in the weights file are aligned for SIMD loads
+_ALIGNMENT = 64
+_TYPED_DATA_FIELDS = ("float_data", "int32_data", "int64_data", "double_data", "uint64_data")
+
+
+@dataclass
+class _MappedWeights:
+    """Initializers of one shared model file and the sessions using them."""
+
+    values: dict[str, ort.OrtValue]
+    users: set[str] = field(default_factory=set)
+
+
+class SharedWeights:
+    """Serves model initializers from a shared, memory-mapped weights file."""
+
+    def __init__(self, min_tensor_bytes: int = 64 * 1024) -> None:
+        self._min_tensor_bytes = min_tensor_bytes
+        # Keyed by shared file and its mtime: a rewritten file gets a new
+        # mapping while sessions on the old one keep theirs alive
+        self._mapped: dict[tuple[Path, int], _MappedWeights] = {}
+        self._users: dict[str, tuple[Path, int]] = {}
+        self._lock = threading.Lock()
+
+    def apply(self, key: str, model_path: Path, sess_options: ort.SessionOptions) -> Path:
+        """Register the shared initializers of ``model_path`` on ``sess_options``.
+
+        Returns the model file the session should load: the rewritten
+        graph, or ``model_path`` itself when no tensor is large enough
+        to share. ``key`` identifies the session for ``release``.
+        Blocking; call it off the event loop.
+        """
+        shared_path = self._externalize(model_path)
+        if shared_path is None:
+            return model_path
+
+        with self._lock:
+            file_key = (shared_path, shared_path.stat().st_mtime_ns)
+            mapped = self._mapped.get(file_key)
+            if mapped is None:
+                mapped = _MappedWeights(_map_initializers(shared_path))
+                self._mapped[file_key] = mapped
+            self._release_locked(key)
+            mapped.users.add(key)
+            self._users[key] = file_key
+
+        for name, value in mapped.values.items():
+            sess_options.add_initializer(name, value)
+        sess_options.add_session_config_entry("session.disable_prepacking", "1")
+        return shared_path
+
+    def prepare(self, model_path: Path) -> Path | None:
+        """Write the shared graph/weights pair of ``model_path`` ahead of any session.
+
+        Lets a supervisor do the one-time rewrite before starting its
+        workers. Returns the shared graph, or None when nothing is shared.
+        """
+        return self._externalize(model_path)
+
+    def release(self, key: str) -> None:
+        """Forget the session ``key``; unmap its weights once no session uses them."""
+        with self._lock:
+            self._release_locked(key)
+
+    def _release_locked(self, key: str) -> None:
+        file_key = self._users.pop(key, None)
+        if file_key is None or file_key not in self._mapped:
+            return
+        mapped = self._mapped[file_key]
+        mapped.users.discard(key)
+        if not mapped.users:
+            del self._mapped[file_key]
+
+    def _externalize(self, model_path: Path) -> Path | None:
+        """Write (once) the shared graph/weights pair next to ``model_path``."""
+        shared_path = model_path.with_name(SHARED_MODEL_FILE)
+        # Serialize rewrites across worker processes sharing the model cache
+        with open(model_path.with_name(".shared.lock"), "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                if shared_path.stat().st_mtime_ns >= model_path.stat().st_mtime_ns:
+                    return shared_path
+            except FileNotFoundError:
+                pass
+            return self._rewrite(model_path, shared_path)
+
+    def _rewrite(self, model_path: Path, shared_path: Path) -> Path | None:
+        model = onnx.load(str(model_path))
+        weights_path = model_path.with_name(WEIGHTS_FILE)
+        tmp_weights = weights_path.with_name(f"{WEIGHTS_FILE}.{os.getpid()}.tmp")
+        tmp_model = shared_path.with_name(f"{SHARED_MODEL_FILE}.{os.getpid()}.tmp")
+
+        offset = 0
+        with open(tmp_weights, "wb") as f:
+            for init in model.graph.initializer:
+                if init.data_type == TensorProto.STRING:
+                    continue
+                data = numpy_helper.to_array(init)
+                if data.nbytes < self._min_tensor_bytes:
+                    continue
+                offset += -offset % _ALIGNMENT
+                f.seek(offset)
+                f.write(np.ascontiguousarray(data).tobytes())
+                init.ClearField("raw_data")
+                for typed in _TYPED_DATA_FIELDS:
+                    init.ClearField(typed)
+                init.data_location = TensorProto.EXTERNAL
+                del init.external_data[:]
+                for k, v in (
+                    ("location", WEIGHTS_FILE),
+                    ("offset", offset),
+                    ("length", data.nbytes),
+                ):
+                    init.external_data.add(key=k, value=str(v))
+                offset += data.nbytes
+
+        if offset == 0:
+            tmp_weights.unlink()
+            return None
+        onnx.save(model, str(tmp_model))
+        # Weights first: a shared graph on disk implies its weights are complete
+        os.replace(tmp_weights, weights_path)
+        os.replace(tmp_model, shared_path)
+        logger.info("Wrote shared weights of %s (%d bytes)", model_path, offset)
+        return shared_path
+
+
+def _map_initializers(shared_path: Path) -> dict[str, ort.OrtValue]:
+    """Read-only memory maps of the external initializers of ``shared_path``."""
+    model = onnx.load(str(shared_path), load_external_data=False)
+    values: dict[str, ort.OrtValue] = {}
+    for init in model.graph.initializer:
+        if init.data_location != TensorProto.EXTERNAL:
+            continue
+        info = {entry.key: entry.value for entry in init.external_data}
+        array = np.memmap(
+            shared_path.with_name(info["location"]),
+            dtype=helper.tensor_dtype_to_np_dtype(init.data_type),
+            mode="r",
+            offset=int(info.get("offset", 0)),
+            shape=tuple(init.dims),
+        )
+        values[init.name] = ort.OrtValue.ortvalue_from_numpy(array)
+    return values
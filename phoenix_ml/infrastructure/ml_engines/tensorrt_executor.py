@@ -1,5 +1,7 @@
 import asyncio
+import functools
 import time
+from collections.abc import Mapping
 from pathlib import Path
 from typing import Any
 
@@ -8,9 +10,18 @@ import onnxruntime as ort
 
 from phoenix_ml.domain.inference.entities.model import Model
 from phoenix_ml.domain.inference.entities.prediction import Prediction
-from phoenix_ml.domain.inference.services.inference_engine import InferenceEngine
+from phoenix_ml.domain.inference.services.inference_engine import EngineHandle, InferenceEngine
 from phoenix_ml.domain.inference.value_objects.confidence_score import ConfidenceScore
 from phoenix_ml.domain.inference.value_objects.feature_vector import FeatureVector
+from phoenix_ml.domain.inference.value_objects.runtime_options import RuntimeOptions
+from phoenix_ml.infrastructure.ml_engines.inference_executor import InferenceExecutor
+from phoenix_ml.infrastructure.ml_engines.io_binding import (
+    IOBindingPool,
+    input_width,
+    numpy_dtype,
+)
+from phoenix_ml.infrastructure.ml_engines.model_residency import ModelResidencyManager
+from phoenix_ml.infrastructure.ml_engines.session_options import build_session_options
 
 
 class TensorRTExecutor(InferenceEngine):
@@ -21,12 +32,29 @@ class TensorRTExecutor(InferenceEngine):
     (NVIDIA GPU + TensorRT installed). Falls back to CPUExecutionProvider
     automatically on machines without TensorRT — allowing the same code
     to run in both GPU-accelerated production and CPU-only development.
+    Loaded sessions are registered with ``residency`` (see
+    ``ModelResidencyManager``) like in ``ONNXInferenceEngine``.
     """
 
-    def __init__(self, cache_dir: Path | None = None) -> None:
+    def __init__(  # noqa: PLR0913
+        self,
+        cache_dir: Path | None = None,
+        executor: InferenceExecutor | None = None,
+        runtime_options: Mapping[str, RuntimeOptions] | None = None,
+        io_binding: bool = True,
+        *,
+        residency: ModelResidencyManager | None = None,
+    ) -> None:
         self._cache_dir = cache_dir or Path("/tmp/phoenix/model_cache")
         self._cache_dir.mkdir(parents=True, exist_ok=True)
         self._sessions: dict[str, ort.InferenceSession] = {}
+        self._executor = executor or InferenceExecutor()
+        self._runtime_options: Mapping[str, RuntimeOptions] = (
+            runtime_options if runtime_options is not None else {}
+        )
+        self._io_binding = io_binding
+        self._io_pools: dict[str, IOBindingPool] = {}
+        self._residency = residency if residency is not None else ModelResidencyManager()
 
     async def load(self, model: Model) -> None:
         if model.framework not in ["tensorrt", "onnx"]:
@@ -35,6 +63,13 @@ class TensorRTExecutor(InferenceEngine):
         if model.unique_key in self._sessions:
             return
 
+        await self._residency.ensure_loaded(
+            model,
+            functools.partial(self._create_session, model),
+            functools.partial(self._unload, model),
+        )
+
+    async def _create_session(self, model: Model) -> int:
         model_path = self._cache_dir / model.id / model.version / "model.onnx"
         if not model_path.exists():
             raise FileNotFoundError(f"Model artifact not found at {model_path}")
@@ -45,10 +80,54 @@ class TensorRTExecutor(InferenceEngine):
             "CPUExecutionProvider",
         ]
 
+        options = self._runtime_options.get(model.id, RuntimeOptions())
+        plan = self._executor.plan(model, options)
+
         session = await asyncio.to_thread(
-            ort.InferenceSession, str(model_path), providers=providers
+            ort.InferenceSession,
+            str(model_path),
+            sess_options=build_session_options(options, plan),
+            providers=providers,
         )
         self._sessions[model.unique_key] = session
+        return self._residency.estimate_footprint(model_path)
+
+    def _unload(self, model: Model) -> bool:
+        if self._executor.in_flight(model):
+            return False
+        self._sessions.pop(model.unique_key, None)
+        self._io_pools.pop(model.unique_key, None)
+        self._executor.release(model)
+        return True
+
+    async def unload(self, model: Model) -> bool:
+        """Release the session of ``model`` and its residency entry."""
+        return self._residency.release(model)
+
+    def set_pinned(self, model: Model, pinned: bool) -> None:
+        """Pin or unpin ``model`` in the residency manager."""
+        if pinned:
+            self._residency.pin(model.id, model.version)
+        else:
+            self._residency.unpin(model.id, model.version)
+
+    def engine_handle(self, model: Model) -> EngineHandle:
+        session = self._sessions[model.unique_key]
+        model_input = session.get_inputs()[0]
+        dtype = numpy_dtype(model_input.type)
+        return EngineHandle(
+            session=session,
+            input_name=model_input.name,
+            dtype=dtype if dtype is not None else np.dtype(np.float32),
+            n_features=input_width(model_input.shape),
+        )
+
+    def _io_pool(self, model: Model) -> IOBindingPool:
+        pool = self._io_pools.get(model.unique_key)
+        if pool is None:
+            pool = IOBindingPool(self._sessions[model.unique_key], enabled=self._io_binding)
+            self._io_pools[model.unique_key] = pool
+        return pool
 
     async def predict(self, model: Model, features: FeatureVector) -> Prediction:
         results = await self.batch_predict(model, [features])
@@ -59,13 +138,13 @@ class TensorRTExecutor(InferenceEngine):
     ) -> list[Prediction]:
         if model.unique_key not in self._sessions:
             await self.load(model)
+        self._residency.touch(model)
 
-        session = self._sessions[model.unique_key]
-        input_name = session.get_inputs()[0].name
-        batch_data = np.stack([f.values for f in features_list]).astype(np.float32)
+        pool = self._io_pool(model)
+        rows = [f.values for f in features_list]
 
         start_time = time.time()
-        outputs = await asyncio.to_thread(session.run, None, {input_name: batch_data})
+        outputs = await self._executor.run(model, pool.run, rows)
         latency_ms_total = (time.time() - start_time) * 1000
         avg_latency_ms = latency_ms_total / len(features_list)
 
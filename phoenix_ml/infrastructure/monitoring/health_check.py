@@ -18,6 +18,14 @@ class HealthStatus:
     healthy: bool
     latency_ms: float = 0.0
     details: str = ""
+    # Working, but with reduced service (e.g. a model failed to warm up)
+    degraded: bool = False
+
+    @property
+    def status(self) -> str:
+        if not self.healthy:
+            return "unhealthy"
+        return "degraded" if self.degraded else "healthy"
 
 
 @dataclass
@@ -27,14 +35,16 @@ class DeepHealthReport:
     overall: str = "healthy"
     components: list[HealthStatus] = field(default_factory=list)
     timestamp: str = ""
+    ready: bool = True
 
     def to_dict(self) -> dict[str, Any]:
         return {
             "status": self.overall,
+            "ready": self.ready,
             "components": [
                 {
                     "name": c.name,
-                    "status": "healthy" if c.healthy else "unhealthy",
+                    "status": c.status,
                     "latency_ms": round(c.latency_ms, 2),
                     "details": c.details,
                 }
@@ -56,11 +66,15 @@ class HealthChecker:
         report.components.append(await self._check_redis())
         report.components.append(await self._check_kafka())
         report.components.append(await self._check_models())
+        report.components.append(self._check_warmup())
+        report.ready = self._warmup_finished()
         report.components.append(self._check_disk())
 
         unhealthy = [c for c in report.components if not c.healthy]
         if unhealthy:
             report.overall = "degraded" if len(unhealthy) < len(report.components) else "unhealthy"
+        elif any(c.degraded for c in report.components):
+            report.overall = "degraded"
 
         return report
 
@@ -141,6 +155,44 @@ class HealthChecker:
             latency = (time.monotonic() - start) * 1000
             return HealthStatus("models", False, latency, str(e)[:100])
 
+    def _check_warmup(self) -> HealthStatus:
+        """
+        Check model warm-up progress (unhealthy until it has finished).
+        Models that failed to warm up and have not loaded since mark it degraded.
+        """
+        start = time.monotonic()
+        try:
+            from phoenix_ml.infrastructure.bootstrap.container import (  # noqa: PLC0415
+                model_runtime_cache,
+                model_warmup,
+            )
+
+            failed = [key for key in model_warmup.failed if key not in model_runtime_cache]
+            degraded = False
+            if not model_warmup.is_ready:
+                healthy, details = False, f"Warming up ({model_warmup.pending} model(s) pending)"
+            elif failed:
+                healthy, degraded = True, True
+                details = f"Failed for {', '.join(failed)}"
+            else:
+                healthy, details = True, f"{len(model_warmup.results)} model(s) warmed up"
+            latency = (time.monotonic() - start) * 1000
+            return HealthStatus("warmup", healthy, latency, details, degraded)
+        except Exception as e:
+            latency = (time.monotonic() - start) * 1000
+            return HealthStatus("warmup", False, latency, str(e)[:100])
+
+    def _warmup_finished(self) -> bool:
+        """Readiness: warm-up has run to completion (failed models included)."""
+        try:
+            from phoenix_ml.infrastructure.bootstrap.container import (  # noqa: PLC0415
+                model_warmup,
+            )
+
+            return model_warmup.is_ready
+        except Exception:
+            return False
+
     def _check_disk(self) -> HealthStatus:
         """Check disk space availability."""
         import shutil  # noqa: PLC0415
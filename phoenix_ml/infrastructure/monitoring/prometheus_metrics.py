@@ -28,6 +28,150 @@ PREDICTION_ERROR_RATE = Gauge(
     ["model_id"],
 )
 
+# ── Batching ─────────────────────────────────────────────────────
+
+BATCH_TARGET_SIZE = Gauge(
+    "batch_target_size",
+    "Batch cap currently chosen by the adaptive batching policy",
+    ["model_id", "version"],
+)
+
+BATCH_WINDOW_MS = Gauge(
+    "batch_window_ms",
+    "Batching wait window (ms) currently chosen by the adaptive batching policy",
+    ["model_id", "version"],
+)
+
+# ── Inference Executor ───────────────────────────────────────────
+
+EXECUTOR_IN_FLIGHT = Gauge(
+    "inference_executor_in_flight",
+    "Inference calls submitted to the model's executor and not yet finished",
+    ["model_id", "version"],
+)
+
+EXECUTOR_QUEUED = Gauge(
+    "inference_executor_queued",
+    "Inference calls waiting for a free executor worker",
+    ["model_id", "version"],
+)
+
+EXECUTOR_WORKERS = Gauge(
+    "inference_executor_workers",
+    "Worker threads in the model's inference executor",
+    ["model_id", "version"],
+)
+
+DEADLINE_MISSES = Counter(
+    "inference_deadline_misses_total",
+    "Requests dropped because their deadline passed before inference started",
+    ["model_id", "version", "priority"],
+)
+
+COALESCED_REQUESTS = Counter(
+    "inference_coalesced_requests_total",
+    "Requests attached to an identical in-flight request instead of being queued",
+    ["model_id", "version"],
+)
+
+SHED_REQUESTS = Counter(
+    "inference_shed_requests_total",
+    "Requests rejected by admission control instead of being queued",
+    ["model_id", "version", "reason"],
+)
+
+# ── Cross-model Batch Scheduler ──────────────────────────────────
+
+SCHEDULER_SLOTS_IN_USE = Gauge(
+    "inference_scheduler_slots_in_use",
+    "Engine slots of the cross-model batch scheduler currently running a batch",
+)
+
+SCHEDULER_SLOTS = Gauge(
+    "inference_scheduler_slots",
+    "Engine slots owned by the cross-model batch scheduler",
+)
+
+SCHEDULER_WEIGHTED_WORK = Counter(
+    "inference_scheduler_weighted_work_total",
+    "Batch rows dispatched divided by the model's weight; equal rates mean fair sharing",
+    ["model_id", "version"],
+)
+
+SCHEDULER_WAIT = Histogram(
+    "inference_scheduler_wait_seconds",
+    "Time a batch waited for a scheduler slot",
+    ["model_id", "version"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+)
+
+# ── Shadow Inference ─────────────────────────────────────────────
+
+SHADOW_PREDICTIONS = Counter(
+    "inference_shadow_predictions_total",
+    "Champion samples replayed against a shadow challenger, by outcome",
+    ["model_id", "version", "outcome"],
+)
+
+# ── Model Cascade ────────────────────────────────────────────────
+
+CASCADE_LATENCY = Histogram(
+    "inference_cascade_latency_seconds",
+    "End-to-end latency of cascaded requests by the stage that answered",
+    ["model_id", "stage"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0),
+)
+
+# ── Model Residency ──────────────────────────────────────────────
+
+RESIDENT_MODELS = Gauge(
+    "inference_resident_models",
+    "Model versions with a loaded inference session",
+)
+
+RESIDENT_MODEL_BYTES = Gauge(
+    "inference_resident_model_bytes",
+    "Estimated memory held by loaded inference sessions",
+)
+
+MODEL_MEMORY_BUDGET = Gauge(
+    "inference_model_memory_budget_bytes",
+    "Memory budget for loaded inference sessions (0 = unbounded)",
+)
+
+MODEL_EVICTIONS = Counter(
+    "inference_model_evictions_total",
+    "Inference sessions unloaded to stay within the memory budget",
+    ["model_id", "version"],
+)
+
+MODEL_RELOADS = Counter(
+    "inference_model_reloads_total",
+    "Inference sessions loaded again after an eviction",
+    ["model_id", "version"],
+)
+
+# ── Model Hot Swap ───────────────────────────────────────────────
+
+MODEL_SWAPS = Counter(
+    "inference_model_swaps_total",
+    "Champion hot swaps by outcome",
+    ["model_id", "version", "outcome"],
+)
+
+MODEL_SWAP_DURATION = Histogram(
+    "inference_model_swap_duration_seconds",
+    "Time from starting to load a new champion to unloading the old one",
+    ["model_id"],
+    buckets=(0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0),
+)
+
+MODEL_SWAP_ADDED_P99 = Gauge(
+    "inference_model_swap_added_p99_seconds",
+    "p99 prediction latency during the last hot swap above the pre-swap p99",
+    ["model_id"],
+)
+
 # ── Drift Detection ──────────────────────────────────────────────
 
 DRIFT_SCORE = Gauge(
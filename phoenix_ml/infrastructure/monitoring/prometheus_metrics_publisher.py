@@ -7,29 +7,49 @@ from typing import Any
 
 from phoenix_ml.domain.monitoring.services.metrics_publisher import MetricsPublisher
 from phoenix_ml.infrastructure.monitoring.prometheus_metrics import (
+    BATCH_TARGET_SIZE,
+    BATCH_WINDOW_MS,
+    CASCADE_LATENCY,
+    COALESCED_REQUESTS,
+    DEADLINE_MISSES,
     DRIFT_DETECTED_COUNT,
     DRIFT_SCORE,
+    EXECUTOR_IN_FLIGHT,
+    EXECUTOR_QUEUED,
+    EXECUTOR_WORKERS,
     INFERENCE_LATENCY,
     MODEL_CONFIDENCE,
+    MODEL_EVICTIONS,
+    MODEL_MEMORY_BUDGET,
     MODEL_PRIMARY_METRIC,
+    MODEL_RELOADS,
+    MODEL_SWAP_ADDED_P99,
+    MODEL_SWAP_DURATION,
+    MODEL_SWAPS,
     PREDICTION_COUNT,
     PREDICTION_ERROR_RATE,
+    RESIDENT_MODEL_BYTES,
+    RESIDENT_MODELS,
+    SCHEDULER_SLOTS,
+    SCHEDULER_SLOTS_IN_USE,
+    SCHEDULER_WAIT,
+    SCHEDULER_WEIGHTED_WORK,
+    SHADOW_PREDICTIONS,
+    SHED_REQUESTS,
 )
 
 logger = logging.getLogger(__name__)
 
 
 class PrometheusMetricsPublisher(MetricsPublisher):
-
     def record_prediction(
         self,
         model_id: str,
         version: str,
         status: str = "ok",
+        count: int = 1,
     ) -> None:
-        PREDICTION_COUNT.labels(
-            model_id=model_id, version=version, status=status
-        ).inc()
+        PREDICTION_COUNT.labels(model_id=model_id, version=version, status=status).inc(count)
 
     def record_latency(
         self,
@@ -37,9 +57,7 @@ class PrometheusMetricsPublisher(MetricsPublisher):
         version: str,
         latency_seconds: float,
     ) -> None:
-        INFERENCE_LATENCY.labels(
-            model_id=model_id, version=version
-        ).observe(latency_seconds)
+        INFERENCE_LATENCY.labels(model_id=model_id, version=version).observe(latency_seconds)
 
     def record_confidence(
         self,
@@ -47,9 +65,7 @@ class PrometheusMetricsPublisher(MetricsPublisher):
         version: str,
         confidence: float,
     ) -> None:
-        MODEL_CONFIDENCE.labels(
-            model_id=model_id, version=version
-        ).observe(confidence)
+        MODEL_CONFIDENCE.labels(model_id=model_id, version=version).observe(confidence)
 
     def publish_model_metrics(
         self,
@@ -96,3 +112,83 @@ class PrometheusMetricsPublisher(MetricsPublisher):
         error_rate: float,
     ) -> None:
         PREDICTION_ERROR_RATE.labels(model_id=model_id).set(error_rate)
+
+    def record_batch_policy(
+        self,
+        model_id: str,
+        version: str,
+        max_batch_size: int,
+        max_wait_time_ms: float,
+    ) -> None:
+        BATCH_TARGET_SIZE.labels(model_id=model_id, version=version).set(max_batch_size)
+        BATCH_WINDOW_MS.labels(model_id=model_id, version=version).set(max_wait_time_ms)
+
+    def record_executor_saturation(
+        self,
+        model_id: str,
+        version: str,
+        in_flight: int,
+        workers: int,
+    ) -> None:
+        EXECUTOR_IN_FLIGHT.labels(model_id=model_id, version=version).set(in_flight)
+        EXECUTOR_QUEUED.labels(model_id=model_id, version=version).set(max(0, in_flight - workers))
+        EXECUTOR_WORKERS.labels(model_id=model_id, version=version).set(workers)
+
+    def record_deadline_miss(
+        self,
+        model_id: str,
+        version: str,
+        priority: str,
+        count: int = 1,
+    ) -> None:
+        DEADLINE_MISSES.labels(model_id=model_id, version=version, priority=priority).inc(count)
+
+    def record_coalesced(self, model_id: str, version: str, count: int = 1) -> None:
+        COALESCED_REQUESTS.labels(model_id=model_id, version=version).inc(count)
+
+    def record_shed(self, model_id: str, version: str, reason: str, count: int = 1) -> None:
+        SHED_REQUESTS.labels(model_id=model_id, version=version, reason=reason).inc(count)
+
+    def record_scheduler_slots(self, in_use: int, total: int) -> None:
+        SCHEDULER_SLOTS_IN_USE.set(in_use)
+        SCHEDULER_SLOTS.set(total)
+
+    def record_scheduler_dispatch(
+        self,
+        model_id: str,
+        version: str,
+        weighted_work: float,
+        wait_ms: float,
+    ) -> None:
+        SCHEDULER_WEIGHTED_WORK.labels(model_id=model_id, version=version).inc(weighted_work)
+        SCHEDULER_WAIT.labels(model_id=model_id, version=version).observe(wait_ms / 1000.0)
+
+    def record_shadow(self, model_id: str, version: str, outcome: str, count: int = 1) -> None:
+        SHADOW_PREDICTIONS.labels(model_id=model_id, version=version, outcome=outcome).inc(count)
+
+    def record_cascade(self, model_id: str, stage: str, latency_seconds: float) -> None:
+        CASCADE_LATENCY.labels(model_id=model_id, stage=stage).observe(latency_seconds)
+
+    def record_model_residency(
+        self, resident_models: int, resident_bytes: int, budget_bytes: int
+    ) -> None:
+        RESIDENT_MODELS.set(resident_models)
+        RESIDENT_MODEL_BYTES.set(resident_bytes)
+        MODEL_MEMORY_BUDGET.set(budget_bytes)
+
+    def record_model_eviction(self, model_id: str, version: str) -> None:
+        MODEL_EVICTIONS.labels(model_id=model_id, version=version).inc()
+
+    def record_model_reload(self, model_id: str, version: str) -> None:
+        MODEL_RELOADS.labels(model_id=model_id, version=version).inc()
+
+    def record_model_swap(
+        self, model_id: str, version: str, outcome: str, duration_seconds: float
+    ) -> None:
+        MODEL_SWAPS.labels(model_id=model_id, version=version, outcome=outcome).inc()
+        MODEL_SWAP_DURATION.labels(model_id=model_id).observe(duration_seconds)
+
+    def record_swap_tail_latency(
+        self, model_id: str, version: str, added_p99_seconds: float
+    ) -> None:
+        MODEL_SWAP_ADDED_P99.labels(model_id=model_id).set(added_p99_seconds)
@@ -0,0 +1,56 @@
+"""Prometheus metrics aggregated across serving worker processes.
+
+With more than one worker, each process keeps its own in-memory metric
+values and a scrape of ``/metrics`` only sees the worker that answered.
+In multiprocess mode ``prometheus_client`` writes every value to a
+per-process file under ``PROMETHEUS_MULTIPROC_DIR`` and
+``MultiProcessCollector`` merges the files at scrape time: counters and
+histograms are summed over all workers, gauges are reported per worker
+with a ``pid`` label.
+
+The directory must be set in the environment before the workers import
+``prometheus_client``; ``prepare_multiprocess_dir`` does this in the
+supervisor process before the workers start.
+"""
+
+import glob
+import os
+import shutil
+from pathlib import Path
+
+from prometheus_client import REGISTRY, CollectorRegistry, multiprocess
+
+MULTIPROC_DIR_ENV = "PROMETHEUS_MULTIPROC_DIR"
+
+
+def prepare_multiprocess_dir(path: Path) -> Path:
+    """Empty ``path`` (values of a previous run) and point workers at it."""
+    shutil.rmtree(path, ignore_errors=True)
+    path.mkdir(parents=True, exist_ok=True)
+    os.environ[MULTIPROC_DIR_ENV] = str(path)
+    return path
+
+
+def multiprocess_enabled() -> bool:
+    return bool(os.environ.get(MULTIPROC_DIR_ENV))
+
+
+def metrics_registry() -> CollectorRegistry:
+    """Registry to expose on ``/metrics``: merged over workers in multiprocess mode."""
+    if not multiprocess_enabled():
+        return REGISTRY
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)  # type: ignore[no-untyped-call]
+    return registry
+
+
+def mark_worker_dead(pid: int | None = None) -> None:
+    """Drop the gauges of a stopped worker so scrapes stop reporting them."""
+    path = os.environ.get(MULTIPROC_DIR_ENV)
+    if not path:
+        return
+    pid = pid if pid is not None else os.getpid()
+    multiprocess.mark_process_dead(pid, path)  # type: ignore[no-untyped-call]
+    # Gauges in the default ("all") mode are kept by mark_process_dead
+    for f in glob.glob(os.path.join(path, f"gauge_all_{pid}.db")):
+        os.remove(f)
@@ -33,6 +33,7 @@ class InMemoryModelRepository(ModelRepository):
         key = f"{model_id}:{version}"
         if key in self._models:
             self._models[key].metadata["role"] = stage
+            self._models[key].is_active = stage not in ("archived", "retired")
 
     async def list_all(self) -> list[Model]:
         return list(self._models.values())
@@ -0,0 +1,207 @@
+"""In-process snapshot of a ``ModelRepository`` for I/O-free routing.
+
+``InferenceService._select_model`` reads the registry on every request.
+``SnapshotModelRepository`` serves those reads from memory: it loads
+``list_all()`` from the backing repository, refreshes it on an interval
+and invalidates it on writes and ``ModelRetrained`` events. Only the
+first load blocks a read: a stale snapshot keeps serving while a
+background task reloads it, so a slow or down backend never sits on the
+request path.
+"""
+
+import asyncio
+import contextlib
+import logging
+import time
+from collections.abc import AsyncIterator, Callable
+from contextlib import AbstractAsyncContextManager
+
+from phoenix_ml.domain.inference.entities.model import Model
+from phoenix_ml.domain.model_registry.repositories.model_repository import ModelRepository
+
+logger = logging.getLogger(__name__)
+
+RepositoryProvider = Callable[[], AbstractAsyncContextManager[ModelRepository]]
+
+
+def static_provider(repo: ModelRepository) -> RepositoryProvider:
+    """Provider for a repository that needs no per-use session."""
+
+    @contextlib.asynccontextmanager
+    async def provide() -> AsyncIterator[ModelRepository]:
+        yield repo
+
+    return provide
+
+
+class SnapshotModelRepository(ModelRepository):
+    """
+    Read-through snapshot in front of any ``ModelRepository``.
+
+    Reads are answered from the snapshot; a ``get_by_id`` miss (e.g. an
+    archived version the backend does not list) falls through to the
+    backend, and a version the backend does not know either is
+    remembered as missing for ``miss_ttl_s``. Writes go to the backend
+    and reload the snapshot before returning, so the writer (not a
+    request) waits for it and reads its own write.
+    """
+
+    def __init__(
+        self,
+        provider: RepositoryProvider,
+        refresh_interval_s: float = 30.0,
+        miss_ttl_s: float = 5.0,
+    ) -> None:
+        self._provider = provider
+        self._refresh_interval_s = refresh_interval_s
+        self._miss_ttl_s = miss_ttl_s
+        self._models: dict[str, Model] = {}
+        self._active: dict[str, list[Model]] = {}
+        # Unknown versions -> monotonic time until which they stay unknown
+        self._misses: dict[str, float] = {}
+        self._loaded_at: float | None = None
+        self._stale = True
+        self._lock = asyncio.Lock()
+        self._task: asyncio.Task[None] | None = None
+        self._reload_task: asyncio.Task[None] | None = None
+
+    @property
+    def is_loaded(self) -> bool:
+        """Whether a snapshot has been loaded at least once."""
+        return self._loaded_at is not None
+
+    @property
+    def age_s(self) -> float | None:
+        return None if self._loaded_at is None else time.monotonic() - self._loaded_at
+
+    # ── Snapshot lifecycle ────────────────────────────────────────
+
+    async def refresh(self) -> None:
+        """Reload the snapshot from the backend."""
+        async with self._lock:
+            await self._load()
+
+    def invalidate(self, model_id: str | None = None) -> None:
+        """Mark the snapshot stale and reload it in the background."""
+        self._stale = True
+        self._misses.clear()
+        logger.debug("Registry snapshot invalidated (model_id=%s)", model_id)
+        with contextlib.suppress(RuntimeError):  # no running loop: next read schedules it
+            self._schedule_reload()
+
+    def start(self) -> None:
+        """Start periodic background refresh."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._refresh_loop(), name="registry_snapshot")
+
+    async def stop(self) -> None:
+        for task in (self._task, self._reload_task):
+            if task is not None:
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+        self._task = None
+        self._reload_task = None
+
+    # ── ModelRepository ───────────────────────────────────────────
+
+    async def save(self, model: Model) -> None:
+        async with self._provider() as repo:
+            await repo.save(model)
+        await self._reload_after_write(model.id)
+
+    async def get_by_id(self, model_id: str, version: str) -> Model | None:
+        await self._ensure_fresh()
+        key = f"{model_id}:{version}"
+        model = self._models.get(key)
+        if model is not None:
+            return model
+        if self._misses.get(key, 0.0) > time.monotonic():
+            return None
+        async with self._provider() as repo:
+            model = await repo.get_by_id(model_id, version)
+        if model is None:
+            self._misses[key] = time.monotonic() + self._miss_ttl_s
+        return model
+
+    async def get_active_versions(self, model_id: str) -> list[Model]:
+        await self._ensure_fresh()
+        return list(self._active.get(model_id, ()))
+
+    async def get_champion(self, model_id: str) -> Model | None:
+        await self._ensure_fresh()
+        for model in self._active.get(model_id, ()):
+            if model.metadata.get("role") == "champion":
+                return model
+        return None
+
+    async def update_stage(self, model_id: str, version: str, stage: str) -> None:
+        async with self._provider() as repo:
+            await repo.update_stage(model_id, version, stage)
+        await self._reload_after_write(model_id)
+
+    async def list_all(self) -> list[Model]:
+        await self._ensure_fresh()
+        return list(self._models.values())
+
+    # ── Internals ─────────────────────────────────────────────────
+
+    async def _ensure_fresh(self) -> None:
+        if not self._stale:
+            return
+        if self.is_loaded:
+            # Serve the current snapshot; never wait for the backend here
+            self._schedule_reload()
+            return
+        async with self._lock:
+            if self._stale and not self.is_loaded:
+                await self._load()
+
+    def _schedule_reload(self) -> None:
+        """Start a background reload unless one is already running."""
+        if self._reload_task is None or self._reload_task.done():
+            self._reload_task = asyncio.get_running_loop().create_task(
+                self._background_reload(), name="registry_snapshot_reload"
+            )
+
+    async def _background_reload(self) -> None:
+        try:
+            await self.refresh()
+        except Exception as e:
+            logger.warning("⚠️ Registry refresh failed, serving last snapshot: %s", e)
+
+    async def _reload_after_write(self, model_id: str) -> None:
+        self._stale = True
+        self._misses.clear()
+        try:
+            await self.refresh()
+        except Exception as e:
+            # The write went through; reads pick it up on a later reload
+            logger.warning("⚠️ Registry reload after write to %s failed: %s", model_id, e)
+
+    async def _load(self) -> None:
+        # Clear the flag first so an invalidation during the load is not lost
+        self._stale = False
+        try:
+            async with self._provider() as repo:
+                models = await repo.list_all()
+        except Exception:
+            self._stale = True
+            raise
+
+        active: dict[str, list[Model]] = {}
+        for model in models:
+            if model.is_active:
+                active.setdefault(model.id, []).append(model)
+        self._models = {m.unique_key: m for m in models}
+        self._active = active
+        self._misses = {}
+        self._loaded_at = time.monotonic()
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self._refresh_interval_s)
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.warning("⚠️ Periodic registry refresh failed: %s", e)
@@ -8,8 +8,6 @@ import logging
 import os
 from pathlib import Path
 
-import uvicorn
-
 logger = logging.getLogger(__name__)
 
 
@@ -116,12 +114,14 @@ class PhoenixPlatform:
         Args:
             host: Bind address.
             port: Port number.
-            workers: Number of uvicorn workers.
+            workers: Number of uvicorn worker processes (metrics are
+                merged across them, one of them serves gRPC).
             reload: Auto-reload on code changes (dev only).
         """
+        from phoenix_ml.infrastructure.http.server import serve  # noqa: PLC0415
+
         logger.info("Starting Phoenix ML server on %s:%d", host, port)
-        uvicorn.run(
-            "phoenix_ml.infrastructure.http.fastapi_server:app",
+        serve(
             host=host,
             port=port,
             workers=workers,
@@ -62,3 +62,25 @@ class ValidationError(PhoenixBaseError):
 
     def __init__(self, detail: str) -> None:
         super().__init__(f"Validation failed: {detail}", code="VALIDATION_ERROR")
+
+
+class DeadlineExceededError(PhoenixBaseError):
+    """Raised when a request's deadline passes before inference starts."""
+
+    def __init__(self, model_id: str) -> None:
+        super().__init__(
+            f"Deadline exceeded before inference for model '{model_id}'",
+            code="DEADLINE_EXCEEDED",
+        )
+
+
+class OverloadedError(PhoenixBaseError):
+    """Raised when admission control sheds a request instead of queueing it."""
+
+    def __init__(self, model_id: str, reason: str, retry_after_s: float = 1.0) -> None:
+        super().__init__(
+            f"Model '{model_id}' is overloaded ({reason}); retry in {retry_after_s:.1f}s",
+            code="OVERLOADED",
+        )
+        self.reason = reason
+        self.retry_after_s = retry_after_s
@@ -1,10 +1,19 @@
 """Unit tests for batch prediction handler and command."""
 
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
 import pytest
 
 from phoenix_ml.application.commands.batch_predict_command import BatchPredictCommand
 from phoenix_ml.application.handlers.batch_predict_handler import BatchPredictHandler
 from phoenix_ml.application.handlers.predict_handler import PredictHandler
+from phoenix_ml.domain.inference.entities.model import Model
+from phoenix_ml.domain.inference.entities.prediction_batch import PredictionBatch
+from phoenix_ml.domain.inference.services.inference_service import InferenceService
+from phoenix_ml.domain.inference.services.model_runtime import ModelRuntime
+from phoenix_ml.domain.inference.value_objects.feature_vector import FeatureMatrix
+from phoenix_ml.domain.shared.event_bus import DomainEventBus
 
 
 async def test_batch_predict_empty_batch() -> None:
@@ -51,7 +60,7 @@ async def test_batch_predict_command_defaults() -> None:
 
 
 async def test_batch_predict_processes_all_items() -> None:
-    """Batch handler should attempt to process every item in the batch."""
+    """Rows with entity ids are each delegated to PredictHandler."""
     from unittest.mock import AsyncMock, MagicMock
 
     from phoenix_ml.domain.inference.entities.prediction import Prediction
@@ -73,6 +82,7 @@ async def test_batch_predict_processes_all_items() -> None:
         model_id="m1",
         batch=[[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]],
         model_version="v1",
+        entity_ids=["e1", "e2", "e3"],
     )
 
     result = await batch_handler.handle(command)
@@ -80,6 +90,8 @@ async def test_batch_predict_processes_all_items() -> None:
     assert result["total"] == 3
     assert result["successful"] == 3
     assert len(result["errors"]) == 0
+    assert result["results"] == [1, 1, 1]
+    assert result["confidences"] == [0.9, 0.9, 0.9]
     assert mock_handler.execute.call_count == 3
 
 
@@ -112,7 +124,9 @@ async def test_batch_predict_handles_partial_failure() -> None:
     mock_handler.execute = AsyncMock(side_effect=_side_effect)
 
     batch_handler = BatchPredictHandler(mock_handler)
-    command = BatchPredictCommand(model_id="m1", batch=[[1.0], [2.0], [3.0]])
+    command = BatchPredictCommand(
+        model_id="m1", batch=[[1.0], [2.0], [3.0]], entity_ids=["e1", "e2", "e3"]
+    )
 
     result = await batch_handler.handle(command)
 
@@ -120,3 +134,111 @@ async def test_batch_predict_handles_partial_failure() -> None:
     assert result["successful"] == 2
     assert len(result["errors"]) == 1
     assert result["errors"][0]["index"] == 1
+    assert result["results"] == [0, None, 0]
+
+
+async def test_batch_predict_reraises_when_every_item_is_shed() -> None:
+    """A fully shed batch surfaces OverloadedError instead of per-item errors."""
+    from unittest.mock import AsyncMock, MagicMock
+
+    from phoenix_ml.shared.exceptions import OverloadedError
+
+    mock_handler = MagicMock(spec=PredictHandler)
+    mock_handler.execute = AsyncMock(side_effect=OverloadedError("m1", "queue_full", 2.0))
+
+    batch_handler = BatchPredictHandler(mock_handler)
+    command = BatchPredictCommand(model_id="m1", batch=[[1.0], [2.0]], entity_ids=["a", "b"])
+
+    with pytest.raises(OverloadedError) as exc_info:
+        await batch_handler.handle(command)
+    assert exc_info.value.retry_after_s == 2.0  # noqa: PLR2004
+
+
+def _matrix_handler(fail_chunk: int | None = None) -> tuple[BatchPredictHandler, MagicMock]:
+    """BatchPredictHandler over a mocked InferenceService with 2-row engine chunks."""
+    runtime = ModelRuntime(
+        model=Model(id="m1", version="v2", uri="local://m", framework="onnx"),
+        feature_names=(),
+        dtype=np.dtype(np.float32),
+        n_features=2,
+    )
+    calls = 0
+
+    async def predict_matrix(
+        rt: ModelRuntime, features: FeatureMatrix, deadline: float | None = None
+    ) -> PredictionBatch:
+        nonlocal calls
+        calls += 1
+        if calls == fail_chunk:
+            raise RuntimeError("engine failed")
+        return PredictionBatch(
+            model_id="m1",
+            model_version="v2",
+            results=features.values[:, 0].astype(np.int64),
+            confidences=np.full(len(features), 0.5),
+            latency_ms=1.0,
+        )
+
+    service = MagicMock(spec=InferenceService)
+    service.resolve = AsyncMock(return_value=runtime)
+    service.max_batch_rows = 2
+    service.predict_matrix = AsyncMock(side_effect=predict_matrix)
+
+    predict_handler = MagicMock(spec=PredictHandler)
+    predict_handler.inference_service = service
+    predict_handler.event_bus = MagicMock(spec=DomainEventBus)
+    return BatchPredictHandler(predict_handler), predict_handler
+
+
+async def test_batch_predict_runs_one_matrix_in_engine_chunks() -> None:
+    """Rows without entity ids resolve the model once and run as matrix chunks."""
+    batch_handler, predict_handler = _matrix_handler()
+    command = BatchPredictCommand(
+        model_id="m1", batch=[[1.0, 0.0], [2.0, 0.0], [9.0], [3.0, 0.0], [4.0, 0.0], [5.0, 0.0]]
+    )
+
+    result = await batch_handler.handle(command)
+
+    assert result["version"] == "v2"
+    assert result["results"] == [1, 2, None, 3, 4, 5]
+    assert result["confidences"] == [0.5, 0.5, None, 0.5, 0.5, 0.5]
+    assert result["successful"] == 5
+    assert result["errors"] == [{"index": 2, "error": "Expected 2 features, got 1"}]
+
+    service = predict_handler.inference_service
+    service.resolve.assert_awaited_once_with("m1", None)
+    assert service.predict_matrix.await_count == 3
+    predict_handler.execute.assert_not_called()
+    events = [c.args[0] for c in predict_handler.event_bus.publish.call_args_list]
+    assert sorted(e.rows for e in events) == [1, 2, 2]
+
+
+async def test_batch_predict_reports_failed_chunk_rows() -> None:
+    """A failing chunk marks only its own rows as errors."""
+    batch_handler, predict_handler = _matrix_handler(fail_chunk=2)
+    command = BatchPredictCommand(model_id="m1", batch=[[float(i), 0.0] for i in range(4)])
+
+    result = await batch_handler.handle(command)
+
+    assert result["results"] == [0, 1, None, None]
+    assert [e["index"] for e in result["errors"]] == [2, 3]
+    assert result["errors"][0]["error"] == "engine failed"
+    statuses = sorted(c.args[0].status for c in predict_handler.event_bus.publish.call_args_list)
+    assert statuses == ["error", "success"]
+
+
+async def test_batch_predict_array_batch_skips_row_checks() -> None:
+    """A decoded (N, D) tensor runs as-is; a width mismatch fails every row."""
+    batch_handler, predict_handler = _matrix_handler()
+    matrix = np.array([[1.0, 0.0], [2.0, 0.0], [3.0, 0.0]], dtype=np.float32)
+
+    result = await batch_handler.handle(BatchPredictCommand(model_id="m1", batch=matrix))
+    wrong = await batch_handler.handle(
+        BatchPredictCommand(model_id="m1", batch=np.zeros((2, 3), dtype=np.float32))
+    )
+
+    assert result["results"] == [1, 2, 3]
+    chunk = predict_handler.inference_service.predict_matrix.await_args_list[0].args[1]
+    assert np.shares_memory(chunk.values, matrix)
+    assert wrong["successful"] == 0
+    assert wrong["errors"][1] == {"index": 1, "error": "Expected 2 features, got 3"}
@@ -6,6 +6,7 @@ import pytest
 
 from phoenix_ml.application.commands.trigger_retrain_command import TriggerRetrainCommand
 from phoenix_ml.application.handlers.retrain_handler import RetrainHandler
+from phoenix_ml.domain.inference.services.model_hot_swap import ModelHotSwapper
 from phoenix_ml.domain.model_registry.repositories.model_repository import ModelRepository
 from phoenix_ml.domain.monitoring.services.model_evaluator import ClassificationEvaluator
 from phoenix_ml.domain.shared.event_bus import DomainEventBus
@@ -85,3 +86,36 @@ async def test_retrain_handler_failure(retrain_handler: RetrainHandler) -> None:
             success = await retrain_handler.execute(command)
 
             assert success is False
+
+
+@pytest.mark.asyncio
+async def test_retrain_handler_hot_swaps_promoted_model(
+    mock_repo: AsyncMock, mock_evaluator: Mock
+) -> None:
+    swapper = AsyncMock(spec=ModelHotSwapper)
+    handler = RetrainHandler(
+        project_root=Path("/tmp/phoenix"),
+        model_repo=mock_repo,
+        evaluator=mock_evaluator,
+        event_bus=DomainEventBus(),
+        hot_swapper=swapper,
+    )
+    command = TriggerRetrainCommand(model_id="m1", reason="test drift")
+
+    with patch("asyncio.create_subprocess_exec") as mock_exec:
+        mock_process = AsyncMock()
+        mock_process.communicate.return_value = (b"done", b"")
+        mock_process.returncode = 0
+        mock_exec.return_value = mock_process
+
+        with (
+            patch("pathlib.Path.mkdir"),
+            patch("builtins.open", mock_open(read_data=json.dumps({"accuracy": 0.9}))),
+        ):
+            assert await handler.execute(command) is True
+
+    # Saved unrouted, then promoted by the swapper instead of update_stage
+    saved = mock_repo.save.await_args.args[0]
+    assert not saved.is_active
+    swapper.promote.assert_awaited_once_with(mock_repo, saved)
+    mock_repo.update_stage.assert_not_awaited()
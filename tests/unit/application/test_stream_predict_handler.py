@@ -0,0 +1,164 @@
+"""Unit tests for the streamed bulk prediction handler."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import pytest
+
+from phoenix_ml.application.handlers.batch_predict_handler import BatchPredictHandler
+from phoenix_ml.application.handlers.predict_handler import PredictHandler
+from phoenix_ml.application.handlers.stream_predict_handler import StreamPredictHandler
+from phoenix_ml.domain.inference.entities.model import Model
+from phoenix_ml.domain.inference.entities.prediction_batch import PredictionBatch
+from phoenix_ml.domain.inference.services.inference_service import InferenceService
+from phoenix_ml.domain.inference.services.model_runtime import ModelRuntime
+from phoenix_ml.domain.inference.value_objects.feature_vector import FeatureMatrix
+from phoenix_ml.domain.shared.event_bus import DomainEventBus
+
+RUNTIME = ModelRuntime(
+    model=Model(id="m1", version="v1", uri="local://m", framework="onnx"),
+    feature_names=(),
+    dtype=np.dtype(np.float32),
+    n_features=2,
+)
+
+
+def _handler(predict_matrix: Any, max_in_flight: int = 2) -> tuple[StreamPredictHandler, MagicMock]:
+    """StreamPredictHandler over a mocked InferenceService with 2-row engine chunks."""
+    service = MagicMock(spec=InferenceService)
+    service.resolve = AsyncMock(return_value=RUNTIME)
+    service.max_batch_rows = 2
+    service.predict_matrix = AsyncMock(side_effect=predict_matrix)
+
+    predict_handler = MagicMock(spec=PredictHandler)
+    predict_handler.inference_service = service
+    predict_handler.event_bus = MagicMock(spec=DomainEventBus)
+    return StreamPredictHandler(BatchPredictHandler(predict_handler), max_in_flight), service
+
+
+def _batch(features: FeatureMatrix) -> PredictionBatch:
+    return PredictionBatch(
+        model_id="m1",
+        model_version="v1",
+        results=features.values[:, 0].astype(np.int64),
+        confidences=np.full(len(features), 0.5),
+        latency_ms=1.0,
+    )
+
+
+async def _chunks(*chunks: Any) -> AsyncIterator[Any]:
+    for chunk in chunks:
+        yield chunk
+
+
+async def test_stream_yields_chunks_in_order_with_row_errors() -> None:
+    async def predict_matrix(
+        rt: ModelRuntime, features: FeatureMatrix, deadline: float | None = None
+    ) -> PredictionBatch:
+        # Later chunks finish first; output must still follow input order
+        await asyncio.sleep(0.01 / features.values[0, 0])
+        return _batch(features)
+
+    handler, service = _handler(predict_matrix)
+    runtime = await handler.open("m1")
+
+    out = [
+        c
+        async for c in handler.stream(
+            runtime,
+            _chunks([[1, 0], None, [2, 0]], np.array([[3.0, 0.0], [4.0, 0.0]])),
+        )
+    ]
+
+    assert [(c["offset"], c["count"]) for c in out] == [(0, 2), (2, 1), (3, 2)]
+    assert out[0]["results"] == [1, None]
+    assert out[0]["errors"] == [{"index": 1, "error": "Malformed row"}]
+    assert out[1]["results"] == [2]
+    assert out[2]["results"] == [3, 4]
+    assert out[2]["confidences"] == [0.5, 0.5]
+    service.resolve.assert_awaited_once_with("m1", None)
+    assert service.predict_matrix.await_count == 3
+
+
+async def test_stream_reports_width_mismatch_and_engine_failure() -> None:
+    async def predict_matrix(
+        rt: ModelRuntime, features: FeatureMatrix, deadline: float | None = None
+    ) -> PredictionBatch:
+        raise RuntimeError("engine failed")
+
+    handler, _ = _handler(predict_matrix)
+
+    out = [
+        c
+        async for c in handler.stream(
+            RUNTIME, _chunks([[1, 0], [1, 2, 3]], np.ones((1, 3), dtype=np.float32))
+        )
+    ]
+
+    assert out[0]["errors"] == [
+        {"index": 0, "error": "engine failed"},
+        {"index": 1, "error": "Expected 2 features, got 3"},
+    ]
+    assert out[1]["errors"] == [{"index": 2, "error": "Expected 2 features, got 3"}]
+
+
+async def test_stream_bounds_chunks_in_flight() -> None:
+    running = 0
+    peak = 0
+
+    async def predict_matrix(
+        rt: ModelRuntime, features: FeatureMatrix, deadline: float | None = None
+    ) -> PredictionBatch:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.005)
+        running -= 1
+        return _batch(features)
+
+    handler, _ = _handler(predict_matrix, max_in_flight=2)
+    rows = np.ones((20, 2), dtype=np.float32)
+
+    out = [c async for c in handler.stream(RUNTIME, _chunks(rows))]
+
+    assert len(out) == 10
+    assert peak == 2
+
+
+async def test_stream_cancels_pending_chunks_when_consumer_stops() -> None:
+    started = asyncio.Event()
+    cancelled = 0
+
+    async def predict_matrix(
+        rt: ModelRuntime, features: FeatureMatrix, deadline: float | None = None
+    ) -> PredictionBatch:
+        nonlocal cancelled
+        if features.values[0, 0] == 1:
+            return _batch(features)
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled += 1
+            raise
+        return _batch(features)
+
+    handler, _ = _handler(predict_matrix, max_in_flight=3)
+    rows = np.array([[1, 0], [1, 0], [2, 0], [2, 0], [3, 0], [3, 0]], dtype=np.float32)
+
+    stream = handler.stream(RUNTIME, _chunks(rows))
+    first = await anext(stream)
+    await started.wait()
+    await stream.aclose()
+    await asyncio.sleep(0)
+
+    assert first["results"] == [1, 1]
+    assert cancelled == 2
+
+
+def test_max_in_flight_must_be_positive() -> None:
+    with pytest.raises(ValueError, match="max_in_flight"):
+        StreamPredictHandler(MagicMock(spec=BatchPredictHandler), max_in_flight=0)
@@ -0,0 +1,396 @@
+import asyncio
+import time
+from unittest.mock import Mock, patch
+
+import numpy as np
+import pytest
+
+from phoenix_ml.config import Settings
+from phoenix_ml.domain.inference.entities.model import Model
+from phoenix_ml.domain.inference.entities.prediction import Prediction
+from phoenix_ml.domain.inference.services.batch_manager import BatchConfig, BatchManager
+from phoenix_ml.domain.inference.services.batch_policy import (
+    AdaptiveBatchPolicy,
+    BatchDecision,
+)
+from phoenix_ml.domain.inference.services.batch_scheduler import BatchScheduler
+from phoenix_ml.domain.inference.services.inference_engine import InferenceEngine
+from phoenix_ml.domain.inference.value_objects.confidence_score import ConfidenceScore
+from phoenix_ml.domain.inference.value_objects.feature_vector import FeatureMatrix, FeatureVector
+from phoenix_ml.domain.inference.value_objects.latency_budget import LatencyBudget
+from phoenix_ml.domain.inference.value_objects.request_priority import RequestPriority
+from phoenix_ml.domain.monitoring.services.metrics_publisher import MetricsPublisher
+from phoenix_ml.shared.exceptions import DeadlineExceededError, OverloadedError
+
+
+class RecordingEngine(InferenceEngine):
+    """Engine stub that records the size of every batch it executes."""
+
+    def __init__(self) -> None:
+        self.batch_sizes: list[int] = []
+
+    async def load(self, model: Model) -> None:
+        pass
+
+    async def predict(self, model: Model, features: FeatureVector) -> Prediction:
+        return (await self.batch_predict(model, [features]))[0]
+
+    async def batch_predict(
+        self, model: Model, features_list: list[FeatureVector]
+    ) -> list[Prediction]:
+        self.batch_sizes.append(len(features_list))
+        return [
+            Prediction(
+                model_id=model.id,
+                model_version=model.version,
+                result=float(f.values[0]),
+                confidence=ConfidenceScore(value=1.0),
+                latency_ms=0.1,
+            )
+            for f in features_list
+        ]
+
+    async def optimize(self, model: Model) -> None:
+        pass
+
+
+def _model(model_id: str = "m1") -> Model:
+    return Model(id=model_id, version="v1", uri="local://m", framework="onnx")
+
+
+def _fv(value: float) -> FeatureVector:
+    return FeatureVector(values=np.array([value, 0.0], dtype=np.float32))
+
+
+async def test_adaptive_builds_policy_per_model() -> None:
+    config = BatchConfig(
+        adaptive=True,
+        model_latency_budgets={"m2": LatencyBudget(20.0)},
+    )
+    manager = BatchManager(RecordingEngine(), config=config)
+    try:
+        await manager.predict(_model("m1"), _fv(1.0))
+        await manager.predict(_model("m2"), _fv(2.0))
+
+        policies = manager._policies
+        assert set(policies) == {"m1:v1", "m2:v1"}
+        assert policies["m1:v1"].budget == config.latency_budget
+        assert policies["m2:v1"].budget == LatencyBudget(20.0)
+    finally:
+        await manager.stop()
+
+
+async def test_static_config_has_no_policy() -> None:
+    manager = BatchManager(RecordingEngine(), config=BatchConfig(max_wait_time_ms=1))
+    try:
+        await manager.predict(_model(), _fv(1.0))
+        assert manager._policies == {}
+    finally:
+        await manager.stop()
+
+
+async def test_record_batch_receives_padded_size() -> None:
+    engine = RecordingEngine()
+    manager = BatchManager(engine, config=BatchConfig(adaptive=True))
+    decision = BatchDecision(max_batch_size=8, max_wait_time_ms=50.0)
+    try:
+        with (
+            patch.object(AdaptiveBatchPolicy, "decide", return_value=decision),
+            patch.object(AdaptiveBatchPolicy, "record_batch", autospec=True) as record,
+        ):
+            await asyncio.gather(*(manager.predict(_model(), _fv(i)) for i in range(3)))
+
+        assert engine.batch_sizes == [4]
+        _, size, engine_ms = record.call_args.args
+        assert size == 4
+        assert engine_ms >= 0.0
+    finally:
+        await manager.stop()
+
+
+async def test_worker_applies_decided_cap() -> None:
+    engine = RecordingEngine()
+    manager = BatchManager(engine, config=BatchConfig(adaptive=True, max_batch_size=32))
+    decision = BatchDecision(max_batch_size=2, max_wait_time_ms=50.0)
+    try:
+        with patch.object(AdaptiveBatchPolicy, "decide", return_value=decision):
+            results = await asyncio.gather(*(manager.predict(_model(), _fv(i)) for i in range(3)))
+
+        assert engine.batch_sizes == [2, 1]
+        assert [p.result for p in results] == [0.0, 1.0, 2.0]
+    finally:
+        await manager.stop()
+
+
+async def test_policy_metrics_published_only_on_change() -> None:
+    metrics = Mock(spec=MetricsPublisher)
+    manager = BatchManager(
+        RecordingEngine(), config=BatchConfig(adaptive=True), metrics_publisher=metrics
+    )
+    first = BatchDecision(max_batch_size=1, max_wait_time_ms=0.0)
+    second = BatchDecision(max_batch_size=4, max_wait_time_ms=2.0)
+    try:
+        with patch.object(AdaptiveBatchPolicy, "decide", side_effect=[first, first, second]):
+            for i in range(3):
+                await manager.predict(_model(), _fv(i))
+
+        assert metrics.record_batch_policy.call_count == 2
+        metrics.record_batch_policy.assert_any_call("m1", "v1", 1, 0.0)
+        metrics.record_batch_policy.assert_called_with("m1", "v1", 4, 2.0)
+    finally:
+        await manager.stop()
+
+
+async def test_predict_matrix_is_one_engine_batch() -> None:
+    engine = RecordingEngine()
+    manager = BatchManager(engine, config=BatchConfig(adaptive=True))
+    try:
+        await manager.predict(_model(), _fv(0.0))  # creates the adaptive policy
+        values = np.array([[1.0, 0.0], [2.0, 0.0], [3.0, 0.0]], dtype=np.float32)
+        batch = await manager.predict_matrix(_model(), FeatureMatrix.from_array(values))
+
+        assert batch.results.tolist() == [1.0, 2.0, 3.0]
+        assert engine.batch_sizes[-1] == 3  # noqa: PLR2004
+    finally:
+        await manager.stop()
+
+
+class GatedEngine(RecordingEngine):
+    """Holds every batch until ``gate`` is set; records row values per batch."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.gate = asyncio.Event()
+        self.started = asyncio.Event()
+        self.batches: list[list[float]] = []
+
+    async def batch_predict(
+        self, model: Model, features_list: list[FeatureVector]
+    ) -> list[Prediction]:
+        self.batches.append([float(f.values[0]) for f in features_list])
+        self.started.set()
+        await self.gate.wait()
+        return await super().batch_predict(model, features_list)
+
+
+async def test_expired_deadline_is_dropped_before_engine() -> None:
+    engine = GatedEngine()
+    manager = BatchManager(engine, config=BatchConfig(max_batch_size=4, max_wait_time_ms=1))
+    try:
+        first = asyncio.create_task(manager.predict(_model(), _fv(1.0)))
+        await engine.started.wait()
+
+        late = asyncio.create_task(
+            manager.predict(_model(), _fv(2.0), deadline=time.monotonic() + 0.01)
+        )
+        await asyncio.sleep(0.05)
+        engine.gate.set()
+
+        assert (await first).result == 1.0
+        with pytest.raises(DeadlineExceededError):
+            await late
+        assert engine.batches == [[1.0]]
+
+        with pytest.raises(DeadlineExceededError):
+            await manager.predict(_model(), _fv(3.0), deadline=time.monotonic() - 1)
+    finally:
+        await manager.stop()
+
+
+async def test_interactive_requests_overtake_bulk_backlog() -> None:
+    engine = GatedEngine()
+    manager = BatchManager(engine, config=BatchConfig(max_batch_size=4, max_wait_time_ms=1))
+    try:
+        first = asyncio.create_task(manager.predict(_model(), _fv(0.0)))
+        await engine.started.wait()
+
+        bulk = [
+            asyncio.create_task(
+                manager.predict(_model(), _fv(float(v)), priority=RequestPriority.BULK)
+            )
+            for v in range(1, 7)
+        ]
+        interactive = asyncio.create_task(manager.predict(_model(), _fv(10.0)))
+        await asyncio.sleep(0.01)
+        engine.gate.set()
+
+        await asyncio.gather(first, interactive, *bulk)
+        assert engine.batches[:2] == [[0.0], [10.0, 1.0, 2.0, 3.0]]
+        # The last batch is padded to the next power of two
+        assert set(engine.batches[2]) == {4.0, 5.0, 6.0}
+    finally:
+        await manager.stop()
+
+
+async def test_identical_requests_share_one_batch_slot() -> None:
+    engine = GatedEngine()
+    metrics = Mock(spec=MetricsPublisher)
+    manager = BatchManager(
+        engine,
+        config=BatchConfig(max_batch_size=8, max_wait_time_ms=1),
+        metrics_publisher=metrics,
+    )
+    try:
+        first = asyncio.create_task(manager.predict(_model(), _fv(0.0)))
+        await engine.started.wait()
+
+        duplicates = [asyncio.create_task(manager.predict(_model(), _fv(1.0))) for _ in range(3)]
+        other = asyncio.create_task(manager.predict(_model(), _fv(2.0)))
+        await asyncio.sleep(0.01)
+        engine.gate.set()
+
+        results = await asyncio.gather(*duplicates, other, first)
+        assert [r.result for r in results] == [1.0, 1.0, 1.0, 2.0, 0.0]
+        assert engine.batches == [[0.0], [1.0, 2.0]]
+        assert metrics.record_coalesced.call_count == 2  # noqa: PLR2004
+    finally:
+        await manager.stop()
+
+
+async def test_coalescing_can_be_disabled() -> None:
+    engine = GatedEngine()
+    engine.gate.set()
+    manager = BatchManager(
+        engine, config=BatchConfig(max_batch_size=4, max_wait_time_ms=5, coalesce=False)
+    )
+    try:
+        await asyncio.gather(*(manager.predict(_model(), _fv(1.0)) for _ in range(2)))
+        assert engine.batches == [[1.0, 1.0]]
+    finally:
+        await manager.stop()
+
+
+async def test_full_queue_sheds_requests() -> None:
+    engine = GatedEngine()
+    metrics = Mock(spec=MetricsPublisher)
+    manager = BatchManager(
+        engine,
+        config=BatchConfig(max_batch_size=4, max_wait_time_ms=1, max_queue_depth=2),
+        metrics_publisher=metrics,
+    )
+    try:
+        running = asyncio.create_task(manager.predict(_model(), _fv(0.0)))
+        await engine.started.wait()
+        queued = [asyncio.create_task(manager.predict(_model(), _fv(v))) for v in (1.0, 2.0)]
+        await asyncio.sleep(0)
+
+        with pytest.raises(OverloadedError) as exc_info:
+            await manager.predict(_model(), _fv(3.0))
+        assert exc_info.value.reason == "queue_full"
+        metrics.record_shed.assert_called_once_with("m1", "v1", "queue_full")
+
+        engine.gate.set()
+        await asyncio.gather(running, *queued)
+    finally:
+        await manager.stop()
+
+
+async def test_default_settings_admit_a_large_batch_fan_out() -> None:
+    # A batch request queues one request per row; none may be shed by default
+    max_depth = Settings(_env_file=None).BATCH_MAX_QUEUE_DEPTH or None
+    manager = BatchManager(
+        RecordingEngine(),
+        config=BatchConfig(max_batch_size=64, max_wait_time_ms=1, max_queue_depth=max_depth),
+    )
+    try:
+        rows = 1500
+        results = await asyncio.gather(
+            *(manager.predict(_model(), _fv(float(i))) for i in range(rows))
+        )
+        assert [r.result for r in results] == [float(i) for i in range(rows)]
+    finally:
+        await manager.stop()
+
+
+async def test_request_that_cannot_meet_its_deadline_is_shed() -> None:
+    engine = GatedEngine()
+    manager = BatchManager(engine, config=BatchConfig(max_batch_size=4, max_wait_time_ms=1))
+    try:
+        running = asyncio.create_task(manager.predict(_model(), _fv(0.0)))
+        await engine.started.wait()
+        await asyncio.sleep(0.05)
+        engine.gate.set()
+        await running
+
+        # A batch has been observed to take ~50ms, so a 5ms budget cannot be met
+        assert manager.estimate_queue_wait_ms(_model()) >= 40  # noqa: PLR2004
+        with pytest.raises(OverloadedError) as exc_info:
+            await manager.predict(_model(), _fv(1.0), deadline=time.monotonic() + 0.005)
+        assert exc_info.value.reason == "deadline"
+        assert exc_info.value.retry_after_s >= 1.0
+
+        assert (await manager.predict(_model(), _fv(2.0), deadline=time.monotonic() + 5)).result
+    finally:
+        await manager.stop()
+
+
+async def test_concurrent_batches_per_model() -> None:
+    engine = GatedEngine()
+    manager = BatchManager(
+        engine,
+        config=BatchConfig(max_batch_size=1, max_wait_time_ms=1, max_concurrent_batches=2),
+    )
+    try:
+        tasks = [asyncio.create_task(manager.predict(_model(), _fv(v))) for v in (1.0, 2.0, 3.0)]
+        await asyncio.sleep(0.02)
+        # Two batches are held by the engine at once; the third waits for a slot
+        assert engine.batches == [[1.0], [2.0]]
+
+        engine.gate.set()
+        await asyncio.gather(*tasks)
+        assert engine.batches == [[1.0], [2.0], [3.0]]
+    finally:
+        await manager.stop()
+
+
+async def test_predict_matrix_waits_for_a_slot() -> None:
+    scheduler = BatchScheduler(slots=1)
+    engine = RecordingEngine()
+    manager = BatchManager(engine, scheduler=scheduler)
+    await scheduler.acquire(_model("other"))
+
+    matrix = FeatureMatrix.from_array(np.zeros((2, 3), dtype=np.float32))
+    task = asyncio.create_task(manager.predict_matrix(_model(), matrix))
+    await asyncio.sleep(0.01)
+    assert engine.batch_sizes == []
+
+    scheduler.release()
+    await task
+    assert engine.batch_sizes == [2]
+    assert scheduler.in_use == 0
+
+
+async def test_predict_matrix_honours_deadline() -> None:
+    engine = RecordingEngine()
+    manager = BatchManager(engine, config=BatchConfig(max_batch_size=8))
+    assert manager.max_batch_rows == 8  # noqa: PLR2004
+    matrix = FeatureMatrix.from_array(np.zeros((2, 3), dtype=np.float32))
+
+    with pytest.raises(DeadlineExceededError):
+        await manager.predict_matrix(_model(), matrix, deadline=time.monotonic() - 1)
+    assert engine.batch_sizes == []
+
+
+async def test_drain_waits_for_running_batches_then_stops_worker() -> None:
+    engine = GatedEngine()
+    manager = BatchManager(engine, config=BatchConfig(max_batch_size=1, max_wait_time_ms=1))
+    try:
+        running = asyncio.create_task(manager.predict(_model(), _fv(1.0)))
+        queued = asyncio.create_task(manager.predict(_model(), _fv(2.0)))
+        await engine.started.wait()
+
+        # Times out while the batch is held; nothing is failed
+        assert not await manager.drain(_model(), timeout_s=0.02)
+        assert "m1:v1" in manager._running_tasks
+
+        engine.gate.set()
+        assert await manager.drain(_model(), timeout_s=1)
+        assert (await running).result == 1.0
+        assert (await queued).result == 2.0  # noqa: PLR2004
+        assert "m1:v1" not in manager._running_tasks
+        assert "m1:v1" not in manager._queues
+
+        # A later request for the version starts a new worker
+        assert (await manager.predict(_model(), _fv(3.0))).result == 3.0  # noqa: PLR2004
+    finally:
+        await manager.stop()
@@ -0,0 +1,76 @@
+import pytest
+
+from phoenix_ml.domain.inference.services.batch_policy import (
+    AdaptiveBatchPolicy,
+    BatchDecision,
+)
+from phoenix_ml.domain.inference.value_objects.latency_budget import LatencyBudget
+
+
+def test_uses_initial_decision_before_observations() -> None:
+    initial = BatchDecision(max_batch_size=16, max_wait_time_ms=5.0)
+    policy = AdaptiveBatchPolicy(LatencyBudget(50.0), initial=initial)
+    assert policy.decide() == initial
+    assert policy.estimate_cost_ms(8) == 0.0
+
+
+def test_idle_traffic_does_not_wait() -> None:
+    policy = AdaptiveBatchPolicy(LatencyBudget(50.0))
+    policy.record_batch(1, 2.0)
+    policy.record_batch(8, 4.0)
+
+    decision = policy.decide()
+    assert decision.max_batch_size == 1
+    assert decision.max_wait_time_ms == 0.0
+
+
+def test_moderate_traffic_gets_no_window_when_batch_one_keeps_up() -> None:
+    policy = AdaptiveBatchPolicy(LatencyBudget(50.0))
+    policy.record_batch(1, 2.0)
+
+    now = 0.0
+    for _ in range(100):
+        now += 0.005  # 200 req/s, unbatched capacity is 500 req/s
+        policy.record_arrival(now)
+
+    assert policy.decide(now=now) == BatchDecision(max_batch_size=1, max_wait_time_ms=0.0)
+
+
+def test_window_reserves_budget_for_in_flight_batch() -> None:
+    policy = AdaptiveBatchPolicy(LatencyBudget(20.0), max_batch_size=256)
+    policy.record_batch(1, 4.0)
+    policy.record_batch(16, 8.0)
+
+    now = 0.0
+    for _ in range(200):
+        now += 0.0005
+        policy.record_arrival(now)
+
+    decision = policy.decide(now=now)
+    cost = policy.estimate_cost_ms(decision.max_batch_size)
+    assert 2 * cost + decision.max_wait_time_ms <= 20.0
+
+
+def test_heavy_traffic_grows_batch_within_budget() -> None:
+    policy = AdaptiveBatchPolicy(LatencyBudget(50.0), max_batch_size=256)
+    policy.record_batch(1, 2.0)
+    policy.record_batch(8, 4.0)
+
+    now = 0.0
+    for _ in range(200):
+        now += 0.0005  # 2k req/s
+        policy.record_arrival(now)
+
+    decision = policy.decide(now=now)
+    assert decision.max_batch_size > 1
+    cost = policy.estimate_cost_ms(decision.max_batch_size)
+    assert 2 * cost + decision.max_wait_time_ms <= 50.0
+
+
+def test_invalid_arguments_raise() -> None:
+    with pytest.raises(ValueError, match="max_batch_size"):
+        AdaptiveBatchPolicy(LatencyBudget(10.0), max_batch_size=0)
+    with pytest.raises(ValueError, match="smoothing"):
+        AdaptiveBatchPolicy(LatencyBudget(10.0), smoothing=0.0)
+    with pytest.raises(ValueError, match="utilization"):
+        AdaptiveBatchPolicy(LatencyBudget(10.0), utilization=1.5)
@@ -0,0 +1,108 @@
+"""Tests for BatchScheduler."""
+
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+
+from phoenix_ml.domain.inference.entities.model import Model
+from phoenix_ml.domain.inference.services.batch_scheduler import BatchScheduler
+from phoenix_ml.domain.monitoring.services.metrics_publisher import MetricsPublisher
+
+
+def _model(model_id: str) -> Model:
+    return Model(id=model_id, version="v1", uri="local://m", framework="onnx")
+
+
+async def test_grants_free_slots_immediately() -> None:
+    metrics = Mock(spec=MetricsPublisher)
+    scheduler = BatchScheduler(slots=2, metrics_publisher=metrics)
+
+    await scheduler.acquire(_model("a"), 4)
+    await scheduler.acquire(_model("b"), 4)
+    assert scheduler.in_use == 2  # noqa: PLR2004
+
+    scheduler.release()
+    assert scheduler.in_use == 1
+    metrics.record_scheduler_slots.assert_called_with(1, 2)
+    assert metrics.record_scheduler_dispatch.call_count == 2  # noqa: PLR2004
+
+
+async def test_weighted_fair_order_under_contention() -> None:
+    scheduler = BatchScheduler(slots=1, weights={"b": 2.0})
+    await scheduler.acquire(_model("holder"))
+    order: list[str] = []
+
+    async def run(name: str) -> None:
+        async with scheduler.slot(_model(name[0]), cost=4):
+            order.append(name)
+
+    tasks = []
+    for name in ("a1", "a2", "a3", "b1", "b2", "b3"):
+        tasks.append(asyncio.create_task(run(name)))
+        await asyncio.sleep(0)
+    assert scheduler.waiting == 6  # noqa: PLR2004
+
+    scheduler.release()
+    await asyncio.gather(*tasks)
+    # Finish tags: a = 4, 8, 12; b (weight 2) = 2, 4, 6
+    assert order == ["b1", "a1", "b2", "b3", "a2", "a3"]
+    assert scheduler.in_use == 0
+
+
+async def test_cancelled_waiter_does_not_leak_a_slot() -> None:
+    scheduler = BatchScheduler(slots=1)
+    await scheduler.acquire(_model("a"))
+    waiter = asyncio.create_task(scheduler.acquire(_model("b")))
+    await asyncio.sleep(0)
+
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    scheduler.release()
+    assert scheduler.in_use == 0
+
+    await scheduler.acquire(_model("c"))
+    assert scheduler.in_use == 1
+
+
+async def test_idle_slot_keeps_one_slot_for_live_batches() -> None:
+    scheduler = BatchScheduler(slots=2)
+    await scheduler.acquire(_model("live"))
+    assert not scheduler.has_idle_slot()
+
+    shadow = asyncio.create_task(_hold_idle_slot(scheduler))
+    await asyncio.sleep(0.02)
+    assert not shadow.done()
+
+    scheduler.release()
+    await asyncio.wait_for(shadow, timeout=1.0)
+    assert scheduler.in_use == 0
+
+
+async def test_idle_slot_yields_to_waiting_live_batch() -> None:
+    scheduler = BatchScheduler(slots=1)
+    await scheduler.acquire(_model("a"))
+    live = asyncio.create_task(scheduler.acquire(_model("b")))
+    shadow = asyncio.create_task(_hold_idle_slot(scheduler))
+    await asyncio.sleep(0)
+
+    scheduler.release()  # goes to the waiting live batch, not the shadow one
+    await live
+    await asyncio.sleep(0.02)
+    assert not shadow.done()
+
+    scheduler.release()
+    await asyncio.wait_for(shadow, timeout=1.0)
+
+
+async def _hold_idle_slot(scheduler: BatchScheduler) -> None:
+    async with scheduler.idle_slot(poll_s=0.001):
+        assert scheduler.in_use == 1
+
+
+def test_invalid_arguments_raise() -> None:
+    with pytest.raises(ValueError, match="slots"):
+        BatchScheduler(slots=0)
+    with pytest.raises(ValueError, match="weight"):
+        BatchScheduler(slots=1, weights={"a": 0.0})
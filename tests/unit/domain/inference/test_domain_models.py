@@ -4,7 +4,7 @@ from pydantic import ValidationError
 
 from phoenix_ml.domain.inference.entities.prediction import Prediction
 from phoenix_ml.domain.inference.value_objects.confidence_score import ConfidenceScore
-from phoenix_ml.domain.inference.value_objects.feature_vector import FeatureVector
+from phoenix_ml.domain.inference.value_objects.feature_vector import FeatureMatrix, FeatureVector
 
 
 class TestFeatureVector:
@@ -23,6 +23,48 @@ class TestFeatureVector:
         v2 = FeatureVector(values=np.array([1.0, 2.0]))
         assert v1 == v2
 
+    def test_from_array_skips_validation(self) -> None:
+        values = np.array([], dtype=np.float32)
+        vec = FeatureVector.from_array(values)
+        assert vec.values is values
+
+    def test_hash_is_cached(self) -> None:
+        vec = FeatureVector(values=np.array([1.0, 2.0]))
+        assert hash(vec) == hash(FeatureVector(values=np.array([1.0, 2.0])))
+        assert vec._hash == hash(vec)
+
+    def test_is_immutable(self) -> None:
+        vec = FeatureVector(values=[1.0, 2.0])
+        with pytest.raises(AttributeError):
+            vec.values = np.array([3.0])  # type: ignore[misc]
+
+    def test_non_numeric_list_raises_error(self) -> None:
+        with pytest.raises(ValidationError):
+            FeatureVector(values=["a", "b"])
+
+
+class TestFeatureMatrix:
+    def test_create_valid_matrix(self) -> None:
+        matrix = FeatureMatrix(values=np.ones((3, 4), dtype=np.float32))
+        assert len(matrix) == 3  # noqa: PLR2004
+        assert matrix.n_features == 4  # noqa: PLR2004
+
+    def test_rows_are_views(self) -> None:
+        values = np.arange(6, dtype=np.float32).reshape(3, 2)
+        matrix = FeatureMatrix.from_array(values)
+        assert matrix.row(1).to_list() == [2.0, 3.0]
+        assert all(np.shares_memory(r.values, values) for r in matrix.rows())
+
+    def test_from_vectors(self) -> None:
+        vectors = [FeatureVector(values=[1.0, 2.0]), FeatureVector(values=[3.0, 4.0])]
+        matrix = FeatureMatrix.from_vectors(vectors)
+        assert matrix.values.dtype == np.float32
+        assert matrix.values.tolist() == [[1.0, 2.0], [3.0, 4.0]]
+
+    def test_one_dimensional_raises_error(self) -> None:
+        with pytest.raises(ValidationError):
+            FeatureMatrix(values=np.array([1.0, 2.0]))
+
 
 class TestConfidenceScore:
     def test_valid_score(self) -> None:
@@ -0,0 +1,83 @@
+"""Tests for the confidence-gated ModelCascade."""
+
+from unittest.mock import AsyncMock, Mock
+
+import numpy as np
+import pytest
+
+from phoenix_ml.domain.inference.entities.model import Model
+from phoenix_ml.domain.inference.entities.prediction import Prediction
+from phoenix_ml.domain.inference.services.batch_manager import BatchManager
+from phoenix_ml.domain.inference.services.model_cascade import ModelCascade
+from phoenix_ml.domain.inference.value_objects.cascade_options import CascadeOptions
+from phoenix_ml.domain.inference.value_objects.confidence_score import ConfidenceScore
+from phoenix_ml.domain.inference.value_objects.feature_vector import FeatureVector
+from phoenix_ml.domain.inference.value_objects.request_priority import RequestPriority
+from phoenix_ml.domain.monitoring.services.metrics_publisher import MetricsPublisher
+
+FIRST = Model(id="fraud-lite", version="v1", uri="local://lite", framework="onnx")
+CHAMPION = Model(id="fraud", version="v3", uri="local://full", framework="onnx")
+FEATURES = FeatureVector.from_array(np.array([1.0, 2.0], dtype=np.float32))
+
+
+def _prediction(model: Model, confidence: float) -> Prediction:
+    return Prediction(
+        model_id=model.id,
+        model_version=model.version,
+        result=1,
+        confidence=ConfidenceScore(value=confidence),
+        latency_ms=1.0,
+    )
+
+
+def _cascade(first_confidence: float) -> tuple[ModelCascade, Mock, Mock]:
+    batch_manager = Mock(spec=BatchManager)
+
+    async def predict(model: Model, features: FeatureVector, **kwargs: object) -> Prediction:
+        return _prediction(model, first_confidence if model is FIRST else 0.99)
+
+    batch_manager.predict = AsyncMock(side_effect=predict)
+    metrics = Mock(spec=MetricsPublisher)
+    options = {"fraud": CascadeOptions(model_id="fraud-lite", confidence_threshold=0.8)}
+    return ModelCascade(batch_manager, options, metrics_publisher=metrics), batch_manager, metrics
+
+
+async def test_confident_first_stage_answers_alone() -> None:
+    cascade, batch_manager, metrics = _cascade(first_confidence=0.95)
+
+    prediction = await cascade.predict(FIRST, CHAMPION, FEATURES, 0.8)
+
+    assert prediction.model_id == "fraud-lite"
+    batch_manager.predict.assert_awaited_once()
+    model_id, stage, _ = metrics.record_cascade.call_args.args
+    assert (model_id, stage) == ("fraud", "first")
+
+
+async def test_low_confidence_escalates_to_champion() -> None:
+    cascade, batch_manager, metrics = _cascade(first_confidence=0.6)
+
+    prediction = await cascade.predict(
+        FIRST, CHAMPION, FEATURES, 0.8, priority=RequestPriority.BULK, deadline=123.0
+    )
+
+    assert prediction.model_id == "fraud"
+    escalation = batch_manager.predict.await_args_list[1]
+    assert escalation.args == (CHAMPION, FEATURES)
+    assert escalation.kwargs == {"priority": RequestPriority.BULK, "deadline": 123.0}
+    model_id, stage, latency = metrics.record_cascade.call_args.args
+    assert (model_id, stage) == ("fraud", "escalated")
+    assert latency >= 0
+
+
+def test_options_for_skips_unconfigured_models() -> None:
+    options = {"fraud": CascadeOptions(version="v1-int8"), "credit": CascadeOptions()}
+    cascade = ModelCascade(Mock(spec=BatchManager), options)
+
+    assert cascade.options_for("fraud") == CascadeOptions(version="v1-int8")
+    assert cascade.options_for("credit") is None
+    assert cascade.options_for("unknown") is None
+
+
+def test_cascade_options_validate_threshold() -> None:
+    with pytest.raises(ValueError, match="confidence_threshold"):
+        CascadeOptions(version="v1", confidence_threshold=1.5)
@@ -104,6 +104,17 @@ class TestModelConfigLoader:
         assert config.framework == "pytorch"
         assert config.has_named_features is False
 
+    def test_dict_to_model_config_cascade(self) -> None:
+        data = {
+            "model_id": "fraud-detection",
+            "cascade": {"version": "v1-int8", "confidence_threshold": 0.85},
+        }
+        config = _dict_to_model_config(data)
+        assert config.cascade.enabled is True
+        assert config.cascade.version == "v1-int8"
+        assert config.cascade.confidence_threshold == 0.85
+        assert _dict_to_model_config({"model_id": "m"}).cascade.enabled is False
+
     def test_load_model_config_json(self, tmp_path: Path) -> None:
         config_data = {
             "model_id": "test-model",
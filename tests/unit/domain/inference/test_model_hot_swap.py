@@ -0,0 +1,183 @@
+"""Tests for ModelHotSwapper (zero-downtime champion promotion)."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from unittest.mock import ANY, Mock
+
+import numpy as np
+import pytest
+
+from phoenix_ml.domain.inference.entities.model import Model
+from phoenix_ml.domain.inference.entities.prediction import Prediction
+from phoenix_ml.domain.inference.services.batch_manager import BatchConfig, BatchManager
+from phoenix_ml.domain.inference.services.inference_engine import InferenceEngine
+from phoenix_ml.domain.inference.services.model_hot_swap import ModelHotSwapper
+from phoenix_ml.domain.inference.services.model_runtime import ModelRuntime
+from phoenix_ml.domain.inference.services.model_warmup import ModelWarmup
+from phoenix_ml.domain.inference.value_objects.confidence_score import ConfidenceScore
+from phoenix_ml.domain.inference.value_objects.feature_vector import FeatureVector
+from phoenix_ml.domain.monitoring.services.metrics_publisher import MetricsPublisher
+from phoenix_ml.domain.shared.domain_events import PredictionCompleted
+from phoenix_ml.infrastructure.persistence.in_memory_model_repo import InMemoryModelRepository
+from phoenix_ml.shared.exceptions import InferenceError
+
+
+class SwapEngine(InferenceEngine):
+    """Holds v1 batches until ``gate`` is set; records batches, unloads and pins."""
+
+    def __init__(self) -> None:
+        self.gate = asyncio.Event()
+        self.started = asyncio.Event()
+        self.batches: list[tuple[str, int]] = []
+        self.unloaded: list[str] = []
+        self.pins: dict[str, bool] = {}
+
+    async def load(self, model: Model) -> None:
+        pass
+
+    async def predict(self, model: Model, features: FeatureVector) -> Prediction:
+        return (await self.batch_predict(model, [features]))[0]
+
+    async def batch_predict(
+        self, model: Model, features_list: list[FeatureVector]
+    ) -> list[Prediction]:
+        self.batches.append((model.version, len(features_list)))
+        if model.version == "v1":
+            self.started.set()
+            await self.gate.wait()
+        return [
+            Prediction(
+                model_id=model.id,
+                model_version=model.version,
+                result=0,
+                confidence=ConfidenceScore(value=1.0),
+                latency_ms=0.1,
+            )
+            for _ in features_list
+        ]
+
+    async def unload(self, model: Model) -> bool:
+        self.unloaded.append(model.version)
+        return True
+
+    def set_pinned(self, model: Model, pinned: bool) -> None:
+        self.pins[model.version] = pinned
+
+    async def optimize(self, model: Model) -> None:
+        pass
+
+
+def _model(version: str, role: str) -> Model:
+    return Model(
+        id="m1", version=version, uri="local://m", framework="onnx", metadata={"role": role}
+    )
+
+
+async def _resolve(model: Model) -> ModelRuntime:
+    if model.version == "broken":
+        raise FileNotFoundError("no artifact")
+    return ModelRuntime(model=model, feature_names=(), dtype=np.dtype(np.float32), n_features=2)
+
+
+def _latency(seconds: float) -> PredictionCompleted:
+    return PredictionCompleted(
+        model_id="m1", version="v1", latency=seconds, confidence=1.0, status="success"
+    )
+
+
+async def _setup(
+    resolve: Callable[[Model], Awaitable[ModelRuntime]] = _resolve,
+    drain_timeout_s: float = 1.0,
+) -> tuple[SwapEngine, BatchManager, InMemoryModelRepository, ModelHotSwapper, Mock]:
+    engine = SwapEngine()
+    manager = BatchManager(engine, config=BatchConfig(max_batch_size=4, max_wait_time_ms=1))
+    repo = InMemoryModelRepository()
+    await repo.save(_model("v1", "champion"))
+    metrics = Mock(spec=MetricsPublisher)
+    swapper = ModelHotSwapper(
+        ModelWarmup(manager, iterations=1, max_batch_size=2),
+        manager,
+        engine,
+        resolve,
+        metrics_publisher=metrics,
+        drain_timeout_s=drain_timeout_s,
+    )
+    return engine, manager, repo, swapper, metrics
+
+
+def _fv() -> FeatureVector:
+    return FeatureVector(values=np.zeros(2, dtype=np.float32))
+
+
+async def test_promote_warms_swaps_then_drains_and_unloads_old_version() -> None:
+    engine, manager, repo, swapper, metrics = await _setup()
+    new = _model("v2", "challenger")
+    await repo.save(new)
+    for _ in range(20):
+        swapper.observe(_latency(0.010))
+    try:
+        in_flight = asyncio.create_task(manager.predict(_model("v1", "champion"), _fv()))
+        await engine.started.wait()
+
+        promotion = asyncio.create_task(swapper.promote(repo, new))
+        await asyncio.sleep(0.05)
+        # Warmed up and routed to before the old version finished its batch
+        assert ("v2", 1) in engine.batches
+        assert ("v2", 2) in engine.batches
+        champion = await repo.get_champion("m1")
+        assert champion is not None
+        assert champion.version == "v2"
+        assert engine.unloaded == []
+        assert engine.pins == {"v2": True, "v1": False}
+
+        for _ in range(20):
+            swapper.observe(_latency(0.030))
+        engine.gate.set()
+        assert await promotion
+        assert (await in_flight).model_version == "v1"
+        assert engine.unloaded == ["v1"]
+        assert "m1:v1" not in manager._running_tasks
+    finally:
+        await manager.stop()
+
+    metrics.record_model_swap.assert_called_once_with("m1", "v2", "completed", ANY)
+    metrics.record_swap_tail_latency.assert_called_once_with("m1", "v2", pytest.approx(0.020))
+
+
+async def test_failed_warm_up_keeps_the_old_champion() -> None:
+    engine, manager, repo, swapper, metrics = await _setup()
+    broken = _model("broken", "challenger")
+    await repo.save(broken)
+    try:
+        with pytest.raises(InferenceError, match="warm-up of broken failed"):
+            await swapper.promote(repo, broken)
+    finally:
+        await manager.stop()
+
+    champion = await repo.get_champion("m1")
+    assert champion is not None
+    assert champion.version == "v1"
+    assert engine.unloaded == []
+    assert engine.pins == {}
+    metrics.record_model_swap.assert_called_once_with("m1", "broken", "failed", ANY)
+
+
+async def test_busy_old_version_is_left_loaded_after_drain_timeout() -> None:
+    engine, manager, repo, swapper, metrics = await _setup(drain_timeout_s=0.02)
+    new = _model("v2", "challenger")
+    await repo.save(new)
+    try:
+        in_flight = asyncio.create_task(manager.predict(_model("v1", "champion"), _fv()))
+        await engine.started.wait()
+
+        assert not await swapper.promote(repo, new)
+        assert engine.unloaded == []
+
+        # The held request still completes on the old version
+        engine.gate.set()
+        assert (await in_flight).model_version == "v1"
+    finally:
+        await manager.stop()
+
+    metrics.record_model_swap.assert_called_once_with("m1", "v2", "undrained", ANY)
+    metrics.record_swap_tail_latency.assert_not_called()
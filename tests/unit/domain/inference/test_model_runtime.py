@@ -0,0 +1,63 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from phoenix_ml.domain.inference.entities.model import Model
+from phoenix_ml.domain.inference.services.model_runtime import ModelRuntime, ModelRuntimeCache
+from phoenix_ml.domain.shared.domain_events import ModelRetrained
+from phoenix_ml.domain.shared.event_bus import DomainEventBus
+
+
+def _model(version: str = "v1") -> Model:
+    return Model(id="m1", version=version, uri="local://m", framework="onnx")
+
+
+def _runtime(model: Model) -> ModelRuntime:
+    return ModelRuntime(model=model, feature_names=("a", "b"), dtype=np.dtype(np.float32))
+
+
+async def test_concurrent_resolution_builds_once() -> None:
+    cache = ModelRuntimeCache()
+    calls = 0
+
+    async def build(model: Model) -> ModelRuntime:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return _runtime(model)
+
+    results = await asyncio.gather(*(cache.resolve(_model(), build) for _ in range(5)))
+    assert calls == 1
+    assert all(r is results[0] for r in results)
+    assert cache.get(_model()) is results[0]
+
+
+async def test_failed_build_is_not_cached() -> None:
+    cache = ModelRuntimeCache()
+
+    async def fail(model: Model) -> ModelRuntime:
+        raise FileNotFoundError("missing")
+
+    with pytest.raises(FileNotFoundError):
+        await cache.resolve(_model(), fail)
+    assert len(cache) == 0
+
+
+async def test_invalidate_by_version_and_model() -> None:
+    cache = ModelRuntimeCache()
+
+    async def build(model: Model) -> ModelRuntime:
+        return _runtime(model)
+
+    await cache.resolve(_model("v1"), build)
+    await cache.resolve(_model("v2"), build)
+
+    cache.invalidate("m1", "v1")
+    assert cache.get(_model("v1")) is None
+    assert cache.get(_model("v2")) is not None
+
+    bus = DomainEventBus()
+    bus.subscribe(ModelRetrained, lambda e: cache.invalidate(e.model_id))
+    bus.publish(ModelRetrained(model_id="m1", version="v3", metrics={}, promoted=True))
+    assert len(cache) == 0
@@ -0,0 +1,141 @@
+"""Tests for ModelWarmup."""
+
+from collections.abc import Awaitable, Callable
+
+import numpy as np
+import pytest
+
+from phoenix_ml.domain.inference.entities.model import Model
+from phoenix_ml.domain.inference.entities.prediction import Prediction
+from phoenix_ml.domain.inference.services.batch_manager import BatchConfig, BatchManager
+from phoenix_ml.domain.inference.services.inference_engine import InferenceEngine
+from phoenix_ml.domain.inference.services.model_runtime import ModelRuntime
+from phoenix_ml.domain.inference.services.model_warmup import ModelWarmup
+from phoenix_ml.domain.inference.value_objects.confidence_score import ConfidenceScore
+from phoenix_ml.domain.inference.value_objects.feature_vector import FeatureVector
+
+
+class RecordingEngine(InferenceEngine):
+    def __init__(self) -> None:
+        self.batch_shapes: list[tuple[int, int]] = []
+
+    async def load(self, model: Model) -> None:
+        pass
+
+    async def predict(self, model: Model, features: FeatureVector) -> Prediction:
+        return (await self.batch_predict(model, [features]))[0]
+
+    async def batch_predict(
+        self, model: Model, features_list: list[FeatureVector]
+    ) -> list[Prediction]:
+        self.batch_shapes.append((len(features_list), len(features_list[0].values)))
+        return [
+            Prediction(
+                model_id=model.id,
+                model_version=model.version,
+                result=0,
+                confidence=ConfidenceScore(value=1.0),
+                latency_ms=0.1,
+            )
+            for _ in features_list
+        ]
+
+    async def optimize(self, model: Model) -> None:
+        pass
+
+
+def _model(model_id: str = "m1") -> Model:
+    return Model(id=model_id, version="v1", uri="local://m", framework="onnx")
+
+
+def _resolver(n_features: int | None = 3) -> Callable[[Model], Awaitable[ModelRuntime]]:
+    async def resolve(model: Model) -> ModelRuntime:
+        if model.id == "broken":
+            raise FileNotFoundError("no artifact")
+        return ModelRuntime(
+            model=model, feature_names=(), dtype=np.dtype(np.float32), n_features=n_features
+        )
+
+    return resolve
+
+
+def test_batch_sizes_cover_padded_cap() -> None:
+    manager = BatchManager(RecordingEngine())
+    assert ModelWarmup(manager, max_batch_size=16).batch_sizes() == [1, 2, 4, 8, 16]
+    assert ModelWarmup(manager, max_batch_size=10).batch_sizes() == [1, 2, 4, 8, 16]
+    assert ModelWarmup(manager, max_batch_size=1).batch_sizes() == [1]
+
+
+async def test_runs_each_padded_size_through_batch_manager() -> None:
+    engine = RecordingEngine()
+    manager = BatchManager(engine, config=BatchConfig(max_wait_time_ms=1))
+    warmup = ModelWarmup(manager, iterations=2, max_batch_size=4)
+    assert not warmup.is_ready
+    try:
+        results = await warmup.run([_model()], _resolver())
+    finally:
+        await manager.stop()
+
+    assert warmup.is_ready
+    assert results[0].ok
+    assert results[0].batch_sizes == (1, 2, 4)
+    # One queued request, then each size twice
+    assert engine.batch_shapes == [(1, 3), (1, 3), (1, 3), (2, 3), (2, 3), (4, 3), (4, 3)]
+
+
+async def test_failed_model_does_not_block_readiness() -> None:
+    manager = BatchManager(RecordingEngine(), config=BatchConfig(max_wait_time_ms=1))
+    warmup = ModelWarmup(manager, iterations=1, max_batch_size=2)
+    try:
+        results = await warmup.run([_model("broken"), _model("m2")], _resolver())
+    finally:
+        await manager.stop()
+
+    assert warmup.is_ready
+    assert [r.ok for r in results] == [False, True]
+    assert results[0].error == "no artifact"
+
+
+async def test_later_successful_warm_up_clears_failure() -> None:
+    manager = BatchManager(RecordingEngine(), config=BatchConfig(max_wait_time_ms=1))
+    warmup = ModelWarmup(manager, iterations=1, max_batch_size=2)
+    attempts = 0
+
+    async def flaky(model: Model) -> ModelRuntime:
+        nonlocal attempts
+        attempts += 1
+        if attempts == 1:
+            raise FileNotFoundError("no artifact yet")
+        return await _resolver()(model)
+
+    try:
+        await warmup.run([_model()], flaky)
+        assert warmup.failed == ["m1:v1"]
+
+        # e.g. warmed again once the artifact exists
+        assert (await warmup.warm(_model(), flaky)).ok
+        assert warmup.failed == []
+    finally:
+        await manager.stop()
+
+
+async def test_unknown_width_only_loads() -> None:
+    engine = RecordingEngine()
+    warmup = ModelWarmup(BatchManager(engine), max_batch_size=4)
+
+    results = await warmup.run([_model()], _resolver(n_features=None))
+
+    assert results[0].ok
+    assert results[0].batch_sizes == ()
+    assert engine.batch_shapes == []
+
+
+async def test_disabled_is_ready_immediately() -> None:
+    warmup = ModelWarmup(BatchManager(RecordingEngine()), enabled=False)
+    assert warmup.is_ready
+    assert await warmup.run([_model()], _resolver()) == []
+
+
+def test_rejects_negative_iterations() -> None:
+    with pytest.raises(ValueError, match="iterations"):
+        ModelWarmup(BatchManager(RecordingEngine()), iterations=-1)
@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+
+from phoenix_ml.domain.inference.entities.prediction import Prediction
+from phoenix_ml.domain.inference.entities.prediction_batch import PredictionBatch
+from phoenix_ml.domain.inference.value_objects.confidence_score import ConfidenceScore
+
+
+def _batch() -> PredictionBatch:
+    return PredictionBatch(
+        model_id="m1",
+        model_version="v1",
+        results=np.array([1, 0, 2], dtype=np.int64),
+        confidences=np.array([0.8, 0.6, 0.9]),
+        latency_ms=0.5,
+    )
+
+
+def test_prediction_materializes_single_row() -> None:
+    pred = _batch().prediction(1)
+    assert pred.model_id == "m1"
+    assert pred.result == 0
+    assert type(pred.result) is int
+    assert pred.confidence.value == pytest.approx(0.6)
+    assert pred.latency_ms == 0.5
+
+
+def test_to_predictions_and_iteration() -> None:
+    batch = _batch()
+    preds = batch.to_predictions()
+    assert [p.result for p in preds] == [1, 0, 2]
+    assert len({p.id for p in preds}) == 3
+    assert [p.result for p in batch] == [1, 0, 2]
+
+
+def test_head_drops_padding() -> None:
+    batch = _batch()
+    assert len(batch.head(2)) == 2
+    assert batch.head(5) is batch
+
+
+def test_mismatched_columns_raise() -> None:
+    with pytest.raises(ValueError, match="same length"):
+        PredictionBatch(
+            model_id="m1",
+            model_version="v1",
+            results=np.array([1, 2]),
+            confidences=np.array([1.0]),
+            latency_ms=0.0,
+        )
+
+
+def test_from_predictions_round_trips() -> None:
+    preds = [
+        Prediction(
+            model_id="m1",
+            model_version="v1",
+            result=[0.1, 0.2],
+            confidence=ConfidenceScore(value=0.7),
+            latency_ms=1.0,
+        )
+    ]
+    batch = PredictionBatch.from_predictions(preds)
+    assert batch.prediction(0).result == [0.1, 0.2]
+    assert batch.prediction(0).confidence.value == pytest.approx(0.7)
+
+
+def test_columns_are_plain_python() -> None:
+    results, confidences = _batch().columns()
+    assert results == [1, 0, 2]
+    assert type(results[0]) is int
+    assert confidences == pytest.approx([0.8, 0.6, 0.9])
+
+    rows = np.empty(1, dtype=object)
+    rows[0] = np.array([0.5, 0.25])
+    batch = PredictionBatch(
+        model_id="m1",
+        model_version="v1",
+        results=rows,
+        confidences=np.array([1.0]),
+        latency_ms=0.0,
+    )
+    assert batch.columns()[0] == [[0.5, 0.25]]
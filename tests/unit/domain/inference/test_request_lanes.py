@@ -0,0 +1,85 @@
+"""Tests for RequestLanes."""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from phoenix_ml.domain.inference.entities.prediction import Prediction
+from phoenix_ml.domain.inference.services.request_lanes import RequestLanes
+from phoenix_ml.domain.inference.value_objects.feature_vector import FeatureVector
+from phoenix_ml.domain.inference.value_objects.request_priority import RequestPriority
+
+BULK = RequestPriority.BULK
+INTERACTIVE = RequestPriority.INTERACTIVE
+
+
+def _push(
+    lanes: RequestLanes,
+    value: float,
+    priority: RequestPriority = INTERACTIVE,
+    deadline: float | None = None,
+) -> None:
+    future: asyncio.Future[Prediction] = asyncio.get_running_loop().create_future()
+    lanes.push(FeatureVector.from_array(np.array([value])), future, priority, deadline)
+
+
+def _values(lanes: RequestLanes, n: int) -> list[float]:
+    return [float(r.features.values[0]) for r in lanes.take(n)]
+
+
+async def test_fifo_without_deadlines() -> None:
+    lanes = RequestLanes()
+    for v in range(3):
+        _push(lanes, v)
+    assert _values(lanes, 8) == [0.0, 1.0, 2.0]
+    assert len(lanes) == 0
+
+
+async def test_earliest_deadline_first_across_lanes() -> None:
+    lanes = RequestLanes(interactive_share=0.0)
+    _push(lanes, 1, INTERACTIVE)
+    _push(lanes, 2, BULK, deadline=20.0)
+    _push(lanes, 3, INTERACTIVE, deadline=10.0)
+    assert lanes.earliest_deadline() == 10.0  # noqa: PLR2004
+    assert _values(lanes, 3) == [3.0, 2.0, 1.0]
+
+
+async def test_interactive_share_is_reserved() -> None:
+    lanes = RequestLanes(interactive_share=0.5)
+    for v in range(6):
+        _push(lanes, v, BULK, deadline=1.0)
+    _push(lanes, 10, INTERACTIVE)
+    _push(lanes, 11, INTERACTIVE)
+
+    # Bulk items have earlier deadlines but cannot take the reserved half
+    assert _values(lanes, 4) == [10.0, 11.0, 0.0, 1.0]
+    # Without waiting interactive requests, bulk fills the whole batch
+    assert _values(lanes, 4) == [2.0, 3.0, 4.0, 5.0]
+
+
+async def test_drop_expired() -> None:
+    lanes = RequestLanes()
+    _push(lanes, 1, deadline=5.0)
+    _push(lanes, 2, BULK, deadline=15.0)
+    _push(lanes, 3)
+
+    expired = lanes.drop_expired(now=10.0)
+    assert [float(r.features.values[0]) for r in expired] == [1.0]
+    assert lanes.depth(INTERACTIVE) == 1
+    assert lanes.depth(BULK) == 1
+
+
+async def test_wait_changed() -> None:
+    lanes = RequestLanes()
+    assert not await lanes.wait_changed(timeout=0.01)
+
+    waiter = asyncio.create_task(lanes.wait_changed(timeout=1.0))
+    await asyncio.sleep(0)
+    _push(lanes, 1)
+    assert await waiter
+
+
+def test_invalid_share_raises() -> None:
+    with pytest.raises(ValueError, match="interactive_share"):
+        RequestLanes(interactive_share=1.5)
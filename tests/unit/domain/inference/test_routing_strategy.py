@@ -98,3 +98,17 @@ def test_shadow_no_challenger(role_models: list[Model]) -> None:
     selected = strategy.select_model(champion_only)
     assert selected.id == "m1"
     assert strategy.shadow_model is None
+
+
+def test_shadow_for_names_challenger(role_models: list[Model]) -> None:
+    strategy = ShadowStrategy()
+    champion = strategy.select_model(role_models)
+    shadow = strategy.shadow_for(role_models, champion)
+    assert shadow is not None
+    assert shadow.id == "m2"
+    assert strategy.shadow_for([role_models[0]], champion) is None
+
+
+def test_other_strategies_have_no_shadow(models: list[Model]) -> None:
+    strategy = SingleModelStrategy()
+    assert strategy.shadow_for(models, strategy.select_model(models)) is None
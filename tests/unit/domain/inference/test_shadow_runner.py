@@ -0,0 +1,179 @@
+"""Tests for ShadowRunner and ShadowPairBuffer."""
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, Mock
+
+import numpy as np
+import pytest
+
+from phoenix_ml.domain.inference.entities.model import Model
+from phoenix_ml.domain.inference.entities.prediction import Prediction
+from phoenix_ml.domain.inference.entities.prediction_batch import PredictionBatch
+from phoenix_ml.domain.inference.services.batch_manager import BatchManager
+from phoenix_ml.domain.inference.services.model_runtime import ModelRuntime
+from phoenix_ml.domain.inference.services.shadow_runner import ShadowPairBuffer, ShadowRunner
+from phoenix_ml.domain.inference.value_objects.confidence_score import ConfidenceScore
+from phoenix_ml.domain.inference.value_objects.feature_vector import FeatureMatrix
+from phoenix_ml.domain.monitoring.services.metrics_publisher import MetricsPublisher
+
+CHALLENGER = Model(id="m1", version="v2", uri="local://m", framework="onnx")
+RUNTIME = ModelRuntime(model=CHALLENGER, feature_names=(), dtype=np.dtype(np.float32), n_features=2)
+
+
+def _champion(result: Any, confidence: float = 0.9) -> Prediction:
+    return Prediction(
+        model_id="m1",
+        model_version="v1",
+        result=result,
+        confidence=ConfidenceScore(value=confidence),
+        latency_ms=4.0,
+    )
+
+
+def _batch(results: list[Any], latency_ms: float = 6.0) -> PredictionBatch:
+    return PredictionBatch(
+        model_id="m1",
+        model_version="v2",
+        results=np.array(results),
+        confidences=np.full(len(results), 0.7),
+        latency_ms=latency_ms,
+    )
+
+
+async def _load() -> ModelRuntime:
+    return RUNTIME
+
+
+def _runner(**kwargs: Any) -> tuple[ShadowRunner, Mock]:
+    batch_manager = Mock(spec=BatchManager)
+
+    async def predict_shadow(model: Model, features: FeatureMatrix) -> PredictionBatch:
+        # Challenger predicts the first feature as its class
+        return _batch(features.values[:, 0].astype(np.int64).tolist())
+
+    batch_manager.predict_shadow = AsyncMock(side_effect=predict_shadow)
+    kwargs.setdefault("sample_rate", 1.0)
+    return ShadowRunner(batch_manager, **kwargs), batch_manager
+
+
+async def _drain(runner: ShadowRunner) -> None:
+    for _ in range(100):
+        if not runner.pending and runner.buffers():
+            return
+        await asyncio.sleep(0)
+
+
+def test_pair_buffer_keeps_latest_pairs_oldest_first() -> None:
+    buffer = ShadowPairBuffer("m1", "v1", "v2", capacity=3)
+    buffer.extend([_champion(i) for i in range(2)], _batch([0, 0]))
+    buffer.extend([_champion(i) for i in range(2, 5)], _batch([2, 3, 0]))
+
+    pairs = buffer.snapshot()
+
+    assert len(pairs) == 3  # noqa: PLR2004
+    np.testing.assert_array_equal(pairs.champion_results, [2, 3, 4])
+    np.testing.assert_array_equal(pairs.challenger_results, [2, 3, 0])
+    np.testing.assert_array_equal(pairs.agree, [True, True, False])
+    np.testing.assert_allclose(pairs.challenger_latency_ms, 6.0)
+
+
+def test_pair_buffer_compares_non_scalar_results() -> None:
+    buffer = ShadowPairBuffer("m1", "v1", "v2")
+    buffer.extend([_champion("cat"), _champion("dog")], _batch(["cat", "cow"]))
+
+    pairs = buffer.snapshot()
+
+    np.testing.assert_array_equal(pairs.agree, [True, False])
+    assert np.isnan(pairs.champion_results).all()
+
+
+async def test_runs_sampled_requests_in_one_shadow_batch() -> None:
+    runner, batch_manager = _runner()
+
+    for value in (1.0, 0.0, 1.0):
+        assert runner.submit(_champion(1), CHALLENGER, np.array([value, 0.5]), _load)
+    await _drain(runner)
+
+    batch_manager.predict_shadow.assert_awaited_once()
+    model, features = batch_manager.predict_shadow.await_args.args
+    assert model is CHALLENGER
+    assert features.values.shape == (3, 2)
+
+    (pairs,) = runner.pairs("m1")
+    assert (pairs.champion_version, pairs.challenger_version) == ("v1", "v2")
+    np.testing.assert_array_equal(pairs.agree, [True, False, True])
+    await runner.stop()
+
+
+async def test_submit_never_waits_for_the_shadow_run() -> None:
+    release = asyncio.Event()
+    runner, batch_manager = _runner()
+
+    async def blocked(model: Model, features: FeatureMatrix) -> PredictionBatch:
+        await release.wait()
+        return _batch([1])
+
+    batch_manager.predict_shadow = AsyncMock(side_effect=blocked)
+
+    assert runner.submit(_champion(1), CHALLENGER, np.array([1.0, 0.0]), _load)
+    await asyncio.sleep(0)
+    assert runner.submit(_champion(1), CHALLENGER, np.array([1.0, 0.0]), _load)
+    assert runner.pending == 1
+
+    release.set()
+    await runner.stop()
+    assert runner.pending == 0
+
+
+async def test_sample_rate_selects_requests_below_rate() -> None:
+    draws = iter([0.05, 0.5])
+    runner, _ = _runner(sample_rate=0.1, rng=lambda: next(draws))
+
+    assert runner.submit(_champion(1), CHALLENGER, np.array([1.0, 0.0]), _load)
+    assert not runner.submit(_champion(1), CHALLENGER, np.array([1.0, 0.0]), _load)
+    await runner.stop()
+
+
+async def test_full_lane_drops_new_samples() -> None:
+    metrics = Mock(spec=MetricsPublisher)
+    runner, _ = _runner(max_pending=1, metrics_publisher=metrics)
+
+    assert runner.submit(_champion(1), CHALLENGER, np.array([1.0, 0.0]), _load)
+    assert not runner.submit(_champion(1), CHALLENGER, np.array([1.0, 0.0]), _load)
+
+    metrics.record_shadow.assert_called_once_with("m1", "v2", "dropped", 1)
+    await runner.stop()
+
+
+async def test_skips_samples_with_other_feature_width() -> None:
+    metrics = Mock(spec=MetricsPublisher)
+    runner, batch_manager = _runner(metrics_publisher=metrics)
+
+    runner.submit(_champion(1), CHALLENGER, np.array([1.0, 0.0, 3.0]), _load)
+    runner.submit(_champion(1), CHALLENGER, np.array([1.0, 0.0]), _load)
+    await _drain(runner)
+
+    assert batch_manager.predict_shadow.await_args.args[1].values.shape == (1, 2)
+    metrics.record_shadow.assert_any_call("m1", "v2", "skipped", 1)
+    metrics.record_shadow.assert_any_call("m1", "v2", "completed", 1)
+    await runner.stop()
+
+
+async def test_failed_shadow_batch_is_contained() -> None:
+    metrics = Mock(spec=MetricsPublisher)
+    runner, batch_manager = _runner(metrics_publisher=metrics)
+    batch_manager.predict_shadow = AsyncMock(side_effect=RuntimeError("engine crash"))
+
+    runner.submit(_champion(1), CHALLENGER, np.array([1.0, 0.0]), _load)
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+    metrics.record_shadow.assert_called_once_with("m1", "v2", "failed", 1)
+    assert runner.buffers() == []
+    await runner.stop()
+
+
+def test_rejects_invalid_sample_rate() -> None:
+    with pytest.raises(ValueError, match="sample_rate"):
+        ShadowRunner(Mock(spec=BatchManager), sample_rate=1.5)
@@ -0,0 +1,87 @@
+"""Tests for SingleFlight."""
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from phoenix_ml.domain.inference.entities.model import Model
+from phoenix_ml.domain.inference.entities.prediction import Prediction
+from phoenix_ml.domain.inference.services.single_flight import SingleFlight, flight_key
+from phoenix_ml.domain.inference.value_objects.confidence_score import ConfidenceScore
+from phoenix_ml.domain.inference.value_objects.feature_vector import FeatureVector
+from phoenix_ml.domain.inference.value_objects.request_priority import RequestPriority
+
+MODEL = Model(id="m1", version="v1", uri="local://m", framework="onnx")
+
+
+def _prediction() -> Prediction:
+    return Prediction(
+        model_id="m1",
+        model_version="v1",
+        result=1,
+        confidence=ConfidenceScore(value=1.0),
+        latency_ms=0.1,
+    )
+
+
+def test_key_uses_float32_bytes() -> None:
+    a = FeatureVector(values=np.array([1.0, 2.0], dtype=np.float64))
+    b = FeatureVector(values=np.array([1.0, 2.0], dtype=np.float32))
+    c = FeatureVector(values=np.array([1.0, 2.5], dtype=np.float32))
+    assert flight_key(MODEL, a) == flight_key(MODEL, b)
+    assert flight_key(MODEL, a) != flight_key(MODEL, c)
+
+
+async def test_followers_share_the_leader_result() -> None:
+    flights = SingleFlight()
+    key = flight_key(MODEL, FeatureVector(values=[1.0]))
+    future: asyncio.Future[Prediction] = asyncio.get_running_loop().create_future()
+
+    assert flights.join(key) is None
+    assert flights.lead(key, future)
+    shared = flights.join(key)
+    assert shared is future
+
+    leader = asyncio.create_task(flights.wait(key, future))
+    follower = asyncio.create_task(flights.wait(key, shared))
+    prediction = _prediction()
+    future.set_result(prediction)
+
+    assert await leader is prediction
+    assert await follower is prediction
+    assert len(flights) == 0
+
+
+async def test_does_not_cover_tighter_deadline_or_higher_priority() -> None:
+    flights = SingleFlight()
+    key = flight_key(MODEL, FeatureVector(values=[1.0]))
+    future: asyncio.Future[Prediction] = asyncio.get_running_loop().create_future()
+    flights.lead(key, future, RequestPriority.BULK, deadline=10.0)
+
+    assert flights.join(key, RequestPriority.BULK, deadline=20.0) is None
+    assert flights.join(key, RequestPriority.INTERACTIVE, deadline=5.0) is None
+    assert flights.join(key, RequestPriority.BULK, deadline=5.0) is future
+    # A caller that could not join runs uncoalesced
+    assert not flights.lead(key, asyncio.get_running_loop().create_future())
+
+
+async def test_future_cancelled_only_when_every_caller_gives_up() -> None:
+    flights = SingleFlight()
+    key = flight_key(MODEL, FeatureVector(values=[1.0]))
+    future: asyncio.Future[Prediction] = asyncio.get_running_loop().create_future()
+    flights.lead(key, future)
+    flights.join(key)
+
+    callers = [asyncio.create_task(flights.wait(key, future)) for _ in range(2)]
+    await asyncio.sleep(0)
+
+    callers[0].cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await callers[0]
+    assert not future.cancelled()
+
+    callers[1].cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await callers[1]
+    assert future.cancelled()
@@ -0,0 +1,78 @@
+"""Tests for VariantSelector (fp32 vs quantized serving artifact)."""
+
+from typing import Any
+
+import pytest
+
+from phoenix_ml.domain.inference.entities.model import Model
+from phoenix_ml.domain.inference.services.variant_selector import VariantSelector
+from phoenix_ml.domain.inference.value_objects.variant_benchmark import (
+    QuantizationReport,
+    VariantBenchmark,
+)
+
+URI = "local:///models/fraud/v3/model.onnx"
+
+
+def _report(
+    quantized_score: float, quantized_p50: float, *, higher_is_better: bool = True
+) -> QuantizationReport:
+    return QuantizationReport(
+        metric="accuracy" if higher_is_better else "rmse",
+        higher_is_better=higher_is_better,
+        fp32=VariantBenchmark("model.onnx", 0.90, latency_p50_ms=2.0, latency_p95_ms=3.0),
+        quantized=VariantBenchmark(
+            "model_quantized.onnx", quantized_score, quantized_p50, latency_p95_ms=2.0
+        ),
+    )
+
+
+def _model(variants: Any = None) -> Model:
+    metadata = {} if variants is None else {"variants": variants}
+    return Model(id="fraud", version="v3", uri=URI, framework="onnx", metadata=metadata)
+
+
+def test_serves_quantized_when_accurate_and_faster() -> None:
+    model = _model(_report(0.895, 1.0).to_dict())
+
+    uri = VariantSelector(max_score_drop=0.01, min_speedup=1.1).artifact_uri(model)
+
+    assert uri == "local:///models/fraud/v3/model_quantized.onnx"
+
+
+@pytest.mark.parametrize(
+    ("quantized_score", "quantized_p50"),
+    [(0.85, 1.0), (0.90, 1.95)],
+    ids=["too_inaccurate", "not_faster"],
+)
+def test_keeps_fp32_outside_the_gate(quantized_score: float, quantized_p50: float) -> None:
+    model = _model(_report(quantized_score, quantized_p50).to_dict())
+
+    assert VariantSelector(max_score_drop=0.01, min_speedup=1.1).artifact_uri(model) == URI
+
+
+def test_lower_is_better_metric_counts_increase_as_drop() -> None:
+    report = _report(0.95, 1.0, higher_is_better=False)
+
+    assert report.score_drop == pytest.approx(0.05)
+    assert VariantSelector(max_score_drop=0.01).artifact_uri(_model(report.to_dict())) == URI
+
+
+def test_keeps_registered_artifact_without_valid_report() -> None:
+    selector = VariantSelector()
+
+    assert selector.artifact_uri(_model()) == URI
+    assert selector.artifact_uri(_model({"metric": "accuracy"})) == URI
+
+
+def test_disabled_selector_ignores_report() -> None:
+    model = _model(_report(0.90, 0.5).to_dict())
+
+    assert VariantSelector(enabled=False).artifact_uri(model) == URI
+
+
+def test_report_round_trips_through_metadata() -> None:
+    report = _report(0.88, 1.0)
+
+    assert QuantizationReport.from_dict(report.to_dict()) == report
+    assert report.speedup == pytest.approx(2.0)
@@ -1,7 +1,12 @@
 """Tests for A/B test statistical analyzer."""
 
+import numpy as np
 import pytest
 
+from phoenix_ml.domain.inference.services.shadow_runner import (
+    ShadowPairBuffer,
+    ShadowPairs,
+)
 from phoenix_ml.domain.monitoring.services.ab_test_analyzer import ABTestAnalyzer
 
 
@@ -83,3 +88,36 @@ class TestABTestAnalyzer:
             [1.0, 2.0] * 50, [5.0, 6.0] * 50
         )
         assert result.effect_size > 0
+
+    def test_compare_shadow(self, analyzer: ABTestAnalyzer) -> None:
+        n = 100
+        pairs = ShadowPairs(
+            model_id="m1",
+            champion_version="v1",
+            challenger_version="v2",
+            champion_results=np.ones(n),
+            challenger_results=np.r_[np.ones(90), np.zeros(10)],
+            agree=np.r_[np.ones(90, dtype=bool), np.zeros(10, dtype=bool)],
+            champion_confidence=np.full(n, 0.9),
+            challenger_confidence=np.full(n, 0.8),
+            champion_latency_ms=np.linspace(4.0, 6.0, n),
+            challenger_latency_ms=np.linspace(9.0, 11.0, n),
+        )
+
+        comparison = analyzer.compare_shadow(pairs)
+
+        assert comparison.count == n
+        assert comparison.agreement == pytest.approx(0.9)
+        assert comparison.latency.is_significant
+        assert comparison.latency.variant_mean > comparison.latency.control_mean
+        assert comparison.confidence.control_name == "v1"
+        assert comparison.to_dict()["challenger_version"] == "v2"
+        # Within tolerance every numeric pair agrees
+        assert analyzer.compare_shadow(pairs, tolerance=1.0).agreement == 1.0
+
+    def test_compare_shadow_needs_pairs(
+        self, analyzer: ABTestAnalyzer
+    ) -> None:
+        pairs = ShadowPairBuffer("m1", "v1", "v2").snapshot()
+        with pytest.raises(ValueError, match="shadow pairs"):
+            analyzer.compare_shadow(pairs)
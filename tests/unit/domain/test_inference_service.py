@@ -8,22 +8,33 @@ from phoenix_ml.domain.feature_store.repositories.feature_store import FeatureSt
 from phoenix_ml.domain.inference.entities.model import Model
 from phoenix_ml.domain.inference.entities.prediction import Prediction
 from phoenix_ml.domain.inference.services.batch_manager import BatchManager
-from phoenix_ml.domain.inference.services.inference_engine import InferenceEngine
+from phoenix_ml.domain.inference.services.inference_engine import EngineHandle, InferenceEngine
 from phoenix_ml.domain.inference.services.inference_service import (
     InferenceService,
     PredictionRequest,
 )
-from phoenix_ml.domain.inference.services.routing_strategy import RoutingStrategy
+from phoenix_ml.domain.inference.services.model_cascade import ModelCascade
+from phoenix_ml.domain.inference.services.model_runtime import ModelRuntimeCache
+from phoenix_ml.domain.inference.services.routing_strategy import RoutingStrategy, ShadowStrategy
+from phoenix_ml.domain.inference.services.shadow_runner import ShadowRunner
+from phoenix_ml.domain.inference.services.variant_selector import VariantSelector
+from phoenix_ml.domain.inference.value_objects.cascade_options import CascadeOptions
 from phoenix_ml.domain.inference.value_objects.confidence_score import ConfidenceScore
+from phoenix_ml.domain.inference.value_objects.variant_benchmark import (
+    QuantizationReport,
+    VariantBenchmark,
+)
 from phoenix_ml.domain.model_registry.repositories.artifact_storage import ArtifactStorage
 from phoenix_ml.domain.model_registry.repositories.model_repository import ModelRepository
 
 
 @pytest.fixture
 def mock_components() -> dict[str, Any]:
+    engine = AsyncMock(spec=InferenceEngine)
+    engine.engine_handle.return_value = EngineHandle()
     return {
         "repo": AsyncMock(spec=ModelRepository),
-        "engine": AsyncMock(spec=InferenceEngine),
+        "engine": engine,
         "batch": AsyncMock(spec=BatchManager),
         "fs": AsyncMock(spec=FeatureStore),
         "storage": AsyncMock(spec=ArtifactStorage),
@@ -123,3 +134,176 @@ async def test_inference_service_uses_model_metadata_features(
     mock_components["fs"].get_online_features.assert_awaited_once_with(
         "user-123", ["income", "debt", "age", "credit_history"]
     )
+
+
+@pytest.mark.asyncio
+async def test_runtime_handle_resolved_once_per_version(
+    mock_components: dict[str, Any],
+) -> None:
+    cache = ModelRuntimeCache()
+    service = InferenceService(
+        model_repo=mock_components["repo"],
+        inference_engine=mock_components["engine"],
+        batch_manager=mock_components["batch"],
+        feature_store=mock_components["fs"],
+        artifact_storage=mock_components["storage"],
+        routing_strategy=mock_components["routing"],
+        cache_dir=Path("/tmp/test_cache"),
+        runtime_cache=cache,
+    )
+    model = Model(
+        id="m1", version="v1", uri="loc://v1", framework="onnx", metadata={"features": ["a"]}
+    )
+    mock_components["repo"].get_by_id.return_value = model
+    mock_components["fs"].get_online_features.return_value = [1.0]
+
+    req = PredictionRequest(model_id="m1", model_version="v1", entity_id="user-1")
+    with patch("pathlib.Path.exists", return_value=False) as exists:
+        await service.predict(req)
+        await service.predict(req)
+        assert exists.call_count == 1
+
+    mock_components["storage"].download.assert_awaited_once()
+    mock_components["engine"].load.assert_awaited_once_with(model)
+    runtime = cache.get(model)
+    assert runtime is not None
+    assert runtime.feature_names == ("a",)
+
+    cache.invalidate("m1")
+    assert cache.get(model) is None
+
+
+@pytest.mark.asyncio
+async def test_shadow_routing_hands_champion_prediction_to_runner(
+    mock_components: dict[str, Any],
+) -> None:
+    runner = Mock(spec=ShadowRunner)
+    service = InferenceService(
+        model_repo=mock_components["repo"],
+        inference_engine=mock_components["engine"],
+        batch_manager=mock_components["batch"],
+        feature_store=mock_components["fs"],
+        artifact_storage=mock_components["storage"],
+        routing_strategy=ShadowStrategy(),
+        cache_dir=Path("/tmp/test_cache"),
+        shadow_runner=runner,
+    )
+    champion = Model(
+        id="m1", version="v1", uri="loc://v1", framework="onnx", metadata={"role": "champion"}
+    )
+    challenger = Model(
+        id="m1", version="v2", uri="loc://v2", framework="onnx", metadata={"role": "challenger"}
+    )
+    mock_components["repo"].get_active_versions.return_value = [champion, challenger]
+    prediction = Prediction(
+        model_id="m1",
+        model_version="v1",
+        result=1,
+        confidence=ConfidenceScore(value=0.9),
+        latency_ms=1.0,
+    )
+    mock_components["batch"].predict.return_value = prediction
+
+    with patch("pathlib.Path.exists", return_value=True):
+        result = await service.predict(PredictionRequest(model_id="m1", features=[1.0, 2.0]))
+
+    assert result == prediction
+    assert mock_components["batch"].predict.await_args.args[0] == champion
+    shadow_prediction, shadow_model, features, _ = runner.submit.call_args.args
+    assert (shadow_prediction, shadow_model) == (prediction, challenger)
+    assert features.tolist() == [1.0, 2.0]
+
+
+@pytest.mark.asyncio
+async def test_cascade_serves_routed_requests_from_first_stage(
+    mock_components: dict[str, Any],
+) -> None:
+    cascade = ModelCascade(
+        mock_components["batch"],
+        {"m1": CascadeOptions(version="v1-int8", confidence_threshold=0.8)},
+    )
+    service = InferenceService(
+        model_repo=mock_components["repo"],
+        inference_engine=mock_components["engine"],
+        batch_manager=mock_components["batch"],
+        feature_store=mock_components["fs"],
+        artifact_storage=mock_components["storage"],
+        routing_strategy=mock_components["routing"],
+        cache_dir=Path("/tmp/test_cache"),
+        cascade=cascade,
+    )
+    champion = Model(id="m1", version="v1", uri="loc://v1", framework="onnx")
+    first_stage = Model(id="m1", version="v1-int8", uri="loc://int8", framework="onnx")
+    mock_components["repo"].get_active_versions.return_value = [champion]
+    mock_components["routing"].select_model.return_value = champion
+    mock_components["routing"].shadow_for.return_value = None
+    mock_components["repo"].get_by_id.side_effect = lambda model_id, version: (
+        first_stage if version == "v1-int8" else champion
+    )
+    mock_components["batch"].predict.return_value = Prediction(
+        model_id="m1",
+        model_version="v1-int8",
+        result=0,
+        confidence=ConfidenceScore(value=0.97),
+        latency_ms=1.0,
+    )
+
+    with patch("pathlib.Path.exists", return_value=True):
+        routed = await service.predict(PredictionRequest(model_id="m1", features=[1.0, 2.0]))
+        assert mock_components["batch"].predict.await_args.args[0] == first_stage
+
+        # An explicitly requested version bypasses the cascade
+        await service.predict(
+            PredictionRequest(model_id="m1", model_version="v1", features=[1.0, 2.0])
+        )
+
+    assert routed.model_version == "v1-int8"
+    assert mock_components["batch"].predict.await_args.args[0] == champion
+    loaded = [call.args[0] for call in mock_components["engine"].load.await_args_list]
+    assert first_stage in loaded
+
+
+@pytest.mark.asyncio
+async def test_runtime_loads_selected_quantized_artifact(
+    mock_components: dict[str, Any], tmp_path: Path
+) -> None:
+    report = QuantizationReport(
+        metric="accuracy",
+        higher_is_better=True,
+        fp32=VariantBenchmark("model.onnx", 0.9, latency_p50_ms=2.0, latency_p95_ms=3.0),
+        quantized=VariantBenchmark(
+            "model_quantized.onnx", 0.9, latency_p50_ms=1.0, latency_p95_ms=1.5
+        ),
+    )
+    model = Model(
+        id="m1",
+        version="v1",
+        uri="local:///models/m1/v1/model.onnx",
+        framework="onnx",
+        metadata={"variants": report.to_dict()},
+    )
+    cached = tmp_path / "m1" / "v1" / "model.onnx"
+    cached.parent.mkdir(parents=True)
+    cached.write_bytes(b"fp32")  # copy cached before the quantized variant won
+    service = InferenceService(
+        model_repo=mock_components["repo"],
+        inference_engine=mock_components["engine"],
+        batch_manager=mock_components["batch"],
+        feature_store=mock_components["fs"],
+        artifact_storage=mock_components["storage"],
+        routing_strategy=mock_components["routing"],
+        cache_dir=tmp_path,
+        variant_selector=VariantSelector(),
+    )
+
+    await service.load_runtime(model)
+
+    mock_components["storage"].download.assert_awaited_once_with(
+        "local:///models/m1/v1/model_quantized.onnx", cached
+    )
+    assert (tmp_path / "m1" / "v1" / "model.source").read_text().endswith("model_quantized.onnx")
+
+    # The cached quantized copy is reused on the next load
+    service._runtime_cache.invalidate("m1")
+    await service.load_runtime(model)
+    mock_components["storage"].download.assert_awaited_once()
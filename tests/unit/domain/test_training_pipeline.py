@@ -5,15 +5,21 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import pytest
 
+from phoenix_ml.domain.inference.value_objects.graph_cache_key import GraphCacheKey
+from phoenix_ml.domain.inference.value_objects.runtime_options import RuntimeOptions
 from phoenix_ml.domain.training.pipeline import (
+    BenchmarkStep,
     IPipelineStep,
+    OptimizeStep,
     PipelineContext,
     RegisterStep,
     TrainingPipeline,
     ValidateStep,
 )
+from phoenix_ml.shared.utils.model_generator import generate_simple_onnx
 
 # ── Fixtures ──────────────────────────────────────────────────────
 
@@ -191,3 +197,99 @@ class TestRegisterStep:
         step = RegisterStep()
         result = await step.execute(context)
         assert "deploy_strategy" not in result.artifacts
+
+
+class TestBenchmarkStep:
+    @pytest.fixture
+    def variants(self, tmp_path: Path) -> PipelineContext:
+        fp32 = tmp_path / "model.onnx"
+        quantized = tmp_path / "model_quantized.onnx"
+        generate_simple_onnx(fp32, n_features=4)
+        generate_simple_onnx(quantized, n_features=4)
+        x = np.random.default_rng(0).random((20, 4), dtype=np.float32)
+        np.savez(tmp_path / "holdout.npz", x=x, y=np.ones(20, dtype=np.int64))
+        return PipelineContext(
+            model_id="test-model",
+            version="v1",
+            model_path=quantized,
+            data_path="",
+            train_script="",
+            artifacts={"model": str(fp32), "quantized_model": str(quantized)},
+        )
+
+    @pytest.mark.asyncio
+    async def test_records_both_variants_in_metrics_file(self, variants: PipelineContext) -> None:
+        import json
+
+        step = BenchmarkStep(config={"iterations": 5, "batch_size": 4})
+        result = await step.execute(variants)
+
+        recorded = json.loads(Path(result.artifacts["metrics"]).read_text())["variants"]
+        assert recorded["metric"] == "accuracy"
+        assert recorded["fp32"]["artifact"] == "model.onnx"
+        assert recorded["quantized"]["artifact"] == "model_quantized.onnx"
+        # Identical graphs: same held-out score
+        assert recorded["fp32"]["score"] == recorded["quantized"]["score"] == 1.0
+        assert recorded["quantized"]["latency_p50_ms"] > 0
+        assert result.metrics["quantized_score_drop"] == 0.0
+        assert result.error is None
+
+    @pytest.mark.asyncio
+    async def test_skips_without_holdout_data(self, variants: PipelineContext) -> None:
+        Path(variants.artifacts["model"]).with_name("holdout.npz").unlink()
+
+        result = await BenchmarkStep().execute(variants)
+
+        assert "metrics" not in result.artifacts
+        assert result.error is None
+
+    def test_registered_as_builtin(self) -> None:
+        pipeline = TrainingPipeline.from_config([{"step": "benchmark"}])
+        assert isinstance(pipeline.steps[0], BenchmarkStep)
+
+
+class TestOptimizeStep:
+    @pytest.fixture
+    def trained(self, tmp_path: Path) -> PipelineContext:
+        model = tmp_path / "model.onnx"
+        generate_simple_onnx(model, n_features=4)
+        return PipelineContext(
+            model_id="test-model",
+            version="v1",
+            model_path=model,
+            data_path="",
+            train_script="",
+            artifacts={"model": str(model)},
+        )
+
+    @pytest.mark.asyncio
+    async def test_writes_graph_under_serving_cache_key(
+        self, trained: PipelineContext, tmp_path: Path
+    ) -> None:
+        import onnxruntime as ort
+
+        cache_dir = tmp_path / "graphs"
+        step = OptimizeStep(config={"cache_dir": str(cache_dir)})
+        result = await step.execute(trained)
+
+        key = GraphCacheKey.for_model(trained.model_path, ort.__version__, RuntimeOptions())
+        assert result.artifacts["optimized_model"] == str(cache_dir / key.filename)
+        assert (cache_dir / key.filename).stat().st_size > 0
+        assert [p.name for p in cache_dir.iterdir()] == [key.filename]
+        assert result.error is None
+
+    @pytest.mark.asyncio
+    async def test_skips_invalid_optimization_level(
+        self, trained: PipelineContext, tmp_path: Path
+    ) -> None:
+        step = OptimizeStep(
+            config={"cache_dir": str(tmp_path / "graphs"), "graph_optimization_level": "max"}
+        )
+        result = await step.execute(trained)
+
+        assert "optimized_model" not in result.artifacts
+        assert not (tmp_path / "graphs").exists()
+
+    def test_registered_as_builtin(self) -> None:
+        pipeline = TrainingPipeline.from_config([{"step": "optimize"}])
+        assert isinstance(pipeline.steps[0], OptimizeStep)
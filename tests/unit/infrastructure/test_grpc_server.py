@@ -0,0 +1,224 @@
+"""Unit tests for the batch and streaming gRPC RPCs."""
+
+import time
+from collections.abc import AsyncIterator
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import grpc
+import numpy as np
+import pytest
+
+from phoenix_ml.application.handlers.predict_handler import PredictHandler
+from phoenix_ml.domain.inference.entities.model import Model
+from phoenix_ml.domain.inference.entities.prediction_batch import PredictionBatch
+from phoenix_ml.domain.inference.services.inference_service import InferenceService
+from phoenix_ml.domain.inference.services.model_runtime import ModelRuntime
+from phoenix_ml.domain.inference.value_objects.feature_vector import FeatureMatrix
+from phoenix_ml.domain.shared.event_bus import DomainEventBus
+from phoenix_ml.infrastructure.grpc.grpc_server import (
+    InferenceServicer,
+    TensorFormatError,
+    create_grpc_server,
+    decode_tensor,
+    encode_tensor,
+)
+from phoenix_ml.infrastructure.grpc.proto import inference_pb2
+from phoenix_ml.shared.exceptions import OverloadedError
+
+RUNTIME = ModelRuntime(
+    model=Model(id="m1", version="v1", uri="local://m", framework="onnx"),
+    feature_names=(),
+    dtype=np.dtype(np.float32),
+    n_features=2,
+)
+
+
+async def _predict_matrix(
+    rt: ModelRuntime, features: FeatureMatrix, deadline: float | None = None
+) -> PredictionBatch:
+    return PredictionBatch(
+        model_id="m1",
+        model_version="v1",
+        results=features.values[:, 0].astype(np.int64),
+        confidences=np.full(len(features), 0.5),
+        latency_ms=1.0,
+    )
+
+
+def _servicer(**service_overrides: Any) -> tuple[InferenceServicer, MagicMock]:
+    service = MagicMock(spec=InferenceService)
+    service.resolve = AsyncMock(return_value=RUNTIME)
+    service.max_batch_rows = 64
+    service.predict_matrix = AsyncMock(side_effect=_predict_matrix)
+    for name, value in service_overrides.items():
+        setattr(service, name, value)
+
+    predict_handler = MagicMock(spec=PredictHandler)
+    predict_handler.inference_service = service
+    predict_handler.event_bus = MagicMock(spec=DomainEventBus)
+    return InferenceServicer(predict_handler), service
+
+
+def _request(matrix: np.ndarray, model_id: str = "m1") -> Any:
+    return inference_pb2.PredictBatchRequest(  # type: ignore[attr-defined]
+        model_id=model_id, features=encode_tensor(matrix)
+    )
+
+
+def _context() -> MagicMock:
+    ctx = MagicMock()
+    ctx.time_remaining.return_value = None
+    return ctx
+
+
+def test_tensor_round_trip_is_float32_view() -> None:
+    matrix = np.arange(6, dtype=np.float64).reshape(3, 2)
+    tensor = encode_tensor(matrix)
+
+    decoded = decode_tensor(tensor)
+
+    assert list(tensor.shape) == [3, 2]
+    assert decoded.dtype == np.float32
+    assert not decoded.flags.writeable  # np.frombuffer view, not a parsed copy
+    np.testing.assert_array_equal(decoded, matrix)
+
+
+def test_decode_tensor_promotes_single_row() -> None:
+    tensor = inference_pb2.Tensor(  # type: ignore[attr-defined]
+        data=np.array([1.0, 2.0], dtype="<f4").tobytes(), shape=[2]
+    )
+    assert decode_tensor(tensor).shape == (1, 2)
+
+
+@pytest.mark.parametrize(
+    ("data", "shape"),
+    [
+        (np.zeros(4, dtype="<f4").tobytes(), [3, 2]),
+        (np.zeros(4, dtype="<f4").tobytes(), [2, 2, 1]),
+        (b"", [0, 2]),
+        (np.array([np.nan, 1.0], dtype="<f4").tobytes(), [1, 2]),
+    ],
+)
+def test_decode_tensor_rejects_malformed(data: bytes, shape: list[int]) -> None:
+    tensor = inference_pb2.Tensor(data=data, shape=shape)  # type: ignore[attr-defined]
+    with pytest.raises(TensorFormatError):
+        decode_tensor(tensor)
+
+
+async def test_predict_batch_runs_matrix_path() -> None:
+    servicer, service = _servicer()
+    ctx = _context()
+
+    response = await servicer.PredictBatch(_request(np.array([[1, 0], [0, 0], [1, 1]])), ctx)
+
+    ctx.set_code.assert_not_called()
+    assert (response.model_id, response.version) == ("m1", "v1")
+    assert response.successful == 3
+    np.testing.assert_array_equal(decode_tensor(response.outputs), [[1, 0.5], [0, 0.5], [1, 0.5]])
+    service.predict_matrix.assert_awaited_once()
+
+
+async def test_predict_batch_marks_failed_rows_nan() -> None:
+    servicer, _ = _servicer()
+
+    response = await servicer.PredictBatch(_request(np.ones((2, 3))), _context())
+
+    assert response.successful == 0
+    assert [e.index for e in response.errors] == [0, 1]
+    outputs = np.frombuffer(response.outputs.data, dtype="<f4")
+    assert np.isnan(outputs).all()
+
+
+async def test_predict_batch_uses_tighter_deadline() -> None:
+    servicer, service = _servicer()
+    ctx = _context()
+    ctx.time_remaining.return_value = 5.0
+    request = _request(np.ones((1, 2)))
+    request.deadline_ms = 250
+
+    await servicer.PredictBatch(request, ctx)
+
+    deadline = service.predict_matrix.await_args.args[2]
+    assert 0 < deadline - time.monotonic() <= 0.25
+
+
+@pytest.mark.parametrize(
+    ("error", "code"),
+    [
+        (ValueError("Model missing not found"), grpc.StatusCode.NOT_FOUND),
+        (
+            OverloadedError("m1", "queue full", retry_after_s=1.5),
+            grpc.StatusCode.RESOURCE_EXHAUSTED,
+        ),
+        (RuntimeError("engine crash"), grpc.StatusCode.INTERNAL),
+    ],
+)
+async def test_predict_batch_maps_errors(error: Exception, code: grpc.StatusCode) -> None:
+    servicer, _ = _servicer(resolve=AsyncMock(side_effect=error))
+    ctx = _context()
+
+    await servicer.PredictBatch(_request(np.ones((1, 2))), ctx)
+
+    ctx.set_code.assert_called_once_with(code)
+    ctx.set_details.assert_called_once_with(str(error))
+
+
+async def test_predict_batch_rejects_bad_tensor() -> None:
+    servicer, service = _servicer()
+    ctx = _context()
+    request = inference_pb2.PredictBatchRequest(  # type: ignore[attr-defined]
+        model_id="m1",
+        features=inference_pb2.Tensor(data=b"\x00" * 3, shape=[1, 2]),  # type: ignore[attr-defined]
+    )
+
+    await servicer.PredictBatch(request, ctx)
+
+    ctx.set_code.assert_called_once_with(grpc.StatusCode.INVALID_ARGUMENT)
+    service.resolve.assert_not_called()
+
+
+async def _requests(*requests: Any) -> AsyncIterator[Any]:
+    for request in requests:
+        yield request
+
+
+async def test_predict_stream_answers_each_message_in_order() -> None:
+    async def resolve(model_id: str, version: str | None = None) -> ModelRuntime:
+        if model_id == "missing":
+            raise ValueError("Model missing not found")
+        return RUNTIME
+
+    servicer, _ = _servicer(resolve=AsyncMock(side_effect=resolve))
+    stream = servicer.PredictStream(
+        _requests(
+            _request(np.array([[1, 0]])),
+            _request(np.array([[0, 0]]), model_id="missing"),
+            _request(np.array([[1, 1], [0, 1]])),
+        ),
+        _context(),
+    )
+
+    responses = [r async for r in stream]
+
+    assert [r.error for r in responses] == ["", "Model missing not found", ""]
+    assert responses[1].model_id == "missing"
+    assert [r.successful for r in responses] == [1, 0, 2]
+    np.testing.assert_array_equal(decode_tensor(responses[2].outputs)[:, 0], [1, 0])
+
+
+def test_create_grpc_server_runs_without_executor() -> None:
+    with patch("phoenix_ml.infrastructure.grpc.grpc_server.grpc.aio.server") as server_factory:
+        create_grpc_server(
+            model_repo=MagicMock(),
+            inference_engine=MagicMock(),
+            batch_manager=MagicMock(),
+            feature_store=MagicMock(),
+            artifact_storage=MagicMock(),
+            port=0,
+        )
+
+    args, kwargs = server_factory.call_args
+    assert args == ()
+    assert "migration_thread_pool" not in kwargs
+    assert ("grpc.max_receive_message_length", 64 * 1024 * 1024) in kwargs["options"]
@@ -0,0 +1,54 @@
+"""Tests for the warm-up component of the deep health check."""
+
+import numpy as np
+import pytest
+
+from phoenix_ml.domain.inference.entities.model import Model
+from phoenix_ml.domain.inference.services.batch_manager import BatchManager
+from phoenix_ml.domain.inference.services.model_runtime import ModelRuntime, ModelRuntimeCache
+from phoenix_ml.domain.inference.services.model_warmup import ModelWarmup
+from phoenix_ml.infrastructure.bootstrap import container
+from phoenix_ml.infrastructure.ml_engines.mock_engine import MockInferenceEngine
+from phoenix_ml.infrastructure.monitoring.health_check import HealthChecker
+
+_MODEL = Model(id="fraud", version="v1", uri="local://m", framework="onnx")
+
+
+async def _runtime(model: Model) -> ModelRuntime:
+    return ModelRuntime(model=model, feature_names=(), dtype=np.dtype(np.float32))
+
+
+async def _broken(model: Model) -> ModelRuntime:
+    raise FileNotFoundError("no artifact")
+
+
+@pytest.fixture
+def runtime_cache(monkeypatch: pytest.MonkeyPatch) -> ModelRuntimeCache:
+    cache = ModelRuntimeCache()
+    monkeypatch.setattr(container, "model_runtime_cache", cache)
+    return cache
+
+
+@pytest.fixture
+def warmup(monkeypatch: pytest.MonkeyPatch) -> ModelWarmup:
+    warmup = ModelWarmup(BatchManager(MockInferenceEngine()))
+    monkeypatch.setattr(container, "model_warmup", warmup)
+    return warmup
+
+
+async def test_failed_warm_up_is_degraded_until_the_model_loads(
+    warmup: ModelWarmup, runtime_cache: ModelRuntimeCache
+) -> None:
+    await warmup.run([_MODEL], _broken)
+
+    status = HealthChecker()._check_warmup()
+    assert (status.healthy, status.status) == (True, "degraded")
+    assert "fraud:v1" in status.details
+
+    # Loaded on demand later: no longer reported
+    await runtime_cache.resolve(_MODEL, _runtime)
+    assert HealthChecker()._check_warmup().status == "healthy"
+
+
+async def test_pending_warm_up_is_unhealthy(warmup: ModelWarmup) -> None:
+    assert HealthChecker()._check_warmup().status == "unhealthy"
@@ -0,0 +1,85 @@
+"""Tests for the per-model InferenceExecutor and ORT session options."""
+
+import asyncio
+import threading
+from unittest.mock import Mock
+
+import onnxruntime as ort
+import pytest
+
+from phoenix_ml.domain.inference.entities.model import Model
+from phoenix_ml.domain.inference.value_objects.runtime_options import RuntimeOptions
+from phoenix_ml.domain.monitoring.services.metrics_publisher import MetricsPublisher
+from phoenix_ml.infrastructure.ml_engines.inference_executor import (
+    InferenceExecutor,
+    ThreadPlan,
+)
+from phoenix_ml.infrastructure.ml_engines.session_options import build_session_options
+
+
+def _model(model_id: str = "m1") -> Model:
+    return Model(id=model_id, version="v1", uri="local://m", framework="onnx")
+
+
+class TestThreadPlan:
+    def test_default_splits_cores_across_workers(self) -> None:
+        executor = InferenceExecutor(default_workers=2, cpu_count=8)
+        assert executor.plan(_model()) == ThreadPlan(
+            workers=2, intra_op_threads=4, inter_op_threads=1
+        )
+
+    def test_oversubscribed_plan_is_clamped(self) -> None:
+        executor = InferenceExecutor(cpu_count=8)
+        options = RuntimeOptions(executor_workers=4, intra_op_threads=4)
+        plan = executor.plan(_model(), options)
+        assert plan.workers == 2
+        assert plan.workers * plan.intra_op_threads <= 8
+
+    def test_plan_is_remembered_per_model(self) -> None:
+        executor = InferenceExecutor(cpu_count=8)
+        first = executor.plan(_model(), RuntimeOptions(executor_workers=1))
+        assert executor.plan(_model(), RuntimeOptions(executor_workers=4)) == first
+
+    def test_invalid_options_raise(self) -> None:
+        with pytest.raises(ValueError, match="execution_mode"):
+            RuntimeOptions(execution_mode="turbo")
+        with pytest.raises(ValueError, match="default_workers"):
+            InferenceExecutor(default_workers=0)
+
+
+class TestRun:
+    async def test_runs_on_dedicated_thread(self) -> None:
+        executor = InferenceExecutor(default_workers=1, cpu_count=2)
+        try:
+            name = await executor.run(_model(), lambda: threading.current_thread().name)
+            assert name.startswith("infer-m1:v1")
+        finally:
+            executor.shutdown()
+
+    async def test_publishes_saturation(self) -> None:
+        metrics = Mock(spec=MetricsPublisher)
+        executor = InferenceExecutor(default_workers=1, metrics_publisher=metrics, cpu_count=2)
+        release = threading.Event()
+        try:
+            tasks = [asyncio.create_task(executor.run(_model(), release.wait)) for _ in range(3)]
+            await asyncio.sleep(0.05)
+            assert executor.in_flight(_model()) == 3
+            metrics.record_executor_saturation.assert_called_with("m1", "v1", 3, 1)
+
+            release.set()
+            await asyncio.gather(*tasks)
+            assert executor.in_flight(_model()) == 0
+            metrics.record_executor_saturation.assert_called_with("m1", "v1", 0, 1)
+        finally:
+            release.set()
+            executor.shutdown()
+
+
+def test_build_session_options() -> None:
+    options = RuntimeOptions(execution_mode="parallel", graph_optimization_level="basic")
+    plan = ThreadPlan(workers=2, intra_op_threads=3, inter_op_threads=2)
+    so = build_session_options(options, plan)
+    assert so.intra_op_num_threads == 3
+    assert so.inter_op_num_threads == 2
+    assert so.execution_mode == ort.ExecutionMode.ORT_PARALLEL
+    assert so.graph_optimization_level == ort.GraphOptimizationLevel.ORT_ENABLE_BASIC
@@ -0,0 +1,77 @@
+"""Tests for preallocated IO-binding buffers."""
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import numpy as np
+import onnxruntime as ort
+import pytest
+
+from phoenix_ml.infrastructure.ml_engines.io_binding import IOBindingPool, input_width
+from phoenix_ml.shared.utils.model_generator import generate_simple_onnx
+
+
+@pytest.fixture
+def session(tmp_path: Path) -> ort.InferenceSession:
+    path = tmp_path / "model.onnx"
+    generate_simple_onnx(path, n_features=4)
+    return ort.InferenceSession(str(path), providers=["CPUExecutionProvider"])
+
+
+def _rows(n: int, seed: int = 0) -> list[np.ndarray]:
+    rng = np.random.default_rng(seed)
+    return [rng.normal(size=4).astype(np.float32) for _ in range(n)]
+
+
+def test_matches_session_run(session: ort.InferenceSession) -> None:
+    pool = IOBindingPool(session)
+    assert pool.supported
+
+    rows = _rows(8)
+    expected = session.run(None, {pool.input_name: np.stack(rows)})
+    outputs = pool.run(rows)
+    np.testing.assert_allclose(outputs[0], expected[0], rtol=1e-6)
+
+
+def test_matrix_input_matches_rows(session: ort.InferenceSession) -> None:
+    pool = IOBindingPool(session)
+    rows = _rows(4)
+    expected = pool.run(rows)
+
+    np.testing.assert_allclose(pool.run(np.stack(rows))[0], expected[0], rtol=1e-6)
+    # Non power-of-two matrices go straight to session.run
+    np.testing.assert_allclose(pool.run(np.stack(rows[:3]))[0], expected[0][:3], rtol=1e-6)
+
+
+def test_reuses_buffers_per_bucket(session: ort.InferenceSession) -> None:
+    pool = IOBindingPool(session)
+    first = pool.run(_rows(4, seed=1))
+    second = pool.run(_rows(4, seed=2))
+
+    assert pool.buffer_count() == 1
+    # Results are copied out, so the next batch does not overwrite them
+    assert not np.array_equal(first[0], second[0])
+
+
+def test_non_power_of_two_falls_back(session: ort.InferenceSession) -> None:
+    pool = IOBindingPool(session)
+    outputs = pool.run(_rows(3))
+    assert outputs[0].shape[0] == 3
+    assert pool.buffer_count() == 0
+
+
+def test_non_tensor_outputs_are_unsupported() -> None:
+    session = MagicMock()
+    session.get_inputs.return_value = [MagicMock(type="tensor(float)")]
+    session.get_outputs.return_value = [
+        MagicMock(type="tensor(int64)", shape=[None]),
+        MagicMock(type="seq(map(int64,tensor(float)))", shape=[]),
+    ]
+    assert not IOBindingPool(session).supported
+    assert not IOBindingPool(session, enabled=False).supported
+
+
+def test_input_width() -> None:
+    assert input_width(["batch", 30]) == 30  # noqa: PLR2004
+    assert input_width([None, "features"]) is None
+    assert input_width([1, 3, 224, 224]) is None
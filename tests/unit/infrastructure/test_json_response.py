@@ -0,0 +1,71 @@
+"""Tests for the pluggable fast JSON response encoder."""
+
+import json
+import uuid
+from datetime import datetime
+from enum import Enum
+
+import numpy as np
+import pytest
+from fastapi.encoders import jsonable_encoder
+
+from phoenix_ml.domain.monitoring.entities.drift_report import DriftReport
+from phoenix_ml.infrastructure.http.json_response import (
+    FastJSONResponse,
+    available_encoders,
+    build_encoder,
+    set_json_encoder,
+)
+
+
+class _Stage(Enum):
+    CHAMPION = "champion"
+
+
+def _payload() -> dict[str, object]:
+    return {
+        "id": uuid.UUID(int=7),
+        "at": datetime(2026, 1, 2, 3, 4, 5),
+        "stage": _Stage.CHAMPION,
+        "report": DriftReport(
+            feature_name="f0",
+            drift_detected=True,
+            p_value=0.01,
+            statistic=0.4,
+            threshold=0.05,
+            analyzed_at=datetime(2026, 1, 2),
+        ),
+        "results": [1, 0, None],
+        "confidence": {"value": 0.93},
+        "text": "naïve",
+    }
+
+
+@pytest.mark.parametrize("backend", available_encoders())
+def test_backends_match_fastapi_default_encoding(backend: str) -> None:
+    payload = _payload()
+    encoded = build_encoder(backend)(payload)
+    assert json.loads(encoded) == jsonable_encoder(payload)
+
+
+@pytest.mark.parametrize("backend", available_encoders())
+def test_backends_encode_numpy_and_null_non_finite(backend: str) -> None:
+    encoded = build_encoder(backend)(
+        {"x": np.float32(1.5), "n": np.arange(3), "nan": float("nan"), "inf": np.float64("inf")}
+    )
+    assert json.loads(encoded) == {"x": 1.5, "n": [0, 1, 2], "nan": None, "inf": None}
+
+
+def test_unknown_backend_is_rejected() -> None:
+    with pytest.raises(ValueError, match="not available"):
+        build_encoder("simdjson")
+
+
+def test_fast_json_response_uses_configured_backend() -> None:
+    try:
+        set_json_encoder("stdlib")
+        response = FastJSONResponse({"results": [1, 2], "latency_ms": 1.5})
+    finally:
+        set_json_encoder("auto")
+    assert response.body == b'{"results":[1,2],"latency_ms":1.5}'
+    assert response.media_type == "application/json"
@@ -45,6 +45,34 @@ class TestDictToModelConfig:
         config = _dict_to_model_config({"metadata": "invalid"})
         assert config.metadata == ()
 
+    def test_serving_latency_budget(self) -> None:
+        config = _dict_to_model_config({"serving": {"latency_budget_ms": 25}})
+        assert config.latency_budget_ms == 25.0
+        assert config.with_version("v2").latency_budget_ms == 25.0
+        assert _dict_to_model_config({}).latency_budget_ms == 0.0
+
+    def test_serving_scheduler_weight(self) -> None:
+        config = _dict_to_model_config({"serving": {"scheduler_weight": 3}})
+        assert config.scheduler_weight == 3.0
+        assert config.with_version("v2").scheduler_weight == 3.0
+        assert _dict_to_model_config({}).scheduler_weight == 1.0
+
+    def test_runtime_options(self) -> None:
+        config = _dict_to_model_config(
+            {
+                "runtime": {
+                    "executor_workers": 3,
+                    "intra_op_threads": 2,
+                    "execution_mode": "parallel",
+                }
+            }
+        )
+        assert config.runtime.executor_workers == 3
+        assert config.runtime.intra_op_threads == 2
+        assert config.runtime.execution_mode == "parallel"
+        assert config.with_version("v2").runtime == config.runtime
+        assert _dict_to_model_config({}).runtime.executor_workers == 0
+
 
 class TestLoadModelConfig:
     def test_load_yaml(self, tmp_path: Path) -> None:
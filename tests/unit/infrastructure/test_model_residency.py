@@ -0,0 +1,180 @@
+"""Tests for ModelResidencyManager (memory-bounded LRU of loaded sessions)."""
+
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+
+from phoenix_ml.domain.inference.entities.model import Model
+from phoenix_ml.domain.monitoring.services.metrics_publisher import MetricsPublisher
+from phoenix_ml.infrastructure.ml_engines.model_residency import ModelResidencyManager
+
+
+def _model(version: str, role: str = "challenger") -> Model:
+    return Model(
+        id="fraud", version=version, uri="local://m", framework="onnx", metadata={"role": role}
+    )
+
+
+class _Engine:
+    """Records loads and unloads the way an engine's callbacks would."""
+
+    def __init__(self, residency: ModelResidencyManager, footprint: int = 100) -> None:
+        self.residency = residency
+        self.footprint = footprint
+        self.loads: list[str] = []
+        self.unloaded: list[str] = []
+        self.busy: set[str] = set()
+
+    async def load(self, model: Model) -> None:
+        async def create() -> int:
+            await asyncio.sleep(0)
+            self.loads.append(model.version)
+            return self.footprint
+
+        def release() -> bool:
+            if model.version in self.busy:
+                return False
+            self.unloaded.append(model.version)
+            return True
+
+        await self.residency.ensure_loaded(model, create, release)
+
+
+async def test_evicts_least_recently_used_over_budget() -> None:
+    metrics = Mock(spec=MetricsPublisher)
+    residency = ModelResidencyManager(budget_bytes=250, metrics_publisher=metrics)
+    evicted: list[Model] = []
+    residency.add_eviction_listener(evicted.append)
+    engine = _Engine(residency)
+
+    await engine.load(_model("v1"))
+    await engine.load(_model("v2"))
+    residency.touch(_model("v1"))
+    await engine.load(_model("v3"))
+
+    assert engine.unloaded == ["v2"]
+    assert [m.version for m in evicted] == ["v2"]
+    assert "fraud:v2" not in residency
+    assert residency.resident_bytes == 200
+    metrics.record_model_eviction.assert_called_once_with("fraud", "v2")
+    metrics.record_model_residency.assert_called_with(2, 200, 250)
+
+
+async def test_champion_and_busy_versions_stay_resident() -> None:
+    residency = ModelResidencyManager(budget_bytes=150)
+    engine = _Engine(residency)
+    engine.busy.add("v2")
+
+    await engine.load(_model("v1", role="champion"))
+    await engine.load(_model("v2"))
+    await engine.load(_model("v3"))
+
+    assert engine.unloaded == []
+    assert len(residency) == 3
+
+
+async def test_concurrent_loads_share_one_load() -> None:
+    residency = ModelResidencyManager()
+    engine = _Engine(residency)
+
+    await asyncio.gather(*(engine.load(_model("v1")) for _ in range(5)))
+
+    assert engine.loads == ["v1"]
+
+
+async def test_evicted_version_reloads_on_demand() -> None:
+    metrics = Mock(spec=MetricsPublisher)
+    residency = ModelResidencyManager(budget_bytes=100, metrics_publisher=metrics)
+    engine = _Engine(residency)
+
+    await engine.load(_model("v1"))
+    await engine.load(_model("v2"))
+    await engine.load(_model("v1"))
+
+    assert engine.loads == ["v1", "v2", "v1"]
+    assert engine.unloaded == ["v1", "v2"]
+    metrics.record_model_reload.assert_called_once_with("fraud", "v1")
+
+
+async def test_failed_load_reaches_waiters_and_can_retry() -> None:
+    residency = ModelResidencyManager()
+    model = _model("v1")
+    attempts = 0
+
+    async def create() -> int:
+        nonlocal attempts
+        attempts += 1
+        await asyncio.sleep(0)
+        if attempts == 1:
+            raise FileNotFoundError("missing artifact")
+        return 10
+
+    results = await asyncio.gather(
+        residency.ensure_loaded(model, create, lambda: True),
+        residency.ensure_loaded(model, create, lambda: True),
+        return_exceptions=True,
+    )
+    assert all(isinstance(r, FileNotFoundError) for r in results)
+
+    await residency.ensure_loaded(model, create, lambda: True)
+    assert "fraud:v1" in residency
+
+
+def test_rejects_negative_budget() -> None:
+    with pytest.raises(ValueError, match="budget_bytes"):
+        ModelResidencyManager(budget_bytes=-1)
+
+
+async def test_release_unloads_a_champion_on_request() -> None:
+    metrics = Mock(spec=MetricsPublisher)
+    residency = ModelResidencyManager(metrics_publisher=metrics)
+    released: list[Model] = []
+    residency.add_eviction_listener(released.append)
+    engine = _Engine(residency)
+    await engine.load(_model("v1", role="champion"))
+    await engine.load(_model("v2"))
+
+    engine.busy.add("v2")
+    assert not residency.release(_model("v2"))
+    assert residency.release(_model("v1"))
+    assert not residency.release(_model("v1"))  # no longer resident
+
+    assert engine.unloaded == ["v1"]
+    assert [m.version for m in released] == ["v1"]
+    assert "fraud:v2" in residency
+    metrics.record_model_eviction.assert_not_called()
+    metrics.record_model_residency.assert_called_with(1, 100, 0)
+
+
+async def test_touch_leaves_the_pin_to_explicit_calls() -> None:
+    residency = ModelResidencyManager(budget_bytes=150)
+    engine = _Engine(residency)
+    await engine.load(_model("v1", role="champion"))
+
+    # A request carrying a stale role neither unpins nor pins a version
+    residency.touch(_model("v1", role="challenger"))
+    await engine.load(_model("v2"))
+    assert engine.unloaded == []
+
+    residency.unpin("fraud", "v1")
+    residency.pin("fraud", "v2")
+    residency.touch(_model("v1", role="champion"))
+    await engine.load(_model("v3"))
+
+    assert engine.unloaded == ["v1"]
+    assert "fraud:v2" in residency
+
+
+async def test_explicit_pin_outlives_eviction() -> None:
+    residency = ModelResidencyManager(budget_bytes=100)
+    engine = _Engine(residency)
+    await engine.load(_model("v1", role="champion"))
+    residency.unpin("fraud", "v1")
+    await engine.load(_model("v2"))
+
+    # Reloaded with the role it was registered under, but still unpinned
+    await engine.load(_model("v1", role="champion"))
+    await engine.load(_model("v3"))
+
+    assert engine.unloaded == ["v1", "v2", "v1"]
@@ -7,8 +7,12 @@ import numpy as np
 import pytest
 
 from phoenix_ml.domain.inference.entities.model import Model
-from phoenix_ml.domain.inference.value_objects.feature_vector import FeatureVector
+from phoenix_ml.domain.inference.value_objects.feature_vector import FeatureMatrix, FeatureVector
+from phoenix_ml.infrastructure.ml_engines.model_residency import ModelResidencyManager
 from phoenix_ml.infrastructure.ml_engines.onnx_engine import ONNXInferenceEngine
+from phoenix_ml.infrastructure.ml_engines.optimized_graph_cache import OptimizedGraphCache
+from phoenix_ml.infrastructure.ml_engines.shared_weights import SharedWeights
+from phoenix_ml.shared.utils.model_generator import generate_simple_onnx
 
 
 @pytest.fixture
@@ -48,6 +52,56 @@ async def test_load_creates_session(
         assert model.unique_key in engine._sessions
 
 
+async def test_load_through_graph_cache_persists_optimized_graph(
+    model: Model, tmp_path: Path
+) -> None:
+    generate_simple_onnx(tmp_path / model.id / model.version / "model.onnx", n_features=4)
+    graph_dir = tmp_path / "graphs"
+    engine = ONNXInferenceEngine(cache_dir=tmp_path, graph_cache=OptimizedGraphCache(graph_dir))
+
+    await engine.load(model)
+
+    assert model.unique_key in engine._sessions
+    assert len(list(graph_dir.glob("*.ort"))) == 1
+
+
+async def test_budget_evicts_cold_version_and_reloads_it(tmp_path: Path) -> None:
+    versions = [
+        Model(id="m", version=v, uri="file:///m", framework="onnx", metadata={"role": "challenger"})
+        for v in ("v1", "v2")
+    ]
+    for m in versions:
+        generate_simple_onnx(tmp_path / m.id / m.version / "model.onnx", n_features=3)
+    residency = ModelResidencyManager(budget_bytes=1, footprint_factor=1.0)
+    engine = ONNXInferenceEngine(cache_dir=tmp_path, residency=residency)
+
+    await engine.load(versions[0])
+    await engine.load(versions[1])
+    assert list(engine._sessions) == ["m:v2"]
+
+    features = [FeatureVector(values=np.ones(3, dtype=np.float32))]
+    preds = await engine.batch_predict(versions[0], features)
+
+    assert preds[0].model_version == "v1"
+    assert list(engine._sessions) == ["m:v1"]
+
+
+async def test_shared_weights_session_predicts_and_releases_mapping(
+    model: Model, tmp_path: Path
+) -> None:
+    generate_simple_onnx(tmp_path / model.id / model.version / "model.onnx", n_features=3)
+    shared = SharedWeights(min_tensor_bytes=1)
+    engine = ONNXInferenceEngine(cache_dir=tmp_path, shared_weights=shared)
+    features = [FeatureVector(values=np.ones(3, dtype=np.float32))]
+
+    preds = await engine.batch_predict(model, features)
+
+    assert preds[0].model_version == "v1"
+    assert (tmp_path / model.id / model.version / "model.weights").exists()
+    assert engine._unload(model)
+    assert shared._mapped == {}
+
+
 async def test_load_skips_if_already_loaded(engine: ONNXInferenceEngine, model: Model) -> None:
     engine._sessions[model.unique_key] = MagicMock()
     await engine.load(model)  # should not raise
@@ -99,3 +153,30 @@ async def test_predict_delegates_to_batch(engine: ONNXInferenceEngine, model: Mo
 
 async def test_optimize_is_noop(engine: ONNXInferenceEngine, model: Model) -> None:
     await engine.optimize(model)  # should not raise
+
+
+async def test_batch_predict_columnar_multiclass(engine: ONNXInferenceEngine, model: Model) -> None:
+    mock_session = MagicMock()
+    mock_session.get_inputs.return_value = [MagicMock(name="input")]
+    mock_session.run.return_value = [np.array([[0.1, 0.9], [0.7, 0.3]], dtype=np.float32)]
+    engine._sessions[model.unique_key] = mock_session
+
+    features = [FeatureVector(values=np.array([1.0, 2.0], dtype=np.float32))] * 2
+    batch = await engine.batch_predict_columnar(model, features)
+    assert batch.results.tolist() == [1, 0]
+    assert batch.confidences.tolist() == pytest.approx([0.9, 0.7])
+    assert batch.raw is not None and batch.raw.shape == (2, 2)
+
+
+async def test_batch_predict_matrix_feeds_matrix(engine: ONNXInferenceEngine, model: Model) -> None:
+    mock_session = MagicMock()
+    mock_session.get_inputs.return_value = [MagicMock(name="input")]
+    mock_session.run.return_value = [np.array([[0.2, 0.8], [0.6, 0.4], [0.5, 0.5]])]
+    engine._sessions[model.unique_key] = mock_session
+
+    values = np.ones((3, 2), dtype=np.float32)
+    batch = await engine.batch_predict_matrix(model, FeatureMatrix.from_array(values))
+
+    assert batch.results.tolist() == [1, 0, 0]
+    fed = next(iter(mock_session.run.call_args.args[1].values()))
+    assert fed is values
@@ -0,0 +1,101 @@
+"""Tests for OptimizedGraphCache (persisted pre-optimized ORT graphs)."""
+
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import onnxruntime as ort
+import pytest
+
+from phoenix_ml.domain.inference.value_objects.graph_cache_key import GraphCacheKey
+from phoenix_ml.domain.inference.value_objects.runtime_options import RuntimeOptions
+from phoenix_ml.infrastructure.ml_engines.inference_executor import ThreadPlan
+from phoenix_ml.infrastructure.ml_engines.optimized_graph_cache import OptimizedGraphCache
+from phoenix_ml.infrastructure.ml_engines.session_options import build_session_options
+from phoenix_ml.shared.utils.model_generator import generate_simple_onnx
+
+PROVIDERS = ["CPUExecutionProvider"]
+PLAN = ThreadPlan(workers=1, intra_op_threads=1, inter_op_threads=1)
+
+
+@pytest.fixture
+def model_path(tmp_path: Path) -> Path:
+    path = tmp_path / "model" / "model.onnx"
+    generate_simple_onnx(path, n_features=4)
+    return path
+
+
+def _session(
+    cache: OptimizedGraphCache, model_path: Path, options: RuntimeOptions | None = None
+) -> ort.InferenceSession:
+    options = options or RuntimeOptions()
+    return cache.create_session(
+        model_path, options, build_session_options(options, PLAN), PROVIDERS
+    )
+
+
+def _run(session: ort.InferenceSession) -> np.ndarray:
+    x = np.ones((2, 4), dtype=np.float32)
+    return np.asarray(session.run(None, {session.get_inputs()[0].name: x})[0])
+
+
+def test_first_load_persists_graph_and_next_load_skips_optimization(
+    model_path: Path, tmp_path: Path
+) -> None:
+    cache = OptimizedGraphCache(tmp_path / "graphs")
+    cold = _session(cache, model_path)
+    graph_path = cache.graph_path(model_path, RuntimeOptions(), PROVIDERS)
+    assert [p.name for p in graph_path.parent.iterdir()] == [graph_path.name]
+
+    with patch(
+        "phoenix_ml.infrastructure.ml_engines.optimized_graph_cache.ort.InferenceSession",
+        wraps=ort.InferenceSession,
+    ) as create:
+        warm = _session(cache, model_path)
+
+    (path,) = create.call_args.args
+    assert path == str(graph_path)
+    sess_options = create.call_args.kwargs["sess_options"]
+    assert sess_options.graph_optimization_level == ort.GraphOptimizationLevel.ORT_DISABLE_ALL
+    np.testing.assert_array_equal(_run(warm), _run(cold))
+
+
+def test_key_changes_with_model_and_session_options(model_path: Path, tmp_path: Path) -> None:
+    cache = OptimizedGraphCache(tmp_path / "graphs")
+    base = cache.graph_path(model_path, RuntimeOptions(), PROVIDERS)
+
+    extended = RuntimeOptions(graph_optimization_level="extended")
+    assert cache.graph_path(model_path, extended, PROVIDERS) != base
+    # Thread counts don't shape the graph
+    assert cache.graph_path(model_path, RuntimeOptions(intra_op_threads=4), PROVIDERS) == base
+
+    other = tmp_path / "other.onnx"
+    generate_simple_onnx(other, n_features=5)
+    assert cache.graph_path(other, RuntimeOptions(), PROVIDERS) != base
+
+    key = GraphCacheKey.for_model(model_path, ort.__version__, RuntimeOptions())
+    assert GraphCacheKey(**{**key.__dict__, "runtime_version": "0.0.1"}).filename != key.filename
+
+
+def test_corrupt_graph_is_rebuilt(model_path: Path, tmp_path: Path) -> None:
+    cache = OptimizedGraphCache(tmp_path / "graphs")
+    graph_path = cache.graph_path(model_path, RuntimeOptions(), PROVIDERS)
+    graph_path.write_bytes(b"truncated")
+
+    session = _session(cache, model_path)
+
+    assert _run(session).shape[0] == 2
+    assert graph_path.read_bytes() != b"truncated"
+
+
+@pytest.mark.parametrize(
+    ("enabled", "level"), [(False, "all"), (True, "disabled")], ids=["off", "no_optimization"]
+)
+def test_nothing_persisted_without_optimization(
+    model_path: Path, tmp_path: Path, enabled: bool, level: str
+) -> None:
+    cache = OptimizedGraphCache(tmp_path / "graphs", enabled=enabled)
+
+    _session(cache, model_path, RuntimeOptions(graph_optimization_level=level))
+
+    assert not any((tmp_path / "graphs").glob("*"))
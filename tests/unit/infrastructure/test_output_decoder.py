@@ -0,0 +1,66 @@
+"""Tests for vectorized ONNX output decoding."""
+
+import numpy as np
+import pytest
+
+from phoenix_ml.infrastructure.ml_engines.output_decoder import decode_outputs
+
+
+def test_zipmap_classification() -> None:
+    outputs = [np.array([1, 0, 1]), [{0: 0.2, 1: 0.8}, {0: 0.9, 1: 0.1}, {0: 0.4, 1: 0.6}]]
+    results, confidences, raw = decode_outputs(outputs, 3)
+    assert results.tolist() == [1, 0, 1]
+    assert confidences == pytest.approx([0.8, 0.9, 0.6])
+    assert raw.shape == (3, 2)
+
+
+def test_zipmap_string_labels() -> None:
+    outputs = [np.array(["yes", "no"]), [{"no": 0.3, "yes": 0.7}, {"no": 0.55, "yes": 0.45}]]
+    results, confidences, _ = decode_outputs(outputs, 2)
+    assert results.tolist() == ["yes", "no"]
+    assert confidences == pytest.approx([0.7, 0.55])
+
+
+def test_probability_tensor_without_zipmap() -> None:
+    outputs = [np.array([2, 0]), np.array([[0.1, 0.2, 0.7], [0.6, 0.3, 0.1]])]
+    results, confidences, _ = decode_outputs(outputs, 2)
+    assert results.tolist() == [2, 0]
+    assert confidences == pytest.approx([0.7, 0.6])
+
+
+def test_multi_output_model_keeps_first_output_decoding() -> None:
+    # e.g. a regressor that also emits an [N, K] embedding
+    outputs = [
+        np.array([[150000.0], [3.5]], dtype=np.float32),
+        np.array([[0.1, 0.9], [0.8, 0.2]], dtype=np.float32),
+    ]
+    results, confidences, _ = decode_outputs(outputs, 2)
+    assert results.tolist() == pytest.approx([150000.0, 3.5])
+    assert confidences.tolist() == [1.0, 1.0]
+
+    # A second matrix whose rows do not match the batch is not probabilities
+    outputs = [np.array([2, 0]), np.array([[0.1, 0.2, 0.7]])]
+    results, confidences, _ = decode_outputs(outputs, 2)
+    assert results.tolist() == [2, 0]
+    assert confidences.tolist() == [1.0, 1.0]
+
+
+def test_regression_column() -> None:
+    outputs = [np.array([[150000.0], [3.5]], dtype=np.float32)]
+    results, confidences, _ = decode_outputs(outputs, 2)
+    assert results.tolist() == pytest.approx([150000.0, 3.5])
+    assert confidences.tolist() == [1.0, 1.0]
+
+
+def test_multiclass_scores_are_clamped() -> None:
+    outputs = [np.array([[0.1, 3.0], [-1.0, -2.0]], dtype=np.float32)]
+    results, confidences, _ = decode_outputs(outputs, 2)
+    assert results.tolist() == [1, 0]
+    assert confidences.tolist() == [1.0, 0.0]
+
+
+def test_fallback_passes_rows_through() -> None:
+    outputs = [np.array([0.25, 0.75], dtype=np.float32)]
+    results, confidences, _ = decode_outputs(outputs, 2)
+    assert results.tolist() == pytest.approx([0.25, 0.75])
+    assert confidences.tolist() == [1.0, 1.0]
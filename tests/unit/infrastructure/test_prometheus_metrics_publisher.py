@@ -0,0 +1,111 @@
+from prometheus_client import REGISTRY
+
+from phoenix_ml.infrastructure.monitoring.prometheus_metrics_publisher import (
+    PrometheusMetricsPublisher,
+)
+
+
+def test_record_batch_policy_sets_gauges() -> None:
+    publisher = PrometheusMetricsPublisher()
+    publisher.record_batch_policy("pub-model", "v3", 16, 4.5)
+
+    labels = {"model_id": "pub-model", "version": "v3"}
+    assert REGISTRY.get_sample_value("batch_target_size", labels) == 16
+    assert REGISTRY.get_sample_value("batch_window_ms", labels) == 4.5
+
+
+def test_record_executor_saturation_sets_gauges() -> None:
+    publisher = PrometheusMetricsPublisher()
+    publisher.record_executor_saturation("pub-model", "v3", 5, 2)
+
+    labels = {"model_id": "pub-model", "version": "v3"}
+    assert REGISTRY.get_sample_value("inference_executor_in_flight", labels) == 5
+    assert REGISTRY.get_sample_value("inference_executor_queued", labels) == 3
+    assert REGISTRY.get_sample_value("inference_executor_workers", labels) == 2
+
+
+def test_record_deadline_miss_counts_per_priority() -> None:
+    publisher = PrometheusMetricsPublisher()
+    publisher.record_deadline_miss("pub-model", "v3", "bulk", 3)
+    publisher.record_deadline_miss("pub-model", "v3", "bulk")
+
+    labels = {"model_id": "pub-model", "version": "v3", "priority": "bulk"}
+    assert REGISTRY.get_sample_value("inference_deadline_misses_total", labels) == 4
+
+
+def test_record_coalesced() -> None:
+    publisher = PrometheusMetricsPublisher()
+    publisher.record_coalesced("pub-model", "v3", 2)
+
+    labels = {"model_id": "pub-model", "version": "v3"}
+    assert REGISTRY.get_sample_value("inference_coalesced_requests_total", labels) == 2
+
+
+def test_record_shed_counts_per_reason() -> None:
+    publisher = PrometheusMetricsPublisher()
+    publisher.record_shed("pub-model", "v3", "queue_full")
+
+    labels = {"model_id": "pub-model", "version": "v3", "reason": "queue_full"}
+    assert REGISTRY.get_sample_value("inference_shed_requests_total", labels) == 1
+
+
+def test_record_scheduler_metrics() -> None:
+    publisher = PrometheusMetricsPublisher()
+    publisher.record_scheduler_slots(1, 4)
+    publisher.record_scheduler_dispatch("pub-model", "v3", 2.5, 3.0)
+
+    assert REGISTRY.get_sample_value("inference_scheduler_slots_in_use") == 1
+    assert REGISTRY.get_sample_value("inference_scheduler_slots") == 4
+    labels = {"model_id": "pub-model", "version": "v3"}
+    assert REGISTRY.get_sample_value("inference_scheduler_weighted_work_total", labels) == 2.5
+    assert REGISTRY.get_sample_value("inference_scheduler_wait_seconds_count", labels) == 1
+
+
+def test_record_shadow() -> None:
+    publisher = PrometheusMetricsPublisher()
+    publisher.record_shadow("pub-model", "v4", "completed", 3)
+    publisher.record_shadow("pub-model", "v4", "dropped")
+
+    labels = {"model_id": "pub-model", "version": "v4"}
+    value = REGISTRY.get_sample_value
+    assert value("inference_shadow_predictions_total", {**labels, "outcome": "completed"}) == 3
+    assert value("inference_shadow_predictions_total", {**labels, "outcome": "dropped"}) == 1
+
+
+def test_record_cascade() -> None:
+    publisher = PrometheusMetricsPublisher()
+    publisher.record_cascade("pub-model", "first", 0.002)
+    publisher.record_cascade("pub-model", "escalated", 0.02)
+    publisher.record_cascade("pub-model", "escalated", 0.03)
+
+    value = REGISTRY.get_sample_value
+    name = "inference_cascade_latency_seconds_count"
+    assert value(name, {"model_id": "pub-model", "stage": "first"}) == 1
+    assert value(name, {"model_id": "pub-model", "stage": "escalated"}) == 2
+
+
+def test_record_model_residency_and_evictions() -> None:
+    publisher = PrometheusMetricsPublisher()
+    publisher.record_model_residency(3, 3_000, 4_096)
+    publisher.record_model_eviction("pub-model", "v1")
+    publisher.record_model_reload("pub-model", "v1")
+
+    value = REGISTRY.get_sample_value
+    assert value("inference_resident_models") == 3
+    assert value("inference_resident_model_bytes") == 3_000
+    assert value("inference_model_memory_budget_bytes") == 4_096
+    labels = {"model_id": "pub-model", "version": "v1"}
+    assert value("inference_model_evictions_total", labels) == 1
+    assert value("inference_model_reloads_total", labels) == 1
+
+
+def test_record_model_swap() -> None:
+    publisher = PrometheusMetricsPublisher()
+    publisher.record_model_swap("pub-model", "v2", "completed", 1.5)
+    publisher.record_swap_tail_latency("pub-model", "v2", 0.004)
+
+    value = REGISTRY.get_sample_value
+    labels = {"model_id": "pub-model", "version": "v2", "outcome": "completed"}
+    assert value("inference_model_swaps_total", labels) == 1
+    assert value("inference_model_swap_duration_seconds_sum", {"model_id": "pub-model"}) == 1.5
+    assert value("inference_model_swap_added_p99_seconds", {"model_id": "pub-model"}) == 0.004
@@ -0,0 +1,82 @@
+"""Tests for Prometheus metrics merged across worker processes."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from prometheus_client import REGISTRY
+
+from phoenix_ml.infrastructure.monitoring import prometheus_multiprocess
+from phoenix_ml.infrastructure.monitoring.prometheus_multiprocess import (
+    MULTIPROC_DIR_ENV,
+    mark_worker_dead,
+    metrics_registry,
+    prepare_multiprocess_dir,
+)
+
+_WORKER = """
+import os
+from prometheus_client import Counter, Gauge
+Counter("test_requests", "requests", ["model_id"]).labels("fraud").inc({n})
+Gauge("test_queue_depth", "queued").set({n})
+print(os.getpid())
+"""
+
+
+def _run_worker(n: int) -> int:
+    """A separate process recording metrics the way a serving worker does."""
+    out = subprocess.run(
+        [sys.executable, "-c", _WORKER.format(n=n)],
+        env=os.environ.copy(),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return int(out.stdout)
+
+
+@pytest.fixture
+def metrics_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    path = tmp_path / "metrics"
+    # Recorded so the variable is removed again after the test
+    monkeypatch.setenv(MULTIPROC_DIR_ENV, str(path))
+    (path / "stale").mkdir(parents=True)
+    prepare_multiprocess_dir(path)
+    return path
+
+
+def test_prepare_clears_previous_run(metrics_dir: Path) -> None:
+    assert os.environ[MULTIPROC_DIR_ENV] == str(metrics_dir)
+    assert list(metrics_dir.iterdir()) == []
+
+
+def test_counters_are_summed_and_gauges_kept_per_worker(metrics_dir: Path) -> None:
+    pids = [_run_worker(2), _run_worker(3)]
+
+    registry = metrics_registry()
+
+    assert registry.get_sample_value("test_requests_total", {"model_id": "fraud"}) == 5.0
+    for pid, n in zip(pids, (2, 3), strict=True):
+        assert registry.get_sample_value("test_queue_depth", {"pid": str(pid)}) == n
+
+
+def test_stopped_worker_gauges_are_dropped(metrics_dir: Path) -> None:
+    stopped, running = _run_worker(2), _run_worker(3)
+
+    mark_worker_dead(stopped)
+
+    registry = metrics_registry()
+    assert registry.get_sample_value("test_queue_depth", {"pid": str(stopped)}) is None
+    assert registry.get_sample_value("test_queue_depth", {"pid": str(running)}) == 3.0
+    # Counters of the stopped worker still count
+    assert registry.get_sample_value("test_requests_total", {"model_id": "fraud"}) == 5.0
+
+
+def test_single_process_uses_default_registry(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv(MULTIPROC_DIR_ENV, raising=False)
+
+    assert not prometheus_multiprocess.multiprocess_enabled()
+    assert metrics_registry() is REGISTRY
+    mark_worker_dead()  # no-op
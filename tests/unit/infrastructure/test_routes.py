@@ -1,5 +1,7 @@
 """Tests for main API routes using httpx AsyncClient with DI overrides."""
 
+import copy
+from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -7,11 +9,18 @@ from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
 
 from phoenix_ml.application.handlers.predict_handler import PredictHandler
+from phoenix_ml.domain.inference.entities.model import Model
 from phoenix_ml.domain.inference.entities.prediction import Prediction
 from phoenix_ml.domain.inference.value_objects.confidence_score import ConfidenceScore
 from phoenix_ml.infrastructure.http.dependencies import get_predict_handler
 from phoenix_ml.infrastructure.http.routes import router
 from phoenix_ml.infrastructure.persistence.database import get_db
+from phoenix_ml.infrastructure.persistence.in_memory_model_repo import InMemoryModelRepository
+from phoenix_ml.infrastructure.persistence.snapshot_model_repo import (
+    SnapshotModelRepository,
+    static_provider,
+)
+from phoenix_ml.shared.utils.model_generator import generate_simple_onnx
 
 
 def _create_test_app() -> FastAPI:
@@ -187,3 +196,323 @@ async def test_get_model_performance(app: FastAPI) -> None:
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
         resp = await client.get("/monitoring/performance/m1")
         assert resp.status_code == 200
+
+
+async def test_predict_overloaded_returns_503_with_retry_after(app: FastAPI) -> None:
+    from phoenix_ml.shared.exceptions import OverloadedError
+
+    handler = MagicMock(spec=PredictHandler)
+    handler.execute = AsyncMock(side_effect=OverloadedError("m1", "queue_full", 1.5))
+
+    async def override_handler():  # type: ignore[no-untyped-def]
+        return handler
+
+    app.dependency_overrides[get_predict_handler] = override_handler
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        resp = await client.post("/predict", json={"model_id": "m1", "features": [1.0]})
+        assert resp.status_code == 503
+        assert resp.headers["Retry-After"] == "2"
+
+
+def _stream_app(service: MagicMock) -> FastAPI:
+    from phoenix_ml.infrastructure.http.stream_routes import stream_router
+
+    app = FastAPI()
+    app.include_router(stream_router)
+    handler = MagicMock(spec=PredictHandler)
+    handler.inference_service = service
+    handler.event_bus = MagicMock()
+
+    async def override_handler():  # type: ignore[no-untyped-def]
+        return handler
+
+    app.dependency_overrides[get_predict_handler] = override_handler
+    return app
+
+
+async def test_stream_predict_ndjson() -> None:
+    import json
+
+    import numpy as np
+
+    from phoenix_ml.domain.inference.entities.model import Model
+    from phoenix_ml.domain.inference.entities.prediction_batch import PredictionBatch
+    from phoenix_ml.domain.inference.services.inference_service import InferenceService
+    from phoenix_ml.domain.inference.services.model_runtime import ModelRuntime
+
+    async def predict_matrix(rt, features, deadline=None):  # type: ignore[no-untyped-def]
+        return PredictionBatch(
+            model_id="m1",
+            model_version="v1",
+            results=features.values[:, 0].astype(np.int64),
+            confidences=np.full(len(features), 0.9),
+            latency_ms=1.0,
+        )
+
+    service = MagicMock(spec=InferenceService)
+    service.resolve = AsyncMock(
+        return_value=ModelRuntime(
+            model=Model(id="m1", version="v1", uri="local://m", framework="onnx"),
+            feature_names=(),
+            dtype=np.dtype(np.float32),
+            n_features=2,
+        )
+    )
+    service.max_batch_rows = 2
+    service.predict_matrix = AsyncMock(side_effect=predict_matrix)
+
+    body = b"[1, 0]\n[2, 0]\n[3, 0]\n"
+    async with AsyncClient(
+        transport=ASGITransport(app=_stream_app(service)), base_url="http://test"
+    ) as client:
+        resp = await client.post(
+            "/predict/stream?model_id=m1",
+            content=body,
+            headers={"content-type": "application/x-ndjson"},
+        )
+
+    assert resp.status_code == 200
+    lines = [json.loads(line) for line in resp.text.splitlines()]
+    assert [line.get("results") for line in lines[:2]] == [[1, 2], [3]]
+    assert lines[-1]["done"] is True
+    assert lines[-1]["total"] == 3
+    assert lines[-1]["successful"] == 3
+
+
+async def test_stream_predict_unknown_model_and_media_type() -> None:
+    from phoenix_ml.domain.inference.services.inference_service import InferenceService
+
+    service = MagicMock(spec=InferenceService)
+    service.resolve = AsyncMock(side_effect=ValueError("Model 'nope' not found"))
+    service.max_batch_rows = 2
+
+    async with AsyncClient(
+        transport=ASGITransport(app=_stream_app(service)), base_url="http://test"
+    ) as client:
+        missing = await client.post(
+            "/predict/stream?model_id=nope",
+            content=b"[1, 0]\n",
+            headers={"content-type": "application/x-ndjson"},
+        )
+        wrong_type = await client.post(
+            "/predict/stream?model_id=m1",
+            content=b"1,0\n",
+            headers={"content-type": "text/csv"},
+        )
+
+    assert missing.status_code == 404
+    assert wrong_type.status_code == 415
+
+
+async def test_predict_binary_tensor_in_and_out(app: FastAPI) -> None:
+    import numpy as np
+
+    from phoenix_ml.infrastructure.http.tensor_codec import TENSOR, decode_tensor, encode_tensor
+
+    handler = MagicMock(spec=PredictHandler)
+    handler.execute = AsyncMock(
+        return_value=Prediction(
+            model_id="m1",
+            model_version="v1",
+            result=1,
+            confidence=ConfidenceScore(value=0.75),
+            latency_ms=2.5,
+        )
+    )
+
+    async def override_handler():  # type: ignore[no-untyped-def]
+        return handler
+
+    app.dependency_overrides[get_predict_handler] = override_handler
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        resp = await client.post(
+            "/predict?model_id=m1&deadline_ms=50",
+            content=encode_tensor(np.array([[0.5, 1.5]], dtype=np.float32), TENSOR),
+            headers={"content-type": TENSOR, "accept": TENSOR},
+        )
+        too_many = await client.post(
+            "/predict?model_id=m1",
+            content=encode_tensor(np.zeros((2, 2), dtype=np.float32), TENSOR),
+            headers={"content-type": TENSOR},
+        )
+        missing_id = await client.post(
+            "/predict",
+            content=encode_tensor(np.zeros((1, 2), dtype=np.float32), TENSOR),
+            headers={"content-type": TENSOR},
+        )
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == TENSOR
+    assert resp.headers["X-Model-Version"] == "v1"
+    np.testing.assert_allclose(decode_tensor(resp.content, TENSOR), [[1.0, 0.75]])
+    command = handler.execute.await_args.args[0]
+    assert command.deadline_ms == 50
+    assert isinstance(command.features_array, np.ndarray)
+    np.testing.assert_array_equal(command.features_array, [0.5, 1.5])
+    assert command.features == [0.5, 1.5]
+    assert too_many.status_code == 422
+    assert missing_id.status_code == 422
+
+
+async def test_predict_json_validation_still_returns_422(app: FastAPI) -> None:
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        missing = await client.post("/predict", json={})
+        invalid = await client.post(
+            "/predict", content=b"not json", headers={"content-type": "application/json"}
+        )
+    assert missing.status_code == 422
+    assert invalid.status_code == 422
+
+
+async def test_batch_predict_npy_in_and_out(app: FastAPI) -> None:
+    import io
+
+    import numpy as np
+
+    from phoenix_ml.domain.inference.entities.model import Model
+    from phoenix_ml.domain.inference.entities.prediction_batch import PredictionBatch
+    from phoenix_ml.domain.inference.services.inference_service import InferenceService
+    from phoenix_ml.domain.inference.services.model_runtime import ModelRuntime
+    from phoenix_ml.infrastructure.http.tensor_codec import NPY
+
+    async def predict_matrix(rt, features, deadline=None):  # type: ignore[no-untyped-def]
+        return PredictionBatch(
+            model_id="m1",
+            model_version="v1",
+            results=features.values[:, 0].astype(np.int64),
+            confidences=np.full(len(features), 0.5),
+            latency_ms=1.0,
+        )
+
+    service = MagicMock(spec=InferenceService)
+    service.resolve = AsyncMock(
+        return_value=ModelRuntime(
+            model=Model(id="m1", version="v1", uri="local://m", framework="onnx"),
+            feature_names=(),
+            dtype=np.dtype(np.float32),
+            n_features=2,
+        )
+    )
+    service.max_batch_rows = 2
+    service.predict_matrix = AsyncMock(side_effect=predict_matrix)
+    handler = MagicMock(spec=PredictHandler)
+    handler.inference_service = service
+    handler.event_bus = MagicMock()
+
+    async def override_handler():  # type: ignore[no-untyped-def]
+        return handler
+
+    app.dependency_overrides[get_predict_handler] = override_handler
+    body = io.BytesIO()
+    np.save(body, np.array([[1, 0], [2, 0], [3, 0]], dtype=np.float32))
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        resp = await client.post(
+            "/predict/batch?model_id=m1",
+            content=body.getvalue(),
+            headers={"content-type": NPY, "accept": NPY},
+        )
+
+    assert resp.status_code == 200
+    assert resp.headers["X-Successful"] == "3"
+    out = np.load(io.BytesIO(resp.content))
+    np.testing.assert_allclose(out, [[1, 0.5], [2, 0.5], [3, 0.5]])
+    assert service.predict_matrix.await_count == 2
+
+
+class _CopyingRepo(InMemoryModelRepository):
+    """Hands out copies, like a database backend does."""
+
+    async def list_all(self) -> list[Model]:
+        return copy.deepcopy(await super().list_all())
+
+
+async def _registry_snapshot(tmp_path: Path) -> SnapshotModelRepository:
+    """Champion v1 and unrouted v2/v3, each with an ONNX artifact under ``tmp_path``."""
+    backend = _CopyingRepo()
+    for version, role in (("v1", "champion"), ("v2", "challenger"), ("v3", "challenger")):
+        generate_simple_onnx(tmp_path / "m" / version / "model.onnx", n_features=2)
+        await backend.save(
+            Model(
+                id="m",
+                version=version,
+                uri="local://m",
+                framework="onnx",
+                metadata={"role": role},
+                is_active=role == "champion",
+            )
+        )
+    return SnapshotModelRepository(static_provider(backend))
+
+
+async def test_batch_predict_after_hot_swap_keeps_champion_resident(
+    app: FastAPI, tmp_path: Path
+) -> None:
+    from phoenix_ml.domain.inference.services.batch_manager import BatchConfig, BatchManager
+    from phoenix_ml.domain.inference.services.inference_service import InferenceService
+    from phoenix_ml.domain.inference.services.model_hot_swap import ModelHotSwapper
+    from phoenix_ml.domain.inference.services.model_runtime import ModelRuntimeCache
+    from phoenix_ml.domain.inference.services.model_warmup import ModelWarmup
+    from phoenix_ml.domain.inference.services.routing_strategy import CanaryStrategy
+    from phoenix_ml.domain.shared.event_bus import DomainEventBus
+    from phoenix_ml.infrastructure.ml_engines.model_residency import ModelResidencyManager
+    from phoenix_ml.infrastructure.ml_engines.onnx_engine import ONNXInferenceEngine
+
+    snapshot = await _registry_snapshot(tmp_path)
+
+    # Every session is over budget: only pinned versions survive a load
+    residency = ModelResidencyManager(budget_bytes=1, footprint_factor=1.0)
+    engine = ONNXInferenceEngine(cache_dir=tmp_path, residency=residency)
+    manager = BatchManager(engine, config=BatchConfig(max_batch_size=4, max_wait_time_ms=1))
+    runtime_cache = ModelRuntimeCache()
+    residency.add_eviction_listener(lambda m: runtime_cache.invalidate(m.id, m.version))
+    service = InferenceService(
+        model_repo=snapshot,
+        inference_engine=engine,
+        batch_manager=manager,
+        feature_store=MagicMock(),
+        artifact_storage=MagicMock(),
+        routing_strategy=CanaryStrategy(canary_percentage=0.0),
+        cache_dir=tmp_path,
+        runtime_cache=runtime_cache,
+    )
+    swapper = ModelHotSwapper(
+        ModelWarmup(manager, iterations=1, max_batch_size=2),
+        manager,
+        engine,
+        service.load_runtime,
+        runtime_cache=runtime_cache,
+    )
+
+    async def override_handler():  # type: ignore[no-untyped-def]
+        return PredictHandler(service, DomainEventBus())
+
+    app.dependency_overrides[get_predict_handler] = override_handler
+    try:
+        await service.load_runtime(await snapshot.get_champion("m"))  # type: ignore[arg-type]
+        promoted = await snapshot.get_by_id("m", "v2")
+        assert promoted is not None
+        assert await swapper.promote(snapshot, promoted)
+
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            resp = await client.post(
+                "/predict/batch", json={"model_id": "m", "batch": [[1.0, 0.0], [0.0, 1.0]]}
+            )
+            # Another version loading must not evict the new champion
+            await service.load_runtime(await snapshot.get_by_id("m", "v3"))  # type: ignore[arg-type]
+            again = await client.post(
+                "/predict/batch", json={"model_id": "m", "batch": [[1.0, 0.0]]}
+            )
+    finally:
+        await manager.stop()
+
+    assert resp.status_code == 200
+    assert resp.json()["version"] == "v2"
+    assert again.json()["version"] == "v2"
+    assert again.json()["successful"] == 1
+    champion = await snapshot.get_champion("m")
+    assert champion is not None
+    runtime = runtime_cache.get(champion)
+    assert runtime is not None
+    assert runtime.model.metadata["role"] == "champion"
+    assert "m:v2" in residency
+    assert "m:v1" not in residency
@@ -0,0 +1,68 @@
+"""Tests for the multi-worker serving entry point."""
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from phoenix_ml.config import Settings
+from phoenix_ml.domain.inference.value_objects.model_config import ModelConfig
+from phoenix_ml.infrastructure.http import server
+from phoenix_ml.infrastructure.ml_engines.shared_weights import SHARED_MODEL_FILE
+from phoenix_ml.infrastructure.monitoring.prometheus_multiprocess import MULTIPROC_DIR_ENV
+from phoenix_ml.shared.utils.model_generator import generate_simple_onnx
+
+
+@pytest.fixture
+def uvicorn_run(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    run = MagicMock()
+    monkeypatch.setattr(server.uvicorn, "run", run)
+    return run
+
+
+@pytest.fixture
+def settings(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Settings:
+    settings = Settings(
+        SERVER_LOOP="uvloop",
+        SERVER_HTTP="httptools",
+        SERVER_RUNTIME_DIR=str(tmp_path / "serve"),
+        SHARED_WEIGHTS_MIN_TENSOR_KB=0,
+    )
+    monkeypatch.setattr(server, "get_settings", lambda: settings)
+    # Recorded so prepare_workers' environment changes are undone
+    monkeypatch.setenv("SERVER_WORKERS", "1")
+    monkeypatch.setenv(MULTIPROC_DIR_ENV, "")
+    return settings
+
+
+def test_multi_worker_serving_prepares_shared_state(
+    settings: Settings, uvicorn_run: MagicMock, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    model_path = tmp_path / "models" / "fraud" / "v1" / "model.onnx"
+    generate_simple_onnx(model_path, n_features=4)
+    monkeypatch.setattr(
+        server,
+        "load_all_model_configs",
+        lambda _dir: {"fraud": ModelConfig(model_id="fraud", model_path=str(model_path))},
+    )
+
+    server.serve(workers=4)
+
+    kwargs = uvicorn_run.call_args.kwargs
+    assert (kwargs["workers"], kwargs["loop"], kwargs["http"]) == (4, "uvloop", "httptools")
+    assert server.os.environ["SERVER_WORKERS"] == "4"
+    assert server.os.environ[MULTIPROC_DIR_ENV] == str(tmp_path / "serve" / "metrics")
+    assert model_path.with_name(SHARED_MODEL_FILE).is_file()
+
+
+def test_single_worker_skips_worker_setup(
+    settings: Settings, uvicorn_run: MagicMock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    prepare = MagicMock()
+    monkeypatch.setattr(server, "prepare_workers", prepare)
+
+    server.serve()
+    server.serve(workers=4, reload=True)
+
+    prepare.assert_not_called()
+    assert [c.kwargs["workers"] for c in uvicorn_run.call_args_list] == [1, 1]
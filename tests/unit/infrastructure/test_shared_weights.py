@@ -0,0 +1,114 @@
+"""Tests for SharedWeights (memory-mapped initializers shared across sessions)."""
+
+import os
+from pathlib import Path
+
+import numpy as np
+import onnx
+import onnxruntime as ort
+import pytest
+from onnx import TensorProto, helper, numpy_helper
+
+from phoenix_ml.infrastructure.ml_engines.shared_weights import (
+    SHARED_MODEL_FILE,
+    WEIGHTS_FILE,
+    SharedWeights,
+)
+from phoenix_ml.shared.utils.model_generator import generate_simple_onnx
+
+N = 64
+
+
+def _dense_onnx(path: Path, seed: int = 0) -> None:
+    """y = x @ W + b with a (N, N) float32 weight (16 KB) and a tiny bias."""
+    rng = np.random.default_rng(seed)
+    weight = numpy_helper.from_array(rng.random((N, N), dtype=np.float32), "W")
+    bias = numpy_helper.from_array(np.ones(N, dtype=np.float32), "b")
+    graph = helper.make_graph(
+        [
+            helper.make_node("MatMul", ["x", "W"], ["xw"]),
+            helper.make_node("Add", ["xw", "b"], ["y"]),
+        ],
+        "dense",
+        [helper.make_tensor_value_info("x", TensorProto.FLOAT, [None, N])],
+        [helper.make_tensor_value_info("y", TensorProto.FLOAT, [None, N])],
+        [weight, bias],
+    )
+    model = helper.make_model(
+        graph, opset_imports=[helper.make_operatorsetid("", 15)], ir_version=8
+    )
+    path.parent.mkdir(parents=True, exist_ok=True)
+    onnx.save(model, str(path))
+
+
+def _run(model_path: Path, sess_options: ort.SessionOptions | None = None) -> np.ndarray:
+    session = ort.InferenceSession(
+        str(model_path), sess_options=sess_options, providers=["CPUExecutionProvider"]
+    )
+    x = np.ones((2, N), dtype=np.float32)
+    return np.asarray(session.run(None, {"x": x})[0])
+
+
+@pytest.fixture
+def model_path(tmp_path: Path) -> Path:
+    path = tmp_path / "dense" / "v1" / "model.onnx"
+    _dense_onnx(path)
+    return path
+
+
+def test_large_initializers_are_served_from_shared_file(model_path: Path) -> None:
+    shared = SharedWeights(min_tensor_bytes=1024)
+    so = ort.SessionOptions()
+
+    source = shared.apply("dense:v1", model_path, so)
+
+    assert source == model_path.with_name(SHARED_MODEL_FILE)
+    assert model_path.with_name(WEIGHTS_FILE).stat().st_size == N * N * 4
+    assert so.get_session_config_entry("session.disable_prepacking") == "1"
+    stripped = onnx.load(str(source), load_external_data=False)
+    external = [
+        i.name for i in stripped.graph.initializer if i.data_location == TensorProto.EXTERNAL
+    ]
+    assert external == ["W"]  # the bias is below the threshold
+    np.testing.assert_allclose(_run(source, so), _run(model_path), rtol=1e-6)
+
+
+def test_sessions_share_one_mapping_until_released(model_path: Path) -> None:
+    shared = SharedWeights(min_tensor_bytes=1024)
+    for key in ("dense:v1", "dense:v1-cascade"):
+        shared.apply(key, model_path, ort.SessionOptions())
+
+    (mapped,) = shared._mapped.values()
+    assert mapped.users == {"dense:v1", "dense:v1-cascade"}
+
+    shared.release("dense:v1")
+    assert len(shared._mapped) == 1
+    shared.release("dense:v1-cascade")
+    assert shared._mapped == {}
+
+
+def test_rewrites_when_model_is_replaced(model_path: Path) -> None:
+    shared = SharedWeights(min_tensor_bytes=1024)
+    shared.apply("dense:v1", model_path, ort.SessionOptions())
+    before = _run(model_path)
+
+    _dense_onnx(model_path, seed=1)
+    stat = model_path.with_name(SHARED_MODEL_FILE).stat()
+    os.utime(model_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    so = ort.SessionOptions()
+    source = shared.apply("dense:v1", model_path, so)
+
+    after = _run(source, so)
+    np.testing.assert_allclose(after, _run(model_path), rtol=1e-6)
+    assert not np.allclose(after, before)
+
+
+def test_small_models_load_unchanged(tmp_path: Path) -> None:
+    path = tmp_path / "simple" / "model.onnx"
+    generate_simple_onnx(path, n_features=4)
+    so = ort.SessionOptions()
+
+    assert SharedWeights().apply("simple:v1", path, so) == path
+    assert not path.with_name(SHARED_MODEL_FILE).exists()
+    with pytest.raises(RuntimeError):
+        so.get_session_config_entry("session.disable_prepacking")
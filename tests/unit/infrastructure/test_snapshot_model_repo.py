@@ -0,0 +1,181 @@
+"""Tests for SnapshotModelRepository."""
+
+import asyncio
+
+import pytest
+
+from phoenix_ml.domain.inference.entities.model import Model
+from phoenix_ml.infrastructure.persistence.in_memory_model_repo import InMemoryModelRepository
+from phoenix_ml.infrastructure.persistence.snapshot_model_repo import (
+    SnapshotModelRepository,
+    static_provider,
+)
+
+
+class _CountingRepo(InMemoryModelRepository):
+    def __init__(self) -> None:
+        super().__init__()
+        self.list_calls = 0
+        self.get_calls = 0
+        self.fail = False
+        # When set, list_all() waits for it (a slow backend)
+        self.gate: asyncio.Event | None = None
+
+    async def list_all(self) -> list[Model]:
+        self.list_calls += 1
+        if self.gate is not None:
+            await self.gate.wait()
+        if self.fail:
+            raise ConnectionError("registry down")
+        return await super().list_all()
+
+    async def get_by_id(self, model_id: str, version: str) -> Model | None:
+        self.get_calls += 1
+        return await super().get_by_id(model_id, version)
+
+
+def _model(version: str, role: str = "champion", active: bool = True) -> Model:
+    return Model(
+        id="m1",
+        version=version,
+        uri="file:///test",
+        framework="onnx",
+        metadata={"role": role},
+        is_active=active,
+    )
+
+
+async def _settle(snapshot: SnapshotModelRepository) -> None:
+    """Wait for a scheduled background reload to finish."""
+    if snapshot._reload_task is not None:
+        await snapshot._reload_task
+
+
+async def _snapshot_with(*models: Model) -> tuple[SnapshotModelRepository, _CountingRepo]:
+    source = _CountingRepo()
+    for m in models:
+        await source.save(m)
+    return SnapshotModelRepository(static_provider(source)), source
+
+
+async def test_reads_are_served_from_snapshot() -> None:
+    snapshot, source = await _snapshot_with(_model("v1"), _model("v2", role="challenger"))
+
+    for _ in range(5):
+        active = await snapshot.get_active_versions("m1")
+        assert {m.version for m in active} == {"v1", "v2"}
+        assert await snapshot.get_by_id("m1", "v1") is not None
+
+    assert source.list_calls == 1
+    assert snapshot.is_loaded
+
+
+async def test_champion_and_inactive_versions() -> None:
+    snapshot, _ = await _snapshot_with(_model("v1"), _model("v0", role="retired", active=False))
+
+    champion = await snapshot.get_champion("m1")
+    assert champion is not None
+    assert champion.version == "v1"
+    assert [m.version for m in await snapshot.get_active_versions("m1")] == ["v1"]
+    assert await snapshot.get_active_versions("unknown") == []
+
+
+async def test_get_by_id_miss_falls_through_to_source() -> None:
+    snapshot, source = await _snapshot_with(_model("v1"))
+    await snapshot.refresh()
+    await source.save(_model("v9", role="challenger"))
+
+    found = await snapshot.get_by_id("m1", "v9")
+    assert found is not None
+    assert found.version == "v9"
+
+
+async def test_unknown_version_is_negatively_cached() -> None:
+    snapshot, source = await _snapshot_with(_model("v1"))
+
+    for _ in range(5):
+        assert await snapshot.get_by_id("m1", "typo") is None
+    assert source.get_calls == 1
+
+    # A write may register the version, so it is looked up again
+    await snapshot.save(_model("typo", role="challenger"))
+    assert await snapshot.get_by_id("m1", "typo") is not None
+
+
+async def test_writes_invalidate_snapshot() -> None:
+    snapshot, source = await _snapshot_with(_model("v1"))
+    await snapshot.get_active_versions("m1")
+
+    await snapshot.save(_model("v2", role="challenger"))
+    assert len(await snapshot.get_active_versions("m1")) == 2
+
+    await snapshot.update_stage("m1", "v2", "champion")
+    champion = await snapshot.get_champion("m1")
+    assert champion is not None
+    assert champion.version == "v2"
+    assert source.list_calls == 3
+
+
+async def test_invalidate_reloads_on_next_read() -> None:
+    snapshot, source = await _snapshot_with(_model("v1"))
+    await snapshot.get_active_versions("m1")
+
+    # Out-of-band change (e.g. another replica promoted a model)
+    await source.save(_model("v2", role="challenger"))
+    assert len(await snapshot.get_active_versions("m1")) == 1
+
+    snapshot.invalidate("m1")
+    await _settle(snapshot)
+    assert len(await snapshot.get_active_versions("m1")) == 2
+
+
+async def test_stale_reads_do_not_wait_for_a_slow_backend() -> None:
+    snapshot, source = await _snapshot_with(_model("v1"))
+    await snapshot.refresh()
+    source.gate = asyncio.Event()
+    await source.save(_model("v2", role="challenger"))
+    snapshot.invalidate("m1")
+
+    # Served from the current snapshot while the reload is blocked
+    reads = await asyncio.wait_for(
+        asyncio.gather(*(snapshot.get_active_versions("m1") for _ in range(10))), timeout=1
+    )
+    assert all(len(r) == 1 for r in reads)
+
+    source.gate.set()
+    await _settle(snapshot)
+    assert len(await snapshot.get_active_versions("m1")) == 2
+
+
+async def test_failed_refresh_keeps_last_snapshot() -> None:
+    snapshot, source = await _snapshot_with(_model("v1"))
+    await snapshot.refresh()
+
+    source.fail = True
+    snapshot.invalidate()
+    await _settle(snapshot)
+    assert [m.version for m in await snapshot.get_active_versions("m1")] == ["v1"]
+
+    # Still stale: the next read retries the backend in the background
+    source.fail = False
+    await source.save(_model("v2", role="challenger"))
+    await snapshot.get_active_versions("m1")
+    await _settle(snapshot)
+    assert len(await snapshot.get_active_versions("m1")) == 2
+
+
+async def test_first_load_failure_propagates() -> None:
+    snapshot, source = await _snapshot_with(_model("v1"))
+    source.fail = True
+
+    with pytest.raises(ConnectionError):
+        await snapshot.get_active_versions("m1")
+    assert not snapshot.is_loaded
+
+
+async def test_background_refresh_start_stop() -> None:
+    snapshot, _ = await _snapshot_with(_model("v1"))
+    snapshot.start()
+    snapshot.start()  # idempotent
+    await snapshot.stop()
+    await snapshot.stop()
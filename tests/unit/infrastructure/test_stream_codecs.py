@@ -0,0 +1,67 @@
+"""Tests for the incremental NDJSON / Arrow IPC request body decoders."""
+
+from collections.abc import AsyncIterator
+
+import numpy as np
+import pyarrow as pa
+import pytest
+
+from phoenix_ml.infrastructure.http.stream_codecs import (
+    StreamDecodeError,
+    arrow_rows,
+    ndjson_rows,
+)
+
+
+async def _body(data: bytes, size: int) -> AsyncIterator[bytes]:
+    for i in range(0, len(data), size):
+        yield data[i : i + size]
+
+
+def _arrow_stream(*batches: pa.RecordBatch) -> bytes:
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, batches[0].schema) as writer:
+        for batch in batches:
+            writer.write_batch(batch)
+    return sink.getvalue().to_pybytes()
+
+
+async def test_ndjson_rows_split_across_body_chunks() -> None:
+    data = b'[1, 2]\n{"features": [3.5, 4]}\n\n[5, 6]\n[7, 8]'
+    chunks = [c async for c in ndjson_rows(_body(data, 3), chunk_rows=2)]
+    assert chunks == [[[1, 2], [3.5, 4]], [[5, 6], [7, 8]]]
+
+
+async def test_ndjson_malformed_lines_become_none() -> None:
+    data = b'[1, 2]\nnot json\n{"x": 1}\n["a"]\n[true]\n'
+    chunks = [c async for c in ndjson_rows(_body(data, 64), chunk_rows=10)]
+    assert chunks == [[[1, 2], None, None, None, None]]
+
+
+@pytest.mark.parametrize("size", [1, 7, 100, 1 << 20])
+async def test_arrow_rows_decode_at_any_split(size: int) -> None:
+    first = pa.record_batch({"a": [1.0, 2.0], "b": pa.array([3, 4], pa.int32())})
+    second = pa.record_batch({"a": [5.0], "b": pa.array([6], pa.int32())})
+
+    batches = [b async for b in arrow_rows(_body(_arrow_stream(first, second), size))]
+
+    assert len(batches) == 2
+    np.testing.assert_array_equal(batches[0], [[1.0, 3.0], [2.0, 4.0]])
+    np.testing.assert_array_equal(batches[1], [[5.0, 6.0]])
+
+
+async def test_arrow_rows_reject_truncated_stream() -> None:
+    data = _arrow_stream(pa.record_batch({"a": [1.0, 2.0]}))
+    with pytest.raises(StreamDecodeError, match="Truncated"):
+        _ = [b async for b in arrow_rows(_body(data[:-20], 16))]
+
+
+async def test_arrow_rows_reject_non_numeric_columns() -> None:
+    data = _arrow_stream(pa.record_batch({"a": ["x", "y"]}))
+    with pytest.raises(StreamDecodeError, match="not numeric"):
+        _ = [b async for b in arrow_rows(_body(data, 1024))]
+
+
+async def test_arrow_rows_reject_other_formats() -> None:
+    with pytest.raises(StreamDecodeError, match="Not an Arrow"):
+        _ = [b async for b in arrow_rows(_body(b"[1, 2]\n[3, 4]\n", 1024))]
@@ -0,0 +1,88 @@
+"""Tests for the binary tensor request/response codec."""
+
+import io
+import struct
+
+import numpy as np
+import pytest
+
+from phoenix_ml.application.commands.predict_command import PredictCommand
+from phoenix_ml.infrastructure.http.tensor_codec import (
+    NPY,
+    TENSOR,
+    TensorDecodeError,
+    accepted_tensor_type,
+    decode_tensor,
+    encode_tensor,
+    request_body_schema,
+)
+
+
+def _npy(array: np.ndarray) -> bytes:
+    buffer = io.BytesIO()
+    np.save(buffer, array)
+    return buffer.getvalue()
+
+
+def test_raw_tensor_round_trip_is_a_view_of_the_body() -> None:
+    matrix = np.arange(6, dtype=np.float32).reshape(2, 3)
+    body = encode_tensor(matrix, TENSOR)
+
+    decoded = decode_tensor(body, TENSOR)
+
+    assert len(body) == 12 + 6 * 4
+    np.testing.assert_array_equal(decoded, matrix)
+    assert decoded.dtype == np.float32
+    assert not decoded.flags.owndata
+    assert not decoded.flags.writeable
+
+
+@pytest.mark.parametrize(
+    "array",
+    [
+        np.arange(6, dtype=np.float64).reshape(2, 3),
+        np.asfortranarray(np.arange(6, dtype=np.float32).reshape(2, 3)),
+        np.arange(4, dtype=">i4"),
+    ],
+)
+def test_npy_decodes_any_numeric_layout(array: np.ndarray) -> None:
+    decoded = decode_tensor(_npy(array), NPY)
+    np.testing.assert_array_equal(decoded, array.reshape(-1, array.shape[-1]))
+    assert decoded.dtype == array.dtype
+
+
+def test_npy_encode_round_trips() -> None:
+    matrix = np.array([[1.0, 0.9], [0.0, 0.4]])
+    np.testing.assert_array_equal(np.load(io.BytesIO(encode_tensor(matrix, NPY))), matrix)
+
+
+@pytest.mark.parametrize(
+    ("body", "content_type", "match"),
+    [
+        (b"PHX", TENSOR, "shorter than its header"),
+        (struct.pack("<4sII", b"NOPE", 1, 1) + b"\0" * 4, TENSOR, "PHXT"),
+        (struct.pack("<4sII", b"PHXT", 2, 2) + b"\0" * 4, TENSOR, "declares 2x2"),
+        (encode_tensor(np.array([[np.nan, 1.0]]), TENSOR), TENSOR, "NaN"),
+        (_npy(np.array(["a", "b"])), NPY, "real numeric"),
+        (_npy(np.zeros((2, 2)))[:-8], NPY, "Truncated"),
+        (b"not npy", NPY, "Invalid .npy"),
+        (_npy(np.zeros((1, 2, 2))), NPY, "shape"),
+    ],
+)
+def test_decode_rejects_malformed_bodies(body: bytes, content_type: str, match: str) -> None:
+    with pytest.raises(TensorDecodeError, match=match):
+        decode_tensor(body, content_type)
+
+
+def test_accepted_tensor_type() -> None:
+    assert accepted_tensor_type("application/x-npy;q=0.9, application/json") == NPY
+    assert accepted_tensor_type("application/json") is None
+    assert accepted_tensor_type(None) is None
+
+
+def test_request_body_schema_inlines_definitions() -> None:
+    content = request_body_schema(PredictCommand)["requestBody"]["content"]
+
+    assert set(content) == {"application/json", TENSOR, NPY}
+    assert "$ref" not in str(content["application/json"])
+    assert "interactive" in str(content["application/json"])
@@ -0,0 +1,54 @@
+"""Tests for WorkerLease and the gRPC leader election built on it."""
+
+import asyncio
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from phoenix_ml.infrastructure.bootstrap import lifespan
+from phoenix_ml.infrastructure.bootstrap.worker_lease import WorkerLease
+
+
+def test_lease_has_a_single_holder(tmp_path: Path) -> None:
+    first = WorkerLease(tmp_path, "grpc")
+    second = WorkerLease(tmp_path, "grpc")
+
+    assert first.try_acquire()
+    assert first.try_acquire()  # re-entrant for the holder
+    assert not second.try_acquire()
+
+    first.release()
+    assert second.try_acquire()
+    assert not first.held
+    second.release()
+
+
+async def test_grpc_server_fails_over_to_waiting_worker(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    servers = [MagicMock(start=AsyncMock(), stop=AsyncMock()) for _ in range(2)]
+    monkeypatch.setattr(lifespan, "create_grpc_server", MagicMock(side_effect=servers))
+    monkeypatch.setattr(lifespan, "shutdown_event", asyncio.Event())
+    monkeypatch.setattr(lifespan, "GRPC_LEASE_RETRY_SECONDS", 0.01)
+
+    leader = WorkerLease(tmp_path, "grpc")
+    follower = WorkerLease(tmp_path, "grpc")
+    leader_task = asyncio.create_task(lifespan._serve_grpc_as_leader(leader))
+    await asyncio.sleep(0.05)
+    follower_task = asyncio.create_task(lifespan._serve_grpc_as_leader(follower))
+    await asyncio.sleep(0.05)
+
+    servers[0].start.assert_awaited_once()
+    assert not follower.held
+
+    # The leader exits without a clean shutdown; the follower takes over
+    leader_task.cancel()
+    await asyncio.gather(leader_task, return_exceptions=True)
+    await asyncio.sleep(0.05)
+    servers[1].start.assert_awaited_once()
+
+    lifespan.shutdown_event.set()
+    await asyncio.wait_for(follower_task, timeout=1)
+    servers[1].stop.assert_awaited_once()
+    assert not follower.held